@@ -0,0 +1,25 @@
+# Archivo: app/cache/__init__.py
+# Descripción: Inicialización del módulo de cache de aplicación
+# Funcionalidad: Cache async con backends en memoria / Redis, tags y single-flight
+
+from .backends import CacheBackend, MemoryBackend, RedisBackend, NullBackend
+from .core import Cache, get_cache, set_cache, build_backend
+from .decorators import cached
+from .versions import VersionStore, MemoryVersionStore, RedisVersionStore, get_version_store, set_version_store
+
+__all__ = [
+    "CacheBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "NullBackend",
+    "Cache",
+    "get_cache",
+    "set_cache",
+    "build_backend",
+    "cached",
+    "VersionStore",
+    "MemoryVersionStore",
+    "RedisVersionStore",
+    "get_version_store",
+    "set_version_store"
+]
@@ -0,0 +1,231 @@
+# Archivo: app/cache/backends.py
+# Descripción: Backends de almacenamiento del cache de aplicación
+# Funcionalidad: Backend en memoria (TTL + LRU por proceso), backend Redis compartido y backend nulo
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from app.utils.responses import json_dumps
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializar un valor del cache. Mismo JSON que las respuestas HTTP:
+    lo que devuelve un hit es lo que el endpoint habría respondido.
+    """
+    return json_dumps(value)
+
+
+def loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class CacheBackend(ABC):
+    """
+    Interfaz asíncrona común de los backends de cache.
+    Las claves llegan ya con namespace (ver app.cache.core.Cache).
+    Todos los backends guardan JSON: get() devuelve siempre una copia
+    decodificada (fechas en ISO 8601, tuplas como listas), nunca el objeto
+    original, así el resultado no depende del backend configurado.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Obtener valor o None si no existe / expiró"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        """Guardar valor con TTL en segundos, asociado a tags de invalidación"""
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        """Guardar solo si la clave no existe (set-if-absent). True si se guardó"""
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Eliminar claves"""
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Eliminar todas las claves asociadas a los tags. Retorna cuántas se eliminaron"""
+        pass
+
+    @abstractmethod
+    async def clear(self, prefix: str = "") -> None:
+        """Eliminar las claves que empiezan con prefix (todas si está vacío)"""
+        pass
+
+    async def close(self) -> None:
+        """Liberar conexiones (si el backend las tiene)"""
+        return None
+
+
+class NullBackend(CacheBackend):
+    """Backend deshabilitado: nunca guarda nada (CACHE_BACKEND=none)"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        return None
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        return None
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        return None
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        return 0
+
+    async def clear(self, prefix: str = "") -> None:
+        return None
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Cache local del proceso con expiración por TTL y desalojo LRU.
+    Cada worker de uvicorn tiene su propia copia. Guarda los valores ya
+    serializados, igual que Redis: modificar lo que devuelve get() no
+    altera la entrada.
+    """
+
+    def __init__(self, max_entries: int = 2048, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+
+    def _remove(self, key: str) -> None:
+        self._data.pop(key, None)
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._data.move_to_end(key)
+        return loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        raw = dumps(value)
+        self._remove(key)
+        self._data[key] = (self._clock() + ttl, raw)
+        tags = tuple(tags)
+        if tags:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+        while len(self._data) > self.max_entries:
+            self._remove(next(iter(self._data)))
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._remove(key)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        keys = set()
+        for tag in tags:
+            keys |= self._tags.get(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    async def clear(self, prefix: str = "") -> None:
+        if not prefix:
+            self._data.clear()
+            self._tags.clear()
+            self._key_tags.clear()
+            return
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            self._remove(key)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Backend compartido entre workers sobre el protocolo Redis.
+    Los valores se guardan como JSON (las fechas quedan en ISO 8601, igual
+    que en la respuesta HTTP). Cada tag es un SET con las claves asociadas;
+    su expiración se renueva en cada set y siempre supera a la de sus claves.
+
+    Acepta un cliente ya construido (por ejemplo fakeredis.aioredis.FakeRedis)
+    para pruebas sin servidor.
+    """
+
+    def __init__(self, url: str = "", client: Any = None, tag_ttl: int = 86400):
+        if client is None:
+            import redis.asyncio as redis_asyncio
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.tag_ttl = tag_ttl
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(key)
+        return None if raw is None else loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(key, dumps(value), ex=ttl)
+            for tag in tags:
+                pipe.sadd(tag, key)
+                pipe.expire(tag, max(ttl, self.tag_ttl))
+            await pipe.execute()
+
+    async def add(self, key: str, value: Any, ttl: int) -> bool:
+        return bool(await self.client.set(key, dumps(value), ex=ttl, nx=True))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*keys)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        if not tags:
+            return 0
+        keys = await self.client.sunion(*tags)
+        await self.client.delete(*keys, *tags)
+        return len(keys)
+
+    async def clear(self, prefix: str = "") -> None:
+        # Nunca FLUSHDB: el servidor Redis puede estar compartido
+        batch = []
+        async for key in self.client.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self.client.delete(*batch)
+                batch = []
+        if batch:
+            await self.client.delete(*batch)
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -0,0 +1,257 @@
+# Archivo: app/cache/core.py
+# Descripción: Fachada del cache de aplicación con namespaces, tags y single-flight
+# Funcionalidad: get/set/invalidación por tags y get_or_set con protección contra estampidas
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+
+from app.cache.backends import CacheBackend, MemoryBackend, NullBackend, RedisBackend, dumps, loads
+from app.config import CACHE_CONFIG
+from app.observability.metrics import CACHE_REQUESTS
+
+
+logger = logging.getLogger(__name__)
+
+
+Loader = Callable[[], Union[Any, Awaitable[Any]]]
+
+
+class Cache:
+    """
+    Cache de aplicación sobre un backend intercambiable.
+
+    - Namespaces: todas las claves llevan el prefijo "<namespace>:v<versión>:",
+      así subir la versión invalida todo sin tocar el servidor.
+    - Tags: cada valor puede asociarse a tablas; invalidate_tags borra todo
+      lo que dependa de ellas.
+    - Single-flight: si varias corrutinas piden la misma clave ausente, solo
+      una ejecuta el loader; con backend compartido además se toma un lock
+      distribuido para que un solo worker recalcule.
+
+    Los errores del backend nunca rompen el request: se tratan como miss.
+    None no se cachea (se interpreta como ausencia).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        namespace: str = "justtime",
+        version: int = 1,
+        default_ttl: int = 60,
+        lock_timeout: float = 10.0,
+        poll_interval: float = 0.05
+    ):
+        self.backend = backend
+        self.prefix = f"{namespace}:v{version}:"
+        self.default_ttl = default_ttl
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.enabled = not isinstance(backend, NullBackend)
+        self.shared = isinstance(backend, RedisBackend)
+        self.hits = 0
+        self.misses = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    # ------------------------------------------------------------------
+    # Claves
+    # ------------------------------------------------------------------
+
+    def make_key(self, *parts: Any) -> str:
+        """Construir clave lógica (sin namespace) a partir de sus partes"""
+        return ":".join(str(p) for p in parts)
+
+    def _key(self, key: str) -> str:
+        return self.prefix + key
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    # ------------------------------------------------------------------
+    # Operaciones básicas
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            return await self.backend.get(self._key(key))
+        except Exception as e:
+            logger.warning("Cache get falló (%s): %s", key, e)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = ()) -> None:
+        try:
+            await self.backend.set(
+                self._key(key), value, ttl or self.default_ttl, [self._tag(t) for t in tags]
+            )
+        except Exception as e:
+            logger.warning("Cache set falló (%s): %s", key, e)
+
+    async def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set-if-absent (usado como lock distribuido). Si el backend falla retorna False"""
+        try:
+            return await self.backend.add(self._key(key), value, ttl or self.default_ttl)
+        except Exception as e:
+            logger.warning("Cache add falló (%s): %s", key, e)
+            return False
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self.backend.delete(*[self._key(k) for k in keys])
+        except Exception as e:
+            logger.warning("Cache delete falló: %s", e)
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalidar todas las entradas asociadas a los tags (nombres de tabla)"""
+        try:
+            return await self.backend.invalidate_tags(*[self._tag(t) for t in tags])
+        except Exception as e:
+            logger.warning("Cache invalidate_tags falló (%s): %s", tags, e)
+            return 0
+
+    async def clear(self) -> None:
+        """Vaciar solo el namespace de esta aplicación"""
+        try:
+            await self.backend.clear(self.prefix)
+        except Exception as e:
+            logger.warning("Cache clear falló: %s", e)
+
+    async def close(self) -> None:
+        try:
+            await self.backend.close()
+        except Exception as e:
+            logger.warning("Cache close falló: %s", e)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # ------------------------------------------------------------------
+    # get_or_set con single-flight
+    # ------------------------------------------------------------------
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Loader,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Retornar el valor cacheado o calcularlo con loader (sync o async).
+        Solo una ejecución del loader por clave y proceso a la vez. El valor
+        pasa por JSON también en el miss, como en un hit.
+        """
+        if not self.enabled:
+            return await _call(loader)
+
+        value = await self.get(key)
+        if value is not None:
+            self.hits += 1
+            CACHE_REQUESTS.labels("hit").inc()
+            return value
+        self.misses += 1
+        CACHE_REQUESTS.labels("miss").inc()
+
+        while True:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Cancelaron al request que calculaba (desconexión, deadline),
+                # no a este: tomar la carga en su lugar
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key, loader, ttl, tags)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # marcar como leída si nadie estaba esperando
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(self, key: str, loader: Loader, ttl: Optional[int], tags: Iterable[str]) -> Any:
+        """Ejecutar loader; con backend compartido, bajo lock distribuido"""
+        lock_key = f"lock:{key}"
+        locked = False
+
+        if self.shared:
+            locked = await self.add(lock_key, 1, ttl=int(self.lock_timeout) or 1)
+            if not locked:
+                # Otro worker está calculando: esperar su resultado
+                waited = 0.0
+                while waited < self.lock_timeout:
+                    await asyncio.sleep(self.poll_interval)
+                    waited += self.poll_interval
+                    value = await self.get(key)
+                    if value is not None:
+                        return value
+                # El otro worker no terminó a tiempo: calcular igualmente
+
+        try:
+            value = await _call(loader)
+            if value is None:
+                return None
+            try:
+                # El que calcula recibe lo mismo que los hits posteriores
+                value = loads(dumps(value))
+            except (TypeError, ValueError) as e:
+                logger.warning("Valor no cacheable (%s): %s", key, e)
+                return value
+            await self.set(key, value, ttl, tags)
+            return value
+        finally:
+            if locked:
+                await self.delete(lock_key)
+
+
+async def _call(loader: Loader) -> Any:
+    result = loader()
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def build_backend(config: Dict = CACHE_CONFIG) -> CacheBackend:
+    """Crear backend según CACHE_CONFIG['backend'] (memory | redis | none)"""
+    backend = config["backend"].lower()
+    if backend == "redis":
+        return RedisBackend(config["url"])
+    if backend == "none":
+        return NullBackend()
+    return MemoryBackend(max_entries=config["max_entries"])
+
+
+_cache: Optional[Cache] = None
+
+
+def get_cache() -> Cache:
+    """Instancia global del cache (creada al primer uso)"""
+    global _cache
+    if _cache is None:
+        _cache = Cache(
+            build_backend(CACHE_CONFIG),
+            namespace=CACHE_CONFIG["namespace"],
+            version=CACHE_CONFIG["version"],
+            default_ttl=CACHE_CONFIG["default_ttl"],
+            lock_timeout=CACHE_CONFIG["lock_timeout"]
+        )
+    return _cache
+
+
+def set_cache(cache: Optional[Cache]) -> None:
+    """Reemplazar la instancia global (por ejemplo con un backend fakeredis)"""
+    global _cache
+    _cache = cache
@@ -0,0 +1,55 @@
+# Archivo: app/cache/decorators.py
+# Descripción: Decorador para que los endpoints de lectura usen el cache
+# Funcionalidad: @cached arma la clave con los parámetros primitivos del endpoint
+
+import functools
+import inspect
+from typing import Callable, Iterable, Optional
+
+from app.cache.core import get_cache
+
+
+_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+def cached(
+    name: str,
+    ttl: Optional[int] = None,
+    tags: Iterable[str] = (),
+    vary_on: Optional[Iterable[str]] = None
+) -> Callable:
+    """
+    Cachear el resultado de un endpoint async.
+
+    La clave se arma con `name` y los parámetros primitivos (query/path) del
+    endpoint; las dependencias (sesión, controladores, usuario actual) se
+    ignoran. Con `vary_on` se eligen explícitamente los parámetros de la clave.
+    `tags` son las tablas de las que depende el resultado.
+
+    Uso (debajo de @router.get):
+        @cached("analytics:resumen", ttl=60, tags=["proyectos", "tareas"])
+    """
+    tags = tuple(tags)
+    vary_on = set(vary_on) if vary_on is not None else None
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache = get_cache()
+            if not cache.enabled:
+                return await func(*args, **kwargs)
+
+            arguments = signature.bind_partial(*args, **kwargs).arguments
+            parts = [
+                f"{param}={value}"
+                for param, value in sorted(arguments.items())
+                if (param in vary_on if vary_on is not None else isinstance(value, _KEY_TYPES))
+            ]
+            key = cache.make_key(name, *parts)
+            return await cache.get_or_set(key, lambda: func(*args, **kwargs), ttl=ttl, tags=tags)
+
+        return wrapper
+
+    return decorator
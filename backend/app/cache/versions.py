@@ -0,0 +1,103 @@
+# Archivo: app/cache/versions.py
+# Descripción: Contadores de versión por tabla para ETags y cache condicional
+# Funcionalidad: Versión que sube con cada commit que toca la tabla (memoria o Redis)
+
+import os
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.config import CACHE_CONFIG
+
+
+class VersionStore(ABC):
+    """
+    Versión monotónica por tabla. `epoch` distingue instancias del store:
+    si el proceso reinicia (memoria) los contadores vuelven a 0 pero el
+    epoch cambia, así ningún ETag viejo vuelve a coincidir.
+    """
+
+    epoch: str = ""
+    shared: bool = False
+
+    @abstractmethod
+    async def get_versions(self, tables: Iterable[str]) -> List[int]:
+        """Versiones actuales de las tablas, en el mismo orden"""
+        pass
+
+    @abstractmethod
+    async def bump(self, tables: Iterable[str]) -> None:
+        """Incrementar la versión de las tablas modificadas"""
+        pass
+
+
+class MemoryVersionStore(VersionStore):
+    """Contadores del proceso: válidos solo con un worker"""
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._versions: Dict[str, int] = {}
+
+    async def get_versions(self, tables: Iterable[str]) -> List[int]:
+        return [self._versions.get(table, 0) for table in tables]
+
+    async def bump(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+
+
+class RedisVersionStore(VersionStore):
+    """Contadores compartidos entre workers (INCR / MGET en una ida y vuelta)"""
+
+    shared = True
+
+    def __init__(self, url: str = "", client: Any = None, prefix: str = "justtime:ver:"):
+        if client is None:
+            import redis.asyncio as redis_asyncio
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        # Los contadores persisten en Redis: el epoch es fijo
+        self.epoch = "r"
+
+    async def get_versions(self, tables: Iterable[str]) -> List[int]:
+        tables = list(tables)
+        values = await self.client.mget([self.prefix + t for t in tables])
+        return [int(v) if v is not None else 0 for v in values]
+
+    async def bump(self, tables: Iterable[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for table in tables:
+                pipe.incr(self.prefix + table)
+            await pipe.execute()
+
+
+_store: Optional[VersionStore] = None
+
+
+def get_version_store() -> VersionStore:
+    """Store global: Redis si el cache es Redis, si no en memoria"""
+    global _store
+    if _store is None:
+        if CACHE_CONFIG["backend"].lower() == "redis":
+            _store = RedisVersionStore(
+                CACHE_CONFIG["url"],
+                prefix=f"{CACHE_CONFIG['namespace']}:v{CACHE_CONFIG['version']}:ver:"
+            )
+        else:
+            _store = MemoryVersionStore()
+    return _store
+
+
+def set_version_store(store: Optional[VersionStore]) -> None:
+    """Reemplazar el store global (pruebas con fakeredis)"""
+    global _store
+    _store = store
+
+
+def multiple_workers() -> bool:
+    """True si el servidor corre con más de un proceso (WEB_CONCURRENCY)"""
+    try:
+        return int(os.environ.get("WEB_CONCURRENCY", "1")) > 1
+    except ValueError:
+        return False
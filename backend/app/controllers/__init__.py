@@ -11,6 +11,7 @@ from .template_controller import TemplateController
 from .pending_activity_controller import PendingActivityController
 from .configuracion_controller import ConfiguracionController
 from .employee_controller import EmpleadoController
+from .sync_controller import SyncController
 
 __all__ = [
     "BaseController",
@@ -22,6 +23,7 @@ __all__ = [
     "TemplateController", # ⬅️ AGREGAR ESTA LÍNEA
     "PendingActivityController",
     "ConfiguracionController",
-    "EmpleadoController"
+    "EmpleadoController",
+    "SyncController"
 ]
 
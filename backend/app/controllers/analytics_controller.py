@@ -2,6 +2,7 @@
 # Descripción: Controlador de analytics con lógica de análisis y reportes
 # Funcionalidad: Análisis estadístico de proyectos, categorías, estados y contactos
 
+import logging
 from typing import Dict, Any, List, Optional
 from sqlalchemy import func, case
 from app.controllers.base_controller import BaseController
@@ -11,6 +12,9 @@ from app.models.contacto import Contacto
 from app.models.tarea import Tarea
 
 
+logger = logging.getLogger(__name__)
+
+
 class AnalyticsController(BaseController):
     """
     Controlador de Analytics/Reportes
@@ -59,7 +63,7 @@ class AnalyticsController(BaseController):
             }
             
         except Exception as e:
-            print(f"Error en get_casos_por_categoria: {e}")
+            logger.error("Error en get_casos_por_categoria: %s", e)
             return {
                 "success": False,
                 "data": [],
@@ -111,7 +115,7 @@ class AnalyticsController(BaseController):
             }
             
         except Exception as e:
-            print(f"Error en get_casos_por_estado: {e}")
+            logger.error("Error en get_casos_por_estado: %s", e)
             return {
                 "success": False,
                 "data": [],
@@ -192,7 +196,7 @@ class AnalyticsController(BaseController):
             }
             
         except Exception as e:
-            print(f"Error en get_casos_por_contacto: {e}")
+            logger.error("Error en get_casos_por_contacto: %s", e)
             return {
                 "success": False,
                 "data": [],
@@ -257,7 +261,7 @@ class AnalyticsController(BaseController):
             }
             
         except Exception as e:
-            print(f"Error en get_casos_por_contacto_especifico: {e}")
+            logger.error("Error en get_casos_por_contacto_especifico: %s", e)
             return {
                 "success": False,
                 "data": None,
@@ -336,7 +340,7 @@ class AnalyticsController(BaseController):
             }
             
         except Exception as e:
-            print(f"Error en get_resumen_completo: {e}")
+            logger.error("Error en get_resumen_completo: %s", e)
             return {
                 "success": False,
                 "data": None,
@@ -3,13 +3,17 @@
 # Funcionalidad: Manejo completo de autenticación de usuarios
 # ✅ ACTUALIZADO: Flujo cambiado - Primero Empleado, luego Usuario (como Odoo)
 
+import logging
 from typing import Dict, Any, Optional
-from passlib.context import CryptContext
-from jose import JWTError, jwt
-from datetime import datetime, timedelta
 from app.controllers.base_controller import BaseController
 from app.factory import BaseRepository
-from app.config import JWT_CONFIG
+from app.models.configuracion import Configuracion
+from app.models.empleado import Empleado
+from app.models.usuario import Usuario
+from app.utils import security
+
+
+logger = logging.getLogger(__name__)
 
 
 class AuthController(BaseController):
@@ -25,7 +29,6 @@ class AuthController(BaseController):
     
     def __init__(self, repository: BaseRepository):
         super().__init__(repository)
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validar datos de usuario"""
@@ -37,35 +40,19 @@ class AuthController(BaseController):
     
     def hash_password(self, password: str) -> str:
         """Encriptar contraseña con bcrypt"""
-        return self.pwd_context.hash(password)
+        return security.hash_password(password)
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verificar contraseña contra hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return security.verify_password(plain_password, hashed_password)
     
     def create_access_token(self, data: dict) -> str:
         """Crear token JWT con expiración"""
-        to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(minutes=JWT_CONFIG["expire_minutes"])
-        to_encode.update({"exp": expire})
-        
-        return jwt.encode(
-            to_encode, 
-            JWT_CONFIG["secret_key"], 
-            algorithm=JWT_CONFIG["algorithm"]
-        )
+        return security.create_access_token(data)
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verificar y decodificar token JWT"""
-        try:
-            payload = jwt.decode(
-                token, 
-                JWT_CONFIG["secret_key"], 
-                algorithms=[JWT_CONFIG["algorithm"]]
-            )
-            return payload
-        except JWTError:
-            return None
+        return security.decode_access_token(token)
     
     def register_user(self, user_data: Dict[str, Any]) -> Any:
         """
@@ -106,7 +93,6 @@ class AuthController(BaseController):
             # ==========================================
             # 1. CREAR EMPLEADO PRIMERO (SIN USUARIO)
             # ==========================================
-            from app.models.empleado import Empleado
             empleado = Empleado(
                 nombre=validated_data["nombre"],
                 puesto="Sin asignar",           # Puesto por defecto
@@ -116,12 +102,10 @@ class AuthController(BaseController):
             )
             self.repository.db.add(empleado)
             self.repository.db.flush()  # Obtener el id_empleado generado
-            print(f"✅ [1/3] Empleado creado: {empleado.nombre} (ID: {empleado.id_empleado})")
             
             # ==========================================
             # 2. CREAR USUARIO CON REFERENCIA AL EMPLEADO
             # ==========================================
-            from app.models.usuario import Usuario
             user = Usuario(
                 nombre=validated_data["nombre"],
                 email=validated_data["email"],
@@ -131,12 +115,10 @@ class AuthController(BaseController):
             )
             self.repository.db.add(user)
             self.repository.db.flush()  # Obtener el id_usuario generado
-            print(f"✅ [2/3] Usuario creado: {user.email} (ID: {user.id_usuario}, empleado_id: {user.empleado_id_fk})")
             
             # ==========================================
             # 3. CREAR CONFIGURACIÓN CON ROL 'usuario'
             # ==========================================
-            from app.models.configuracion import Configuracion
             configuracion = Configuracion(
                 usuario_id_fk=user.id_usuario,  # Relación 1:1 con usuario
                 idioma='es',      # Español por defecto
@@ -144,7 +126,6 @@ class AuthController(BaseController):
                 tema='claro'      # Tema claro por defecto
             )
             self.repository.db.add(configuracion)
-            print(f"✅ [3/3] Configuración creada (rol: usuario, idioma: es, tema: claro)")
             
             # ==========================================
             # 4. CONFIRMAR TODOS LOS CAMBIOS EN LA BD
@@ -152,11 +133,7 @@ class AuthController(BaseController):
             self.repository.db.commit()
             self.repository.db.refresh(user)
             
-            print(f"🎉 Registro completo exitoso:")
-            print(f"   • Empleado ID: {empleado.id_empleado}")
-            print(f"   • Usuario: {user.email}")
-            print(f"   • Relación: usuario.empleado_id_fk = {user.empleado_id_fk}")
-            print(f"   • Configuración: Creada")
+            logger.info("Usuario registrado", extra={"usuario_id": user.id_usuario, "empleado_id": user.empleado_id_fk})
             
             return user
             
@@ -166,7 +143,7 @@ class AuthController(BaseController):
         except Exception as e:
             # Revertir TODOS los cambios si algo falla
             self.repository.db.rollback()
-            print(f"❌ Error en register_user: {e}")
+            logger.error("Error en register_user: %s", e)
             raise ValueError(f"Error al registrar usuario: {str(e)}")
     
     def authenticate_user(self, email: str, password: str) -> Optional[Any]:
@@ -186,7 +163,7 @@ class AuthController(BaseController):
                 return user
             return None
         except Exception as e:
-            print(f"Error en authenticate_user: {e}")
+            logger.error("Error en authenticate_user: %s", e)
             return None
     
     def get_user_by_email(self, email: str) -> Optional[Any]:
@@ -200,12 +177,11 @@ class AuthController(BaseController):
             Usuario si existe, None en caso contrario
         """
         try:
-            from app.models.usuario import Usuario
             return self.repository.db.query(Usuario).filter(
                 Usuario.email == email
             ).first()
         except Exception as e:
-            print(f"Error en get_user_by_email: {e}")
+            logger.error("Error en get_user_by_email: %s", e)
             return None
     
     def login(self, email: str, password: str) -> Dict[str, Any]:
@@ -233,7 +209,6 @@ class AuthController(BaseController):
                 raise ValueError("Usuario inactivo. Contacte al administrador.")
             
             # Obtener configuración del usuario para incluir el rol
-            from app.models.configuracion import Configuracion
             configuracion = self.repository.db.query(Configuracion).filter(
                 Configuracion.usuario_id_fk == user.id_usuario
             ).first()
@@ -265,5 +240,5 @@ class AuthController(BaseController):
             # Re-lanzar errores de validación
             raise
         except Exception as e:
-            print(f"Error en login: {e}")
+            logger.error("Error en login: %s", e)
             raise ValueError("Error al procesar el login")
\ No newline at end of file
@@ -3,9 +3,11 @@
 # Funcionalidad: Base común para todos los controladores del sistema
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.factory import BaseRepository
+from app.observability.tracing import instrument_methods
 
 
 class BaseController(ABC):
@@ -14,6 +16,21 @@ class BaseController(ABC):
     Implementa patrón MVC como controlador base.
     """
     
+    # Lectura por proyección (modo lite): nombre de campo -> columna SQL
+    PROJECTION_FIELDS: Dict[str, Any] = {}
+    # Joins necesarios para campos de otras tablas: campo -> (modelo, condición ON)
+    PROJECTION_JOINS: Dict[str, Tuple[Any, Any]] = {}
+    # Campos por defecto del modo lite (los que muestra la grilla)
+    LITE_FIELDS: List[str] = []
+    # Métodos públicos sin span propio (auxiliares baratos, sin E/S)
+    UNTRACED = frozenset({"validate_data", "resolve_fields", "build_projection"})
+    
+    def __init_subclass__(cls, **kwargs):
+        # Cada método público de un controlador es un span "<Controlador>.<método>"
+        # cuando el tracing está activo (ver app/observability/tracing.py)
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls, cls.UNTRACED)
+    
     def __init__(self, repository: BaseRepository):
         self.repository = repository
     
@@ -37,7 +54,54 @@ class BaseController(ABC):
         """Eliminar registro"""
         return self.repository.delete(id)
     
+    def resolve_fields(self, fields: Optional[str] = None) -> List[str]:
+        """
+        Resolver el parámetro fields= (lista separada por comas) contra los
+        campos proyectables. Sin fields se usan los campos LITE_FIELDS.
+        
+        Raises:
+            ValueError: Si se pide un campo que no existe
+        """
+        if not fields:
+            return list(self.LITE_FIELDS)
+        
+        requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        invalid = [f for f in requested if f not in self.PROJECTION_FIELDS]
+        if invalid or not requested:
+            raise ValueError(
+                f"Campos no válidos: {', '.join(invalid) or fields}. "
+                f"Disponibles: {', '.join(self.PROJECTION_FIELDS)}"
+            )
+        return requested
+    
+    def build_projection(self, field_names: List[str]):
+        """
+        Construir SELECT solo de las columnas pedidas, con los outer joins
+        que requieran los campos de otras tablas.
+        """
+        stmt = select(
+            *[self.PROJECTION_FIELDS[name].label(name) for name in field_names]
+        ).select_from(self.repository.model)
+        
+        joined = set()
+        for name in field_names:
+            join = self.PROJECTION_JOINS.get(name)
+            if join and join[0] not in joined:
+                stmt = stmt.outerjoin(*join)
+                joined.add(join[0])
+        return stmt
+    
+    def fetch_projection(self, stmt, field_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Ejecutar proyección y serializar las tuplas Row directamente,
+        sin hidratar entidades ORM (sin identity map ni change tracking).
+        """
+        return [dict(zip(field_names, row)) for row in self.repository.db.execute(stmt)]
+    
     @abstractmethod
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validar datos específicos de cada entidad"""
-        pass
\ No newline at end of file
+        pass
+
+
+instrument_methods(BaseController, BaseController.UNTRACED)
@@ -2,10 +2,14 @@
 # Descripción: Controlador de configuraciones - Ajustes de usuario
 # Funcionalidad: CRUD de configuraciones con validación de restricciones
 
+import logging
 from typing import Dict, Any, Optional
 from app.controllers.base_controller import BaseController
 
 
+logger = logging.getLogger(__name__)
+
+
 class ConfiguracionController(BaseController):
     """
     Controlador de configuraciones de usuario.
@@ -48,7 +52,7 @@ class ConfiguracionController(BaseController):
                 "tema": config.tema
             }
         except Exception as e:
-            print(f"Error en _config_to_dict: {e}")
+            logger.error("Error en _config_to_dict: %s", e)
             return {
                 "id_configuracion": getattr(config, 'id_configuracion', None),
                 "usuario_id_fk": getattr(config, 'usuario_id_fk', None),
@@ -66,7 +70,7 @@ class ConfiguracionController(BaseController):
             
             return self._config_to_dict(config)
         except Exception as e:
-            print(f"Error en get_by_usuario: {e}")
+            logger.error("Error en get_by_usuario: %s", e)
             return None
     
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,7 +85,7 @@ class ConfiguracionController(BaseController):
             config = self.repository.create(validated_data)
             return self._config_to_dict(config)
         except Exception as e:
-            print(f"Error en create config: {e}")
+            logger.error("Error en create config: %s", e)
             raise e
     
     def get_by_id(self, config_id: int) -> Optional[Dict[str, Any]]:
@@ -90,7 +94,7 @@ class ConfiguracionController(BaseController):
             config = self.repository.get_by_id(config_id)
             return self._config_to_dict(config)
         except Exception as e:
-            print(f"Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             return None
     
     def update(self, config_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -100,7 +104,7 @@ class ConfiguracionController(BaseController):
             updated_config = self.repository.update(config_id, validated_data)
             return self._config_to_dict(updated_config)
         except Exception as e:
-            print(f"Error en update config: {e}")
+            logger.error("Error en update config: %s", e)
             raise e
     
     def update_by_usuario(self, usuario_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -125,7 +129,7 @@ class ConfiguracionController(BaseController):
             return self._config_to_dict(config)
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en update_by_usuario: {e}")
+            logger.error("Error en update_by_usuario: %s", e)
             raise e
     
     def delete(self, config_id: int) -> bool:
@@ -133,7 +137,7 @@ class ConfiguracionController(BaseController):
         try:
             return self.repository.delete(config_id)
         except Exception as e:
-            print(f"Error en delete config: {e}")
+            logger.error("Error en delete config: %s", e)
             return False
     
     def delete_by_usuario(self, usuario_id: int) -> bool:
@@ -150,5 +154,5 @@ class ConfiguracionController(BaseController):
             return False
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en delete_by_usuario: {e}")
+            logger.error("Error en delete_by_usuario: %s", e)
             return False
\ No newline at end of file
@@ -1,11 +1,28 @@
 # Archivo 25/43: app/controllers/contact_controller.py
-from typing import List, Dict, Any
+import logging
+from typing import List, Dict, Any, Optional
 from .base_controller import BaseController
+from app.models.contacto import Contacto
+
+
+logger = logging.getLogger(__name__)
 
 
 class ContactController(BaseController):
     """Controlador para gestión de contactos"""
     
+    # Lectura por proyección para listados (ver BaseController.build_projection)
+    PROJECTION_FIELDS = {
+        "id_contacto": Contacto.id_contacto,
+        "nombre": Contacto.nombre,
+        "tipo": Contacto.tipo,
+        "telefono": Contacto.telefono,
+        "email": Contacto.email,
+        "direccion": Contacto.direccion,
+        "activo": Contacto.activo
+    }
+    LITE_FIELDS = ["id_contacto", "nombre", "tipo", "telefono", "email", "activo"]
+    
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validar datos específicos de contactos"""
         required_fields = ['nombre', 'tipo']
@@ -43,7 +60,7 @@ class ContactController(BaseController):
             ).all()
             return [self._contact_to_dict(contact) for contact in contacts]
         except Exception as e:
-            print(f"Error en get_by_type: {e}")
+            logger.error("Error en get_by_type: %s", e)
             return []
     
     def search_by_name(self, nombre: str) -> List[Dict[str, Any]]:
@@ -53,7 +70,7 @@ class ContactController(BaseController):
             filtered = [c for c in all_contacts if nombre.lower() in c.nombre.lower()]
             return [self._contact_to_dict(contact) for contact in filtered]
         except Exception as e:
-            print(f"Error en search_by_name: {e}")
+            logger.error("Error en search_by_name: %s", e)
             return []
     
     def get_contact_by_id(self, contact_id: int) -> Dict[str, Any]:
@@ -62,16 +79,33 @@ class ContactController(BaseController):
             contact = self.repository.get_by_id(contact_id)
             return self._contact_to_dict(contact)
         except Exception as e:
-            print(f"Error en get_contact_by_id: {e}")
+            logger.error("Error en get_contact_by_id: %s", e)
             return None
     
     def get_all_contacts(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
         """Obtener todos los contactos como diccionarios"""
         try:
-            contacts = self.repository.get_all(skip=skip, limit=limit)
+            # Orden por clave primaria: paginación estable (PostgreSQL no garantiza orden sin ORDER BY)
+            contacts = self.repository.db.query(Contacto).order_by(Contacto.id_contacto).offset(skip).limit(limit).all()
             return [self._contact_to_dict(contact) for contact in contacts]
         except Exception as e:
-            print(f"Error en get_all_contacts: {e}")
+            logger.error("Error en get_all_contacts: %s", e)
+            return []
+    
+    def get_all_contacts_lite(self, field_names: List[str], skip: int = 0, limit: int = 100,
+                              tipo: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Obtener contactos por proyección de columnas (sin hidratar objetos ORM)"""
+        try:
+            stmt = self.build_projection(field_names)
+            
+            if tipo:
+                stmt = stmt.where(Contacto.tipo == tipo)
+            
+            # Mismo orden que get_all_contacts: la misma página con y sin ?fields=
+            stmt = stmt.order_by(Contacto.id_contacto).offset(skip).limit(limit)
+            return self.fetch_projection(stmt, field_names)
+        except Exception as e:
+            logger.error("Error en get_all_contacts_lite: %s", e)
             return []
     
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,7 +115,7 @@ class ContactController(BaseController):
             contact = self.repository.create(validated_data)
             return self._contact_to_dict(contact)
         except Exception as e:
-            print(f"Error en create contact: {e}")
+            logger.error("Error en create contact: %s", e)
             raise e
     
     def update_contact(self, contact_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,5 +124,5 @@ class ContactController(BaseController):
             contact = self.repository.update(contact_id, data)
             return self._contact_to_dict(contact)
         except Exception as e:
-            print(f"Error en update_contact: {e}")
+            logger.error("Error en update_contact: %s", e)
             return None
\ No newline at end of file
@@ -2,14 +2,19 @@
 # Descripción: Controlador para gestión de documentos
 # Funcionalidad: Lógica de negocio para CRUD de documentos con manejo de archivos
 
+import logging
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 from app.controllers.base_controller import BaseController
 from app.services.file_service import FileService
+from app.models.documento import Documento
+from app.models.proyecto import Proyecto
 from fastapi import UploadFile, HTTPException
 import os
-from datetime import datetime
+
+
+logger = logging.getLogger(__name__)
 
 
 class DocumentController(BaseController):
@@ -41,6 +46,25 @@ class DocumentController(BaseController):
         'archive': 50    # 50MB para archivos comprimidos
     }
     
+    # Lectura por proyección para listados (ver BaseController.build_projection)
+    PROJECTION_FIELDS = {
+        'id_documento': Documento.id_documento,
+        'nombre_archivo': Documento.nombre_archivo,
+        'ruta_archivo': Documento.ruta_archivo,
+        'tipo_archivo': Documento.tipo_archivo,
+        'proyecto_id_fk': Documento.proyecto_id_fk,
+        'subido_por_fk': Documento.subido_por_fk,
+        'fecha_subida': Documento.fecha_subida,
+        'proyecto_nombre': Proyecto.nombre
+    }
+    PROJECTION_JOINS = {
+        'proyecto_nombre': (Proyecto, Documento.proyecto_id_fk == Proyecto.id_proyecto)
+    }
+    LITE_FIELDS = [
+        'id_documento', 'nombre_archivo', 'tipo_archivo',
+        'proyecto_id_fk', 'subido_por_fk', 'fecha_subida'
+    ]
+    
     def __init__(self, repository, file_service: FileService = None):
         super().__init__(repository)
         self.file_service = file_service or FileService()
@@ -188,7 +212,7 @@ class DocumentController(BaseController):
             'tipo_archivo': document.tipo_archivo,
             'proyecto_id_fk': document.proyecto_id_fk,
             'subido_por_fk': document.subido_por_fk,
-            'fecha_subida': document.fecha_subida.isoformat() if document.fecha_subida else None
+            'fecha_subida': document.fecha_subida
         }
     
     def get_all_documents(
@@ -222,7 +246,37 @@ class DocumentController(BaseController):
             return [self._document_to_dict(d) for d in documents]
             
         except Exception as e:
-            print(f"Error en get_all_documents: {e}")
+            logger.error("Error en get_all_documents: %s", e)
+            return []
+    
+    def get_all_documents_lite(
+        self,
+        field_names: List[str],
+        skip: int = 0,
+        limit: int = 100,
+        proyecto_id: Optional[int] = None,
+        tipo_archivo: Optional[str] = None,
+        usuario_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Obtener documentos por proyección de columnas (sin hidratar objetos ORM)"""
+        try:
+            stmt = self.build_projection(field_names)
+            
+            if proyecto_id:
+                stmt = stmt.where(Documento.proyecto_id_fk == proyecto_id)
+            
+            if tipo_archivo:
+                if not tipo_archivo.startswith('.'):
+                    tipo_archivo = f'.{tipo_archivo}'
+                stmt = stmt.where(Documento.tipo_archivo == tipo_archivo.lower())
+            
+            if usuario_id:
+                stmt = stmt.where(Documento.subido_por_fk == usuario_id)
+            
+            stmt = stmt.order_by(Documento.fecha_subida.desc()).offset(skip).limit(limit)
+            return self.fetch_projection(stmt, field_names)
+        except Exception as e:
+            logger.error("Error en get_all_documents_lite: %s", e)
             return []
     
     def get_document_by_id(self, document_id: int) -> Optional[Dict[str, Any]]:
@@ -233,7 +287,7 @@ class DocumentController(BaseController):
             ).first()
             return self._document_to_dict(document)
         except Exception as e:
-            print(f"Error en get_document_by_id: {e}")
+            logger.error("Error en get_document_by_id: %s", e)
             return None
     
     def get_by_project(self, proyecto_id: int) -> List[Dict[str, Any]]:
@@ -244,7 +298,7 @@ class DocumentController(BaseController):
             ).order_by(self.repository.model.fecha_subida.desc()).all()
             return [self._document_to_dict(d) for d in documents]
         except Exception as e:
-            print(f"Error en get_by_project: {e}")
+            logger.error("Error en get_by_project: %s", e)
             return []
     
     def get_by_type(self, tipo_archivo: str) -> List[Dict[str, Any]]:
@@ -258,7 +312,7 @@ class DocumentController(BaseController):
             ).order_by(self.repository.model.fecha_subida.desc()).all()
             return [self._document_to_dict(d) for d in documents]
         except Exception as e:
-            print(f"Error en get_by_type: {e}")
+            logger.error("Error en get_by_type: %s", e)
             return []
     
     def update_document(
@@ -287,7 +341,7 @@ class DocumentController(BaseController):
             return self._document_to_dict(document)
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en update_document: {e}")
+            logger.error("Error en update_document: %s", e)
             return None
     
     def delete_document(self, document_id: int, delete_file: bool = True) -> bool:
@@ -319,7 +373,7 @@ class DocumentController(BaseController):
             return False
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en delete_document: {e}")
+            logger.error("Error en delete_document: %s", e)
             return False
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -354,7 +408,7 @@ class DocumentController(BaseController):
                 'por_tipo': por_tipo
             }
         except Exception as e:
-            print(f"Error en get_statistics: {e}")
+            logger.error("Error en get_statistics: %s", e)
             return {
                 'total': 0,
                 'con_proyecto': 0,
@@ -371,5 +425,5 @@ class DocumentController(BaseController):
             
             return [self._document_to_dict(d) for d in documents]
         except Exception as e:
-            print(f"Error en search_documents: {e}")
+            logger.error("Error en search_documents: %s", e)
             return []
\ No newline at end of file
@@ -2,13 +2,17 @@
 # Descripción: Controlador de empleados - Gestión de personal
 # Funcionalidad: CRUD de empleados con vinculación opcional a usuarios
 
+import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from sqlalchemy.orm import joinedload
 from app.controllers.base_controller import BaseController
 from app.factory import BaseRepository
-from passlib.context import CryptContext
+from app.models.configuracion import Configuracion
+from app.models.usuario import Usuario
+from app.utils.security import hash_password
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+logger = logging.getLogger(__name__)
 
 
 class EmpleadoController(BaseController):
@@ -49,14 +53,8 @@ class EmpleadoController(BaseController):
                 "activo": empleado.activo
             }
             
-            # Manejar fecha_ingreso
-            if hasattr(empleado, 'fecha_ingreso') and empleado.fecha_ingreso:
-                if isinstance(empleado.fecha_ingreso, datetime):
-                    empleado_dict["fecha_ingreso"] = empleado.fecha_ingreso.isoformat()
-                else:
-                    empleado_dict["fecha_ingreso"] = empleado.fecha_ingreso
-            else:
-                empleado_dict["fecha_ingreso"] = None
+            # Las fechas se dejan como date: las serializa la respuesta JSON
+            empleado_dict["fecha_ingreso"] = getattr(empleado, 'fecha_ingreso', None)
             
             # Manejar relación con Usuario
             empleado_dict["tiene_usuario"] = False
@@ -74,12 +72,12 @@ class EmpleadoController(BaseController):
                     if hasattr(empleado.usuario, 'configuracion') and empleado.usuario.configuracion:
                         empleado_dict["rol"] = empleado.usuario.configuracion.rol
                 except Exception as e:
-                    print(f"Error obteniendo datos de usuario: {e}")
+                    logger.error("Error obteniendo datos de usuario: %s", e)
             
             return empleado_dict
             
         except Exception as e:
-            print(f"Error en _empleado_to_dict: {e}")
+            logger.error("Error en _empleado_to_dict: %s", e)
             return {
                 "id_empleado": getattr(empleado, 'id_empleado', None),
                 "nombre": getattr(empleado, 'nombre', 'Error al cargar'),
@@ -113,12 +111,8 @@ class EmpleadoController(BaseController):
             empleado_validado = self.validate_data(empleado_data)
             empleado = self.repository.create(empleado_validado)
             
-            # 2. Importar modelos necesarios
-            from app.models.usuario import Usuario
-            from app.models.configuracion import Configuracion
-            
-            # 3. Crear usuario con empleado_id_fk
-            password_hash = pwd_context.hash(usuario_data["password"])
+            # 2. Crear usuario con empleado_id_fk
+            password_hash = hash_password(usuario_data["password"])
             usuario = Usuario(
                 nombre=usuario_data.get("nombre", empleado.nombre),
                 email=usuario_data["email"],
@@ -129,7 +123,7 @@ class EmpleadoController(BaseController):
             self.repository.db.add(usuario)
             self.repository.db.flush()  # Para obtener el id_usuario
             
-            # 4. Crear configuración con el rol
+            # 3. Crear configuración con el rol
             configuracion = Configuracion(
                 usuario_id_fk=usuario.id_usuario,
                 rol=rol,
@@ -138,7 +132,7 @@ class EmpleadoController(BaseController):
             )
             self.repository.db.add(configuracion)
             
-            # 5. Commit final
+            # 4. Commit final
             self.repository.db.commit()
             self.repository.db.refresh(empleado)
             
@@ -146,7 +140,7 @@ class EmpleadoController(BaseController):
             
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en create_empleado_con_usuario: {e}")
+            logger.error("Error en create_empleado_con_usuario: %s", e)
             raise e
     
     def create_empleado_sin_usuario(self, empleado_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -164,7 +158,7 @@ class EmpleadoController(BaseController):
             empleado = self.repository.create(empleado_validado)
             return self._empleado_to_dict(empleado)
         except Exception as e:
-            print(f"Error en create_empleado_sin_usuario: {e}")
+            logger.error("Error en create_empleado_sin_usuario: %s", e)
             raise e
     
     def get_all_empleados(self, skip: int = 0, limit: int = 100, 
@@ -181,9 +175,6 @@ class EmpleadoController(BaseController):
             Lista de diccionarios con empleados
         """
         try:
-            from sqlalchemy.orm import joinedload
-            from app.models.usuario import Usuario
-            
             query = self.repository.db.query(self.repository.model).options(
                 joinedload(self.repository.model.usuario).joinedload(Usuario.configuracion)
             )
@@ -194,9 +185,7 @@ class EmpleadoController(BaseController):
             empleados = query.offset(skip).limit(limit).all()
             return [self._empleado_to_dict(emp) for emp in empleados]
         except Exception as e:
-            print(f"Error en get_all_empleados: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error en get_all_empleados: %s", e)
             return []
     
     def get_by_id(self, empleado_id: int) -> Optional[Dict[str, Any]]:
@@ -205,7 +194,7 @@ class EmpleadoController(BaseController):
             empleado = self.repository.get_by_id(empleado_id)
             return self._empleado_to_dict(empleado)
         except Exception as e:
-            print(f"Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             return None
     
     def update(self, empleado_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -214,7 +203,7 @@ class EmpleadoController(BaseController):
             updated_empleado = self.repository.update(empleado_id, data)
             return self._empleado_to_dict(updated_empleado)
         except Exception as e:
-            print(f"Error en update empleado: {e}")
+            logger.error("Error en update empleado: %s", e)
             raise e
     
     def delete(self, empleado_id: int) -> bool:
@@ -238,7 +227,7 @@ class EmpleadoController(BaseController):
             return True
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en delete empleado: {e}")
+            logger.error("Error en delete empleado: %s", e)
             return False
     
     def vincular_usuario_existente(self, empleado_id: int, usuario_id: int) -> Optional[Dict[str, Any]]:
@@ -253,8 +242,6 @@ class EmpleadoController(BaseController):
             Diccionario con el empleado actualizado
         """
         try:
-            from app.models.usuario import Usuario
-            
             # Verificar que el empleado existe
             empleado = self.repository.get_by_id(empleado_id)
             if not empleado:
@@ -279,5 +266,5 @@ class EmpleadoController(BaseController):
             return self._empleado_to_dict(empleado)
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en vincular_usuario_existente: {e}")
+            logger.error("Error en vincular_usuario_existente: %s", e)
             raise e
\ No newline at end of file
@@ -2,10 +2,23 @@
 # Descripción: Controlador de actividades pendientes - Sistema de recordatorios
 # Funcionalidad: CRUD de actividades con estados completada/pendiente
 
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import joinedload
 from app.controllers.base_controller import BaseController
 from app.factory import BaseRepository
+from app.models.actividad_pendiente import ActividadPendiente
+from app.models.proyecto import Proyecto
+from app.models.usuario import Usuario
+
+
+logger = logging.getLogger(__name__)
+
+
+# _activity_to_dict lee usuario.nombre y proyecto.nombre: ambos en el mismo SELECT (JOIN)
+_WITH_RELACIONES = (joinedload(ActividadPendiente.usuario), joinedload(ActividadPendiente.proyecto))
 
 
 class PendingActivityController(BaseController):
@@ -14,6 +27,27 @@ class PendingActivityController(BaseController):
     Maneja recordatorios y actividades por completar.
     """
     
+    # Lectura por proyección para listados (ver BaseController.build_projection)
+    PROJECTION_FIELDS = {
+        "id_actividad_pendiente": ActividadPendiente.id_actividad_pendiente,
+        "descripcion": ActividadPendiente.descripcion,
+        "completada": ActividadPendiente.completada,
+        "prioridad": ActividadPendiente.prioridad,
+        "fecha_vencimiento": ActividadPendiente.fecha_vencimiento,
+        "usuario_id_fk": ActividadPendiente.usuario_id_fk,
+        "proyecto_id_fk": ActividadPendiente.proyecto_id_fk,
+        "usuario_nombre": Usuario.nombre,
+        "proyecto_nombre": Proyecto.nombre
+    }
+    PROJECTION_JOINS = {
+        "usuario_nombre": (Usuario, ActividadPendiente.usuario_id_fk == Usuario.id_usuario),
+        "proyecto_nombre": (Proyecto, ActividadPendiente.proyecto_id_fk == Proyecto.id_proyecto)
+    }
+    LITE_FIELDS = [
+        "id_actividad_pendiente", "descripcion", "completada", "prioridad",
+        "fecha_vencimiento", "usuario_id_fk", "proyecto_id_fk"
+    ]
+    
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validar datos de actividad pendiente"""
         required_fields = ["descripcion", "usuario_id_fk"]
@@ -52,14 +86,8 @@ class PendingActivityController(BaseController):
                 "proyecto_id_fk": activity.proyecto_id_fk
             }
             
-            # Manejar fecha_vencimiento (puede ser None)
-            if hasattr(activity, 'fecha_vencimiento') and activity.fecha_vencimiento:
-                if isinstance(activity.fecha_vencimiento, datetime):
-                    activity_dict["fecha_vencimiento"] = activity.fecha_vencimiento.isoformat()
-                else:
-                    activity_dict["fecha_vencimiento"] = activity.fecha_vencimiento
-            else:
-                activity_dict["fecha_vencimiento"] = None
+            # Las fechas se dejan como datetime: las serializa la respuesta JSON
+            activity_dict["fecha_vencimiento"] = getattr(activity, 'fecha_vencimiento', None)
             
             # Manejar relación con Usuario
             if hasattr(activity, 'usuario') and activity.usuario is not None:
@@ -82,7 +110,7 @@ class PendingActivityController(BaseController):
             return activity_dict
             
         except Exception as e:
-            print(f"Error en _activity_to_dict: {e}")
+            logger.error("Error en _activity_to_dict: %s", e)
             return {
                 "id_actividad_pendiente": getattr(activity, 'id_actividad_pendiente', None),
                 "descripcion": getattr(activity, 'descripcion', 'Error al cargar'),
@@ -98,100 +126,125 @@ class PendingActivityController(BaseController):
     def get_by_usuario(self, usuario_id: int) -> List[Dict[str, Any]]:
         """Obtener actividades de un usuario específico"""
         try:
-            activities = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.usuario_id_fk == usuario_id
-            ).all()
+            # lambda_stmt: la construcción y la cache key se calculan una sola vez
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(ActividadPendiente.usuario_id_fk == usuario_id)
+            )
+            activities = self.repository.db.execute(stmt).scalars().all()
             
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_by_usuario: {e}")
+            logger.error("Error en get_by_usuario: %s", e)
             return []
     
     def get_pendientes(self, usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Obtener actividades pendientes (no completadas)"""
         try:
-            query = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.completada == False
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(ActividadPendiente.completada == False)
             )
             
             if usuario_id:
-                query = query.filter(self.repository.model.usuario_id_fk == usuario_id)
+                stmt += lambda s: s.where(ActividadPendiente.usuario_id_fk == usuario_id)
             
-            activities = query.all()
+            activities = self.repository.db.execute(stmt).scalars().all()
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_pendientes: {e}")
+            logger.error("Error en get_pendientes: %s", e)
             return []
     
     def get_completadas(self, usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Obtener actividades completadas"""
         try:
-            query = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.completada == True
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(ActividadPendiente.completada == True)
             )
             
             if usuario_id:
-                query = query.filter(self.repository.model.usuario_id_fk == usuario_id)
+                stmt += lambda s: s.where(ActividadPendiente.usuario_id_fk == usuario_id)
             
-            activities = query.all()
+            activities = self.repository.db.execute(stmt).scalars().all()
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_completadas: {e}")
+            logger.error("Error en get_completadas: %s", e)
             return []
     
     def marcar_completada(self, activity_id: int, completada: bool = True) -> Optional[Dict[str, Any]]:
         """Marcar actividad como completada o pendiente"""
         try:
-            updated_activity = self.update(activity_id, {"completada": completada})
-            return self._activity_to_dict(updated_activity)
+            # update() ya retorna la actividad serializada
+            return self.update(activity_id, {"completada": completada})
         except Exception as e:
-            print(f"Error en marcar_completada: {e}")
+            logger.error("Error en marcar_completada: %s", e)
             return None
     
     def get_by_proyecto(self, proyecto_id: int) -> List[Dict[str, Any]]:
         """Obtener actividades de un proyecto específico"""
         try:
-            activities = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.proyecto_id_fk == proyecto_id
-            ).all()
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(ActividadPendiente.proyecto_id_fk == proyecto_id)
+            )
+            activities = self.repository.db.execute(stmt).scalars().all()
             
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_by_proyecto: {e}")
+            logger.error("Error en get_by_proyecto: %s", e)
             return []
     
     def get_by_prioridad(self, prioridad: str, usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Obtener actividades por prioridad"""
         try:
-            query = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.prioridad == prioridad
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(ActividadPendiente.prioridad == prioridad)
             )
             
             if usuario_id:
-                query = query.filter(self.repository.model.usuario_id_fk == usuario_id)
+                stmt += lambda s: s.where(ActividadPendiente.usuario_id_fk == usuario_id)
             
-            activities = query.all()
+            activities = self.repository.db.execute(stmt).scalars().all()
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_by_prioridad: {e}")
+            logger.error("Error en get_by_prioridad: %s", e)
             return []
     
-    def get_vencidas(self, usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_vencidas(self, usuario_id: Optional[int] = None, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Obtener actividades vencidas (no completadas y fecha pasada)"""
         try:
-            now = datetime.now()
-            query = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.completada == False,
-                self.repository.model.fecha_vencimiento < now
+            now = now or datetime.now()
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(
+                    ActividadPendiente.completada == False,
+                    ActividadPendiente.fecha_vencimiento < now
+                )
             )
             
             if usuario_id:
-                query = query.filter(self.repository.model.usuario_id_fk == usuario_id)
+                stmt += lambda s: s.where(ActividadPendiente.usuario_id_fk == usuario_id)
             
-            activities = query.all()
+            activities = self.repository.db.execute(stmt).scalars().all()
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_vencidas: {e}")
+            logger.error("Error en get_vencidas: %s", e)
+            return []
+    
+    def get_proximas(self, desde: datetime, hasta: datetime, usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Obtener actividades no completadas que vencen entre desde y hasta"""
+        try:
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES).where(
+                    ActividadPendiente.completada == False,
+                    ActividadPendiente.fecha_vencimiento >= desde,
+                    ActividadPendiente.fecha_vencimiento < hasta
+                ).order_by(ActividadPendiente.fecha_vencimiento)
+            )
+            
+            if usuario_id:
+                stmt += lambda s: s.where(ActividadPendiente.usuario_id_fk == usuario_id)
+            
+            activities = self.repository.db.execute(stmt).scalars().all()
+            return [self._activity_to_dict(activity) for activity in activities]
+        except Exception as e:
+            logger.error("Error en get_proximas: %s", e)
             return []
     
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -201,30 +254,58 @@ class PendingActivityController(BaseController):
             activity = self.repository.create(validated_data)
             return self._activity_to_dict(activity)
         except Exception as e:
-            print(f"Error en create activity: {e}")
+            logger.error("Error en create activity: %s", e)
             raise e
     
     def get_all_activities(self, skip: int = 0, limit: int = 100, completada: Optional[bool] = None) -> List[Dict[str, Any]]:
         """Obtener todas las actividades con filtros opcionales"""
         try:
-            query = self.repository.db.query(self.repository.model)
+            stmt = lambda_stmt(lambda: select(ActividadPendiente).options(*_WITH_RELACIONES))
             
             if completada is not None:
-                query = query.filter(self.repository.model.completada == completada)
+                stmt += lambda s: s.where(ActividadPendiente.completada == completada)
             
-            activities = query.offset(skip).limit(limit).all()
+            stmt += lambda s: s.order_by(ActividadPendiente.id_actividad_pendiente).offset(skip).limit(limit)
+            activities = self.repository.db.execute(stmt).scalars().all()
             return [self._activity_to_dict(activity) for activity in activities]
         except Exception as e:
-            print(f"Error en get_all_activities: {e}")
+            logger.error("Error en get_all_activities: %s", e)
+            return []
+    
+    def get_all_activities_lite(self, field_names: List[str], skip: int = 0, limit: int = 100,
+                                completada: Optional[bool] = None, usuario_id: Optional[int] = None,
+                                prioridad: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Obtener actividades por proyección de columnas (sin hidratar objetos ORM)"""
+        try:
+            stmt = self.build_projection(field_names)
+            
+            if completada is not None:
+                stmt = stmt.where(ActividadPendiente.completada == completada)
+            
+            if usuario_id:
+                stmt = stmt.where(ActividadPendiente.usuario_id_fk == usuario_id)
+            
+            if prioridad:
+                stmt = stmt.where(ActividadPendiente.prioridad == prioridad)
+            
+            # Mismo orden que get_all_activities: la misma página con y sin ?fields=
+            stmt = stmt.order_by(ActividadPendiente.id_actividad_pendiente).offset(skip).limit(limit)
+            return self.fetch_projection(stmt, field_names)
+        except Exception as e:
+            logger.error("Error en get_all_activities_lite: %s", e)
             return []
     
     def get_by_id(self, activity_id: int) -> Optional[Dict[str, Any]]:
         """Obtener actividad por ID como diccionario"""
         try:
-            activity = self.repository.get_by_id(activity_id)
+            stmt = lambda_stmt(
+                lambda: select(ActividadPendiente).options(*_WITH_RELACIONES)
+                .where(ActividadPendiente.id_actividad_pendiente == activity_id)
+            )
+            activity = self.repository.db.execute(stmt).scalar_one_or_none()
             return self._activity_to_dict(activity)
         except Exception as e:
-            print(f"Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             return None
     
     def update(self, activity_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -241,7 +322,7 @@ class PendingActivityController(BaseController):
             updated_activity = self.repository.update(activity_id, data)
             return self._activity_to_dict(updated_activity)
         except Exception as e:
-            print(f"Error en update activity: {e}")
+            logger.error("Error en update activity: %s", e)
             raise e
     
     def delete(self, activity_id: int) -> bool:
@@ -249,5 +330,5 @@ class PendingActivityController(BaseController):
         try:
             return self.repository.delete(activity_id)
         except Exception as e:
-            print(f"Error en delete activity: {e}")
+            logger.error("Error en delete activity: %s", e)
             return False
\ No newline at end of file
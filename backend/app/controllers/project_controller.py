@@ -2,10 +2,29 @@
 # Descripción: Controlador de proyectos con tareas_count agregado
 # Funcionalidad: CRUD de proyectos con categorías, estados y contador de tareas
 
+import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from sqlalchemy import func, select, lambda_stmt
+from sqlalchemy.orm import joinedload
 from app.controllers.base_controller import BaseController
 from app.factory import BaseRepository
+from app.models.proyecto import Proyecto
+from app.models.tarea import Tarea
+
+
+logger = logging.getLogger(__name__)
+
+
+# Listados: contacto y categoría en el mismo SELECT (JOIN) y el conteo de
+# tareas como subconsulta correlacionada, en lugar de 3 queries lazy por fila
+_TAREAS_COUNT = (
+    select(func.count(Tarea.id_tarea))
+    .where(Tarea.proyecto_id_fk == Proyecto.id_proyecto)
+    .correlate(Proyecto)
+    .scalar_subquery()
+    .label("tareas_count")
+)
+_LISTING_OPTIONS = (joinedload(Proyecto.contacto), joinedload(Proyecto.categoria))
 
 
 class ProjectController(BaseController):
@@ -29,11 +48,12 @@ class ProjectController(BaseController):
         
         return data
     
-    def _project_to_dict(self, project) -> Optional[Dict[str, Any]]:
+    def _project_to_dict(self, project, tareas_count: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Convertir objeto Project a diccionario para serialización.
         Maneja correctamente las relaciones con otros objetos SQLAlchemy.
-        INCLUYE contador de tareas asociadas.
+        INCLUYE contador de tareas asociadas: los listados lo pasan ya
+        calculado (_TAREAS_COUNT); si no, se cargan las tareas del proyecto.
         """
         if project is None:
             return None
@@ -49,16 +69,8 @@ class ProjectController(BaseController):
                 "categoria_id_fk": project.categoria_id_fk if hasattr(project, 'categoria_id_fk') else None
             }
             
-            # Manejar fecha_inicio (puede ser None)
-            if hasattr(project, 'fecha_inicio') and project.fecha_inicio:
-                if isinstance(project.fecha_inicio, datetime):
-                    project_dict["fecha_inicio"] = project.fecha_inicio.isoformat()
-                elif hasattr(project.fecha_inicio, 'isoformat'):
-                    project_dict["fecha_inicio"] = project.fecha_inicio.isoformat()
-                else:
-                    project_dict["fecha_inicio"] = str(project.fecha_inicio)
-            else:
-                project_dict["fecha_inicio"] = None
+            # Las fechas se dejan como date/datetime: las serializa la respuesta JSON
+            project_dict["fecha_inicio"] = getattr(project, 'fecha_inicio', None)
             
             # CRÍTICO: Manejar relación con Contacto
             # Si el proyecto tiene un contacto asociado (lazy loading), extraer solo el nombre
@@ -81,26 +93,26 @@ class ProjectController(BaseController):
                 project_dict["categoria_nombre"] = None
             
             # ✅ NUEVO: Agregar contador de tareas asociadas
-            if hasattr(project, 'tareas') and project.tareas is not None:
+            if tareas_count is not None:
+                project_dict["tareas_count"] = tareas_count
+            elif hasattr(project, 'tareas') and project.tareas is not None:
                 try:
                     project_dict["tareas_count"] = len(project.tareas)
                 except Exception as e:
-                    print(f"Error al contar tareas: {e}")
+                    logger.error("Error al contar tareas: %s", e)
                     project_dict["tareas_count"] = 0
             else:
                 project_dict["tareas_count"] = 0
             
             # Agregar fechas de auditoría si existen
-            if hasattr(project, 'fecha_creacion') and project.fecha_creacion:
-                if isinstance(project.fecha_creacion, datetime):
-                    project_dict["fecha_creacion"] = project.fecha_creacion.isoformat()
+            if getattr(project, 'fecha_creacion', None):
+                project_dict["fecha_creacion"] = project.fecha_creacion
             
             return project_dict
             
         except Exception as e:
             # Log del error para debugging
-            print(f"Error en _project_to_dict: {e}")
-            print(f"Project object: {project}")
+            logger.error("Error en _project_to_dict: %s (%r)", e, project)
             # Retornar diccionario mínimo en caso de error
             return {
                 "id_proyecto": getattr(project, 'id_proyecto', None),
@@ -115,40 +127,40 @@ class ProjectController(BaseController):
                 "tareas_count": 0
             }
     
+    def _fetch_projects(self, stmt) -> List[Dict[str, Any]]:
+        """Ejecutar un SELECT (Proyecto, tareas_count) y serializar las filas"""
+        rows = self.repository.db.execute(stmt).all()
+        return [self._project_to_dict(project, tareas_count) for project, tareas_count in rows]
+    
     def get_by_estado(self, estado: str) -> List[Dict[str, Any]]:
         """Obtener proyectos por estado"""
         try:
-            projects = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.estado == estado
-            ).all()
-            
-            return [self._project_to_dict(project) for project in projects]
+            # lambda_stmt: la construcción y la cache key se calculan una sola vez
+            stmt = lambda_stmt(lambda: select(Proyecto, _TAREAS_COUNT).options(*_LISTING_OPTIONS))
+            stmt += lambda s: s.where(Proyecto.estado == estado)
+            return self._fetch_projects(stmt)
         except Exception as e:
-            print(f"Error en get_by_estado: {e}")
+            logger.error("Error en get_by_estado: %s", e)
             return []
     
     def get_by_categoria(self, categoria_id: int) -> List[Dict[str, Any]]:
         """Obtener proyectos por categoría"""
         try:
-            projects = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.categoria_id_fk == categoria_id
-            ).all()
-            
-            return [self._project_to_dict(project) for project in projects]
+            stmt = lambda_stmt(lambda: select(Proyecto, _TAREAS_COUNT).options(*_LISTING_OPTIONS))
+            stmt += lambda s: s.where(Proyecto.categoria_id_fk == categoria_id)
+            return self._fetch_projects(stmt)
         except Exception as e:
-            print(f"Error en get_by_categoria: {e}")
+            logger.error("Error en get_by_categoria: %s", e)
             return []
     
     def get_by_contacto(self, contacto_id: int) -> List[Dict[str, Any]]:
         """Obtener proyectos de un contacto específico"""
         try:
-            projects = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.contacto_id_fk == contacto_id
-            ).all()
-            
-            return [self._project_to_dict(project) for project in projects]
+            stmt = lambda_stmt(lambda: select(Proyecto, _TAREAS_COUNT).options(*_LISTING_OPTIONS))
+            stmt += lambda s: s.where(Proyecto.contacto_id_fk == contacto_id)
+            return self._fetch_projects(stmt)
         except Exception as e:
-            print(f"Error en get_by_contacto: {e}")
+            logger.error("Error en get_by_contacto: %s", e)
             return []
     
     def get_activos(self) -> List[Dict[str, Any]]:
@@ -161,25 +173,23 @@ class ProjectController(BaseController):
             updated_project = self.update(project_id, {"estado": "finalizado"})
             return self._project_to_dict(updated_project)
         except Exception as e:
-            print(f"Error en finalizar_proyecto: {e}")
+            logger.error("Error en finalizar_proyecto: %s", e)
             return None
     
     def get_dashboard_stats(self) -> Dict[str, int]:
-        """Obtener estadísticas para dashboard"""
+        """Obtener estadísticas para dashboard (un solo GROUP BY por estado)"""
         try:
-            total = len(self.get_all_projects())
-            activos = len(self.get_by_estado("activo"))
-            pausados = len(self.get_by_estado("pausado"))
-            finalizados = len(self.get_by_estado("finalizado"))
+            stmt = lambda_stmt(lambda: select(Proyecto.estado, func.count(Proyecto.id_proyecto)).group_by(Proyecto.estado))
+            por_estado = dict(self.repository.db.execute(stmt).all())
             
             return {
-                "total": total,
-                "activos": activos,
-                "pausados": pausados,
-                "finalizados": finalizados
+                "total": sum(por_estado.values()),
+                "activos": por_estado.get("activo", 0),
+                "pausados": por_estado.get("pausado", 0),
+                "finalizados": por_estado.get("finalizado", 0)
             }
         except Exception as e:
-            print(f"Error en get_dashboard_stats: {e}")
+            logger.error("Error en get_dashboard_stats: %s", e)
             return {
                 "total": 0,
                 "activos": 0,
@@ -194,31 +204,36 @@ class ProjectController(BaseController):
             project = self.repository.create(validated_data)
             return self._project_to_dict(project)
         except Exception as e:
-            print(f"Error en create project: {e}")
+            logger.error("Error en create project: %s", e)
             raise e
     
-    def get_all_projects(self, skip: int = 0, limit: int = 100, estado: str = None) -> List[Dict[str, Any]]:
+    def get_all_projects(self, skip: int = 0, limit: int = 100, estado: str = None,
+                         categoria_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Obtener todos los proyectos como diccionarios con filtros opcionales"""
         try:
-            query = self.repository.db.query(self.repository.model)
+            stmt = lambda_stmt(lambda: select(Proyecto, _TAREAS_COUNT).options(*_LISTING_OPTIONS))
             
-            # Aplicar filtro de estado si se proporciona
+            # Aplicar filtros si se proporcionan
             if estado and estado != "":
-                query = query.filter(self.repository.model.estado == estado)
+                stmt += lambda s: s.where(Proyecto.estado == estado)
+            if categoria_id:
+                stmt += lambda s: s.where(Proyecto.categoria_id_fk == categoria_id)
             
-            projects = query.offset(skip).limit(limit).all()
-            return [self._project_to_dict(project) for project in projects]
+            stmt += lambda s: s.order_by(Proyecto.id_proyecto).offset(skip).limit(limit)
+            return self._fetch_projects(stmt)
         except Exception as e:
-            print(f"Error en get_all_projects: {e}")
+            logger.error("Error en get_all_projects: %s", e)
             return []
     
     def get_project_by_id(self, project_id: int) -> Optional[Dict[str, Any]]:
         """Obtener proyecto por ID como diccionario"""
         try:
-            project = self.repository.get_by_id(project_id)
-            return self._project_to_dict(project)
+            stmt = lambda_stmt(lambda: select(Proyecto, _TAREAS_COUNT).options(*_LISTING_OPTIONS))
+            stmt += lambda s: s.where(Proyecto.id_proyecto == project_id)
+            projects = self._fetch_projects(stmt)
+            return projects[0] if projects else None
         except Exception as e:
-            print(f"Error en get_project_by_id: {e}")
+            logger.error("Error en get_project_by_id: %s", e)
             return None
     
     def update(self, project_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -233,7 +248,7 @@ class ProjectController(BaseController):
             updated_project = self.repository.update(project_id, data)
             return self._project_to_dict(updated_project)
         except Exception as e:
-            print(f"Error en update project: {e}")
+            logger.error("Error en update project: %s", e)
             raise e
     
     def delete(self, project_id: int) -> bool:
@@ -241,5 +256,5 @@ class ProjectController(BaseController):
         try:
             return self.repository.delete(project_id)
         except Exception as e:
-            print(f"Error en delete project: {e}")
+            logger.error("Error en delete project: %s", e)
             return False
\ No newline at end of file
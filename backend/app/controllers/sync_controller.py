@@ -0,0 +1,196 @@
+# Archivo: app/controllers/sync_controller.py
+# Descripción: Controlador de sincronización incremental (delta sync)
+# Funcionalidad: Cambios y eliminaciones desde un token, paginados por keyset (versión, tabla, id)
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, func, or_, select
+
+from app.controllers.base_controller import BaseController
+from app.models.actividad_pendiente import ActividadPendiente
+from app.models.contacto import Contacto
+from app.models.documento import Documento
+from app.models.proyecto import Proyecto
+from app.models.sync import RegistroEliminado, SyncContador
+from app.models.tarea import Tarea
+
+
+logger = logging.getLogger(__name__)
+
+
+# Orden fijo: forma parte del token, no reordenar (solo agregar al final)
+SYNC_MODELS = [Proyecto, Contacto, Tarea, ActividadPendiente, Documento]
+SYNC_TABLES = [model.__table__.name for model in SYNC_MODELS]
+TOMBSTONE_INDEX = len(SYNC_MODELS)
+
+Cursor = Tuple[int, int, int]
+
+
+def parse_token(token: Optional[str]) -> Optional[Cursor]:
+    """
+    Token opaco "version.tabla.id": posición del último cambio entregado.
+
+    Raises:
+        ValueError: Si el token no tiene el formato esperado
+    """
+    if not token:
+        return None
+    try:
+        version, table_index, pk = (int(part) for part in token.split("."))
+    except ValueError:
+        raise ValueError(f"Token de sincronización inválido: {token}")
+    if version < 0 or not 0 <= table_index <= TOMBSTONE_INDEX:
+        raise ValueError(f"Token de sincronización inválido: {token}")
+    return version, table_index, pk
+
+
+def format_token(cursor: Cursor) -> str:
+    return ".".join(str(part) for part in cursor)
+
+
+class SyncController(BaseController):
+    """
+    Sincronización incremental para el store local del SPA.
+
+    Cada fila de las tablas sincronizables lleva la versión de la
+    transacción que la escribió; las filas eliminadas dejan una lápida con
+    la versión del borrado. Los cambios se entregan ordenados por
+    (versión, tabla, id) y el token es la posición del último entregado,
+    así un cliente que vuelve tras días offline avanza por páginas sin
+    repetir ni saltear filas.
+    """
+    
+    def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """La sincronización es solo lectura: no valida datos de entrada"""
+        return data
+    
+    @property
+    def db(self):
+        return self.repository.db
+    
+    def _contador(self) -> Tuple[int, int]:
+        row = self.db.execute(
+            select(SyncContador.version, SyncContador.purgado_hasta).where(SyncContador.id == 1)
+        ).first()
+        return (row.version, row.purgado_hasta) if row else (0, 0)
+    
+    @staticmethod
+    def _after_cursor(version_col, pk_col, index: int, cursor: Optional[Cursor]):
+        """Condición keyset: posiciones (versión, tabla, id) posteriores al cursor"""
+        if cursor is None:
+            return None
+        version, table_index, pk = cursor
+        if index < table_index:
+            return version_col > version
+        if index > table_index:
+            return version_col >= version
+        return or_(version_col > version, and_(version_col == version, pk_col > pk))
+    
+    def _changed_rows(self, cursor: Optional[Cursor], limit: int) -> List[Tuple[Cursor, Dict[str, Any]]]:
+        entries = []
+        for index, model in enumerate(SYNC_MODELS):
+            table = model.__table__
+            pk_col = list(table.primary_key.columns)[0]
+            stmt = select(table).order_by(table.c.version, pk_col).limit(limit + 1)
+            condition = self._after_cursor(table.c.version, pk_col, index, cursor)
+            if condition is not None:
+                stmt = stmt.where(condition)
+            for row in self.db.execute(stmt):
+                data = dict(row._mapping)
+                pk = data[pk_col.name]
+                entries.append(((data["version"], index, pk), {
+                    "tabla": table.name,
+                    "operacion": "upsert",
+                    "id": pk,
+                    "version": data["version"],
+                    "datos": data
+                }))
+        return entries
+    
+    def _deleted_rows(self, cursor: Optional[Cursor], limit: int) -> List[Tuple[Cursor, Dict[str, Any]]]:
+        stmt = (
+            select(RegistroEliminado.id_registro_eliminado, RegistroEliminado.tabla,
+                   RegistroEliminado.registro_id, RegistroEliminado.version)
+            .order_by(RegistroEliminado.version, RegistroEliminado.id_registro_eliminado)
+            .limit(limit + 1)
+        )
+        condition = self._after_cursor(
+            RegistroEliminado.version, RegistroEliminado.id_registro_eliminado, TOMBSTONE_INDEX, cursor
+        )
+        if condition is not None:
+            stmt = stmt.where(condition)
+        return [
+            ((row.version, TOMBSTONE_INDEX, row.id_registro_eliminado), {
+                "tabla": row.tabla,
+                "operacion": "delete",
+                "id": row.registro_id,
+                "version": row.version
+            })
+            for row in self.db.execute(stmt)
+        ]
+    
+    def get_changes(self, since: Optional[str] = None, limit: int = 500) -> Dict[str, Any]:
+        """
+        Cambios posteriores al token `since`.
+        
+        Sin token (o con un token anterior a las lápidas ya purgadas) se hace
+        una sincronización completa: todas las filas vivas, sin eliminados,
+        y reset=True para que el cliente descarte su store local.
+        Con has_more=True el cliente debe volver a pedir con el nuevo token.
+        
+        Raises:
+            ValueError: Si el token es inválido
+        """
+        cursor = parse_token(since)
+        current_version, purged_until = self._contador()
+        reset = cursor is None or cursor[0] < purged_until
+        if reset:
+            cursor = None
+        
+        # Cada tabla aporta a lo sumo limit+1 filas; el merge se queda con las primeras `limit`
+        entries = self._changed_rows(cursor, limit)
+        if cursor is not None:
+            entries += self._deleted_rows(cursor, limit)
+        entries.sort(key=lambda entry: entry[0])
+        page = entries[:limit]
+        
+        if page:
+            token = format_token(page[-1][0])
+        elif cursor is not None:
+            token = format_token(cursor)
+        else:
+            # Base vacía: el cliente queda al día con la versión actual
+            token = format_token((current_version, TOMBSTONE_INDEX, 0))
+        
+        return {
+            "token": token,
+            "reset": reset,
+            "has_more": len(entries) > limit,
+            "cambios": [change for _, change in page]
+        }
+    
+    def purge_tombstones(self, retention_days: int) -> int:
+        """
+        Eliminar lápidas más antiguas que la retención. Los clientes con un
+        token anterior a la última lápida purgada recibirán reset=True.
+        Retorna la cantidad de lápidas eliminadas.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        max_version = self.db.execute(
+            select(func.max(RegistroEliminado.version)).where(RegistroEliminado.fecha_eliminacion < cutoff)
+        ).scalar()
+        if max_version is None:
+            return 0
+        try:
+            result = self.db.execute(delete(RegistroEliminado).where(RegistroEliminado.version <= max_version))
+            contador = self.db.get(SyncContador, 1)
+            if contador is not None:
+                contador.purgado_hasta = max(contador.purgado_hasta, max_version)
+            self.db.commit()
+            return result.rowcount
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error en purge_tombstones: %s", e)
+            raise
@@ -3,10 +3,23 @@
 # Funcionalidad: CRUD de tareas con estados y filtros para tablero Kanban
 # ✅ ACTUALIZADO: Usa 'en_progreso' para mejor estética
 
+import logging
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+from datetime import date
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import joinedload
 from app.controllers.base_controller import BaseController
 from app.factory import BaseRepository
+from app.models.tarea import Tarea
+from app.models.proyecto import Proyecto
+
+
+logger = logging.getLogger(__name__)
+
+
+# _task_to_dict lee proyecto.nombre: el proyecto viene en el mismo SELECT (JOIN)
+_WITH_PROYECTO = joinedload(Tarea.proyecto)
+KANBAN_ESTADOS = ("nuevo", "en_progreso", "finalizado")
 
 
 class TaskController(BaseController):
@@ -16,6 +29,25 @@ class TaskController(BaseController):
     ✅ ACTUALIZADO para usar 'en_progreso'
     """
     
+    # Lectura por proyección para listados (ver BaseController.build_projection)
+    PROJECTION_FIELDS = {
+        "id_tarea": Tarea.id_tarea,
+        "titulo": Tarea.titulo,
+        "descripcion": Tarea.descripcion,
+        "estado": Tarea.estado,
+        "prioridad": Tarea.prioridad,
+        "fecha_vencimiento": Tarea.fecha_vencimiento,
+        "proyecto_id_fk": Tarea.proyecto_id_fk,
+        "proyecto_nombre": Proyecto.nombre
+    }
+    PROJECTION_JOINS = {
+        "proyecto_nombre": (Proyecto, Tarea.proyecto_id_fk == Proyecto.id_proyecto)
+    }
+    LITE_FIELDS = [
+        "id_tarea", "titulo", "estado", "prioridad",
+        "fecha_vencimiento", "proyecto_id_fk", "proyecto_nombre"
+    ]
+    
     def validate_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Validar datos de tarea"""
         required_fields = ["titulo"]
@@ -56,14 +88,8 @@ class TaskController(BaseController):
                 "proyecto_id_fk": task.proyecto_id_fk
             }
             
-            # Manejar fecha_vencimiento (puede ser None)
-            if hasattr(task, 'fecha_vencimiento') and task.fecha_vencimiento:
-                if isinstance(task.fecha_vencimiento, datetime):
-                    task_dict["fecha_vencimiento"] = task.fecha_vencimiento.isoformat()
-                else:
-                    task_dict["fecha_vencimiento"] = task.fecha_vencimiento
-            else:
-                task_dict["fecha_vencimiento"] = None
+            # Las fechas se dejan como date/datetime: las serializa la respuesta JSON
+            task_dict["fecha_vencimiento"] = getattr(task, 'fecha_vencimiento', None)
             
             # CRÍTICO: Manejar relación con Proyecto
             if hasattr(task, 'proyecto') and task.proyecto is not None:
@@ -75,15 +101,13 @@ class TaskController(BaseController):
                 task_dict["proyecto_nombre"] = None
             
             # Agregar fechas de auditoría si existen
-            if hasattr(task, 'fecha_creacion') and task.fecha_creacion:
-                if isinstance(task.fecha_creacion, datetime):
-                    task_dict["fecha_creacion"] = task.fecha_creacion.isoformat()
+            if getattr(task, 'fecha_creacion', None):
+                task_dict["fecha_creacion"] = task.fecha_creacion
             
             return task_dict
             
         except Exception as e:
-            print(f"Error en _task_to_dict: {e}")
-            print(f"Task object: {task}")
+            logger.error("Error en _task_to_dict: %s (%r)", e, task)
             return {
                 "id_tarea": getattr(task, 'id_tarea', None),
                 "titulo": getattr(task, 'titulo', 'Error al cargar'),
@@ -98,26 +122,64 @@ class TaskController(BaseController):
     def get_by_estado(self, estado: str) -> List[Dict[str, Any]]:
         """Obtener tareas por estado para tablero Kanban"""
         try:
-            tasks = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.estado == estado
-            ).all()
+            # lambda_stmt: la construcción y la cache key se calculan una sola vez
+            stmt = lambda_stmt(lambda: select(Tarea).options(_WITH_PROYECTO).where(Tarea.estado == estado))
+            tasks = self.repository.db.execute(stmt).scalars().all()
+            
+            return [self._task_to_dict(task) for task in tasks]
+        except Exception as e:
+            logger.error("Error en get_by_estado: %s", e)
+            return []
+    
+    def get_vencidas(self, hoy: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Obtener tareas no finalizadas con fecha de vencimiento pasada"""
+        try:
+            hoy = hoy or date.today()
+            stmt = lambda_stmt(
+                lambda: select(Tarea).options(_WITH_PROYECTO).where(
+                    Tarea.estado != "finalizado",
+                    Tarea.fecha_vencimiento < hoy
+                ).order_by(Tarea.fecha_vencimiento)
+            )
+            tasks = self.repository.db.execute(stmt).scalars().all()
             
             return [self._task_to_dict(task) for task in tasks]
         except Exception as e:
-            print(f"Error en get_by_estado: {e}")
+            logger.error("Error en get_vencidas: %s", e)
+            return []
+    
+    def get_proximas(self, desde: date, hasta: date) -> List[Dict[str, Any]]:
+        """Obtener tareas no finalizadas que vencen entre desde y hasta (inclusive)"""
+        try:
+            stmt = lambda_stmt(
+                lambda: select(Tarea).options(_WITH_PROYECTO).where(
+                    Tarea.estado != "finalizado",
+                    Tarea.fecha_vencimiento >= desde,
+                    Tarea.fecha_vencimiento <= hasta
+                ).order_by(Tarea.fecha_vencimiento)
+            )
+            tasks = self.repository.db.execute(stmt).scalars().all()
+            
+            return [self._task_to_dict(task) for task in tasks]
+        except Exception as e:
+            logger.error("Error en get_proximas: %s", e)
             return []
     
     def get_kanban_board(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Obtener estructura completa del tablero Kanban"""
+        """Obtener estructura completa del tablero Kanban (una consulta, agrupada aquí)"""
         try:
             # ✅ ACTUALIZADO: 'en_progreso'
-            return {
-                "nuevo": self.get_by_estado("nuevo"),
-                "en_progreso": self.get_by_estado("en_progreso"), 
-                "finalizado": self.get_by_estado("finalizado")
-            }
+            board: Dict[str, List[Dict[str, Any]]] = {estado: [] for estado in KANBAN_ESTADOS}
+            stmt = lambda_stmt(
+                lambda: select(Tarea).options(_WITH_PROYECTO)
+                .where(Tarea.estado.in_(KANBAN_ESTADOS))
+                .order_by(Tarea.id_tarea)
+            )
+            for task in self.repository.db.execute(stmt).scalars().all():
+                board[task.estado].append(self._task_to_dict(task))
+            return board
         except Exception as e:
-            print(f"Error en get_kanban_board: {e}")
+            logger.error("Error en get_kanban_board: %s", e)
             return {
                 "nuevo": [],
                 "en_progreso": [],
@@ -132,34 +194,32 @@ class TaskController(BaseController):
             if nuevo_estado not in valid_states:
                 raise ValueError(f"Estado inválido: {nuevo_estado}")
             
-            updated_task = self.update(task_id, {"estado": nuevo_estado})
-            return self._task_to_dict(updated_task)
+            # update() ya retorna la tarea serializada
+            return self.update(task_id, {"estado": nuevo_estado})
         except Exception as e:
-            print(f"Error en update_task_estado: {e}")
+            logger.error("Error en update_task_estado: %s", e)
             return None
     
     def get_by_proyecto(self, proyecto_id: int) -> List[Dict[str, Any]]:
         """Obtener tareas de un proyecto específico"""
         try:
-            tasks = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.proyecto_id_fk == proyecto_id
-            ).all()
+            stmt = lambda_stmt(lambda: select(Tarea).options(_WITH_PROYECTO).where(Tarea.proyecto_id_fk == proyecto_id))
+            tasks = self.repository.db.execute(stmt).scalars().all()
             
             return [self._task_to_dict(task) for task in tasks]
         except Exception as e:
-            print(f"Error en get_by_proyecto: {e}")
+            logger.error("Error en get_by_proyecto: %s", e)
             return []
     
     def get_by_prioridad(self, prioridad: str) -> List[Dict[str, Any]]:
         """Obtener tareas por prioridad"""
         try:
-            tasks = self.repository.db.query(self.repository.model).filter(
-                self.repository.model.prioridad == prioridad
-            ).all()
+            stmt = lambda_stmt(lambda: select(Tarea).options(_WITH_PROYECTO).where(Tarea.prioridad == prioridad))
+            tasks = self.repository.db.execute(stmt).scalars().all()
             
             return [self._task_to_dict(task) for task in tasks]
         except Exception as e:
-            print(f"Error en get_by_prioridad: {e}")
+            logger.error("Error en get_by_prioridad: %s", e)
             return []
     
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -169,31 +229,49 @@ class TaskController(BaseController):
             task = self.repository.create(validated_data)
             return self._task_to_dict(task)
         except Exception as e:
-            print(f"Error en create task: {e}")
+            logger.error("Error en create task: %s", e)
             raise e
     
     def get_all_tasks(self, skip: int = 0, limit: int = 100, estado: str = None) -> List[Dict[str, Any]]:
         """Obtener todas las tareas como diccionarios con filtros opcionales"""
         try:
-            query = self.repository.db.query(self.repository.model)
+            stmt = lambda_stmt(lambda: select(Tarea).options(_WITH_PROYECTO))
             
             # Aplicar filtro de estado si se proporciona
             if estado and estado != "":
-                query = query.filter(self.repository.model.estado == estado)
+                stmt += lambda s: s.where(Tarea.estado == estado)
             
-            tasks = query.offset(skip).limit(limit).all()
+            stmt += lambda s: s.order_by(Tarea.id_tarea).offset(skip).limit(limit)
+            tasks = self.repository.db.execute(stmt).scalars().all()
             return [self._task_to_dict(task) for task in tasks]
         except Exception as e:
-            print(f"Error en get_all_tasks: {e}")
+            logger.error("Error en get_all_tasks: %s", e)
+            return []
+    
+    def get_all_tasks_lite(self, field_names: List[str], skip: int = 0, limit: int = 100,
+                           estado: str = None) -> List[Dict[str, Any]]:
+        """Obtener tareas por proyección de columnas (sin hidratar objetos ORM)"""
+        try:
+            stmt = self.build_projection(field_names)
+            
+            if estado:
+                stmt = stmt.where(Tarea.estado == estado)
+            
+            # Mismo orden que get_all_tasks: la misma página con y sin ?fields=
+            stmt = stmt.order_by(Tarea.id_tarea).offset(skip).limit(limit)
+            return self.fetch_projection(stmt, field_names)
+        except Exception as e:
+            logger.error("Error en get_all_tasks_lite: %s", e)
             return []
     
     def get_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Obtener tarea por ID como diccionario"""
         try:
-            task = self.repository.get_by_id(task_id)
+            stmt = lambda_stmt(lambda: select(Tarea).options(_WITH_PROYECTO).where(Tarea.id_tarea == task_id))
+            task = self.repository.db.execute(stmt).scalar_one_or_none()
             return self._task_to_dict(task)
         except Exception as e:
-            print(f"Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             return None
     
     def update(self, task_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -213,7 +291,7 @@ class TaskController(BaseController):
             updated_task = self.repository.update(task_id, data)
             return self._task_to_dict(updated_task)
         except Exception as e:
-            print(f"Error en update task: {e}")
+            logger.error("Error en update task: %s", e)
             raise e
     
     def delete(self, task_id: int) -> bool:
@@ -221,5 +299,5 @@ class TaskController(BaseController):
         try:
             return self.repository.delete(task_id)
         except Exception as e:
-            print(f"Error en delete task: {e}")
+            logger.error("Error en delete task: %s", e)
             return False
\ No newline at end of file
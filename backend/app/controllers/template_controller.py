@@ -2,6 +2,7 @@
 # Descripción: Controlador para gestión de plantillas de documentos
 # Funcionalidad: Lógica de negocio para CRUD de plantillas .docx
 
+import logging
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from app.controllers.base_controller import BaseController
@@ -10,6 +11,9 @@ from fastapi import UploadFile, HTTPException
 import os
 
 
+logger = logging.getLogger(__name__)
+
+
 class TemplateController(BaseController):
     """
     Controlador para gestión de plantillas de documentos Word.
@@ -123,7 +127,7 @@ class TemplateController(BaseController):
             'ruta_archivo': template.ruta_archivo,
             'categoria': template.categoria,
             'descripcion': template.descripcion,
-            'fecha_subida': template.fecha_subida.isoformat() if template.fecha_subida else None,
+            'fecha_subida': template.fecha_subida,
             'activo': bool(template.activo)
         }
     
@@ -139,7 +143,7 @@ class TemplateController(BaseController):
             
             return [self._template_to_dict(t) for t in templates]
         except Exception as e:
-            print(f"Error en get_all_templates: {e}")
+            logger.error("Error en get_all_templates: %s", e)
             return []
     
     def get_by_category(self, categoria: str) -> List[Dict[str, Any]]:
@@ -151,7 +155,7 @@ class TemplateController(BaseController):
             ).all()
             return [self._template_to_dict(t) for t in templates]
         except Exception as e:
-            print(f"Error en get_by_category: {e}")
+            logger.error("Error en get_by_category: %s", e)
             return []
     
     def get_template_by_id(self, template_id: int) -> Optional[Dict[str, Any]]:
@@ -162,7 +166,7 @@ class TemplateController(BaseController):
             ).first()
             return self._template_to_dict(template)
         except Exception as e:
-            print(f"Error en get_template_by_id: {e}")
+            logger.error("Error en get_template_by_id: %s", e)
             return None
     
     def update_template(self, template_id: int, update_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -187,7 +191,7 @@ class TemplateController(BaseController):
             return self._template_to_dict(template)
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en update_template: {e}")
+            logger.error("Error en update_template: %s", e)
             return None
     
     def soft_delete_template(self, template_id: int) -> bool:
@@ -204,7 +208,7 @@ class TemplateController(BaseController):
             return False
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en soft_delete_template: {e}")
+            logger.error("Error en soft_delete_template: %s", e)
             return False
     
     def hard_delete_template(self, template_id: int) -> bool:
@@ -229,7 +233,7 @@ class TemplateController(BaseController):
             return False
         except Exception as e:
             self.repository.db.rollback()
-            print(f"Error en hard_delete_template: {e}")
+            logger.error("Error en hard_delete_template: %s", e)
             return False
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -259,5 +263,5 @@ class TemplateController(BaseController):
                 'por_categoria': por_categoria
             }
         except Exception as e:
-            print(f"Error en get_statistics: {e}")
+            logger.error("Error en get_statistics: %s", e)
             return {'total': 0, 'activas': 0, 'inactivas': 0, 'por_categoria': {}}
\ No newline at end of file
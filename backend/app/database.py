@@ -1,34 +1,152 @@
 # Archivo 04/43: app/database.py
 # Descripción: Configuración de conexión a PostgreSQL con SQLAlchemy
 # Funcionalidad: Engine, SessionLocal y Base para modelos ORM
+# ⭐ AGREGADO: Engine opcional de réplica de lectura con stickiness read-your-writes
 
-from sqlalchemy import create_engine, MetaData, text
+import hashlib
+import logging
+from collections import OrderedDict
+from sqlalchemy import create_engine, event, MetaData, text
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
+from fastapi import Request
 import asyncio
-from typing import Generator
+import time
+from typing import Generator, Optional
 
 from app.config import DATABASE_CONFIG
+from app.deadlines import apply_statement_timeout, mark_pool_timeout
+from app.observability.metrics import DB_POOL_WAIT
+from app.utils.security import token_from_header, user_id_from_token
 
 
-# Configuración del engine de SQLAlchemy
-engine = create_engine(
-    DATABASE_CONFIG["url"],
-    echo=DATABASE_CONFIG["echo"],
-    pool_size=DATABASE_CONFIG["pool_size"],
-    max_overflow=DATABASE_CONFIG["max_overflow"],
-    poolclass=StaticPool if "sqlite" in DATABASE_CONFIG["url"] else None,
-    pool_pre_ping=True,  # Verificar conexiones antes de usar
-    pool_recycle=300,    # Reciclar conexiones cada 5 minutos
-)
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que registra la espera de cada checkout en
+    justtime_db_pool_checkout_seconds{pool}. La etiqueta es el
+    pool_logging_name del engine (primary / replica), que sobrevive a dispose().
+    Un pool agotado dentro de un request se informa como 503 (app/deadlines.py).
+    """
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            mark_pool_timeout()
+            raise
+        finally:
+            DB_POOL_WAIT.labels(self._orig_logging_name or "primary").observe(time.perf_counter() - started)
+
+
+def _build_engine(url: str, name: str = "primary"):
+    """
+    Crear engine de SQLAlchemy según el dialecto de la URL.
+    SQLite no acepta parámetros de pool; en memoria usa StaticPool
+    para compartir la misma base entre sesiones.
+    """
+    if url.startswith("sqlite"):
+        in_memory = url in ("sqlite://", "sqlite:///:memory:")
+        return create_engine(
+            url,
+            echo=DATABASE_CONFIG["echo"],
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool if in_memory else InstrumentedQueuePool,
+            pool_logging_name=name,
+            query_cache_size=DATABASE_CONFIG["query_cache_size"],
+        )
+    
+    engine = create_engine(
+        url,
+        echo=DATABASE_CONFIG["echo"],
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_size=DATABASE_CONFIG["pool_size"],
+        max_overflow=DATABASE_CONFIG["max_overflow"],
+        pool_pre_ping=True,  # Verificar conexiones antes de usar
+        pool_recycle=300,    # Reciclar conexiones cada 5 minutos
+        query_cache_size=DATABASE_CONFIG["query_cache_size"],
+    )
+    # statement_timeout = deadline del request que toma la conexión
+    event.listen(engine, "checkout", apply_statement_timeout)
+    return engine
+
+
+# Engines creados bajo demanda: con gunicorn cada worker abre su propio pool
+# después del fork (un pool heredado del master compartiría sockets entre procesos)
+_engine = None
+_read_engine = None
+
+
+def get_engine():
+    """Engine primario (lecturas y escrituras), creado en el primer uso del proceso"""
+    global _engine
+    if _engine is None:
+        _engine = _build_engine(DATABASE_CONFIG["url"])
+    return _engine
+
+
+def get_read_engine():
+    """Engine de réplica de solo lectura (None si no está configurada)"""
+    global _read_engine
+    if _read_engine is None and DATABASE_CONFIG["replica_url"]:
+        _read_engine = _build_engine(DATABASE_CONFIG["replica_url"], "replica")
+    return _read_engine
+
+
+def dispose_engines() -> None:
+    """
+    Descartar los engines del proceso (hook post_fork de gunicorn).
+    close=False suelta las conexiones heredadas sin cerrarlas: los sockets
+    siguen siendo del proceso padre.
+    """
+    global _engine, _read_engine
+    for current in (_engine, _read_engine):
+        if current is not None:
+            current.dispose(close=False)
+    _engine = None
+    _read_engine = None
+
+
+def __getattr__(name: str):
+    # Compatibilidad: `from app.database import engine` sigue funcionando en scripts
+    if name == "engine":
+        return get_engine()
+    if name == "read_engine":
+        return get_read_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazySessionmaker(sessionmaker):
+    """sessionmaker que resuelve el engine al abrir cada sesión, no al importar"""
+
+    def __init__(self, engine_getter, **kw):
+        super().__init__(**kw)
+        self._engine_getter = engine_getter
+
+    def __call__(self, **local_kw) -> Session:
+        local_kw.setdefault("bind", self._engine_getter())
+        return super().__call__(**local_kw)
+
 
 # Configuración de sesiones de base de datos
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine
-)
+SessionLocal = _LazySessionmaker(get_engine, autocommit=False, autoflush=False)
+
+ReadSessionLocal = _LazySessionmaker(get_read_engine, autocommit=False, autoflush=False)
+
+# Clientes que escribieron recientemente en este proceso: clave -> instante (monotonic)
+# hasta el que leen del primario. Entre workers la marca viaja por el cache
+# compartido (ReadYourWritesMiddleware).
+_recent_writers: "OrderedDict[str, float]" = OrderedDict()
+_MAX_TRACKED_WRITERS = 10000
+
+# Instante (monotonic) hasta el que la réplica se considera caída
+_replica_down_until = 0.0
 
 # Configuración de metadatos para naming conventions
 convention = {
@@ -60,50 +178,134 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def client_key(request: Request) -> str:
+    """
+    Identificar al cliente para la stickiness read-your-writes: el usuario
+    del JWT (todas sus sesiones y workers comparten la marca). Un token que
+    no se puede decodificar se identifica por un hash, nunca se guarda el
+    token. Sin Authorization se usa la IP del cliente.
+    """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        user_id = user_id_from_token(token_from_header(authorization))
+        if user_id is not None:
+            return f"user:{user_id}"
+        return "token:" + hashlib.blake2b(authorization.encode("utf-8"), digest_size=16).hexdigest()
+    return "ip:" + (request.client.host if request.client else "anonimo")
+
+
+def mark_write(key: str) -> None:
+    """Registrar que un cliente escribió: sus lecturas irán al primario durante la ventana configurada"""
+    if not DATABASE_CONFIG["replica_url"]:
+        return
+    
+    _recent_writers[key] = time.monotonic() + DATABASE_CONFIG["read_your_writes_window"]
+    _recent_writers.move_to_end(key)
+    # Todas las marcas duran lo mismo: la más antigua es la primera en vencer
+    while len(_recent_writers) > _MAX_TRACKED_WRITERS:
+        _recent_writers.popitem(last=False)
+
+
+def _wrote_recently(key: str) -> bool:
+    """Verificar si el cliente sigue dentro de su ventana read-your-writes"""
+    until = _recent_writers.get(key)
+    if until is None:
+        return False
+    if until <= time.monotonic():
+        _recent_writers.pop(key, None)
+        return False
+    return True
+
+
+def _open_read_session(key: str, wrote_recently: bool = False) -> Session:
+    """
+    Abrir sesión para rutas de solo lectura.
+    Usa la réplica si está configurada y disponible; si el cliente escribió
+    recientemente (en este worker o, según el cache compartido, en otro) o
+    la réplica no responde, usa el primario.
+    """
+    global _replica_down_until
+    
+    if (
+        get_read_engine() is None
+        or wrote_recently
+        or _wrote_recently(key)
+        or time.monotonic() < _replica_down_until
+    ):
+        return SessionLocal()
+    
+    db = ReadSessionLocal()
+    try:
+        # Forzar checkout de conexión para detectar réplica caída antes de usarla
+        db.connection()
+        return db
+    except DBAPIError as e:
+        db.close()
+        _replica_down_until = time.monotonic() + DATABASE_CONFIG["replica_retry_after"]
+        logger.warning("Réplica de lectura no disponible, usando primario: %s", e)
+        return SessionLocal()
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Generador de sesiones de solo lectura para dependency injection.
+    Para rutas SELECT-only (listados, búsquedas, kanban, analytics).
+    """
+    db = _open_read_session(client_key(request), getattr(request.state, "read_your_writes", False))
+    # Marca para middlewares: respuestas de la réplica pueden ir atrasadas (sin ETag)
+    read_engine = get_read_engine()
+    request.state.read_replica = read_engine is not None and db.bind is read_engine
+    try:
+        yield db
+    except Exception as e:
+        db.rollback()
+        raise e
+    finally:
+        db.close()
+
+
 def test_connection():
     """Verificar conectividad con la base de datos"""
     try:
-        with engine.connect() as connection:
+        with get_engine().connect() as connection:
             result = connection.execute(text("SELECT 1"))
-            print("✅ Conexión a PostgreSQL exitosa")
+            logger.info("Conexión a PostgreSQL exitosa")
             return True
     except Exception as e:
-        print(f"❌ Error de conexión: {e}")
-        print("💡 Soluciones posibles:")
-        print("   1. Verificar que PostgreSQL esté ejecutándose")
-        print("   2. Crear base de datos 'justtime'")
-        print("   3. Verificar credenciales (usuario: postgres, password: hola1234)")
-        print("   4. Verificar puerto 5432")
+        # Revisar: PostgreSQL ejecutándose, base 'justtime' creada, credenciales y puerto 5432
+        logger.error("Error de conexión: %s", e)
         return False
 
 
-async def create_tables():
+def ensure_sync_schema():
     """
-    Crear todas las tablas definidas en los modelos.
-    Se ejecuta al iniciar la aplicación.
+    Agregar la columna version (delta sync) a tablas creadas antes de que
+    existiera y sembrar la fila del contador global. create_all no altera
+    tablas existentes. Solo para adoptar bases antiguas (app.migrate) y
+    reset_database: el esquema nuevo lo crean las migraciones.
     """
-    try:
-        # Verificar conexión primero
-        if not test_connection():
-            print("❌ No se pudo conectar a la base de datos")
-            print("⚠️  La aplicación se ejecutará sin base de datos")
-            return
-        
-        # Importar todos los modelos para asegurar que estén registrados
-        from app.models import (
-            usuario, empleado, contacto, categoria_proyecto, proyecto,
-            tarea, documento, actividad_pendiente, configuracion,
-            plantilla, empleado_proyecto, empleado_tarea
-        )
-        
-        # Crear todas las tablas
-        Base.metadata.create_all(bind=engine)
-        print("✅ Tablas de base de datos creadas correctamente")
-        
-    except Exception as e:
-        print(f"❌ Error al crear tablas: {e}")
-        print("⚠️  La aplicación se ejecutará sin base de datos")
-        # NO lanzar excepción para permitir que la app inicie
+    from sqlalchemy import inspect as sa_inspect
+    from app.models.sync import SyncContador, SyncVersionMixin
+    
+    engine = get_engine()
+    inspector = sa_inspect(engine)
+    versioned = [
+        mapper.local_table for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, SyncVersionMixin)
+    ]
+    with engine.begin() as connection:
+        for table in versioned:
+            columns = {column["name"] for column in inspector.get_columns(table.name)}
+            if "version" not in columns:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ADD COLUMN version BIGINT NOT NULL DEFAULT 0"
+                ))
+                connection.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table.name}_version ON {table.name} (version)"
+                ))
+                logger.info("Columna version agregada a %s", table.name)
+        if connection.execute(text("SELECT COUNT(*) FROM sync_contador")).scalar() == 0:
+            connection.execute(SyncContador.__table__.insert().values(id=1, version=0, purgado_hasta=0))
 
 
 def get_db_session() -> Session:
@@ -121,9 +323,10 @@ def reset_database():
     ¡CUIDADO! Elimina todos los datos existentes.
     """
     try:
-        print("⚠️ Recreando base de datos...")
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
-        print("✅ Base de datos recreada")
+        logger.warning("Recreando base de datos...")
+        Base.metadata.drop_all(bind=get_engine())
+        Base.metadata.create_all(bind=get_engine())
+        ensure_sync_schema()
+        logger.info("Base de datos recreada")
     except Exception as e:
-        print(f"❌ Error al recrear base de datos: {e}")
\ No newline at end of file
+        logger.error("Error al recrear base de datos: %s", e)
\ No newline at end of file
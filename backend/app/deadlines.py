@@ -0,0 +1,254 @@
+# Archivo: app/deadlines.py
+# Descripción: Deadlines por request propagados a la base de datos
+# Funcionalidad: Deadline en contexto, statement_timeout de PostgreSQL, cancelación de sentencias en curso
+#
+# Las rutas son async def pero ejecutan el SQL de forma síncrona en el hilo
+# del event loop: mientras una búsqueda ILIKE sin índice corre, ningún
+# temporizador de asyncio puede dispararse. Por eso el deadline se hace
+# cumplir desde afuera del loop:
+#
+# - PostgreSQL: cada conexión que toma un request lleva statement_timeout =
+#   lo que le queda al deadline (SET en cada checkout).
+# - Un hilo (_Reaper) cancela al vencer el deadline las sentencias que el
+#   request tiene en curso: connection.cancel() en psycopg, interrupt() en
+#   SQLite. Ambos son seguros desde otro hilo.
+# - Una sentencia que empieza con el deadline vencido no llega a la base.
+#
+# TimeoutMiddleware crea el Deadline, cancela también por desconexión del
+# cliente y traduce el resultado a 504 (deadline) o 503 (pool agotado).
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import TIMEOUT_CONFIG
+from app.observability.metrics import DB_STATEMENTS_CANCELLED
+
+
+logger = logging.getLogger(__name__)
+
+# Motivos de corte de un request
+TIMEOUT = "timeout"                    # venció el deadline del request
+STATEMENT_TIMEOUT = "statement_timeout"  # PostgreSQL canceló una sentencia (SQLSTATE 57014)
+POOL_TIMEOUT = "pool_timeout"          # no hubo conexión libre en el pool
+DISCONNECT = "disconnect"              # el cliente cerró la conexión
+
+_QUERY_CANCELED = "57014"
+_STATEMENT_TIMEOUT_KEY = "justtime_statement_timeout"
+
+
+class DeadlineExceeded(Exception):
+    """Sentencia SQL pedida con el deadline del request ya vencido"""
+
+
+class Deadline:
+    """
+    Plazo de un request. `reason` queda en None mientras el request puede
+    seguir; cancel() lo fija una sola vez (el primero que llega gana) y
+    cancela las sentencias que el request tiene en curso.
+    """
+
+    def __init__(self, timeout: float, group: str = "default"):
+        self.timeout = timeout
+        self.group = group
+        self.expires_at = time.monotonic() + timeout
+        self.reason: Optional[str] = None
+        self.finished = False
+        self._connections: Set[Any] = set()
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def cancel(self, reason: str) -> bool:
+        """Cortar el request; False si ya estaba cortado o terminado"""
+        with self._lock:
+            if self.reason is not None or self.finished:
+                return False
+            self.reason = reason
+            # Con el lock tomado: ninguna conexión vuelve al pool (y a otro request) mientras se cancela
+            for dbapi_connection in self._connections:
+                _interrupt(dbapi_connection)
+                DB_STATEMENTS_CANCELLED.labels(reason).inc()
+        return True
+
+    def mark(self, reason: str) -> None:
+        """Registrar un motivo detectado por la base o el pool, sin cancelar nada"""
+        with self._lock:
+            if self.reason is None and not self.finished:
+                self.reason = reason
+
+    def finish(self) -> Optional[str]:
+        """Dejar de hacer cumplir el deadline; devuelve el motivo si ya se había cortado"""
+        with self._lock:
+            self.finished = True
+            self._connections.clear()
+            return self.reason
+
+    def _enter(self, dbapi_connection: Any) -> None:
+        with self._lock:
+            if self.reason is not None:
+                raise DeadlineExceeded(f"Deadline del request vencido ({self.reason})")
+            self._connections.add(dbapi_connection)
+
+    def _exit(self, dbapi_connection: Any) -> None:
+        with self._lock:
+            self._connections.discard(dbapi_connection)
+
+
+def _interrupt(dbapi_connection: Any) -> None:
+    try:
+        if hasattr(dbapi_connection, "cancel"):
+            dbapi_connection.cancel()       # psycopg2 / psycopg: CancelRequest por un socket aparte
+        elif hasattr(dbapi_connection, "interrupt"):
+            dbapi_connection.interrupt()    # sqlite3
+    except Exception as e:
+        logger.warning("No se pudo cancelar la sentencia en curso: %s", e)
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("justtime_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+def set_deadline(deadline: Optional[Deadline]) -> Token:
+    return _current.set(deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    _current.reset(token)
+
+
+def request_timeout(group: Optional[str]) -> float:
+    """Deadline en segundos de un grupo de rutas (o el general)"""
+    if group is None:
+        return TIMEOUT_CONFIG["default"]
+    return TIMEOUT_CONFIG["groups"][group]["timeout"]
+
+
+class _Reaper:
+    """
+    Hilo único que cancela los deadlines vencidos. Los deadlines terminados
+    se descartan al llegar al frente del heap, como mucho `timeout`
+    segundos después: el heap queda acotado por requests/s x deadline.
+    """
+
+    def __init__(self):
+        self._heap: List[Any] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, deadline: Deadline) -> None:
+        with self._condition:
+            heapq.heappush(self._heap, (deadline.expires_at, next(self._sequence), deadline))
+            if self._thread is None or not self._thread.is_alive():
+                # Tras un fork el hilo del padre no existe en el hijo
+                self._thread = threading.Thread(target=self._run, name="justtime-deadline-reaper", daemon=True)
+                self._thread.start()
+            elif self._heap[0][2] is deadline:
+                self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                expires_at, _, deadline = self._heap[0]
+                wait = expires_at - time.monotonic()
+                if wait > 0 and not deadline.finished:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+            deadline.cancel(TIMEOUT)  # TimeoutMiddleware registra y responde cuando el loop se libera
+
+
+_reaper = _Reaper()
+
+
+def watch_deadline(deadline: Deadline) -> None:
+    """Cancelar las sentencias del request al vencer el deadline, aunque el loop esté bloqueado"""
+    _reaper.add(deadline)
+
+
+def mark_pool_timeout() -> None:
+    """Llamado por el pool al agotar la espera de una conexión (503 en lugar de 500)"""
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.mark(POOL_TIMEOUT)
+
+
+# ----------------------------------------------------------------------
+# Eventos de SQLAlchemy
+# ----------------------------------------------------------------------
+
+def apply_statement_timeout(dbapi_connection, connection_record, connection_proxy) -> None:
+    """
+    Evento checkout de los engines PostgreSQL (app/database.py). Con un
+    deadline en contexto el límite es lo que le queda al request, distinto
+    en cada checkout: SET siempre. Sin deadline (jobs, migraciones, scripts)
+    el límite es 0 y se omite si la conexión ya lo tiene.
+
+    El SET se confirma enseguida: un SET dentro de una transacción que
+    termina en ROLLBACK (lo normal al devolver la conexión al pool) se deshace.
+    """
+    deadline = _current.get()
+    if deadline is not None and TIMEOUT_CONFIG["statement_timeout"]:
+        # Redondeo hacia arriba: 0 desactivaría el límite
+        milliseconds = max(1, math.ceil(deadline.remaining() * 1000))
+    elif connection_record.info.get(_STATEMENT_TIMEOUT_KEY, 0) == 0:
+        return
+    else:
+        milliseconds = 0
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET statement_timeout = {milliseconds}")
+    finally:
+        cursor.close()
+    dbapi_connection.commit()
+    connection_record.info[_STATEMENT_TIMEOUT_KEY] = milliseconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    deadline = _current.get()
+    if deadline is not None:
+        deadline._enter(cursor.connection)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    deadline = _current.get()
+    if deadline is not None:
+        deadline._exit(cursor.connection)
+
+
+def _handle_error(exception_context) -> None:
+    deadline = _current.get()
+    if deadline is None or exception_context.cursor is None:
+        return
+    deadline._exit(exception_context.cursor.connection)
+    if getattr(exception_context.original_exception, "pgcode", None) == _QUERY_CANCELED and deadline.reason is None:
+        deadline.mark(STATEMENT_TIMEOUT)
+
+
+_registered = False
+
+
+def register_deadline_instrumentation() -> None:
+    """Escuchar las sentencias de todos los engines. Idempotente"""
+    global _registered
+    if _registered or not TIMEOUT_CONFIG["enabled"]:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _registered = True
@@ -0,0 +1,27 @@
+# Archivo: app/events/__init__.py
+# Descripción: Inicialización del módulo de eventos de cambio
+# Funcionalidad: Bus (tabla, pk, operación) alimentado por los commits de SQLAlchemy
+
+from .bus import ChangeEvent, EventBus, bus, INSERT, UPDATE, DELETE
+from .session_hooks import register_session_events
+from .versioning import register_versioning, next_version, current_version
+from .subscribers import register_default_subscribers, invalidate_cache, bump_table_versions
+from .rollups import get_estado_rollup, maintain_rollups
+
+__all__ = [
+    "ChangeEvent",
+    "EventBus",
+    "bus",
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "register_session_events",
+    "register_versioning",
+    "next_version",
+    "current_version",
+    "register_default_subscribers",
+    "invalidate_cache",
+    "bump_table_versions",
+    "get_estado_rollup",
+    "maintain_rollups"
+]
@@ -0,0 +1,142 @@
+# Archivo: app/events/bus.py
+# Descripción: Bus central de eventos de cambio de datos
+# Funcionalidad: Suscriptores reciben (tabla, pk, operación) por transacción confirmada
+
+import asyncio
+import contextvars
+import inspect
+import logging
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+
+logger = logging.getLogger(__name__)
+
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+
+class ChangeEvent(NamedTuple):
+    """
+    Cambio confirmado en una fila. pk es None en UPDATE/DELETE masivos.
+    data lleva los atributos de ruteo de la fila (proyecto, usuario, estado)
+    y en "campos" los atributos modificados en un UPDATE ("anterior": sus
+    valores de ruteo previos).
+    """
+    table: str
+    pk: Any
+    op: str
+    data: Optional[Dict[str, Any]] = None
+
+
+Handler = Callable[[List[ChangeEvent]], Any]
+
+
+# Tareas async lanzadas durante el request actual (ver ChangeEventMiddleware):
+# se esperan antes de responder para que el cliente nunca vea datos viejos
+_request_tasks: contextvars.ContextVar[Optional[List[asyncio.Task]]] = contextvars.ContextVar(
+    "change_event_request_tasks", default=None
+)
+
+
+class EventBus:
+    """
+    Bus en proceso. Cada suscriptor recibe la lista de eventos de UNA
+    transacción (solo las que hicieron commit) filtrada por sus tablas.
+
+    Los suscriptores pueden ser funciones sync o async. Las async se
+    programan en el event loop; si el commit ocurre fuera del loop (por
+    ejemplo en un hilo del worker de jobs) se envían al loop registrado.
+    Un suscriptor que falla nunca afecta al commit ni a los demás.
+    """
+
+    def __init__(self):
+        self._subscribers: List[tuple] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Set[asyncio.Future] = set()
+
+    def subscribe(self, handler: Handler, tables: Optional[Iterable[str]] = None) -> Handler:
+        """Registrar suscriptor (opcionalmente solo para ciertas tablas)"""
+        entry = (handler, frozenset(tables) if tables else None)
+        if entry not in self._subscribers:
+            self._subscribers.append(entry)
+        return handler
+
+    def unsubscribe(self, handler: Handler) -> None:
+        self._subscribers = [s for s in self._subscribers if s[0] is not handler]
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Loop al que se envían los suscriptores async cuando el commit es en otro hilo"""
+        self._loop = loop
+
+    def publish(self, events: List[ChangeEvent]) -> None:
+        """Entregar los eventos de una transacción confirmada"""
+        if not events:
+            return
+
+        for handler, tables in self._subscribers:
+            selected = events if tables is None else [e for e in events if e.table in tables]
+            if not selected:
+                continue
+            try:
+                result = handler(selected)
+                if inspect.isawaitable(result):
+                    self._schedule(result, handler)
+            except Exception as e:
+                logger.warning("Suscriptor %s falló: %s", getattr(handler, '__name__', handler), e)
+
+    def _schedule(self, coro, handler: Handler) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            task = loop.create_task(self._guard(coro, handler))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+            request_tasks = _request_tasks.get()
+            if request_tasks is not None:
+                request_tasks.append(task)
+        elif self._loop is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._guard(coro, handler), self._loop)
+        else:
+            # Sin loop disponible (scripts, worker sync): ejecutar en el acto
+            asyncio.run(self._guard(coro, handler))
+
+    @staticmethod
+    async def _guard(coro, handler: Handler) -> None:
+        try:
+            await coro
+        except Exception as e:
+            logger.warning("Suscriptor %s falló: %s", getattr(handler, '__name__', handler), e)
+
+    async def drain(self) -> None:
+        """Esperar los suscriptores async pendientes (tests y apagado)"""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+
+bus = EventBus()
+
+
+def begin_request_scope() -> contextvars.Token:
+    """Abrir el registro de tareas del request actual"""
+    return _request_tasks.set([])
+
+
+async def drain_request_scope() -> None:
+    """Esperar las tareas de suscriptores lanzadas por el request actual"""
+    tasks = _request_tasks.get()
+    if tasks:
+        pending, tasks[:] = list(tasks), []
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def end_request_scope(token: contextvars.Token) -> None:
+    _request_tasks.reset(token)
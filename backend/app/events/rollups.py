@@ -0,0 +1,124 @@
+# Archivo: app/events/rollups.py
+# Descripción: Agregados (rollups) mantenidos por el bus de eventos de cambio
+# Funcionalidad: Conteo por estado de proyectos y tareas actualizado con cada commit, sin GROUP BY por lectura
+
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.cache import get_cache
+from app.config import CACHE_CONFIG
+from app.events.bus import ChangeEvent, DELETE, INSERT
+from app.models.proyecto import Proyecto
+from app.models.tarea import Tarea
+
+
+# Tablas con rollup {estado: cantidad}
+ROLLUP_MODELS = {"proyectos": Proyecto, "tareas": Tarea}
+
+# Un lock por event loop: los lotes de commits concurrentes no se pisan el get/set
+_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def rollup_key(table: str) -> str:
+    return f"rollup:estado:{table}"
+
+
+def count_by_estado(db: Session, table: str) -> Dict[str, int]:
+    """{estado: cantidad} con un solo GROUP BY"""
+    model = ROLLUP_MODELS[table]
+    id_column = model.__mapper__.primary_key[0]
+    return dict(db.query(model.estado, func.count(id_column)).group_by(model.estado).all())
+
+
+def _ttl(generado: float) -> int:
+    # El TTL corre desde el GROUP BY que inicializó el rollup, no desde el último cambio
+    return max(int(CACHE_CONFIG["ttl"]["rollups"] - (time.time() - generado)), 1)
+
+
+async def get_estado_rollup(db: Session, table: str) -> Dict[str, int]:
+    """
+    Conteo por estado desde el rollup. Si no está (primer uso, vencido o
+    descartado por un cambio masivo) se hace el GROUP BY y se deja como base
+    para los eventos siguientes.
+    """
+    cache = get_cache()
+    rollup = await cache.get(rollup_key(table))
+    if rollup is not None:
+        return rollup["conteo"]
+    conteo = count_by_estado(db, table)
+    await cache.add(rollup_key(table), {"generado": time.time(), "conteo": conteo}, ttl=_ttl(time.time()))
+    return conteo
+
+
+def _deltas(event: ChangeEvent) -> Optional[List[tuple]]:
+    """(estado, delta) del cambio; None si el evento no alcanza para ajustar el conteo"""
+    if event.pk is None:
+        return None  # UPDATE/DELETE masivo: no se sabe qué filas cambiaron
+    data = event.data or {}
+    anterior = data.get("anterior", {})
+    if event.op == INSERT:
+        deltas = [(data.get("estado"), 1)]
+    elif event.op == DELETE:
+        # Si además cambió de estado en la transacción, el conteo tenía el anterior
+        deltas = [(anterior.get("estado", data.get("estado")), -1)]
+    elif "estado" not in data.get("campos", []):
+        return []
+    elif "estado" not in anterior:
+        return None  # el valor previo no estaba cargado en la sesión
+    else:
+        deltas = [(anterior["estado"], -1), (data.get("estado"), 1)]
+    return None if any(estado is None for estado, _ in deltas) else deltas
+
+
+def apply_events(conteo: Dict[str, int], events: List[ChangeEvent]) -> bool:
+    """Ajustar el conteo con los eventos; False si hay que recalcularlo"""
+    for event in events:
+        deltas = _deltas(event)
+        if deltas is None:
+            return False
+        for estado, delta in deltas:
+            cantidad = conteo.get(estado, 0) + delta
+            if cantidad < 0:
+                return False  # la base estaba desfasada
+            if cantidad:
+                conteo[estado] = cantidad
+            else:
+                conteo.pop(estado, None)  # el GROUP BY no devuelve estados vacíos
+    return True
+
+
+def _lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _locks.get(loop)
+    if lock is None:
+        lock = _locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def maintain_rollups(events: List[ChangeEvent]) -> None:
+    """
+    Suscriptor: aplicar los cambios confirmados a los rollups existentes.
+    Un rollup que no está no se crea acá (lo inicializa la próxima lectura);
+    uno que el evento no permite ajustar se descarta.
+    """
+    cache = get_cache()
+    by_table: Dict[str, List[ChangeEvent]] = {}
+    for event in events:
+        if event.table in ROLLUP_MODELS:
+            by_table.setdefault(event.table, []).append(event)
+
+    async with _lock():
+        for table, table_events in by_table.items():
+            key = rollup_key(table)
+            rollup: Dict[str, Any] = await cache.get(key)
+            if rollup is None:
+                continue
+            if apply_events(rollup["conteo"], table_events):
+                await cache.set(key, rollup, ttl=_ttl(rollup["generado"]))
+            else:
+                await cache.delete(key)
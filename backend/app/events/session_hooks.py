@@ -0,0 +1,124 @@
+# Archivo: app/events/session_hooks.py
+# Descripción: Hooks de sesión SQLAlchemy que alimentan el bus de eventos
+# Funcionalidad: Recolecta cambios en after_flush y los publica solo en after_commit
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.events.bus import ChangeEvent, DELETE, INSERT, UPDATE, bus
+
+
+_SESSION_KEY = "change_events"
+_registered = False
+
+# Atributos que se copian al evento para filtrar suscripciones (push en tiempo real)
+ROUTING_ATTRS = ("proyecto_id_fk", "usuario_id_fk", "subido_por_fk", "estado", "completada")
+
+Pending = Dict[Tuple[str, Any], Tuple[str, Optional[Dict[str, Any]]]]
+
+
+def _pending(session: Session) -> Pending:
+    """Cambios acumulados de la transacción en curso: (tabla, pk) -> (operación, datos)"""
+    return session.info.setdefault(_SESSION_KEY, {})
+
+
+def _record(pending: Pending, table: str, pk: Any, op: str, data: Optional[Dict[str, Any]] = None) -> None:
+    """Combinar operaciones sobre la misma fila dentro de la transacción"""
+    key = (table, pk)
+    previous_op, previous_data = pending.get(key, (None, None))
+    if previous_op == INSERT and op == DELETE:
+        del pending[key]  # nunca existió fuera de la transacción
+        return
+    if previous_data and data:
+        campos = sorted(set(previous_data.get("campos", [])) | set(data.get("campos", [])))
+        # El valor anterior que cuenta es el de antes de la transacción (el primero)
+        anterior = {**data.get("anterior", {}), **previous_data.get("anterior", {})}
+        data = {**previous_data, **data, "campos": campos, "anterior": anterior}
+    if previous_op == INSERT and op == UPDATE:
+        op = INSERT  # sigue siendo una fila nueva
+    pending.pop(key, None)  # reinsertar para conservar el orden del último cambio
+    pending[key] = (op, data or previous_data)
+
+
+def _routing_data(obj: Any, op: str) -> Dict[str, Any]:
+    """
+    Atributos de ruteo de la fila y, en UPDATE, los campos modificados y en
+    "anterior" el valor previo de los atributos de ruteo que cambiaron
+    (si estaba cargado), para mantener los rollups por estado.
+    """
+    state = inspect(obj)
+    # state.dict evita disparar cargas perezosas dentro del flush
+    data = {attr: state.dict.get(attr) for attr in ROUTING_ATTRS if attr in state.mapper.column_attrs}
+    if op == UPDATE:
+        changed = [
+            attr for attr in state.attrs
+            if attr.key in state.mapper.column_attrs and attr.history.has_changes()
+        ]
+        data["campos"] = sorted(attr.key for attr in changed)
+        data["anterior"] = {
+            attr.key: attr.history.deleted[0]
+            for attr in changed if attr.key in ROUTING_ATTRS and attr.history.deleted
+        }
+    return data
+
+
+def _identity(obj: Any) -> Any:
+    # La identity key de las filas nuevas se asigna después de after_flush:
+    # se lee la PK directamente de los atributos
+    pk = inspect(obj).mapper.primary_key_from_instance(obj)
+    return pk[0] if len(pk) == 1 else tuple(pk)
+
+
+def _table(obj: Any) -> str:
+    return obj.__table__.name
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # En after_flush new/dirty/deleted aún muestran el estado previo al flush
+    # y las filas nuevas ya tienen su clave primaria asignada
+    pending = _pending(session)
+    for obj in session.new:
+        _record(pending, _table(obj), _identity(obj), INSERT, _routing_data(obj, INSERT))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            _record(pending, _table(obj), _identity(obj), UPDATE, _routing_data(obj, UPDATE))
+    for obj in session.deleted:
+        _record(pending, _table(obj), _identity(obj), DELETE, _routing_data(obj, DELETE))
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    # UPDATE / DELETE masivos (query.update(), delete(Model).where(...)) no pasan
+    # por el flush: se registran a nivel de tabla con pk None
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            op = UPDATE if orm_execute_state.is_update else DELETE
+            _record(_pending(orm_execute_state.session), mapper.local_table.name, None, op)
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_SESSION_KEY, None)
+    if pending:
+        events: List[ChangeEvent] = [
+            ChangeEvent(table, pk, op, data) for (table, pk), (op, data) in pending.items()
+        ]
+        bus.publish(events)
+
+
+def _after_rollback(session: Session) -> None:
+    # Una escritura revertida nunca debe invalidar ni notificar nada
+    session.info.pop(_SESSION_KEY, None)
+
+
+def register_session_events() -> None:
+    """Conectar los hooks a todas las sesiones ORM (idempotente)"""
+    global _registered
+    if _registered:
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "do_orm_execute", _do_orm_execute)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+    _registered = True
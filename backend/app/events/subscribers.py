@@ -0,0 +1,29 @@
+# Archivo: app/events/subscribers.py
+# Descripción: Suscriptores por defecto del bus de eventos de cambio
+# Funcionalidad: Invalidación del cache de aplicación, versiones por tabla (ETags) y rollups por estado
+
+from typing import List
+
+from app.cache import get_cache
+from app.cache.versions import get_version_store
+from app.events.bus import ChangeEvent, bus
+from app.events.rollups import ROLLUP_MODELS, maintain_rollups
+
+
+async def invalidate_cache(events: List[ChangeEvent]) -> None:
+    """Invalidar las entradas del cache etiquetadas con las tablas modificadas"""
+    tables = {event.table for event in events}
+    await get_cache().invalidate_tags(*sorted(tables))
+
+
+async def bump_table_versions(events: List[ChangeEvent]) -> None:
+    """Subir la versión de cada tabla modificada (invalida los ETags que dependen de ella)"""
+    tables = {event.table for event in events}
+    await get_version_store().bump(sorted(tables))
+
+
+def register_default_subscribers() -> None:
+    """Registrar los suscriptores de la aplicación (idempotente)"""
+    bus.subscribe(invalidate_cache)
+    bus.subscribe(bump_table_versions)
+    bus.subscribe(maintain_rollups, tables=ROLLUP_MODELS.keys())
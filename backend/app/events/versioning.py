@@ -0,0 +1,150 @@
+# Archivo: app/events/versioning.py
+# Descripción: Versionado de filas para sincronización incremental
+# Funcionalidad: Asigna la versión de la transacción al confirmar y registra lápidas de eliminados
+#
+# La versión se toma en before_commit, no en el primer flush: el UPDATE del
+# contador bloquea su fila hasta el commit, y tomarlo al principio hacía
+# que toda transacción con escrituras esperara a que terminaran las demás
+# (requests completos, jobs largos). Ahora el bloqueo cubre solo el final
+# de la transacción: el UPDATE del contador, el flush del commit (que ya
+# escribe la versión en sus INSERT / UPDATE) y el COMMIT. Las filas de
+# flushes anteriores reciben la versión con un UPDATE por tabla.
+
+from datetime import datetime
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import Table, event, inspect, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.sync import RegistroEliminado, SyncContador, SyncVersionMixin
+
+
+_SESSION_KEY = "sync_pendientes"
+_VERSION_KEY = "sync_version"
+_CHUNK = 500  # claves por UPDATE (SQLite acepta 999 parámetros por sentencia)
+_registered = False
+
+
+def next_version(session: Session) -> int:
+    """
+    Tomar la siguiente versión del contador global.
+
+    El UPDATE bloquea la fila del contador hasta el commit: las versiones
+    quedan en el orden en que las transacciones confirman y un cliente que
+    ya vio la versión N nunca se pierde una transacción con versión menor
+    que confirme después.
+    """
+    connection = session.connection()
+    version = connection.execute(
+        update(SyncContador)
+        .where(SyncContador.id == 1)
+        .values(version=SyncContador.version + 1)
+        .returning(SyncContador.version)
+    ).scalar()
+    if version is None:
+        # Primera escritura sobre una base sin la fila del contador
+        connection.execute(insert(SyncContador).values(id=1, version=1, purgado_hasta=0))
+        version = 1
+    return version
+
+
+def current_version(session: Session) -> int:
+    """Última versión confirmada"""
+    return session.execute(select(SyncContador.version).where(SyncContador.id == 1)).scalar() or 0
+
+
+def _pending(session: Session) -> Tuple[Dict[Table, Set[Any]], List[Tuple[str, Any]]]:
+    # (tabla -> claves escritas, [(tabla, clave) eliminadas]) en flushes anteriores a la versión
+    return session.info.setdefault(_SESSION_KEY, ({}, []))
+
+
+def _primary_key(obj: Any) -> Any:
+    return inspect(obj).mapper.primary_key_from_instance(obj)[0]
+
+
+def _versioned_changes(session: Session) -> Tuple[List[Any], List[Any]]:
+    written = [obj for obj in session.new if isinstance(obj, SyncVersionMixin)] + [
+        obj for obj in session.dirty
+        if isinstance(obj, SyncVersionMixin) and session.is_modified(obj, include_collections=False)
+    ]
+    return written, [obj for obj in session.deleted if isinstance(obj, SyncVersionMixin)]
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    # Flush del commit: la versión ya está tomada y va en el mismo INSERT / UPDATE
+    version = session.info.get(_VERSION_KEY)
+    if version is None:
+        return
+    written, deleted = _versioned_changes(session)
+    for obj in written:
+        obj.version = version
+    for obj in deleted:
+        session.add(RegistroEliminado(
+            tabla=obj.__table__.name,
+            registro_id=_primary_key(obj),
+            version=version,
+            fecha_eliminacion=datetime.utcnow()
+        ))
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    # Flush antes del commit (db.flush(), refresh): anotar las filas para
+    # versionarlas al confirmar. En after_flush new/dirty/deleted aún
+    # muestran el estado previo y las filas nuevas ya tienen clave primaria
+    if session.info.get(_VERSION_KEY) is not None:
+        return
+    written, deleted = _versioned_changes(session)
+    if not (written or deleted):
+        return
+    keys, tombstones = _pending(session)
+    for obj in written:
+        keys.setdefault(obj.__table__, set()).add(_primary_key(obj))
+    for obj in deleted:
+        keys.get(obj.__table__, set()).discard(_primary_key(obj))
+        tombstones.append((obj.__table__.name, _primary_key(obj)))
+
+
+def _before_commit(session: Session) -> None:
+    pending = session.info.pop(_SESSION_KEY, None)
+    if not pending and not any(_versioned_changes(session)):
+        return
+
+    version = session.info[_VERSION_KEY] = next_version(session)
+    session.flush()  # lo que queda sin flush recibe la versión en _before_flush
+    if not pending:
+        return
+
+    # Filas ya escritas en flushes anteriores
+    keys, tombstones = pending
+    connection = session.connection()
+    for table, table_keys in keys.items():
+        pk_column = list(table.primary_key.columns)[0]
+        table_keys = list(table_keys)
+        for start in range(0, len(table_keys), _CHUNK):
+            connection.execute(
+                update(table).where(pk_column.in_(table_keys[start:start + _CHUNK])).values(version=version)
+            )
+    if tombstones:
+        now = datetime.utcnow()
+        connection.execute(insert(RegistroEliminado.__table__), [
+            {"tabla": tabla, "registro_id": registro_id, "version": version, "fecha_eliminacion": now}
+            for tabla, registro_id in tombstones
+        ])
+
+
+def _end_transaction(session: Session) -> None:
+    session.info.pop(_SESSION_KEY, None)
+    session.info.pop(_VERSION_KEY, None)
+
+
+def register_versioning() -> None:
+    """Conectar el versionado de filas a todas las sesiones ORM (idempotente)"""
+    global _registered
+    if _registered:
+        return
+    event.listen(Session, "before_flush", _before_flush)
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "before_commit", _before_commit)
+    event.listen(Session, "after_commit", _end_transaction)
+    event.listen(Session, "after_rollback", _end_transaction)
+    _registered = True
@@ -3,12 +3,28 @@
 # Funcionalidad: Creación centralizada de servicios y repositorios
 # ⭐ AGREGADO: create_empleado_repository() y create_employee_service()
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Type, TypeVar, Generic
 from sqlalchemy.orm import Session
 
 from app.database import get_db_session
+from app.models import (
+    ActividadPendiente,
+    Configuracion,
+    Contacto,
+    Documento,
+    Empleado,
+    Plantilla,
+    Proyecto,
+    Tarea,
+    Usuario
+)
 from app.models.base import Base
+from app.services.file_service import FileService
+
+
+logger = logging.getLogger(__name__)
 
 
 T = TypeVar('T', bound=Base)
@@ -54,40 +70,23 @@ class BaseRepository(RepositoryInterface[T]):
             return obj
         except Exception as e:
             self.db.rollback()
-            print(f"Error en create: {e}")
+            logger.error("Error en create: %s", e)
             raise e
     
     def get_by_id(self, obj_id: int) -> T:
         try:
-            # Usar el campo de clave primaria correcto según el modelo
-            if hasattr(self.model, 'id_usuario'):
-                return self.db.query(self.model).filter(self.model.id_usuario == obj_id).first()
-            elif hasattr(self.model, 'id_empleado'):
-                return self.db.query(self.model).filter(self.model.id_empleado == obj_id).first()
-            elif hasattr(self.model, 'id_proyecto'):
-                return self.db.query(self.model).filter(self.model.id_proyecto == obj_id).first()
-            elif hasattr(self.model, 'id_tarea'):
-                return self.db.query(self.model).filter(self.model.id_tarea == obj_id).first()
-            elif hasattr(self.model, 'id_plantilla'):
-                return self.db.query(self.model).filter(self.model.id_plantilla == obj_id).first()
-            elif hasattr(self.model, 'id_documento'):
-                return self.db.query(self.model).filter(self.model.id_documento == obj_id).first()
-            elif hasattr(self.model, 'id_actividad_pendiente'):
-                return self.db.query(self.model).filter(self.model.id_actividad_pendiente == obj_id).first()
-            elif hasattr(self.model, 'id_configuracion'):
-                return self.db.query(self.model).filter(self.model.id_configuracion == obj_id).first()
-            else:
-                # Fallback genérico
-                return self.db.query(self.model).filter(self.model.id == obj_id).first()
+            # Session.get usa la clave primaria del modelo y el identity map:
+            # si el objeto ya está cargado en la sesión no emite SQL
+            return self.db.get(self.model, obj_id)
         except Exception as e:
-            print(f"Error en get_by_id: {e}")
+            logger.error("Error en get_by_id: %s", e)
             return None
     
     def get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         try:
             return self.db.query(self.model).offset(skip).limit(limit).all()
         except Exception as e:
-            print(f"Error en get_all: {e}")
+            logger.error("Error en get_all: %s", e)
             return []
     
     def update(self, obj_id: int, obj_data: dict) -> T:
@@ -102,7 +101,7 @@ class BaseRepository(RepositoryInterface[T]):
             return obj
         except Exception as e:
             self.db.rollback()
-            print(f"Error en update: {e}")
+            logger.error("Error en update: %s", e)
             return None
     
     def delete(self, obj_id: int) -> bool:
@@ -115,7 +114,7 @@ class BaseRepository(RepositoryInterface[T]):
             return False
         except Exception as e:
             self.db.rollback()
-            print(f"Error en delete: {e}")
+            logger.error("Error en delete: %s", e)
             return False
 
 
@@ -145,60 +144,55 @@ class RepositoryFactory:
     @staticmethod
     def create_user_repository(db: Session = None):
         """Factory específico para repositorio de usuarios"""
-        from app.models.usuario import Usuario
         return RepositoryFactory.create_repository(Usuario, db)
     
     @staticmethod
     def create_empleado_repository(db: Session = None):
         """Factory específico para repositorio de empleados"""
-        from app.models.empleado import Empleado
         return RepositoryFactory.create_repository(Empleado, db)
     
     @staticmethod
     def create_project_repository(db: Session = None):
         """Factory específico para repositorio de proyectos"""
-        from app.models.proyecto import Proyecto
         return RepositoryFactory.create_repository(Proyecto, db)
     
     @staticmethod
     def create_task_repository(db: Session = None):
         """Factory específico para repositorio de tareas"""
-        from app.models.tarea import Tarea
         return RepositoryFactory.create_repository(Tarea, db)
     
     @staticmethod
     def create_contact_repository(db: Session = None):
         """Factory específico para repositorio de contactos"""
-        from app.models.contacto import Contacto
         return RepositoryFactory.create_repository(Contacto, db)
     
     @staticmethod
     def create_template_repository(db: Session = None):
         """Factory específico para repositorio de plantillas"""
-        from app.models.plantilla import Plantilla
         return RepositoryFactory.create_repository(Plantilla, db)
     
     @staticmethod
     def create_document_repository(db: Session = None):
         """Factory específico para repositorio de documentos"""
-        from app.models.documento import Documento
         return RepositoryFactory.create_repository(Documento, db)
     
     @staticmethod
     def create_pending_activity_repository(db: Session = None):
         """Factory específico para repositorio de actividades pendientes"""
-        from app.models.actividad_pendiente import ActividadPendiente
         return RepositoryFactory.create_repository(ActividadPendiente, db)
     
     @staticmethod
     def create_configuracion_repository(db: Session = None):
         """Factory específico para repositorio de configuraciones"""
-        from app.models.configuracion import Configuracion
         return RepositoryFactory.create_repository(Configuracion, db)
 
 
 class ServiceFactory:
-    """Factory para servicios de negocio"""
+    """
+    Factory para servicios de negocio.
+    Los controladores se importan dentro de cada método: importan
+    BaseRepository de este módulo (import circular a nivel de módulo).
+    """
     
     @staticmethod
     def create_auth_service(db: Session = None):
@@ -231,8 +225,7 @@ class ServiceFactory:
     @staticmethod
     def create_template_service(db: Session = None):
         """Factory para servicio de plantillas"""
-        from app.controllers.plantilla_controller import TemplateController
-        from app.services.file_service import FileService
+        from app.controllers.template_controller import TemplateController
         template_repo = RepositoryFactory.create_template_repository(db)
         file_service = FileService()
         return TemplateController(template_repo, file_service)
@@ -241,7 +234,6 @@ class ServiceFactory:
     def create_document_service(db: Session = None):
         """Factory para servicio de documentos"""
         from app.controllers.document_controller import DocumentController
-        from app.services.file_service import FileService
         document_repo = RepositoryFactory.create_document_repository(db)
         file_service = FileService()
         return DocumentController(document_repo, file_service)
@@ -0,0 +1,23 @@
+# Archivo: app/jobs/__init__.py
+# Descripción: Inicialización del módulo de cola de trabajos
+# Funcionalidad: Cola durable en la tabla jobs, handlers registrados y worker
+
+from .queue import enqueue, claim, heartbeat, complete, fail, retry, job_to_dict, PENDIENTE, EN_PROCESO, COMPLETADO, FALLIDO
+from .registry import job_handler, get_handler, registered_types
+
+__all__ = [
+    "enqueue",
+    "claim",
+    "heartbeat",
+    "complete",
+    "fail",
+    "retry",
+    "job_to_dict",
+    "PENDIENTE",
+    "EN_PROCESO",
+    "COMPLETADO",
+    "FALLIDO",
+    "job_handler",
+    "get_handler",
+    "registered_types"
+]
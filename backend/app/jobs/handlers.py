@@ -0,0 +1,7 @@
+# Archivo: app/jobs/handlers.py
+# Descripción: Handlers de trabajos en segundo plano
+# Funcionalidad: Punto de registro de los handlers de la aplicación (el worker importa este módulo)
+#
+# Cada handler se registra con @job_handler("tipo") y recibe (payload, db).
+# Solo va a la cola trabajo que hoy corre dentro de un request: encolar
+# cuesta un INSERT y un commit más en ese request.
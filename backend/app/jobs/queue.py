@@ -0,0 +1,202 @@
+# Archivo: app/jobs/queue.py
+# Descripción: Cola de trabajos durable sobre la base de datos (tabla jobs)
+# Funcionalidad: Encolar con idempotencia, tomar con SKIP LOCKED, renovar el lease, completar y reintentar con backoff
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import JOBS_CONFIG
+from app.models.trabajo import Trabajo
+
+
+PENDIENTE = "pendiente"
+EN_PROCESO = "en_proceso"
+COMPLETADO = "completado"
+FALLIDO = "fallido"
+
+
+def enqueue(
+    db: Session,
+    tipo: str,
+    payload: Optional[Dict[str, Any]] = None,
+    clave_idempotencia: Optional[str] = None,
+    max_intentos: Optional[int] = None,
+    retraso: float = 0
+) -> Trabajo:
+    """
+    Encolar un trabajo (hace commit). Con clave_idempotencia, encolar dos
+    veces lo mismo retorna el trabajo existente en lugar de duplicarlo.
+    """
+    if clave_idempotencia:
+        existing = db.execute(
+            select(Trabajo).where(Trabajo.clave_idempotencia == clave_idempotencia)
+        ).scalar_one_or_none()
+        if existing is not None:
+            return existing
+
+    job = Trabajo(
+        tipo=tipo,
+        payload=payload or {},
+        estado=PENDIENTE,
+        max_intentos=max_intentos or JOBS_CONFIG["max_attempts"],
+        ejecutar_despues=datetime.utcnow() + timedelta(seconds=retraso),
+        clave_idempotencia=clave_idempotencia
+    )
+    try:
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return job
+    except IntegrityError:
+        # Otro request encoló la misma clave entre el SELECT y el INSERT
+        db.rollback()
+        return db.execute(
+            select(Trabajo).where(Trabajo.clave_idempotencia == clave_idempotencia)
+        ).scalar_one()
+
+
+def claim(db: Session, worker_id: str, tipos: Optional[Iterable[str]] = None) -> Optional[Trabajo]:
+    """
+    Tomar el próximo trabajo disponible: pendiente y vencido, o en proceso
+    con el lease expirado (el worker que lo tenía murió).
+
+    En PostgreSQL FOR UPDATE SKIP LOCKED deja que varios workers tomen
+    trabajos distintos sin esperarse. SQLite ignora el FOR UPDATE; ahí el
+    UPDATE condicional (estado sin cambios) garantiza que un solo worker
+    gana cada trabajo.
+    """
+    now = datetime.utcnow()
+    disponible = or_(
+        and_(Trabajo.estado == PENDIENTE, Trabajo.ejecutar_despues <= now),
+        and_(Trabajo.estado == EN_PROCESO, Trabajo.bloqueado_hasta < now)
+    )
+    stmt = (
+        select(Trabajo.id_trabajo, Trabajo.estado)
+        .where(disponible)
+        .order_by(Trabajo.ejecutar_despues, Trabajo.id_trabajo)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if tipos:
+        stmt = stmt.where(Trabajo.tipo.in_(list(tipos)))
+
+    try:
+        row = db.execute(stmt).first()
+        if row is None:
+            db.rollback()
+            return None
+
+        result = db.execute(
+            update(Trabajo)
+            .where(Trabajo.id_trabajo == row.id_trabajo, Trabajo.estado == row.estado, disponible)
+            .values(
+                estado=EN_PROCESO,
+                intentos=Trabajo.intentos + 1,
+                bloqueado_por=worker_id,
+                bloqueado_hasta=now + timedelta(seconds=JOBS_CONFIG["lease_seconds"]),
+                fecha_actualizacion=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount != 1:
+            return None  # lo tomó otro worker
+        return db.get(Trabajo, row.id_trabajo, populate_existing=True)
+    except Exception:
+        db.rollback()
+        raise
+
+
+def backoff_seconds(intentos: int) -> float:
+    """Backoff exponencial con jitter: base * 2^(n-1), acotado a max_backoff"""
+    delay = min(JOBS_CONFIG["backoff_base"] * (2 ** max(intentos - 1, 0)), JOBS_CONFIG["max_backoff"])
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _owned_by(job_id: int, worker_id: str):
+    """El trabajo sigue en proceso con el lease de este worker (nadie lo retomó)"""
+    return and_(Trabajo.id_trabajo == job_id, Trabajo.estado == EN_PROCESO, Trabajo.bloqueado_por == worker_id)
+
+
+def _update_owned(db: Session, job_id: int, worker_id: str, **values: Any) -> bool:
+    result = db.execute(
+        update(Trabajo)
+        .where(_owned_by(job_id, worker_id))
+        .values(**values, fecha_actualizacion=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def heartbeat(db: Session, job_id: int, worker_id: str) -> bool:
+    """
+    Extender el lease del trabajo en curso. False si el lease ya no es de
+    este worker: venció y otro worker retomó el trabajo.
+    """
+    return _update_owned(
+        db, job_id, worker_id,
+        bloqueado_hasta=datetime.utcnow() + timedelta(seconds=JOBS_CONFIG["lease_seconds"])
+    )
+
+
+def complete(db: Session, job: Trabajo, worker_id: str, resultado: Any = None) -> bool:
+    """
+    Marcar completado. Solo el dueño del lease puede hacerlo: False si otro
+    worker retomó el trabajo (su ejecución es la que cuenta).
+    """
+    return _update_owned(
+        db, job.id_trabajo, worker_id,
+        estado=COMPLETADO, resultado=resultado, error=None, bloqueado_por=None, bloqueado_hasta=None
+    )
+
+
+def fail(db: Session, job: Trabajo, worker_id: str, error: str) -> bool:
+    """
+    Registrar el fallo: reprogramar con backoff o marcar fallido al agotar
+    los intentos. Igual que complete(), solo con el lease vigente.
+    """
+    values: Dict[str, Any] = {"error": error[:2000], "bloqueado_por": None, "bloqueado_hasta": None}
+    if job.intentos < job.max_intentos:
+        values.update(estado=PENDIENTE, ejecutar_despues=datetime.utcnow() + timedelta(seconds=backoff_seconds(job.intentos)))
+    else:
+        values.update(estado=FALLIDO)
+    return _update_owned(db, job.id_trabajo, worker_id, **values)
+
+
+def retry(db: Session, job_id: int) -> Optional[Trabajo]:
+    """Reencolar manualmente un trabajo fallido (con un intento más disponible)"""
+    job = db.get(Trabajo, job_id)
+    if job is None:
+        return None
+    if job.estado != FALLIDO:
+        raise ValueError(f"Solo se pueden reintentar trabajos fallidos (estado actual: {job.estado})")
+    job.estado = PENDIENTE
+    job.max_intentos = max(job.max_intentos, job.intentos + 1)
+    job.ejecutar_despues = datetime.utcnow()
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def job_to_dict(job: Trabajo) -> Optional[Dict[str, Any]]:
+    if job is None:
+        return None
+    return {
+        "id_trabajo": job.id_trabajo,
+        "tipo": job.tipo,
+        "estado": job.estado,
+        "intentos": job.intentos,
+        "max_intentos": job.max_intentos,
+        "ejecutar_despues": job.ejecutar_despues,
+        "clave_idempotencia": job.clave_idempotencia,
+        "resultado": job.resultado,
+        "error": job.error,
+        "fecha_creacion": job.fecha_creacion,
+        "fecha_actualizacion": job.fecha_actualizacion
+    }
@@ -0,0 +1,29 @@
+# Archivo: app/jobs/registry.py
+# Descripción: Registro de handlers de la cola de trabajos
+# Funcionalidad: Decorador @job_handler("tipo") y búsqueda del handler por tipo
+
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+
+# handler(payload, db) -> resultado serializable a JSON (o None)
+Handler = Callable[[Dict[str, Any], Session], Any]
+
+_handlers: Dict[str, Handler] = {}
+
+
+def job_handler(tipo: str) -> Callable[[Handler], Handler]:
+    """Registrar la función que procesa los trabajos de un tipo"""
+    def decorator(func: Handler) -> Handler:
+        _handlers[tipo] = func
+        return func
+    return decorator
+
+
+def get_handler(tipo: str) -> Optional[Handler]:
+    return _handlers.get(tipo)
+
+
+def registered_types() -> list:
+    return sorted(_handlers)
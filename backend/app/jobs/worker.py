@@ -0,0 +1,127 @@
+# Archivo: app/jobs/worker.py
+# Descripción: Worker de la cola de trabajos (proceso aparte del web)
+# Funcionalidad: Toma trabajos, ejecuta el handler, reintenta con backoff y se detiene limpio con SIGTERM
+#
+# Uso: python -m app.jobs.worker   (ver Procfile)
+
+import logging
+import os
+import signal
+import socket
+import threading
+import traceback
+from typing import Iterable, Optional
+
+from app.config import JOBS_CONFIG
+from app.database import SessionLocal
+from app.jobs import handlers  # noqa: F401  (registra los handlers)
+from app.jobs.queue import claim, complete, fail, heartbeat
+from app.jobs.registry import get_handler
+from app.observability.logs import configure_logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class _LeaseHeartbeat:
+    """
+    Renueva el lease del trabajo en curso desde un hilo aparte (con su
+    propia sesión): un handler que tarda más que lease_seconds no queda
+    disponible para otro worker mientras este sigue vivo.
+    """
+
+    def __init__(self, job_id: int, worker_id: str):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"justtime-job-{job_id}-heartbeat", daemon=True)
+
+    def __enter__(self) -> "_LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(JOBS_CONFIG["heartbeat_interval"]):
+            db = SessionLocal()
+            try:
+                if not heartbeat(db, self.job_id, self.worker_id):
+                    logger.warning("Trabajo %s: lease perdido, otro worker lo retomó", self.job_id)
+                    return
+            except Exception as e:
+                logger.warning("Trabajo %s: no se pudo renovar el lease: %s", self.job_id, e)
+            finally:
+                db.close()
+
+
+class Worker:
+    """Procesa trabajos de a uno; varios procesos worker pueden correr en paralelo"""
+
+    def __init__(self, worker_id: Optional[str] = None, tipos: Optional[Iterable[str]] = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.tipos = list(tipos) if tipos else None
+        self._stop = threading.Event()
+
+    def stop(self, *args) -> None:
+        """Terminar después del trabajo en curso"""
+        self._stop.set()
+
+    def run_once(self) -> bool:
+        """Procesar un trabajo. Retorna False si no había trabajos disponibles"""
+        db = SessionLocal()
+        try:
+            job = claim(db, self.worker_id, self.tipos)
+            if job is None:
+                return False
+
+            job_id = job.id_trabajo
+            handler = get_handler(job.tipo)
+            try:
+                if handler is None:
+                    raise LookupError(f"No hay handler registrado para '{job.tipo}'")
+                with _LeaseHeartbeat(job_id, self.worker_id):
+                    result = handler(job.payload or {}, db)
+                if not complete(db, job, self.worker_id, result):
+                    logger.warning("Trabajo %s terminó sin lease vigente: se descarta su resultado", job_id)
+            except Exception as e:
+                db.rollback()
+                logger.error("Trabajo %s (%s) falló, intento %s: %s", job_id, job.tipo, job.intentos, e)
+                if not fail(db, job, self.worker_id, f"{e}\n{traceback.format_exc(limit=5)}"):
+                    logger.warning("Trabajo %s falló sin lease vigente: otro worker lo retomó", job_id)
+            return True
+        finally:
+            db.close()
+
+    def run_batch(self, max_jobs: int) -> int:
+        """Procesar hasta max_jobs trabajos disponibles (worker embebido en el web)"""
+        processed = 0
+        while processed < max_jobs and not self._stop.is_set() and self.run_once():
+            processed += 1
+        return processed
+
+    def run_forever(self) -> None:
+        logger.info("Worker %s iniciado", self.worker_id)
+        while not self._stop.is_set():
+            try:
+                if not self.run_once():
+                    self._stop.wait(JOBS_CONFIG["poll_interval"])
+            except Exception as e:
+                # Base caída u otro error de infraestructura: esperar y reintentar
+                logger.error("Error en worker: %s", e)
+                self._stop.wait(JOBS_CONFIG["poll_interval"])
+        logger.info("Worker %s detenido", self.worker_id)
+
+
+def main() -> None:
+    configure_logging()
+    worker = Worker()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,14 @@
 # Descripción: Aplicación principal FastAPI con configuración CORS desde variables de entorno
 # Funcionalidad: Servidor ASGI, CORS dinámico, rutas y documentación automática
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import logging
+
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
 from contextlib import asynccontextmanager
+from starlette.concurrency import run_in_threadpool
 
-from app.database import engine, create_tables
 from app.routers import (
     auth_routes, 
     task_routes, 
@@ -19,24 +20,87 @@ from app.routers import (
     document_routes,
     pending_activity_routes,
     configuracion_routes,
-    employee_routes
+    employee_routes,
+    realtime_routes,
+    sync_routes,
+    job_routes,
+    profiling_routes
+)
+from app.middleware import (
+    ReadYourWritesMiddleware,
+    CompressionMiddleware,
+    ChangeEventMiddleware,
+    ConditionalGetMiddleware,
+    QueryMetricsMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    LoopWatchdogMiddleware,
+    RequestIdMiddleware,
+    TracingMiddleware,
+    RateLimitMiddleware,
+    TimeoutMiddleware
 )
+from app.cache import get_cache
+from app.deadlines import register_deadline_instrumentation
+from app.events import bus, register_session_events, register_default_subscribers, register_versioning
+from app.observability import (
+    LoopWatchdog,
+    configure_logging,
+    configure_tracing,
+    register_sql_instrumentation,
+    register_stack_dump_signal,
+    render_metrics,
+    shutdown_tracing
+)
+from app.ratelimit import get_rate_limiter
+from app.readiness import check_readiness
+from app.realtime import get_broker, register_realtime_subscriber
+from app.scheduler import get_scheduler, register_default_jobs
 from app.utils.exceptions import JustTimeException
+from app.utils.responses import FastJSONResponse
 from app import PROJECT_INFO
-from app.config import settings, CORS_CONFIG  # ⭐ IMPORTAR CORS_CONFIG
+from app.config import settings, CORS_CONFIG, LOOP_WATCHDOG_CONFIG, METRICS_CONFIG, PROFILING_CONFIG, SCHEDULER_CONFIG, SERVER_CONFIG  # ⭐ IMPORTAR CORS_CONFIG
+
+
+# Logs JSON por cola con request id (LOG_LEVEL, LOG_LEVELS, LOG_SAMPLING)
+configure_logging()
+configure_tracing()  # no-op salvo TRACING_ENABLED=true con opentelemetry instalado
+logger = logging.getLogger(__name__)
+
+
+async def _startup_check():
+    """Verificación inicial en segundo plano: solo informa, /ready decide el tráfico"""
+    ready, checks = await check_readiness()
+    if not ready:
+        logger.warning("Worker aún no listo (GET /ready responde 503)", extra={"checks": checks})
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gestión del ciclo de vida de la aplicación"""
-    # Startup: intentar crear tablas en base de datos
-    print("🚀 Iniciando JustTime Backend...")
-    print(f"📡 CORS Origins configurados: {CORS_CONFIG['origins']}")  # ⭐ LOG para debug
-    await create_tables()
-    print("✅ JustTime Backend iniciado")
+    # Startup sin DDL ni consultas bloqueantes: el esquema lo migra
+    # app.migrate una vez por despliegue (gunicorn_conf.on_starting)
+    logger.info("Iniciando JustTime Backend", extra={"cors_origins": CORS_CONFIG["origins"]})
+    app.state.startup_check = asyncio.create_task(_startup_check())
+    # Ruta y pila de callbacks que bloquean el loop; alimenta justtime_event_loop_lag_seconds
+    app.state.loop_watchdog = LoopWatchdog().start() if LOOP_WATCHDOG_CONFIG["enabled"] else None
+    if PROFILING_CONFIG["enabled"]:
+        register_stack_dump_signal()  # kill -USR2 <pid>: pilas de todos los hilos en stderr
+    if SCHEDULER_CONFIG["enabled"]:
+        register_default_jobs(get_scheduler()).start()
+    logger.info("JustTime Backend iniciado")
     yield
     # Shutdown: cleanup si es necesario
-    print("🛑 Cerrando JustTime Backend...")
+    logger.info("Cerrando JustTime Backend")
+    app.state.startup_check.cancel()
+    if app.state.loop_watchdog is not None:
+        app.state.loop_watchdog.stop()
+    await get_scheduler().stop()
+    await bus.drain()
+    await get_broker().close()
+    await get_cache().close()
+    await get_rate_limiter().close()
+    shutdown_tracing()  # exporta los spans pendientes
 
 
 # Configuración de la aplicación FastAPI
@@ -47,9 +111,14 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,  # orjson en lugar de json estándar
     lifespan=lifespan
 )
 
+# ETag / 304 por versión de tabla. Se registra primero para quedar dentro
+# de CORS: las respuestas 304 también llevan los headers CORS
+app.add_middleware(ConditionalGetMiddleware)
+
 # ⭐ CONFIGURACIÓN CORS DINÁMICA - Lee desde variables de entorno
 app.add_middleware(
     CORSMiddleware,
@@ -59,6 +128,51 @@ app.add_middleware(
     allow_headers=CORS_CONFIG["headers"],
 )
 
+# Stickiness read-your-writes: tras escribir, el cliente lee del primario
+app.add_middleware(ReadYourWritesMiddleware)
+
+# Eventos de cambio: los suscriptores async terminan antes de responder
+app.add_middleware(ChangeEventMiddleware)
+
+# Compresión gzip/br/zstd negociada (COMPRESSION_CONFIG)
+app.add_middleware(CompressionMiddleware)
+
+# Conteo y tiempo de SQL por request (Server-Timing / X-DB-Queries)
+app.add_middleware(QueryMetricsMiddleware)
+
+# Perfil de un request para admins que envían X-Profile (X-Profile-Id en la respuesta)
+app.add_middleware(ProfilingMiddleware)
+
+# Tarea asyncio -> ruta, para que el watchdog del loop nombre la ruta que lo bloquea
+app.add_middleware(LoopWatchdogMiddleware)
+
+# Deadline por grupo de rutas: cancela las sentencias en curso al vencer o si
+# el cliente se desconecta (504 / 503). Fuera de LoopWatchdog y Profiling: la
+# ruta corre en una tarea propia
+app.add_middleware(TimeoutMiddleware)
+
+# Límite de tasa (429) y de requests simultáneos del worker (503) antes de
+# leer el cuerpo o tocar la base
+app.add_middleware(RateLimitMiddleware)
+
+# Span OpenTelemetry del request (padre de controladores, SQL y archivos)
+app.add_middleware(TracingMiddleware)
+
+# Métricas Prometheus; mide el request completo
+app.add_middleware(MetricsMiddleware)
+
+# Request id en el contexto de logging y en X-Request-ID; el más externo
+# para que todo log del request (también de los middlewares) lo lleve
+app.add_middleware(RequestIdMiddleware)
+
+# Bus de eventos de cambio: hooks de sesión SQLAlchemy + suscriptores por defecto
+register_session_events()
+register_versioning()
+register_default_subscribers()
+register_realtime_subscriber()
+register_sql_instrumentation()
+register_deadline_instrumentation()
+
 
 # Endpoint de salud del sistema
 @app.get("/", tags=["Sistema"])
@@ -82,10 +196,34 @@ async def health_check():
     }
 
 
+@app.get("/ready", tags=["Sistema"])
+async def readiness_check():
+    """
+    Disponibilidad para recibir tráfico (balanceador / orquestador).
+    503 si la base no responde, el esquema no está migrado o el worker se apaga.
+    /health solo indica que el proceso está vivo.
+    """
+    ready, checks = await check_readiness()
+    return FastJSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "checks": checks}
+    )
+
+
+@app.get(METRICS_CONFIG["path"], include_in_schema=False)
+async def metrics():
+    """Métricas Prometheus (formato texto) agregadas de todos los workers"""
+    if not METRICS_CONFIG["enabled"]:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # Con varios workers lee un archivo por proceso: fuera del event loop
+    body, content_type = await run_in_threadpool(render_metrics)
+    return Response(content=body, headers={"Content-Type": content_type})
+
+
 # Manejador global de excepciones personalizadas
 @app.exception_handler(JustTimeException)
 async def justtime_exception_handler(request, exc: JustTimeException):
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "error_type": exc.error_type}
     )
@@ -94,7 +232,7 @@ async def justtime_exception_handler(request, exc: JustTimeException):
 # Manejador para errores HTTP generales
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc: HTTPException):
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
@@ -114,12 +252,21 @@ app.include_router(document_routes.router, prefix="/api/documentos", tags=["Docu
 app.include_router(pending_activity_routes.router, prefix="/api/pending-activities", tags=["Actividades Pendientes"])
 app.include_router(configuracion_routes.router, prefix="/api/configuraciones", tags=["Configuraciones"])
 app.include_router(employee_routes.router, prefix="/api/empleados", tags=["Empleados"])
+app.include_router(realtime_routes.router, prefix="/api/realtime", tags=["Tiempo Real"])
+app.include_router(sync_routes.router, prefix="/api/sync", tags=["Sincronización"])
+app.include_router(job_routes.router, prefix="/api/jobs", tags=["Trabajos"])
+app.include_router(profiling_routes.router, prefix="/api/admin/profiling", tags=["Profiling"])
 
 
 if __name__ == "__main__":
+    # Desarrollo: recarga automática solo con DEBUG. Producción: gunicorn_conf.py
+    import uvicorn
+    if SERVER_CONFIG["migrate_on_start"]:
+        from app.migrate import upgrade_database
+        upgrade_database()
     uvicorn.run(
         "app.main:app",
         host="127.0.0.1",
         port=8000,
-        reload=True
+        reload=settings.debug
     )
\ No newline at end of file
@@ -0,0 +1,31 @@
+# Archivo: app/middleware/__init__.py
+# Descripción: Inicialización del módulo de middlewares ASGI
+# Funcionalidad: Middlewares transversales registrados en app/main.py
+
+from .read_your_writes import ReadYourWritesMiddleware
+from .compression import CompressionMiddleware
+from .change_events import ChangeEventMiddleware
+from .etag import ConditionalGetMiddleware
+from .query_metrics import QueryMetricsMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .loop_watchdog import LoopWatchdogMiddleware
+from .request_id import RequestIdMiddleware
+from .tracing import TracingMiddleware
+from .rate_limit import RateLimitMiddleware
+from .timeout import TimeoutMiddleware
+
+__all__ = [
+    "ReadYourWritesMiddleware",
+    "CompressionMiddleware",
+    "ChangeEventMiddleware",
+    "ConditionalGetMiddleware",
+    "QueryMetricsMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "LoopWatchdogMiddleware",
+    "RequestIdMiddleware",
+    "TracingMiddleware",
+    "RateLimitMiddleware",
+    "TimeoutMiddleware"
+]
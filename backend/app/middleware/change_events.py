@@ -0,0 +1,43 @@
+# Archivo: app/middleware/change_events.py
+# Descripción: Middleware que acota los eventos de cambio al request
+# Funcionalidad: Espera a los suscriptores async (invalidación de cache) antes de responder
+
+import asyncio
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.events.bus import bus, begin_request_scope, drain_request_scope, end_request_scope
+
+
+class ChangeEventMiddleware:
+    """
+    Middleware ASGI puro. Los suscriptores async lanzados por los commits de
+    un request (por ejemplo la invalidación del cache en Redis) se esperan
+    antes de enviar las cabeceras: la siguiente lectura del cliente ya no
+    puede encontrar datos viejos en cache.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if bus.loop is None:
+            # Commits hechos en el threadpool (dependencias sync) usan este loop
+            bus.bind_loop(asyncio.get_running_loop())
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                await drain_request_scope()
+            await send(message)
+
+        token = begin_request_scope()
+        try:
+            await self.app(scope, receive, send_wrapper)
+            # Commits posteriores a la respuesta (background tasks)
+            await drain_request_scope()
+        finally:
+            end_request_scope(token)
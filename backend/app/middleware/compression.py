@@ -0,0 +1,212 @@
+# Archivo: app/middleware/compression.py
+# Descripción: Middleware de compresión de respuestas con negociación de encoding
+# Funcionalidad: gzip / brotli / zstd según Accept-Encoding, umbral mínimo y exclusión de tipos ya comprimidos
+
+import zlib
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import COMPRESSION_CONFIG
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli es opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard es opcional
+    zstandard = None
+
+
+class _GzipCompressor:
+    """Compresor gzip incremental (zlib con cabecera gzip)"""
+
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliCompressor:
+    """Compresor brotli incremental"""
+
+    def __init__(self, quality: int):
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdCompressor:
+    """Compresor zstd incremental"""
+
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+def available_compressors(config: Dict = COMPRESSION_CONFIG) -> Dict[str, Callable[[], object]]:
+    """Fábricas de compresores disponibles (brotli/zstd solo si están instalados)"""
+    factories: Dict[str, Callable[[], object]] = {
+        "gzip": lambda: _GzipCompressor(config["gzip_level"])
+    }
+    if brotli is not None:
+        factories["br"] = lambda: _BrotliCompressor(config["brotli_quality"])
+    if zstandard is not None:
+        factories["zstd"] = lambda: _ZstdCompressor(config["zstd_level"])
+    return factories
+
+
+def negotiate_encoding(accept_encoding: str, preference: List[str]) -> Optional[str]:
+    """
+    Elegir encoding según Accept-Encoding (con pesos q=).
+    Gana el mayor q; en empate, el orden de preferencia del servidor.
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+
+    best, best_q = None, 0.0
+    for encoding in preference:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Middleware ASGI puro de compresión.
+    - Respuestas de un solo bloque menores a minimum_size se envían tal cual.
+    - Tipos ya comprimidos (PDF, imágenes, ZIP, Office) y respuestas que ya
+      traen Content-Encoding no se tocan.
+    - Respuestas en streaming (FileResponse) se comprimen por chunks.
+    """
+
+    def __init__(self, app: ASGIApp, config: Dict = COMPRESSION_CONFIG):
+        self.app = app
+        self.enabled = config["enabled"]
+        self.minimum_size = config["minimum_size"]
+        self.excluded_types = tuple(config["excluded_types"])
+        self.compressors = available_compressors(config)
+        self.preference = [e for e in config["encodings"] if e in self.compressors]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.preference)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Estado de una respuesta: decide en el primer chunk si se comprime"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.decided = False
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        if self.start_message["status"] in (204, 304) or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(self.middleware.excluded_types)
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Retener cabeceras hasta ver el primer chunk del cuerpo
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if not self.decided:
+            await self._first_body(message)
+            return
+
+        if self.compressor is None:
+            await self._send(message)
+            return
+
+        body = self.compressor.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self.compressor.flush()
+        if body or not more_body:
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _first_body(self, message: Message) -> None:
+        self.decided = True
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self._compressible(headers):
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            # Respuesta completa en memoria: comprimir solo si vale la pena
+            if len(body) >= self.middleware.minimum_size:
+                compressor = self.middleware.compressors[self.encoding]()
+                compressed = compressor.compress(body) + compressor.flush()
+                if len(compressed) < len(body):
+                    body = compressed
+                    headers["Content-Encoding"] = self.encoding
+                    headers["Content-Length"] = str(len(body))
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # Streaming: el largo final no se conoce, se elimina Content-Length
+        self.compressor = self.middleware.compressors[self.encoding]()
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        await self._send(self.start_message)
+        await self._send({
+            "type": "http.response.body",
+            "body": self.compressor.compress(body),
+            "more_body": True
+        })
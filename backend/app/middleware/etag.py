@@ -0,0 +1,152 @@
+# Archivo: app/middleware/etag.py
+# Descripción: Middleware de cache HTTP condicional (ETag / If-None-Match)
+# Funcionalidad: ETags débiles derivados de versiones por tabla; 304 antes de ejecutar el endpoint
+
+import hashlib
+import logging
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import PROJECT_INFO
+from app.cache.versions import get_version_store, multiple_workers
+from app.config import ETAG_CONFIG
+from app.utils.security import decode_access_token, token_from_header
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConditionalGetMiddleware:
+    """
+    Middleware ASGI puro para GET/HEAD de endpoints JSON.
+
+    El ETag no se calcula hasheando el cuerpo: sale de las versiones de las
+    tablas de las que depende la ruta (ETAG_CONFIG["routes"]), que suben con
+    cada commit (ver app.events). Así, si el cliente envía un If-None-Match
+    vigente, se responde 304 sin ejecutar el endpoint ni consultar la base.
+
+    Las versiones se leen ANTES de ejecutar el endpoint: si un commit ocurre
+    mientras tanto, el ETag queda más viejo que los datos y el siguiente
+    request simplemente recibe 200, nunca un 304 con datos desactualizados.
+
+    El header Authorization entra en el ETag: cada token tiene sus propias
+    validaciones y las respuestas por usuario no se mezclan. El 304 se
+    responde antes de la autenticación, así que solo se evalúa si el token
+    verifica (firma y exp); si no, el endpoint responde el 401. Con token,
+    la tabla usuarios entra en las versiones: desactivar un usuario cambia
+    el ETag y su siguiente request pasa por get_current_user (403).
+
+    Las rutas de ETAG_CONFIG["exempt"] cambian con el reloj, no solo con
+    las tablas: se sirven siempre sin ETag.
+    """
+
+    def __init__(self, app: ASGIApp, config: Dict = ETAG_CONFIG):
+        self.app = app
+        self.routes = sorted(config["routes"].items(), key=lambda item: len(item[0]), reverse=True)
+        self.exempt = set(config.get("exempt", []))
+        self.enabled = config["enabled"]
+        self._checked_store = False
+
+    def _tables_for(self, path: str) -> Optional[List[str]]:
+        if path.rstrip("/") in self.exempt:
+            return None
+        for prefix, tables in self.routes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return tables
+        return None
+
+    def _store(self):
+        store = get_version_store()
+        if not self._checked_store:
+            self._checked_store = True
+            if not store.shared and multiple_workers():
+                # Con contadores por proceso un worker no ve los commits de otro
+                logger.warning("ETags deshabilitados: varios workers sin CACHE_BACKEND=redis")
+                self.enabled = False
+        return store
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        tables = self._tables_for(scope["path"])
+        store = self._store() if tables else None
+        if not tables or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        authorization = headers.get("authorization", "")
+        if authorization:
+            if decode_access_token(token_from_header(authorization)) is None:
+                # Token vencido, mal firmado o mal formado: nada de 304, que responda la autenticación
+                await self.app(scope, receive, send)
+                return
+            if "usuarios" not in tables:
+                tables = tables + ["usuarios"]
+
+        try:
+            versions = await store.get_versions(tables)
+        except Exception as e:
+            logger.warning("No se pudieron leer versiones para ETag: %s", e)
+            await self.app(scope, receive, send)
+            return
+
+        etag = self._make_etag(store.epoch, tables, versions, authorization)
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [
+                    (b"etag", etag.encode("latin-1")),
+                    (b"cache-control", b"private, no-cache"),
+                    (b"vary", b"Authorization, Accept-Encoding")
+                ]
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                response_headers = MutableHeaders(scope=message)
+                served_by_replica = scope.get("state", {}).get("read_replica", False)
+                if (
+                    response_headers.get("content-type", "").startswith("application/json")
+                    and "etag" not in response_headers
+                    and not served_by_replica  # la réplica puede ir atrasada respecto a las versiones
+                ):
+                    response_headers["ETag"] = etag
+                    response_headers["Cache-Control"] = "private, no-cache"
+                    response_headers.add_vary_header("Authorization")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _make_etag(epoch: str, tables: List[str], versions: List[int], authorization: str) -> str:
+        raw = "|".join([
+            PROJECT_INFO["version"],
+            epoch,
+            ",".join(f"{t}:{v}" for t, v in zip(tables, versions)),
+            authorization
+        ])
+        return f'W/"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Comparación débil (RFC 9110): se ignora el prefijo W/"""
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
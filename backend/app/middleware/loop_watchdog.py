@@ -0,0 +1,30 @@
+# Archivo: app/middleware/loop_watchdog.py
+# Descripción: Middleware que asocia cada request con su tarea asyncio
+# Funcionalidad: Permite al watchdog del event loop nombrar la ruta que lo está bloqueando
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import LOOP_WATCHDOG_CONFIG
+from app.observability.loop_watchdog import register_request_task, unregister_request_task
+
+
+class LoopWatchdogMiddleware:
+    """
+    Middleware ASGI puro. Registra la tarea que atiende el request; cuando el
+    loop se bloquea, el hilo del watchdog busca la tarea en curso y obtiene
+    la plantilla de la ruta desde su scope.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not LOOP_WATCHDOG_CONFIG["enabled"]:
+            await self.app(scope, receive, send)
+            return
+
+        task = register_request_task(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            unregister_request_task(task)
@@ -0,0 +1,49 @@
+# Archivo: app/middleware/metrics.py
+# Descripción: Middleware de métricas HTTP para Prometheus
+# Funcionalidad: Latencia por plantilla de ruta, conteo por status y requests en curso
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import METRICS_CONFIG
+from app.observability.metrics import HTTP_IN_FLIGHT, observe_request
+
+
+UNMATCHED_ROUTE = "sin_ruta"
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI puro. La etiqueta de ruta es la plantilla que resolvió el
+    router ("/api/tasks/{task_id}"), nunca la URL concreta: así la
+    cardinalidad queda acotada aunque lleguen ids o rutas inexistentes.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not METRICS_CONFIG["enabled"]:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        timed = scope["path"] not in METRICS_CONFIG["untimed_routes"]
+        if timed:
+            HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if timed:
+                HTTP_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            observe_request(scope["method"], route, status, time.perf_counter() - started, timed)
@@ -0,0 +1,54 @@
+# Archivo: app/middleware/profiling.py
+# Descripción: Middleware de profiling por request para administradores
+# Funcionalidad: Con el header X-Profile y un token admin, muestrea el request y guarda su perfil
+
+import asyncio
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import PROFILING_CONFIG
+from app.observability.profiling import SamplingProfiler, new_profile_name, save_profile
+from app.utils.security import is_admin_token, token_from_header
+
+
+def _finish(profiler: SamplingProfiler, name: str) -> None:
+    profiler.stop()
+    save_profile(profiler, name)
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI puro. Un admin que envía `X-Profile: 1` recibe en la
+    respuesta `X-Profile-Id: request-....folded`; el archivo queda en
+    GET /api/admin/profiling/profiles/{id} cuando el request termina.
+    Sin el header (o sin rol admin) el costo es buscar un header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not PROFILING_CONFIG["enabled"]:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if PROFILING_CONFIG["header"] not in headers or not is_admin_token(token_from_header(headers.get("authorization"))):
+            await self.app(scope, receive, send)
+            return
+
+        name = new_profile_name("request")
+        profiler = SamplingProfiler(task=asyncio.current_task()).start()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = name
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # join del hilo de muestreo y escritura del archivo fuera del event loop
+            await run_in_threadpool(_finish, profiler, name)
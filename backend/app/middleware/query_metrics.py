@@ -0,0 +1,56 @@
+# Archivo: app/middleware/query_metrics.py
+# Descripción: Middleware de métricas SQL por request
+# Funcionalidad: Headers Server-Timing / X-DB-Queries y log de requests con demasiadas sentencias
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import SQL_METRICS_CONFIG
+from app.observability.sql import logger, track_queries
+
+
+class QueryMetricsMiddleware:
+    """
+    Middleware ASGI puro. Abre un contador de sentencias para el request
+    (lo alimentan los eventos de cursor de app/observability/sql.py) y, fuera
+    de producción, lo publica en los headers de la respuesta:
+
+        Server-Timing: db;dur=12.4;desc="7 queries", app;dur=31.0
+        X-DB-Queries: 7
+
+    Las sentencias ejecutadas después de http.response.start (respuestas en
+    streaming) se cuentan en el log pero no en los headers, que ya salieron.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not SQL_METRICS_CONFIG["enabled"]:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        with track_queries(scope) as stats:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and SQL_METRICS_CONFIG["headers"]:
+                    headers = MutableHeaders(scope=message)
+                    elapsed = (time.perf_counter() - started) * 1000
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.total * 1000:.1f};desc="{stats.count} queries", app;dur={elapsed:.1f}'
+                    )
+                    headers["X-DB-Queries"] = str(stats.count)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if stats.count > SQL_METRICS_CONFIG["request_query_warning"]:
+                    logger.warning(
+                        "Request con %s sentencias SQL", stats.count,
+                        extra={"event": "many_queries", **stats.as_dict()}
+                    )
@@ -0,0 +1,71 @@
+# Archivo: app/middleware/rate_limit.py
+# Descripción: Middleware de control de admisión
+# Funcionalidad: 429 con Retry-After por token bucket agotado y 503 cuando el worker no tiene cupo de requests
+
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import RATE_LIMIT_CONFIG
+from app.observability.metrics import LOAD_SHED, RATE_LIMITED
+from app.ratelimit import get_concurrency_limiter, get_rate_limiter, is_exempt, is_long_lived, retry_after_seconds
+from app.utils.responses import FastJSONResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+def _reject(status: int, detail: str, error_type: str, retry_after: int) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status,
+        content={"detail": detail, "error_type": error_type},
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI puro. Decide antes de leer el cuerpo y antes de tocar
+    la base: un request rechazado cuesta verificar el JWT y una operación
+    sobre los buckets. Va dentro de RequestId / Metrics / Tracing para que
+    los 429 y 503 se vean en logs, métricas y trazas.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http" or not RATE_LIMIT_CONFIG["enabled"]
+                or scope["method"] == "OPTIONS" or is_exempt(scope["path"])):
+            await self.app(scope, receive, send)
+            return
+
+        decision = await get_rate_limiter().check(scope)
+        if not decision.allowed:
+            RATE_LIMITED.labels(decision.bucket).inc()
+            logger.info("Request limitado por el bucket %s", decision.bucket, extra={
+                "event": "rate_limited", "bucket": decision.bucket, "path": scope["path"], "sample_rate": 0.1
+            })
+            response = _reject(
+                429, "Demasiadas solicitudes, intente nuevamente en unos segundos",
+                "rate_limited", retry_after_seconds(decision.retry_after)
+            )
+            await response(scope, receive, send)
+            return
+
+        if is_long_lived(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = get_concurrency_limiter()
+        if not await limiter.acquire():
+            LOAD_SHED.inc()
+            response = _reject(
+                503, "Servidor ocupado, intente nuevamente", "overloaded", RATE_LIMIT_CONFIG["shed_retry_after"]
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
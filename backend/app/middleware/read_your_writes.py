@@ -0,0 +1,56 @@
+# Archivo: app/middleware/read_your_writes.py
+# Descripción: Middleware de stickiness read-your-writes para la réplica de lectura
+# Funcionalidad: Marca a los clientes que escriben para que sus lecturas usen el primario, en todos los workers
+
+import math
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cache import get_cache
+from app.config import DATABASE_CONFIG
+from app.database import client_key, mark_write
+
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+MARKER_PREFIX = "ryw:"
+
+
+class ReadYourWritesMiddleware:
+    """
+    Middleware ASGI puro (sin BaseHTTPMiddleware para no bufferizar respuestas).
+    Tras una escritura exitosa registra al cliente en la ventana read-your-writes
+    antes de enviar la respuesta, así la siguiente lectura ya ve sus cambios.
+
+    La marca queda en el proceso (app.database) y, con cache compartido
+    (Redis), también en el cache: la lectura siguiente puede caer en otro
+    worker. Las lecturas consultan esa marca y la dejan en
+    request.state.read_your_writes para get_read_db. Sin réplica
+    configurada no hace nada.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not DATABASE_CONFIG["replica_url"]:
+            await self.app(scope, receive, send)
+            return
+        
+        cache = get_cache()
+        key = client_key(Request(scope))
+        if scope["method"] not in WRITE_METHODS:
+            if cache.shared and await cache.get(MARKER_PREFIX + key):
+                scope.setdefault("state", {})["read_your_writes"] = True
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                mark_write(key)
+                if cache.shared:
+                    # Los errores del cache se tratan como miss: en el peor caso, lectura de la réplica
+                    await cache.set(MARKER_PREFIX + key, 1, ttl=math.ceil(DATABASE_CONFIG["read_your_writes_window"]))
+            await send(message)
+        
+        await self.app(scope, receive, send_wrapper)
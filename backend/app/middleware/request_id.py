@@ -0,0 +1,48 @@
+# Archivo: app/middleware/request_id.py
+# Descripción: Middleware de request id para correlacionar logs
+# Funcionalidad: Toma X-Request-ID del cliente/proxy o genera uno, lo deja en el contexto de logging y lo devuelve
+
+import re
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import LOGGING_CONFIG
+from app.observability.logs import reset_request_id, set_request_id
+
+
+# Ids de proxies (Railway, nginx, gateways): se aceptan si son cortos y sin caracteres raros
+_VALID_REQUEST_ID = re.compile(r"^[\w.:-]{1,128}$")
+
+
+class RequestIdMiddleware:
+    """
+    Middleware ASGI puro. Todo lo que se loguea durante el request (también
+    en el threadpool, que copia el contexto) lleva el mismo "request_id",
+    y la respuesta lo devuelve en X-Request-ID para buscarlo desde el cliente.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        header = LOGGING_CONFIG["request_id_header"]
+        request_id = Headers(scope=scope).get(header)
+        if not request_id or not _VALID_REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[header] = request_id
+            await send(message)
+
+        token = set_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_id(token)
@@ -0,0 +1,133 @@
+# Archivo: app/middleware/timeout.py
+# Descripción: Middleware de deadlines por request
+# Funcionalidad: Deadline por grupo de rutas, cancelación por desconexión del cliente y respuestas 504 / 503
+
+import asyncio
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import TIMEOUT_CONFIG
+from app.deadlines import (
+    DISCONNECT, POOL_TIMEOUT, TIMEOUT, Deadline, request_timeout, reset_deadline, set_deadline, watch_deadline
+)
+from app.observability.metrics import REQUEST_TIMEOUTS
+from app.observability.sql import route_name
+from app.ratelimit import is_exempt, route_group
+from app.utils.responses import FastJSONResponse
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimeoutMiddleware:
+    """
+    Middleware ASGI puro. La ruta corre en su propia tarea con el Deadline
+    en el contexto (también en el threadpool, que copia el contexto):
+
+    - Mientras la ruta espera (threadpool, cache, pool), el loop atiende el
+      vencimiento del deadline o el http.disconnect del cliente: cancela las
+      sentencias en curso y la tarea.
+    - Mientras la ruta bloquea el loop con SQL síncrono, el hilo de
+      app.deadlines cancela la sentencia; la ruta falla (500, o 400 con el
+      texto de la cancelación en algunos routers) y esa respuesta se
+      reemplaza por 504.
+
+    El deadline cubre hasta el http.response.start: cortar un cuerpo ya
+    empezado (descargas con FileResponse, streaming) solo lo truncaría.
+
+    Va fuera de LoopWatchdog y Profiling: ambos miran la tarea actual, que
+    desde aquí hacia adentro es la de la ruta.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not TIMEOUT_CONFIG["enabled"] or is_exempt(scope["path"], TIMEOUT_CONFIG):
+            await self.app(scope, receive, send)
+            return
+
+        group = route_group(scope["method"], scope["path"], TIMEOUT_CONFIG)
+        deadline = Deadline(request_timeout(group), group or "default")
+        messages: asyncio.Queue = asyncio.Queue(maxsize=1)  # el cuerpo pasa de a un bloque
+        disconnected = asyncio.Event()
+        response_started = asyncio.Event()
+        suppressed = False
+
+        async def read_client() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    return
+
+        async def receive_wrapper() -> Message:
+            if disconnected.is_set() and messages.empty():
+                return {"type": "http.disconnect"}
+            return await messages.get()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal suppressed
+            if message["type"] == "http.response.start":
+                # finish() es atómico con cancel(): o el request ya estaba cortado
+                # y su respuesta (cualquier status) se reemplaza, o ya no se corta
+                if deadline.finish() is not None:
+                    suppressed = True
+                    return
+                response_started.set()
+            elif suppressed:
+                return
+            await send(message)
+
+        token = set_deadline(deadline)
+        try:
+            route_task = asyncio.ensure_future(self.app(scope, receive_wrapper, send_wrapper))
+        finally:
+            reset_deadline(token)
+        watch_deadline(deadline)
+        reader = asyncio.ensure_future(read_client())
+        waiters = [asyncio.ensure_future(disconnected.wait()), asyncio.ensure_future(response_started.wait())]
+        try:
+            done, _ = await asyncio.wait(
+                {route_task, *waiters}, timeout=deadline.remaining(), return_when=asyncio.FIRST_COMPLETED
+            )
+            if route_task not in done and not deadline.finished:
+                deadline.cancel(DISCONNECT if disconnected.is_set() else TIMEOUT)
+                route_task.cancel()
+            await asyncio.wait({route_task})
+        finally:
+            deadline.finish()
+            reader.cancel()
+            for waiter in waiters:
+                waiter.cancel()
+            if not route_task.done():
+                route_task.cancel()  # cancelaron este request desde afuera (apagado del worker)
+
+        if deadline.reason is None:
+            route_task.result()  # excepciones de la ruta siguen su camino normal
+            return
+        if not route_task.cancelled():
+            route_task.exception()  # la falla provocada por la cancelación no se propaga
+
+        REQUEST_TIMEOUTS.labels(deadline.group, deadline.reason).inc()
+        logger.warning("Request cortado (%s): %s", deadline.reason, route_name(scope), extra={
+            "event": "request_timeout", "group": deadline.group, "reason": deadline.reason, "timeout": deadline.timeout
+        })
+        if deadline.reason == DISCONNECT:
+            return  # sin cliente que lea la respuesta
+
+        if deadline.reason == POOL_TIMEOUT:
+            response = FastJSONResponse(
+                status_code=503,
+                content={"detail": "Servidor ocupado, intente nuevamente", "error_type": "overloaded"},
+                headers={"Retry-After": "1"}
+            )
+        else:
+            response = FastJSONResponse(
+                status_code=504,
+                content={"detail": "La operación excedió el tiempo máximo permitido", "error_type": "timeout"}
+            )
+        await response(scope, receive, send)
@@ -0,0 +1,37 @@
+# Archivo: app/middleware/tracing.py
+# Descripción: Middleware de trazas distribuidas (OpenTelemetry)
+# Funcionalidad: Span SERVER por request, continuando el traceparent entrante; padre de los spans de controladores y SQL
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.observability.tracing import finish_request_span, request_span, tracing_enabled
+
+
+class TracingMiddleware:
+    """
+    Middleware ASGI puro. Abre el span del request antes de que corran los
+    middlewares internos y las rutas, así los spans de controladores, SQL y
+    archivos quedan como hijos. Sin tracing configurado solo pasa el request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with request_span(scope) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                finish_request_span(span, status)
@@ -0,0 +1,133 @@
+# Archivo: app/migrate.py
+# Descripción: Migraciones del esquema con Alembic (una vez por despliegue, no en cada worker)
+# Funcionalidad: upgrade a head, adopción de bases creadas con create_all y revisión actual para /ready
+#
+# Uso (desde backend/):
+#     python -m app.migrate            aplicar migraciones pendientes
+#     python -m app.migrate --check    salir con código 1 si la base no está en head (CI)
+
+import argparse
+import logging
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import inspect as sa_inspect, text
+
+from app.database import Base, ensure_sync_schema, get_engine
+from app.observability.logs import configure_logging
+
+
+logger = logging.getLogger(__name__)
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Primera revisión: equivale al esquema que creaba create_all al iniciar
+BASELINE_REVISION = "0001"
+
+# Clave del advisory lock de PostgreSQL: varias instancias desplegando a la
+# vez aplican las migraciones de a una
+_MIGRATION_LOCK_KEY = 731_905_001
+
+
+def alembic_config(connection=None):
+    """Configuración de Alembic con rutas absolutas (funciona desde cualquier cwd)"""
+    from alembic.config import Config
+
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache()
+def head_revision() -> Optional[str]:
+    """Revisión más reciente de migrations/versions (se calcula una vez por proceso)"""
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(connection) -> Optional[str]:
+    """Revisión aplicada en la base (None si nunca se migró). SQL plano: sin importar Alembic"""
+    if not sa_inspect(connection).has_table("alembic_version"):
+        return None
+    return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def _is_legacy(connection) -> bool:
+    """Base creada por create_all antes de Alembic: tiene tablas pero no alembic_version"""
+    tables = set(sa_inspect(connection).get_table_names())
+    return "alembic_version" not in tables and "usuarios" in tables
+
+
+def upgrade_database() -> bool:
+    """
+    Aplicar las migraciones pendientes. Las bases creadas con create_all
+    se completan (tablas y columnas nuevas) y se marcan en la revisión base
+    antes de migrar. Devuelve False si la base no está disponible.
+    """
+    from alembic import command
+
+    engine = get_engine()
+    try:
+        with engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+                connection.commit()
+            try:
+                if _is_legacy(connection):
+                    logger.warning("Base creada sin Alembic: completando esquema y marcando revisión base")
+                    import app.models  # noqa: F401 - registra los modelos en Base.metadata
+                    Base.metadata.create_all(bind=engine)
+                    ensure_sync_schema()
+                    command.stamp(alembic_config(connection), BASELINE_REVISION)
+                    connection.commit()
+
+                before = current_revision(connection)
+                command.upgrade(alembic_config(connection), "head")
+                connection.commit()
+                after = current_revision(connection)
+            finally:
+                if connection.dialect.name == "postgresql":
+                    connection.rollback()  # por si una migración falló a mitad de transacción
+                    connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _MIGRATION_LOCK_KEY})
+                    connection.commit()
+
+        if before != after:
+            logger.info("Esquema migrado: %s -> %s", before or 'vacío', after)
+        else:
+            logger.info("Esquema al día (revisión %s)", after)
+        return True
+    except Exception as e:
+        logger.error("Error al migrar la base de datos: %s", e)
+        return False
+
+
+def check_database_revision() -> bool:
+    """True si la base está en la última revisión"""
+    with get_engine().connect() as connection:
+        return current_revision(connection) == head_revision()
+
+
+def main() -> None:
+    configure_logging()
+    parser = argparse.ArgumentParser(description="Migraciones del esquema de JustTime")
+    parser.add_argument("--check", action="store_true", help="Solo verificar que la base esté en head")
+    options = parser.parse_args()
+
+    if options.check:
+        ok = check_database_revision()
+        if ok:
+            logger.info("Esquema al día")
+        else:
+            logger.error("Esquema desactualizado (head: %s)", head_revision())
+    else:
+        ok = upgrade_database()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ from .configuracion import Configuracion
 from .plantilla import Plantilla
 from .empleado_proyecto import EmpleadoProyecto
 from .empleado_tarea import EmpleadoTarea
+from .sync import SyncVersionMixin, SyncContador, RegistroEliminado
+from .trabajo import Trabajo
 
 __all__ = [
     "Base",
@@ -28,5 +30,9 @@ __all__ = [
     "Configuracion",
     "Plantilla",
     "EmpleadoProyecto",
-    "EmpleadoTarea"
+    "EmpleadoTarea",
+    "SyncVersionMixin",
+    "SyncContador",
+    "RegistroEliminado",
+    "Trabajo"
 ]
\ No newline at end of file
@@ -5,9 +5,10 @@
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, CheckConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.sync import SyncVersionMixin
 
 
-class ActividadPendiente(Base):
+class ActividadPendiente(SyncVersionMixin, Base):
     """
     Modelo ActividadPendiente - Tabla actividades_pendientes
     Sistema de recordatorios y actividades pendientes
@@ -5,9 +5,10 @@
 from sqlalchemy import Column, Integer, String, Boolean, Text, CheckConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.sync import SyncVersionMixin
 
 
-class Contacto(Base):
+class Contacto(SyncVersionMixin, Base):
     """
     Modelo Contacto - Tabla contactos
     Clientes y empresas para casos jurídicos
@@ -6,9 +6,10 @@ from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.sync import SyncVersionMixin
 
 
-class Documento(Base):
+class Documento(SyncVersionMixin, Base):
     """
     Modelo Documento - Tabla documentos
     Gestión de archivos vinculados a proyectos y usuarios
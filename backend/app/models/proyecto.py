@@ -6,9 +6,10 @@ from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, CheckCon
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
+from app.models.sync import SyncVersionMixin
 
 
-class Proyecto(Base):
+class Proyecto(SyncVersionMixin, Base):
     """
     Modelo Proyecto - Tabla proyectos
     Casos jurídicos completos vinculados a contactos y categorías
@@ -0,0 +1,47 @@
+# Archivo: app/models/sync.py
+# Descripción: Modelos de soporte para sincronización incremental (delta sync)
+# Funcionalidad: Versión de fila, contador global de versiones y lápidas de registros eliminados
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from app.database import Base
+
+
+class SyncVersionMixin:
+    """
+    Columna version para sincronización incremental.
+    Todas las filas escritas en una misma transacción reciben la misma
+    versión, tomada del contador global (ver app/events/versioning.py).
+    Las filas anteriores a la columna quedan con versión 0.
+    """
+    version = Column(BigInteger, nullable=False, default=0, server_default="0", index=True)
+
+
+class SyncContador(Base):
+    """
+    Contador global de versiones (una sola fila, id=1).
+    purgado_hasta: versión máxima de las lápidas ya purgadas; un cliente
+    con token anterior debe hacer una sincronización completa.
+    """
+    __tablename__ = 'sync_contador'
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    purgado_hasta = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<SyncContador(version={self.version}, purgado_hasta={self.purgado_hasta})>"
+
+
+class RegistroEliminado(Base):
+    """Lápida de una fila eliminada de una tabla sincronizable"""
+    __tablename__ = 'sync_eliminados'
+    
+    id_registro_eliminado = Column(Integer, primary_key=True, autoincrement=True)
+    tabla = Column(String(50), nullable=False)
+    registro_id = Column(Integer, nullable=False)
+    version = Column(BigInteger, nullable=False, index=True)
+    fecha_eliminacion = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f"<RegistroEliminado(tabla={self.tabla}, registro_id={self.registro_id}, version={self.version})>"
@@ -5,9 +5,10 @@
 from sqlalchemy import Column, Integer, String, Text, Date, ForeignKey, CheckConstraint
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.sync import SyncVersionMixin
 
 
-class Tarea(Base):
+class Tarea(SyncVersionMixin, Base):
     """
     Modelo Tarea - Tabla tareas
     Sistema Kanban con estados (nuevo, progreso, finalizado)
@@ -0,0 +1,42 @@
+# Archivo: app/models/trabajo.py
+# Descripción: Modelo SQLAlchemy para tabla jobs - Cola de trabajos en segundo plano
+# Funcionalidad: Trabajos durables con reintentos, backoff, lease y clave de idempotencia
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index, CheckConstraint
+from app.database import Base
+
+
+class Trabajo(Base):
+    """
+    Modelo Trabajo - Tabla jobs
+    Un worker toma el trabajo (estado en_proceso) por un tiempo limitado
+    (bloqueado_hasta); si muere, el trabajo vuelve a estar disponible.
+    """
+    __tablename__ = 'jobs'
+    
+    id_trabajo = Column(Integer, primary_key=True, autoincrement=True)
+    tipo = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    estado = Column(String(20), nullable=False, default='pendiente')
+    intentos = Column(Integer, nullable=False, default=0)
+    max_intentos = Column(Integer, nullable=False, default=5)
+    ejecutar_despues = Column(DateTime, nullable=False, default=datetime.utcnow)
+    clave_idempotencia = Column(String(200), nullable=True, unique=True)
+    resultado = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    bloqueado_por = Column(String(100), nullable=True)
+    bloqueado_hasta = Column(DateTime, nullable=True)
+    fecha_creacion = Column(DateTime, nullable=False, default=datetime.utcnow)
+    fecha_actualizacion = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    __table_args__ = (
+        CheckConstraint(
+            "estado IN ('pendiente', 'en_proceso', 'completado', 'fallido')", name='ck_jobs_estado'
+        ),
+        # Índice de la consulta de claim: estado + próxima ejecución
+        Index('ix_jobs_estado_ejecutar_despues', 'estado', 'ejecutar_despues'),
+    )
+    
+    def __repr__(self):
+        return f"<Trabajo(id_trabajo={self.id_trabajo}, tipo={self.tipo}, estado={self.estado})>"
@@ -0,0 +1,30 @@
+# Archivo: app/observability/__init__.py
+# Descripción: Inicialización del módulo de observabilidad
+# Funcionalidad: Logging estructurado, instrumentación SQL por request, métricas Prometheus, profiling bajo demanda watchdog del event loop y trazas OpenTelemetry
+
+from .logs import configure_logging, current_request_id, shutdown_logging
+from .sql import QueryStats, current_query_stats, register_sql_instrumentation, route_name, track_queries
+from .metrics import render_metrics, run_in_threadpool_timed
+from .profiling import SamplingProfiler, register_stack_dump_signal
+from .loop_watchdog import LoopWatchdog
+from .tracing import configure_tracing, shutdown_tracing, start_span, traced
+
+__all__ = [
+    "configure_logging",
+    "current_request_id",
+    "shutdown_logging",
+    "QueryStats",
+    "current_query_stats",
+    "register_sql_instrumentation",
+    "route_name",
+    "track_queries",
+    "render_metrics",
+    "run_in_threadpool_timed",
+    "SamplingProfiler",
+    "register_stack_dump_signal",
+    "LoopWatchdog",
+    "configure_tracing",
+    "shutdown_tracing",
+    "start_span",
+    "traced"
+]
@@ -0,0 +1,218 @@
+# Archivo: app/observability/logs.py
+# Descripción: Logging estructurado del backend
+# Funcionalidad: Una línea JSON por registro, request id por contexto, cola no bloqueante, niveles por logger y muestreo
+#
+# Quien llama a logger.info() solo arma el registro y lo encola: el formato
+# JSON y la escritura en stdout los hace un hilo QueueListener, así el
+# event loop y el threadpool no esperan por I/O de logs. Con la cola llena
+# (stdout trabado) los registros se descartan en lugar de bloquear.
+#
+#     {"ts": "2025-03-02T14:05:11.204+00:00", "level": "ERROR", "logger": "app.controllers.task_controller",
+#      "msg": "Error en get_by_id: ...", "request_id": "5f0c9a3e..."}
+#
+# Los campos de `extra=` salen como claves propias del JSON:
+#     logger.info("Trabajo terminado", extra={"job_id": job.id_trabajo, "tipo": job.tipo})
+
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.config import LOGGING_CONFIG
+
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+# Atributos propios de LogRecord: todo lo demás vino por extra=
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "request_id"}
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+_lock = threading.Lock()
+_queue_handler: Optional["LogQueueHandler"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def set_request_id(request_id: Optional[str]) -> contextvars.Token:
+    return _request_id.set(request_id)
+
+
+def reset_request_id(token: contextvars.Token) -> None:
+    _request_id.reset(token)
+
+
+class JsonFormatter(logging.Formatter):
+    """Registro -> una línea JSON (ts, level, logger, msg, request_id, extras, exc)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Formato legible para desarrollo (LOG_FORMAT=text)"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s [%(request_id)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not getattr(record, "request_id", None):
+            record.request_id = "-"
+        return super().format(record)
+
+
+class RequestIdFilter(logging.Filter):
+    """Copia el request id del contexto al registro (en el hilo que loguea, antes de encolar)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Conserva una fracción de los registros INFO/DEBUG de loggers ruidosos.
+    La fracción sale de LOG_SAMPLING por prefijo de logger o de
+    extra={"sample_rate": 0.01} en la llamada; los registros conservados
+    llevan "sample_rate" para poder escalar los conteos. WARNING y
+    superiores nunca se descartan.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        # Prefijo más largo primero: "app.cache.redis" gana sobre "app.cache"
+        self.rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._by_logger: Dict[str, float] = {}
+
+    def _logger_rate(self, name: str) -> float:
+        rate = self._by_logger.get(name)
+        if rate is None:
+            rate = next(
+                (rate for prefix, rate in self.rates if name == prefix or name.startswith(prefix + ".")),
+                1.0
+            )
+            self._by_logger[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = getattr(record, "sample_rate", None)
+        if rate is None:
+            rate = self._logger_rate(record.name)
+            if rate >= 1.0:
+                return True
+            record.sample_rate = rate
+        return random.random() < rate
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler que descarta (y cuenta) en lugar de bloquear con la cola llena"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Mensaje y traceback como texto: el registro cruza de hilo sin
+        # referencias a los argumentos ni a los frames de la excepción
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _formatter() -> logging.Formatter:
+    return JsonFormatter() if LOGGING_CONFIG["format"] == "json" else TextFormatter()
+
+
+def _start_listener() -> None:
+    global _listener
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(_formatter())
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, output)
+    _listener.start()
+
+
+def _after_fork() -> None:
+    # El hilo del listener no existe en el proceso hijo (workers de gunicorn)
+    if _queue_handler is not None:
+        _queue_handler.queue = queue.Queue(LOGGING_CONFIG["queue_size"])
+        _start_listener()
+
+
+def configure_logging() -> None:
+    """
+    Instalar el handler de cola en el logger raíz con LOG_LEVEL y los
+    niveles de LOG_LEVELS. Idempotente: lo llaman app.main, gunicorn_conf
+    y los comandos (python -m app.migrate).
+    """
+    global _queue_handler
+    with _lock:
+        if _queue_handler is not None:
+            return
+
+        _queue_handler = LogQueueHandler(queue.Queue(LOGGING_CONFIG["queue_size"]))
+        _queue_handler.addFilter(RequestIdFilter())
+        if LOGGING_CONFIG["sampling"]:
+            _queue_handler.addFilter(SamplingFilter(LOGGING_CONFIG["sampling"]))
+
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(LOGGING_CONFIG["level"])
+        for name, level in LOGGING_CONFIG["levels"].items():
+            logging.getLogger(name).setLevel(level)
+
+        _start_listener()
+        atexit.register(shutdown_logging)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_after_fork)
+
+
+def shutdown_logging() -> None:
+    """Escribir lo que quede en la cola (salida del proceso)"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+    if _queue_handler is not None and _queue_handler.dropped:
+        sys.stderr.write(f"{_queue_handler.dropped} registros de log descartados por cola llena\n")
@@ -0,0 +1,134 @@
+# Archivo: app/observability/loop_watchdog.py
+# Descripción: Watchdog del event loop de cada worker
+# Funcionalidad: Latido del loop, hilo vigilante, log de ruta y pila de los bloqueos, histograma de lag
+#
+# Las rutas son async def pero varias hacen trabajo síncrono (SQL, escritura
+# de documentos, os.path.exists, bcrypt): mientras corre, el worker no
+# atiende a ningún otro request. El loop programa un latido con call_later
+# cada LOOP_WATCHDOG_CONFIG["interval"] segundos y un hilo aparte vigila la
+# hora del último latido. Si pasan más de "threshold" segundos sin latir,
+# el loop está bloqueado: el hilo toma en ese momento la pila del hilo del
+# loop (el código culpable está en la hoja) y la ruta del request cuya
+# tarea está corriendo.
+#
+# asyncio en modo debug (slow_callback_duration) avisa recién cuando el
+# callback termina, sin pila, y encarece todo el loop. Esto cuesta un
+# callback cada 100 ms y un hilo que despierta unas pocas veces por segundo.
+#
+#     {"msg": "Event loop bloqueado por POST /api/auth/login", "event": "event_loop_blocked", "blocked_ms": 312.4, "stack": [...]}
+#     sum by (route) (rate(justtime_event_loop_blocked_total[5m]))
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config import LOOP_WATCHDOG_CONFIG
+from app.observability.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+from app.observability.profiling import frame_stack
+from app.observability.sql import route_name
+
+
+logger = logging.getLogger("justtime.loop")
+
+NO_REQUEST = "sin_request"
+
+# Tarea de cada request en curso -> scope ASGI (lo mantiene LoopWatchdogMiddleware)
+_request_scopes: Dict[asyncio.Task, Dict[str, Any]] = {}
+
+
+def register_request_task(scope: Dict[str, Any]) -> Optional[asyncio.Task]:
+    task = asyncio.current_task()
+    if task is not None:
+        _request_scopes[task] = scope
+    return task
+
+
+def unregister_request_task(task: Optional[asyncio.Task]) -> None:
+    if task is not None:
+        _request_scopes.pop(task, None)
+
+
+class LoopWatchdog:
+    """
+    Vigilante del event loop donde se llama start(). Cada bloqueo suma en
+    justtime_event_loop_blocked_total{route}; el log con la pila sale como
+    máximo una vez cada "report_interval" segundos por ruta, así una ruta
+    que bloquea en cada request no inunda el log.
+    """
+
+    def __init__(self, interval: Optional[float] = None, threshold: Optional[float] = None):
+        self.interval = interval or LOOP_WATCHDOG_CONFIG["interval"]
+        self.threshold = threshold or LOOP_WATCHDOG_CONFIG["threshold"]
+        self.blocks = 0
+        self._beat = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_report: Dict[str, float] = {}
+
+    def start(self) -> "LoopWatchdog":
+        """Arrancar desde el event loop a vigilar (lifespan)"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._handle = self._loop.call_later(self.interval, self._heartbeat)
+        self._thread = threading.Thread(target=self._watch, name="justtime-loop-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _heartbeat(self) -> None:
+        now = time.monotonic()
+        EVENT_LOOP_LAG.observe(max(0.0, now - self._beat - self.interval))
+        self._beat = now
+        if not self._stop.is_set():
+            self._handle = self._loop.call_later(self.interval, self._heartbeat)
+
+    def _watch(self) -> None:
+        reported = None  # latido del último bloqueo informado: uno por bloqueo
+        timeout = self.interval + self.threshold
+        while True:
+            beat = self._beat
+            remaining = beat + timeout - time.monotonic()
+            if remaining <= 0 and beat != reported:
+                reported = beat
+                self._report(beat)
+                remaining = self.interval
+            if self._stop.wait(max(remaining, 0.01)):
+                return
+
+    def _report(self, beat: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread)
+        task = asyncio.current_task(self._loop)
+        if self._beat != beat:
+            return  # el loop se liberó mientras se tomaba la pila
+        blocked = time.monotonic() - beat - self.interval
+        scope = _request_scopes.get(task) if task is not None else None
+        route = route_name(scope) if scope is not None else NO_REQUEST
+
+        self.blocks += 1
+        EVENT_LOOP_BLOCKS.labels(route).inc()
+
+        now = time.monotonic()
+        if now - self._last_report.get(route, float("-inf")) < LOOP_WATCHDOG_CONFIG["report_interval"]:
+            return
+        self._last_report[route] = now
+        stack = frame_stack(frame)[-LOOP_WATCHDOG_CONFIG["stack_limit"]:] if frame is not None else []
+        logger.warning("Event loop bloqueado por %s", route, extra={
+            "event": "event_loop_blocked",
+            "route": route,
+            "blocked_ms": round(blocked * 1000, 1),
+            "task": task.get_name() if task is not None else None,
+            "stack": stack
+        })
@@ -0,0 +1,146 @@
+# Archivo: app/observability/metrics.py
+# Descripción: Métricas Prometheus de la API, el pool de base de datos, archivos, bcrypt, cache, admisión, timeouts y event loop
+# Funcionalidad: Definición de métricas y exposición en texto para GET /metrics
+#
+# Con varios workers (gunicorn o python -m app.server) cada proceso escribe
+# sus valores en PROMETHEUS_MULTIPROC_DIR y /metrics agrega los archivos de
+# todos: cualquier worker que atienda el scrape responde por el servidor
+# completo. La variable la fija app.server.configure_metrics_dir() antes
+# de crear los workers; sin ella (un solo proceso) se usa el registro local.
+#
+# Consultas útiles:
+#     histogram_quantile(0.95, sum by (le, route) (rate(justtime_http_request_duration_seconds_bucket[5m])))
+#     sum(rate(justtime_cache_requests_total{result="hit"}[5m])) / sum(rate(justtime_cache_requests_total[5m]))
+
+import os
+import time
+from typing import Any, Callable, Tuple, TypeVar
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import multiprocess
+from starlette.concurrency import run_in_threadpool
+
+
+T = TypeVar("T")
+
+# Latencias de requests HTTP (segundos)
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Esperas cortas: pool, threadpool y lag del loop
+_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+HTTP_REQUESTS = Counter(
+    "justtime_http_requests_total",
+    "Requests HTTP atendidos",
+    ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "justtime_http_request_duration_seconds",
+    "Duración de requests HTTP por plantilla de ruta, hasta el último byte de la respuesta",
+    ["method", "route"],
+    buckets=_LATENCY_BUCKETS
+)
+HTTP_IN_FLIGHT = Gauge(
+    "justtime_http_requests_in_flight",
+    "Requests HTTP en curso",
+    multiprocess_mode="livesum"
+)
+DB_POOL_WAIT = Histogram(
+    "justtime_db_pool_checkout_seconds",
+    "Espera para obtener una conexión del pool (incluye abrir conexiones nuevas)",
+    ["pool"],
+    buckets=_WAIT_BUCKETS
+)
+UPLOAD_BYTES = Counter(
+    "justtime_upload_bytes_total",
+    "Bytes de documentos escritos a disco por FileService"
+)
+UPLOAD_LATENCY = Histogram(
+    "justtime_upload_duration_seconds",
+    "Duración de la escritura de documentos subidos",
+    buckets=_LATENCY_BUCKETS
+)
+BCRYPT_LATENCY = Histogram(
+    "justtime_bcrypt_seconds",
+    "Duración de hash / verificación bcrypt",
+    ["operation"],
+    buckets=_LATENCY_BUCKETS
+)
+THREADPOOL_QUEUE = Histogram(
+    "justtime_threadpool_queue_seconds",
+    "Espera de trabajo bloqueante por un hilo libre del threadpool",
+    ["task"],
+    buckets=_WAIT_BUCKETS
+)
+CACHE_REQUESTS = Counter(
+    "justtime_cache_requests_total",
+    "Lecturas de cache de get_or_set por resultado (hit / miss)",
+    ["result"]
+)
+EVENT_LOOP_LAG = Histogram(
+    "justtime_event_loop_lag_seconds",
+    "Retraso del event loop respecto del intervalo de muestreo",
+    buckets=_WAIT_BUCKETS
+)
+RATE_LIMITED = Counter(
+    "justtime_rate_limited_total",
+    "Requests rechazados con 429 por bucket agotado (user, ip o grupo de rutas)",
+    ["bucket"]
+)
+ADMISSION_WAIT = Histogram(
+    "justtime_admission_wait_seconds",
+    "Espera por un cupo de requests simultáneos del worker",
+    buckets=_WAIT_BUCKETS
+)
+LOAD_SHED = Counter(
+    "justtime_load_shed_total",
+    "Requests rechazados con 503 por falta de cupo de requests simultáneos"
+)
+REQUEST_TIMEOUTS = Counter(
+    "justtime_request_timeouts_total",
+    "Requests cortados por deadline, statement_timeout, pool agotado o desconexión del cliente",
+    ["group", "reason"]
+)
+DB_STATEMENTS_CANCELLED = Counter(
+    "justtime_db_statements_cancelled_total",
+    "Sentencias SQL en curso canceladas al vencer el deadline del request o desconectarse el cliente",
+    ["reason"]
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "justtime_event_loop_blocked_total",
+    "Callbacks que bloquearon el event loop más que el umbral del watchdog",
+    ["route"]
+)
+
+
+def observe_request(method: str, route: str, status: int, elapsed: float, timed: bool = True) -> None:
+    HTTP_REQUESTS.labels(method, route, str(status)).inc()
+    if timed:
+        HTTP_LATENCY.labels(method, route).observe(elapsed)
+
+
+async def run_in_threadpool_timed(task: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    run_in_threadpool que registra cuánto esperó el trabajo por un hilo libre
+    (40 por defecto en anyio): la cola crece cuando bcrypt u otras tareas
+    CPU-bound saturan el pool.
+    """
+    submitted = time.perf_counter()
+
+    def call() -> T:
+        THREADPOOL_QUEUE.labels(task).observe(time.perf_counter() - submitted)
+        return func(*args, **kwargs)
+
+    return await run_in_threadpool(call)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Cuerpo y content-type de GET /metrics"""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
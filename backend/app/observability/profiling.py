@@ -0,0 +1,248 @@
+# Archivo: app/observability/profiling.py
+# Descripción: Profiler por muestreo del proceso en vivo y volcado de tareas asyncio / hilos
+# Funcionalidad: Capturas de N segundos o de un request, guardadas como pilas colapsadas (.folded)
+#
+# Un hilo propio lee sys._current_frames() cada PROFILING_CONFIG["interval"]
+# segundos y cuenta cada pila en formato colapsado, una línea por pila:
+#
+#     thread:MainThread;run (asyncio/base_events.py:604);get_projects (app/routers/project_routes.py:37) 12
+#
+# Es el mismo formato de `py-spy record --format raw`: flamegraph.pl,
+# inferno-flamegraph y speedscope.app lo abren sin conversión. El costo es
+# del hilo de muestreo (sin instrumentar llamadas), así que se puede usar
+# sobre un worker de producción cargado.
+
+import asyncio
+import faulthandler
+import os
+import re
+import secrets
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.config import PROFILING_CONFIG
+
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_BACKEND_DIR = os.path.dirname(_APP_DIR)
+_STDLIB_DIR = os.path.dirname(os.__file__)
+_PROFILE_NAME = re.compile(r"^[\w.-]+\.folded$")
+
+# Una captura del proceso a la vez por worker
+_capture_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    """Ruta legible: relativa a backend/, a site-packages o a la stdlib"""
+    if filename.startswith(_BACKEND_DIR):
+        return os.path.relpath(filename, _BACKEND_DIR)
+    index = filename.rfind("site-packages" + os.sep)
+    if index != -1:
+        return filename[index + len("site-packages") + 1:]
+    if filename.startswith(_STDLIB_DIR):
+        return os.path.relpath(filename, _STDLIB_DIR)
+    return filename
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({_short_path(code.co_filename)}:{frame.f_lineno})".replace(";", ":")
+
+
+def frame_stack(frame) -> List[str]:
+    """Pila de la raíz a la hoja"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _runs_app_code(frame) -> bool:
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(_APP_DIR):
+            return True
+        frame = frame.f_back
+    return False
+
+
+class SamplingProfiler:
+    """
+    Muestrea las pilas de todos los hilos del proceso.
+
+    Con `task` (perfil de un request) solo cuenta el hilo del event loop
+    mientras esa tarea es la que corre, y los demás hilos solo cuando
+    ejecutan código de app/ (trabajo del threadpool). Las muestras del
+    threadpool pueden incluir requests concurrentes: no hay forma barata de
+    atribuir un hilo a un request.
+    """
+
+    def __init__(self, interval: Optional[float] = None, task: Optional[asyncio.Task] = None):
+        self.interval = interval or PROFILING_CONFIG["interval"]
+        self.task = task
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started = 0.0
+        self.elapsed = 0.0
+        self._loop = task.get_loop() if task is not None else None
+        self._loop_thread = threading.get_ident() if task is not None else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "SamplingProfiler":
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="justtime-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own)
+
+    def _sample(self, own: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            if self.task is not None:
+                if thread_id == self._loop_thread:
+                    if asyncio.current_task(self._loop) is not self.task:
+                        continue
+                elif not _runs_app_code(frame):
+                    continue
+            root = f"thread:{names.get(thread_id, thread_id)}"
+            self.stacks[";".join([root] + frame_stack(frame))] += 1
+        self.samples += 1
+
+    def folded(self) -> str:
+        """Pilas colapsadas (una por línea, con su cantidad de muestras)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "stacks": len(self.stacks),
+            "seconds": round(self.elapsed, 3),
+            "interval_ms": self.interval * 1000
+        }
+
+
+async def capture(seconds: float, interval: Optional[float] = None) -> SamplingProfiler:
+    """
+    Perfil de todo el proceso durante `seconds`. El event loop queda libre
+    mientras tanto (el muestreo corre en su propio hilo). RuntimeError si
+    ya hay una captura en curso en este worker.
+    """
+    if _capture_lock.locked():
+        raise RuntimeError("Ya hay una captura de perfil en curso en este worker")
+    async with _capture_lock:
+        profiler = SamplingProfiler(interval).start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+        return profiler
+
+
+def new_profile_name(kind: str) -> str:
+    """Nombre único del archivo de un perfil ("captura" o "request")"""
+    return f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{secrets.token_hex(3)}.folded"
+
+
+def save_profile(profiler: SamplingProfiler, name: str) -> str:
+    """Escribir el perfil en output_dir (bloqueante: usar en el threadpool)"""
+    directory = PROFILING_CONFIG["output_dir"]
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, name), "w", encoding="utf-8") as file:
+        file.write(profiler.folded())
+    _prune(directory)
+    return name
+
+
+def _prune(directory: str) -> None:
+    profiles = sorted(
+        (entry for entry in os.scandir(directory) if _PROFILE_NAME.match(entry.name)),
+        key=lambda entry: entry.stat().st_mtime
+    )
+    for entry in profiles[:-PROFILING_CONFIG["keep"]]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Perfiles guardados, del más reciente al más viejo (de todos los workers)"""
+    directory = PROFILING_CONFIG["output_dir"]
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for entry in os.scandir(directory):
+        if _PROFILE_NAME.match(entry.name):
+            stat = entry.stat()
+            profiles.append({"name": entry.name, "bytes": stat.st_size, "created": stat.st_mtime})
+    return sorted(profiles, key=lambda profile: profile["created"], reverse=True)
+
+
+def profile_path(name: str) -> Optional[str]:
+    """Ruta de un perfil guardado; None si el nombre no es válido o no existe"""
+    if not _PROFILE_NAME.match(name):
+        return None
+    path = os.path.join(PROFILING_CONFIG["output_dir"], name)
+    return path if os.path.isfile(path) else None
+
+
+def dump_tasks(limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Tareas asyncio vivas del event loop actual con la cadena de awaits
+    donde está suspendida cada una (qué espera cada request, stream o job).
+    """
+    tasks = []
+    for task in asyncio.all_tasks():
+        coro = task.get_coro()
+        tasks.append({
+            "name": task.get_name(),
+            "coro": getattr(coro, "__qualname__", repr(coro)),
+            "stack": [_frame_label(frame) for frame in task.get_stack(limit=limit)]
+        })
+    return sorted(tasks, key=lambda task: task["name"])
+
+
+def dump_threads() -> Dict[str, List[str]]:
+    """Pila actual de cada hilo (threadpool, scheduler, profiler)"""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    return {
+        f"{names.get(thread_id, 'desconocido')} ({thread_id})": frame_stack(frame)
+        for thread_id, frame in sys._current_frames().items()
+    }
+
+
+def register_stack_dump_signal() -> bool:
+    """
+    `kill -USR2 <pid del worker>` escribe en stderr la pila de todos los
+    hilos. Sirve cuando el event loop está bloqueado y ni siquiera el
+    endpoint de volcado puede responder.
+    """
+    if not hasattr(signal, "SIGUSR2"):
+        return False
+    try:
+        faulthandler.register(signal.SIGUSR2, all_threads=True)
+        return True
+    except (RuntimeError, ValueError):
+        # Fuera del hilo principal (TestClient) no se pueden registrar señales
+        return False
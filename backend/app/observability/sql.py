@@ -0,0 +1,138 @@
+# Archivo: app/observability/sql.py
+# Descripción: Instrumentación de sentencias SQL a nivel de cursor
+# Funcionalidad: Conteo, tiempo total y sentencia más lenta por request; log de consultas lentas
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import SQL_METRICS_CONFIG
+
+
+logger = logging.getLogger("justtime.sql")
+
+_START_KEY = "justtime_query_start"
+_registered = False
+
+
+class QueryStats:
+    """
+    Sentencias ejecutadas dentro de un request (o de un bloque track_queries).
+    Las dependencias sync corren en el threadpool con una copia del contexto:
+    el objeto es el mismo, así que sus consultas también se cuentan aquí.
+    """
+
+    __slots__ = ("scope", "label", "count", "total", "slowest", "slowest_statement")
+
+    def __init__(self, scope: Optional[Dict[str, Any]] = None, label: Optional[str] = None):
+        self.scope = scope
+        self.label = label
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.slowest:
+            self.slowest = elapsed
+            self.slowest_statement = statement
+
+    @property
+    def route(self) -> str:
+        # El router completa scope["route"] después de que el middleware crea las stats
+        return self.label or (route_name(self.scope) if self.scope is not None else "-")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "route": self.route,
+            "queries": self.count,
+            "db_ms": round(self.total * 1000, 2),
+            "slowest_ms": round(self.slowest * 1000, 2),
+            "slowest_statement": _truncate(self.slowest_statement)
+        }
+
+
+_current: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar("query_stats", default=None)
+
+
+def route_name(scope: Dict[str, Any]) -> str:
+    """"GET /api/tasks/{task_id}": plantilla de la ruta, no la URL concreta"""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    method = scope.get("method")
+    return f"{method} {path}" if method else path
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries(scope: Optional[Dict[str, Any]] = None, label: Optional[str] = None) -> Iterator[QueryStats]:
+    """Contar las sentencias del bloque (requests, jobs, scripts y tests)"""
+    stats = QueryStats(scope, label)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _truncate(statement: Optional[str]) -> Optional[str]:
+    if statement is None:
+        return None
+    statement = " ".join(statement.split())
+    limit = SQL_METRICS_CONFIG["statement_max_length"]
+    return statement if len(statement) <= limit else statement[:limit] + "..."
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= SQL_METRICS_CONFIG["slow_query_ms"]:
+        # Parámetros omitidos: pueden contener datos personales
+        logger.warning("Consulta lenta (%.0f ms)", elapsed * 1000, extra={
+            "event": "slow_query",
+            "route": stats.route if stats is not None else "-",
+            "duration_ms": round(elapsed * 1000, 2),
+            "statement": _truncate(statement),
+            "executemany": executemany
+        })
+
+
+def _handle_error(exception_context) -> None:
+    # Una sentencia fallida no llega a after_cursor_execute: descartar su inicio
+    connection = exception_context.connection
+    if connection is not None:
+        starts = connection.info.get(_START_KEY)
+        if starts:
+            starts.pop()
+
+
+def register_sql_instrumentation() -> None:
+    """Escuchar todos los engines (primario, réplica y los creados después del fork). Idempotente"""
+    global _registered
+    if _registered or not SQL_METRICS_CONFIG["enabled"]:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _registered = True
@@ -0,0 +1,228 @@
+# Archivo: app/observability/tracing.py
+# Descripción: Trazas distribuidas con OpenTelemetry (opcional)
+# Funcionalidad: Spans de request, métodos de controlador, sentencias SQL y archivos; exportación OTLP con muestreo
+#
+# Jerarquía de un request trazado:
+#
+#     GET /api/projects/{project_id}              (TracingMiddleware, SERVER)
+#       └─ ProjectController.get_project_by_id    (métodos públicos de cada BaseController)
+#            └─ SELECT                            (eventos de cursor de SQLAlchemy, CLIENT)
+#
+# Con TRACING_ENABLED=false, o sin los paquetes opentelemetry instalados,
+# los controladores no se envuelven y el middleware solo pasa el request.
+# Para probar localmente:
+#     docker run -p 16686:16686 -p 4318:4318 jaegertracing/all-in-one
+#     TRACING_ENABLED=true TRACING_SAMPLE_RATIO=1 uvicorn app.main:app   (UI en http://localhost:16686)
+
+import functools
+import inspect
+import logging
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import PROJECT_INFO
+from app.config import TRACING_CONFIG
+from app.observability.logs import current_request_id
+from app.observability.sql import route_name
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - opentelemetry es opcional
+    trace = None
+
+
+logger = logging.getLogger(__name__)
+
+_SPAN_KEY = "justtime_query_span"
+
+_tracer = None
+_provider = None
+
+
+def tracing_available() -> bool:
+    """TRACING_ENABLED y opentelemetry instalado (se decide al importar los controladores)"""
+    return TRACING_CONFIG["enabled"] and trace is not None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def configure_tracing(exporter=None) -> bool:
+    """
+    Crear el TracerProvider con muestreo ParentBased(TraceIdRatioBased) y
+    exportación OTLP/HTTP por lotes (hilo propio), y escuchar las sentencias
+    SQL de todos los engines. `exporter` reemplaza al OTLP (pruebas).
+    Idempotente; False si el tracing está deshabilitado o no disponible.
+    """
+    global _tracer, _provider
+    if _tracer is not None:
+        return True
+    if not tracing_available():
+        return False
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+        if exporter is None:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            exporter = OTLPSpanExporter(endpoint=TRACING_CONFIG["endpoint"])
+    except ImportError as e:
+        logger.warning("Tracing deshabilitado: falta opentelemetry-sdk / exporter OTLP (%s)", e)
+        return False
+
+    _provider = TracerProvider(
+        resource=Resource.create({
+            "service.name": TRACING_CONFIG["service_name"],
+            "service.version": PROJECT_INFO["version"]
+        }),
+        sampler=ParentBased(TraceIdRatioBased(TRACING_CONFIG["sample_ratio"]))
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    _tracer = _provider.get_tracer("justtime")
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    logger.info("Tracing OTLP habilitado", extra={
+        "endpoint": TRACING_CONFIG["endpoint"], "sample_ratio": TRACING_CONFIG["sample_ratio"]
+    })
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Exportar los spans pendientes y dejar de trazar (apagado del worker)"""
+    global _tracer, _provider
+    if _tracer is None:
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.remove(Engine, "handle_error", _handle_error)
+    provider, _tracer, _provider = _provider, None, None
+    provider.shutdown()
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None):
+    """Span hijo del actual (context manager); sin tracing no hace nada"""
+    if _tracer is None:
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def _wrap(func: Callable, name: Callable[..., str]) -> Callable:
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _tracer is None:
+                return await func(*args, **kwargs)
+            with _tracer.start_as_current_span(name(*args)):
+                return await func(*args, **kwargs)
+        wrapper = async_wrapper
+    else:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.start_as_current_span(name(*args)):
+                return func(*args, **kwargs)
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorador: span con el nombre dado (o el de la función) en cada llamada"""
+    def decorator(func: Callable) -> Callable:
+        if not tracing_available():
+            return func
+        span_name = name or func.__qualname__
+        return _wrap(func, lambda *args: span_name)
+    return decorator
+
+
+def instrument_methods(cls: type, exclude: frozenset = frozenset()) -> type:
+    """
+    Envolver los métodos públicos definidos en `cls` en spans
+    "<Clase concreta>.<método>". Lo usa BaseController.__init_subclass__:
+    cualquier controlador, lo cree ServiceFactory o una dependencia de
+    ruta, queda trazado sin decorar cada método.
+    """
+    if not tracing_available():
+        return cls
+    for attribute, member in list(vars(cls).items()):
+        if (attribute.startswith("_") or attribute in exclude
+                or not inspect.isfunction(member) or getattr(member, "__traced__", False)):
+            continue
+        setattr(cls, attribute, _wrap(
+            member, lambda self, *args, _method=member.__name__: f"{type(self).__name__}.{_method}"
+        ))
+    return cls
+
+
+@contextmanager
+def request_span(scope: Dict[str, Any]) -> Iterator[Any]:
+    """
+    Span SERVER de un request HTTP, hijo del traceparent entrante si lo hay.
+    El nombre se completa con la plantilla de la ruta al terminar (el router
+    la resuelve dentro del request).
+    """
+    carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope.get("headers", [])}
+    method = scope.get("method", "HTTP")
+    with _tracer.start_as_current_span(
+        method,
+        context=propagate.extract(carrier),
+        kind=SpanKind.SERVER,
+        attributes={
+            "http.request.method": method,
+            "url.path": scope.get("path", ""),
+            "justtime.request_id": current_request_id() or ""
+        }
+    ) as span:
+        try:
+            yield span
+        finally:
+            if scope.get("route") is not None:
+                span.update_name(route_name(scope))
+                span.set_attribute("http.route", scope["route"].path)
+
+
+def finish_request_span(span, status: int) -> None:
+    span.set_attribute("http.response.status_code", status)
+    if status >= 500:
+        span.set_status(Status(StatusCode.ERROR))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Solo dentro de un span muestreado: sin spans raíz por pings del pool o jobs
+    span = None
+    if trace.get_current_span().is_recording():
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        text = " ".join(statement.split())
+        limit = TRACING_CONFIG["statement_max_length"]
+        span = _tracer.start_span(operation, kind=SpanKind.CLIENT, attributes={
+            "db.system": conn.dialect.name,
+            "db.operation": operation,
+            "db.statement": text if len(text) <= limit else text[:limit] + "..."
+        })
+    conn.info.setdefault(_SPAN_KEY, []).append(span)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    spans = conn.info.get(_SPAN_KEY)
+    span = spans.pop() if spans else None
+    if span is not None:
+        span.end()
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    spans = connection.info.get(_SPAN_KEY) if connection is not None else None
+    span = spans.pop() if spans else None
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
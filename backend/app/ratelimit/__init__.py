@@ -0,0 +1,37 @@
+# Archivo: app/ratelimit/__init__.py
+# Descripción: Inicialización del módulo de control de admisión
+# Funcionalidad: Token buckets por usuario / IP / grupo de rutas (memoria o Redis) y cupos de requests simultáneos
+
+from .backends import Bucket, BucketStore, MemoryBucketStore, RedisBucketStore, retry_after_seconds
+from .core import (
+    ConcurrencyLimiter,
+    Decision,
+    RateLimiter,
+    build_store,
+    get_concurrency_limiter,
+    get_rate_limiter,
+    is_exempt,
+    is_long_lived,
+    route_group,
+    set_concurrency_limiter,
+    set_rate_limiter
+)
+
+__all__ = [
+    "Bucket",
+    "BucketStore",
+    "MemoryBucketStore",
+    "RedisBucketStore",
+    "retry_after_seconds",
+    "ConcurrencyLimiter",
+    "Decision",
+    "RateLimiter",
+    "build_store",
+    "get_concurrency_limiter",
+    "get_rate_limiter",
+    "is_exempt",
+    "is_long_lived",
+    "route_group",
+    "set_concurrency_limiter",
+    "set_rate_limiter"
+]
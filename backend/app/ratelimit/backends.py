@@ -0,0 +1,140 @@
+# Archivo: app/ratelimit/backends.py
+# Descripción: Almacenamiento de los token buckets del límite de tasa
+# Funcionalidad: Buckets en memoria (por worker, LRU) y en Redis (compartidos, script Lua atómico)
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class Bucket(NamedTuple):
+    """Token bucket: `rate` tokens por segundo hasta `capacity`; `name` es la etiqueta de la métrica"""
+    key: str
+    rate: float
+    capacity: float
+    name: str
+
+
+class BucketStore(ABC):
+    """
+    Interfaz asíncrona de los stores de buckets. take() es todo o nada:
+    consume un token de cada bucket solo si todos tienen, así un request
+    rechazado por el bucket de analytics no gasta el del usuario.
+    """
+
+    @abstractmethod
+    async def take(self, buckets: Sequence[Bucket]) -> Tuple[float, Optional[int]]:
+        """
+        (0, None) si se consumió un token de cada bucket; si no
+        (segundos hasta que haya token, índice del bucket que limita)
+        """
+        pass
+
+    async def close(self) -> None:
+        """Liberar conexiones (si el store las tiene)"""
+        return None
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Buckets del proceso: cada worker limita por su cuenta (con N workers el
+    límite efectivo es N veces el configurado). Un bucket que se llenó de
+    nuevo equivale a uno ausente, así que desalojar por LRU no regala tokens
+    salvo a clientes que lleven tiempo sin pedir nada.
+    """
+
+    def __init__(self, max_entries: int = 10000, clock=time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, buckets: Sequence[Bucket]) -> Tuple[float, Optional[int]]:
+        # Sin await entre leer y escribir: atómico dentro del event loop
+        now = self._clock()
+        levels: List[float] = []
+        wait, limiting = 0.0, None
+        for index, bucket in enumerate(buckets):
+            tokens, updated = self._buckets.get(bucket.key, (bucket.capacity, now))
+            tokens = min(bucket.capacity, tokens + (now - updated) * bucket.rate)
+            levels.append(tokens)
+            if tokens < 1 and (1 - tokens) / bucket.rate > wait:
+                wait, limiting = (1 - tokens) / bucket.rate, index
+        if limiting is not None:
+            return wait, limiting
+
+        for bucket, tokens in zip(buckets, levels):
+            self._buckets[bucket.key] = (tokens - 1, now)
+            self._buckets.move_to_end(bucket.key)
+        while len(self._buckets) > self.max_entries:
+            self._buckets.popitem(last=False)
+        return 0.0, None
+
+
+# KEYS: claves de los buckets; ARGV: rate y capacity de cada uno, en orden.
+# Usa el reloj de Redis: todos los workers y hosts ven el mismo tiempo.
+_TAKE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local levels = {}
+local wait, limiting = 0, 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local updated = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+    levels[i] = tokens
+    if tokens < 1 and (1 - tokens) / rate > wait then
+        wait, limiting = (1 - tokens) / rate, i
+    end
+end
+if limiting > 0 then
+    return {tostring(wait), limiting}
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    redis.call('HSET', key, 'tokens', tostring(levels[i] - 1), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return {'0', 0}
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """
+    Buckets compartidos entre workers sobre el protocolo Redis: el límite
+    es por usuario en todo el despliegue. Cada bucket es un HASH (tokens,
+    ts) que expira cuando se habría llenado de nuevo; la lectura, el
+    cálculo y la escritura de todos los buckets del request corren en un
+    solo script (una ida y vuelta, sin carreras entre workers).
+
+    Acepta un cliente ya construido (como RedisBackend del cache).
+    """
+
+    def __init__(self, url: str = "", client: Any = None):
+        if client is None:
+            import redis.asyncio as redis_asyncio
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self._script = client.register_script(_TAKE_SCRIPT)
+
+    async def take(self, buckets: Sequence[Bucket]) -> Tuple[float, Optional[int]]:
+        args: List[float] = []
+        for bucket in buckets:
+            args.extend((bucket.rate, bucket.capacity))
+        wait, limiting = await self._script(keys=[bucket.key for bucket in buckets], args=args)
+        if int(limiting) == 0:
+            return 0.0, None
+        return float(wait), int(limiting) - 1
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+def retry_after_seconds(wait: float) -> int:
+    """Valor entero del header Retry-After (al menos 1 segundo)"""
+    return max(1, math.ceil(wait))
@@ -0,0 +1,177 @@
+# Archivo: app/ratelimit/core.py
+# Descripción: Límite de tasa por usuario / IP / grupo de rutas y límite de requests simultáneos
+# Funcionalidad: Arma los buckets de cada request, decide 429 y reparte los cupos del worker
+#
+# Un usuario que repite /api/analytics/resumen-completo o la búsqueda de
+# documentos puede ocupar el pool (5 + 10 conexiones por worker) y dejar
+# esperando a todos los demás. Dos defensas independientes:
+#
+# - Tasa: cada request consume un token del bucket de su IP, del de su
+#   usuario (claim sub del JWT) y, en rutas caras, del bucket del grupo
+#   (analytics, search, uploads) para ese usuario. Bucket vacío: 429 con
+#   Retry-After = segundos hasta el próximo token.
+# - Concurrencia: como mucho max_in_flight requests a la vez por worker
+#   (por defecto el tamaño del pool); el resto espera queue_timeout
+#   segundos por un cupo y si no lo obtiene recibe 503. Es una cola en
+#   memoria, no depende de Redis.
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from starlette.datastructures import Headers
+
+from app.config import RATE_LIMIT_CONFIG
+from app.observability.metrics import ADMISSION_WAIT
+from app.ratelimit.backends import Bucket, BucketStore, MemoryBucketStore, RedisBucketStore
+from app.utils.security import token_from_header, user_id_from_token
+
+
+logger = logging.getLogger(__name__)
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    retry_after: float = 0.0
+    bucket: Optional[str] = None
+
+
+ALLOWED = Decision(True)
+
+
+def _matches(path: str, prefixes: List[str]) -> bool:
+    return any(path == prefix or path.startswith(prefix.rstrip("/") + "/") for prefix in prefixes)
+
+
+def is_exempt(path: str, config: Dict[str, Any] = RATE_LIMIT_CONFIG) -> bool:
+    return _matches(path, config["exempt"])
+
+
+def is_long_lived(path: str, config: Dict[str, Any] = RATE_LIMIT_CONFIG) -> bool:
+    return _matches(path, config["long_lived"])
+
+
+def route_group(method: str, path: str, config: Dict[str, Any] = RATE_LIMIT_CONFIG) -> Optional[str]:
+    """Grupo de rutas caras al que pertenece el request (o None)"""
+    for name, group in config["groups"].items():
+        if (not group["methods"] or method in group["methods"]) and _matches(path, group["prefixes"]):
+            return name
+    return None
+
+
+def _bucket(key: str, limits: Dict[str, Any], name: str) -> Bucket:
+    return Bucket(key, limits["per_minute"] / 60.0, float(limits["burst"]), name)
+
+
+class RateLimiter:
+    """
+    Token buckets de los requests sobre un store intercambiable.
+    Los errores del store nunca rompen el request: se deja pasar (mejor
+    sin límite unos segundos que la API caída junto con Redis).
+    """
+
+    def __init__(self, store: BucketStore, config: Dict[str, Any] = RATE_LIMIT_CONFIG):
+        self.store = store
+        self.config = config
+
+    def buckets_for(self, scope: Dict[str, Any]) -> List[Bucket]:
+        prefix = self.config["prefix"]
+        ip = scope["client"][0] if scope.get("client") else "anonimo"
+        user_id = user_id_from_token(token_from_header(Headers(scope=scope).get("authorization")))
+
+        buckets = [_bucket(f"{prefix}ip:{ip}", self.config["ip"], "ip")]
+        identity = f"ip:{ip}"
+        if user_id is not None:
+            identity = f"user:{user_id}"
+            buckets.append(_bucket(f"{prefix}{identity}", self.config["user"], "user"))
+
+        group = route_group(scope["method"], scope["path"], self.config)
+        if group is not None:
+            buckets.append(_bucket(f"{prefix}{group}:{identity}", self.config["groups"][group], group))
+        return buckets
+
+    async def check(self, scope: Dict[str, Any]) -> Decision:
+        buckets = self.buckets_for(scope)
+        try:
+            wait, limiting = await self.store.take(buckets)
+        except Exception as e:
+            logger.warning("Límite de tasa sin store, request admitido: %s", e)
+            return ALLOWED
+        if limiting is None:
+            return ALLOWED
+        return Decision(False, wait, buckets[limiting].name)
+
+    async def close(self) -> None:
+        await self.store.close()
+
+
+class ConcurrencyLimiter:
+    """
+    Cupos de requests simultáneos del worker. Un request sin cupo espera
+    en orden de llegada hasta `queue_timeout` segundos; si el servidor
+    sigue saturado es mejor un 503 rápido que un request que espera el
+    pool 30 segundos y expira del lado del cliente.
+    """
+
+    def __init__(self, limit: int, queue_timeout: float):
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> bool:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        else:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                return False
+            finally:
+                ADMISSION_WAIT.observe(time.perf_counter() - started)
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+
+def build_store(config: Dict[str, Any] = RATE_LIMIT_CONFIG) -> BucketStore:
+    """Crear store según RATE_LIMIT_CONFIG['backend'] (memory | redis)"""
+    if config["backend"].lower() == "redis":
+        return RedisBucketStore(config["url"])
+    return MemoryBucketStore(max_entries=config["max_entries"])
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_concurrency_limiter: Optional[ConcurrencyLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Instancia global del límite de tasa (creada al primer uso)"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(build_store(RATE_LIMIT_CONFIG))
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Reemplazar la instancia global (por ejemplo con un store de reloj controlado)"""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    """Cupos de requests simultáneos de este worker"""
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        _concurrency_limiter = ConcurrencyLimiter(RATE_LIMIT_CONFIG["max_in_flight"], RATE_LIMIT_CONFIG["queue_timeout"])
+    return _concurrency_limiter
+
+
+def set_concurrency_limiter(limiter: Optional[ConcurrencyLimiter]) -> None:
+    global _concurrency_limiter
+    _concurrency_limiter = limiter
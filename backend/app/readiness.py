@@ -0,0 +1,66 @@
+# Archivo: app/readiness.py
+# Descripción: Verificación de disponibilidad del worker para GET /ready
+# Funcionalidad: Conectividad y latencia de la base, revisión del esquema, estado del pool y drenado
+
+import asyncio
+import time
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from app.config import DATABASE_CONFIG, SERVER_CONFIG
+from app.database import get_engine
+from app.migrate import current_revision, head_revision
+from app.server import is_draining
+
+
+def pool_status() -> Dict[str, Any]:
+    """Conexiones del pool primario. StaticPool / NullPool (SQLite) no exponen contadores"""
+    pool = get_engine().pool
+    status: Dict[str, Any] = {"tipo": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        counter = getattr(pool, name, None)
+        if callable(counter):
+            status[name] = counter()
+    if "size" in status:
+        # Informativo: un pool saturado no saca al worker de rotación (todos lo estarían)
+        status["saturado"] = status["checkedout"] >= status["size"] + DATABASE_CONFIG["max_overflow"]
+    return status
+
+
+def _check_database() -> Dict[str, Any]:
+    started = time.perf_counter()
+    with get_engine().connect() as connection:
+        connection.execute(text("SELECT 1"))
+        revision = current_revision(connection)
+    return {
+        "ok": True,
+        "latencia_ms": round((time.perf_counter() - started) * 1000, 1),
+        "revision": revision
+    }
+
+
+async def check_readiness() -> Tuple[bool, Dict[str, Any]]:
+    """
+    Listo = base alcanzable dentro de ready_timeout, esquema en la última
+    migración y worker sin apagarse. La consulta corre en el threadpool:
+    una base colgada nunca bloquea el event loop.
+    """
+    try:
+        database = await asyncio.wait_for(run_in_threadpool(_check_database), SERVER_CONFIG["ready_timeout"])
+    except asyncio.TimeoutError:
+        database = {"ok": False, "error": f"sin respuesta en {SERVER_CONFIG['ready_timeout']}s"}
+    except Exception as e:
+        database = {"ok": False, "error": str(e).splitlines()[0]}
+
+    head = head_revision()
+    revision = database.get("revision")
+    checks = {
+        "database": database,
+        "schema": {"ok": database["ok"] and revision == head, "revision": revision, "head": head},
+        "pool": pool_status(),
+        "draining": is_draining()
+    }
+    ready = database["ok"] and checks["schema"]["ok"] and not checks["draining"]
+    return ready, checks
@@ -0,0 +1,18 @@
+# Archivo: app/realtime/__init__.py
+# Descripción: Inicialización del módulo de push en tiempo real
+# Funcionalidad: Broker (memoria / Redis pub/sub) y publicación de cambios vía WebSocket / SSE
+
+from .broker import Broker, LocalBroker, RedisBroker, Subscription, get_broker, set_broker
+from .publisher import build_message, push_changes, register_realtime_subscriber
+
+__all__ = [
+    "Broker",
+    "LocalBroker",
+    "RedisBroker",
+    "Subscription",
+    "get_broker",
+    "set_broker",
+    "build_message",
+    "push_changes",
+    "register_realtime_subscriber"
+]
@@ -0,0 +1,228 @@
+# Archivo: app/realtime/broker.py
+# Descripción: Broker de mensajes en tiempo real para WebSocket / SSE
+# Funcionalidad: Fan-out local a colas por conexión y pub/sub Redis entre workers
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Set
+
+from app.config import REALTIME_CONFIG
+from app.utils.responses import json_dumps
+
+
+logger = logging.getLogger(__name__)
+
+
+Message = Dict[str, Any]
+
+RESYNC = {"tipo": "resync"}
+PING = {"tipo": "ping"}
+# El proceso se apaga (SIGTERM / reciclado): el cliente debe reconectar a otro worker
+CLOSING = {"tipo": "cierre"}
+
+
+class Subscription:
+    """
+    Conexión suscrita. Sin filtros recibe todo; con filtros recibe los
+    mensajes de sus proyectos o los del propio usuario (OR entre ambos).
+    """
+
+    def __init__(
+        self,
+        usuario_id: int,
+        proyectos: Optional[Iterable[int]] = None,
+        propios: bool = False,
+        queue_size: Optional[int] = None
+    ):
+        self.usuario_id = usuario_id
+        # Loop de la conexión: los commits pueden ocurrir en otro hilo (worker de jobs)
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or REALTIME_CONFIG["queue_size"])
+        self.update_filters(proyectos, propios)
+
+    def update_filters(self, proyectos: Optional[Iterable[int]] = None, propios: bool = False) -> None:
+        self.proyectos: Set[int] = {int(p) for p in proyectos or ()}
+        self.propios = propios
+
+    def matches(self, message: Message) -> bool:
+        if message.get("broadcast") or (not self.proyectos and not self.propios):
+            return True
+        if self.proyectos and message.get("proyecto_id") in self.proyectos:
+            return True
+        return self.propios and message.get("usuario_id") == self.usuario_id
+
+    def deliver(self, message: Message) -> None:
+        """Encolar sin bloquear. Si el cliente no consume, se reemplaza la cola por un resync"""
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is not self.loop:
+            # asyncio.Queue no es thread-safe: encolar desde el loop de la conexión
+            self.loop.call_soon_threadsafe(self._enqueue, message)
+        else:
+            self._enqueue(message)
+
+    def _enqueue(self, message: Message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(CLOSING if message is CLOSING else RESYNC)
+
+    async def get(self, timeout: float) -> Message:
+        """Siguiente mensaje, o un ping si no hubo nada en `timeout` segundos"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return PING
+
+
+class Broker(ABC):
+    """Interfaz común: publicar a todos los workers y suscribir conexiones locales"""
+
+    def __init__(self):
+        self._subscriptions: Set[Subscription] = set()
+
+    def subscribe(self, subscription: Subscription) -> Subscription:
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    @property
+    def connections(self) -> int:
+        return len(self._subscriptions)
+
+    def _fan_out(self, message: Message) -> None:
+        """Entregar a las conexiones de ESTE proceso"""
+        for subscription in list(self._subscriptions):
+            if subscription.matches(message):
+                subscription.deliver(message)
+
+    @abstractmethod
+    async def publish(self, message: Message) -> None:
+        pass
+
+    def close_connections(self) -> None:
+        """
+        Pedir a las conexiones de este proceso que terminen. Los streams
+        SSE / WebSocket no acaban solos y bloquearían el drenado ordenado
+        del servidor hasta agotar graceful_timeout.
+        """
+        for subscription in list(self._subscriptions):
+            subscription.deliver(CLOSING)
+
+    async def close(self) -> None:
+        self._subscriptions.clear()
+
+
+class LocalBroker(Broker):
+    """Fan-out en proceso: válido con un solo worker (desarrollo)"""
+
+    async def publish(self, message: Message) -> None:
+        self._fan_out(message)
+
+
+class RedisBroker(Broker):
+    """
+    Pub/sub Redis: cada worker publica en el canal y un listener por proceso
+    reparte los mensajes recibidos a sus conexiones locales. Si Redis no
+    responde al publicar, el mensaje se entrega al menos a las conexiones
+    locales; si se corta la suscripción, el listener se reconecta solo.
+    """
+
+    def __init__(self, url: str = "", client: Any = None, channel: str = "justtime:realtime"):
+        super().__init__()
+        if client is None:
+            import redis.asyncio as redis_asyncio
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.channel = channel
+        self._listener: Optional[asyncio.Task] = None
+
+    def subscribe(self, subscription: Subscription) -> Subscription:
+        # El listener se arranca con la primera conexión, dentro del loop
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+        return super().subscribe(subscription)
+
+    async def publish(self, message: Message) -> None:
+        try:
+            await self.client.publish(self.channel, json_dumps(message))
+        except Exception as e:
+            logger.warning("Redis no disponible para tiempo real, entrega local: %s", e)
+            self._fan_out(message)
+
+    async def _listen(self) -> None:
+        """
+        Recibir del canal mientras el proceso tenga conexiones. Si Redis se
+        cae, reintentar con backoff; al volver, las conexiones reciben un
+        resync porque pudieron perderse mensajes mientras no hubo listener.
+        """
+        delay = REALTIME_CONFIG["reconnect_min"]
+        reconnecting = False
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if reconnecting:
+                    logger.info("Listener de tiempo real reconectado")
+                    self._fan_out({**RESYNC, "broadcast": True})
+                reconnecting, delay = False, REALTIME_CONFIG["reconnect_min"]
+                while True:
+                    item = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if item is None or item.get("type") != "message":
+                        continue
+                    try:
+                        self._fan_out(json.loads(item["data"]))
+                    except ValueError as e:
+                        logger.warning("Mensaje de tiempo real inválido: %s", e)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error en listener de tiempo real, reintento en %.1fs: %s", delay, e)
+                reconnecting = True
+            finally:
+                try:
+                    await pubsub.unsubscribe(self.channel)
+                    await pubsub.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REALTIME_CONFIG["reconnect_max"])
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        await super().close()
+        await self.client.close()
+
+
+_broker: Optional[Broker] = None
+
+
+def get_broker() -> Broker:
+    """Broker global según REALTIME_CONFIG"""
+    global _broker
+    if _broker is None:
+        if REALTIME_CONFIG["backend"].lower() == "redis":
+            _broker = RedisBroker(REALTIME_CONFIG["url"], channel=REALTIME_CONFIG["channel"])
+        else:
+            _broker = LocalBroker()
+    return _broker
+
+
+def set_broker(broker: Optional[Broker]) -> None:
+    """Reemplazar el broker global (pruebas con fakeredis)"""
+    global _broker
+    _broker = broker
@@ -0,0 +1,58 @@
+# Archivo: app/realtime/publisher.py
+# Descripción: Suscriptor del bus de eventos que alimenta el push en tiempo real
+# Funcionalidad: Convierte ChangeEvent de tareas/proyectos/documentos/actividades en mensajes
+
+from typing import List, Optional
+
+from app.config import REALTIME_CONFIG
+from app.events.bus import ChangeEvent, DELETE, INSERT, UPDATE, bus
+from app.realtime.broker import Message, get_broker
+
+
+_OPERACIONES = {INSERT: "creado", UPDATE: "actualizado", DELETE: "eliminado"}
+
+
+def build_message(event: ChangeEvent) -> Optional[Message]:
+    """Mensaje para los clientes; None si la tabla no se notifica"""
+    entidad = REALTIME_CONFIG["tables"].get(event.table)
+    if entidad is None:
+        return None
+
+    data = event.data or {}
+    campos = data.get("campos", [])
+    tipo = f"{entidad}.{_OPERACIONES[event.op]}"
+    if event.op == UPDATE and "estado" in campos:
+        tipo = f"{entidad}.estado"
+    elif event.op == UPDATE and "completada" in campos:
+        tipo = f"{entidad}.completada"
+
+    proyecto_id = event.pk if event.table == "proyectos" else data.get("proyecto_id_fk")
+    message: Message = {
+        "tipo": tipo,
+        "tabla": event.table,
+        "operacion": event.op,
+        "id": event.pk,
+        "proyecto_id": proyecto_id,
+        "usuario_id": data.get("usuario_id_fk", data.get("subido_por_fk")),
+        "campos": campos,
+        "datos": {k: data[k] for k in ("estado", "completada") if k in data}
+    }
+    if event.pk is None:
+        # UPDATE/DELETE masivo: no se sabe qué filas cambiaron, avisar a todos
+        message["broadcast"] = True
+    return message
+
+
+async def push_changes(events: List[ChangeEvent]) -> None:
+    """Publicar los cambios confirmados a las conexiones suscritas"""
+    broker = get_broker()
+    for event in events:
+        message = build_message(event)
+        if message is not None:
+            await broker.publish(message)
+
+
+def register_realtime_subscriber() -> None:
+    """Conectar el push al bus de eventos (idempotente)"""
+    if REALTIME_CONFIG["enabled"]:
+        bus.subscribe(push_changes, tables=REALTIME_CONFIG["tables"].keys())
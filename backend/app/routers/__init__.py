@@ -2,7 +2,7 @@
 # Descripción: Inicialización del módulo de routers FastAPI
 # Funcionalidad: Definición de rutas API REST para el sistema
 
-from . import auth_routes, task_routes, project_routes,contact_routes, analytics_routes, template_routes,pending_activity_routes, configuracion_routes,employee_routes
+from . import auth_routes, task_routes, project_routes,contact_routes, analytics_routes, template_routes,pending_activity_routes, configuracion_routes,employee_routes, realtime_routes, sync_routes, job_routes, profiling_routes
 
 __all__ = [
     "auth_routes",
@@ -13,5 +13,9 @@ __all__ = [
     "template_routes",
     "pending_activity_routes",
     "configuracion_routes",
-    "employee_routes"
+    "employee_routes",
+    "realtime_routes",
+    "sync_routes",
+    "job_routes",
+    "profiling_routes"
 ]
@@ -4,29 +4,79 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional
+from sqlalchemy import case, func
+from typing import Any, Dict, List, Optional
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models.proyecto import Proyecto
 from app.models.categoria_proyecto import CategoriaProyecto
 from app.models.contacto import Contacto
-from app.models.tarea import Tarea
 from app.routers.auth_routes import get_current_user
+from app.cache import cached
+from app.events import get_estado_rollup
+from app.config import CACHE_CONFIG
+from app.observability.tracing import traced
 
 
 # Crear router
 router = APIRouter()
 
 
+@traced()
+def _top_contactos(db: Session, limit: int) -> List[Dict[str, Any]]:
+    """
+    Contactos con más casos y su desglose activos / finalizados en una sola
+    consulta (COUNT condicional), sin dos COUNT extra por contacto.
+    """
+    results = db.query(
+        Contacto.id_contacto,
+        Contacto.nombre,
+        Contacto.tipo,
+        func.count(Proyecto.id_proyecto).label('total_casos'),
+        func.count(case((Proyecto.estado == 'activo', 1))).label('casos_activos'),
+        func.count(case((Proyecto.estado == 'finalizado', 1))).label('casos_finalizados')
+    ).join(
+        Proyecto,
+        Proyecto.contacto_id_fk == Contacto.id_contacto
+    ).group_by(
+        Contacto.id_contacto,
+        Contacto.nombre,
+        Contacto.tipo
+    ).order_by(
+        func.count(Proyecto.id_proyecto).desc()
+    ).limit(limit).all()
+    
+    return [
+        {
+            "contacto_id": c.id_contacto,
+            "contacto_nombre": c.nombre,
+            "contacto_tipo": c.tipo,
+            "total_casos": c.total_casos,
+            "casos_activos": c.casos_activos,
+            "casos_finalizados": c.casos_finalizados
+        }
+        for c in results
+    ]
+
+
+@traced()
+def _conteo_por_estado(db: Session, model, *filtros) -> Dict[str, int]:
+    """{estado: cantidad} de proyectos o tareas con un solo GROUP BY"""
+    id_column = model.__mapper__.primary_key[0]
+    return dict(
+        db.query(model.estado, func.count(id_column)).filter(*filtros).group_by(model.estado).all()
+    )
+
+
 @router.get(
     "/casos-por-categoria",
     summary="Obtener casos por categoría",
     description="Retorna la cantidad de casos agrupados por categoría jurídica"
 )
+@cached("analytics:casos-por-categoria", ttl=CACHE_CONFIG["ttl"]["analytics"], tags=["proyectos", "categorias_proyecto"])
 async def get_casos_por_categoria(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Obtener casos por categoría"""
     try:
@@ -77,14 +127,16 @@ async def get_casos_por_categoria(
     summary="Obtener casos por estado",
     description="Retorna la cantidad de casos agrupados por estado"
 )
+@cached("analytics:casos-por-estado", ttl=CACHE_CONFIG["ttl"]["analytics"], tags=["proyectos"])
 async def get_casos_por_estado(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Obtener casos por estado"""
     try:
-        # Contar total de proyectos
-        total_proyectos = db.query(func.count(Proyecto.id_proyecto)).scalar()
+        # Conteo por estado desde el rollup que mantiene el bus de eventos
+        por_estado = await get_estado_rollup(db, "proyectos")
+        total_proyectos = sum(por_estado.values())
         
         if total_proyectos == 0:
             return {
@@ -93,21 +145,13 @@ async def get_casos_por_estado(
                 "total": 0
             }
         
-        # Contar por estado
-        results = db.query(
-            Proyecto.estado,
-            func.count(Proyecto.id_proyecto).label('total_casos')
-        ).group_by(
-            Proyecto.estado
-        ).all()
-        
         # Formatear datos con porcentajes
         data = []
-        for result in results:
-            porcentaje = round((result.total_casos / total_proyectos) * 100, 2)
+        for estado, total_casos in por_estado.items():
+            porcentaje = round((total_casos / total_proyectos) * 100, 2)
             item = {
-                "estado": result.estado,
-                "total_casos": result.total_casos,
+                "estado": estado,
+                "total_casos": total_casos,
                 "porcentaje": porcentaje
             }
             data.append(item)
@@ -130,58 +174,15 @@ async def get_casos_por_estado(
     summary="Obtener top contactos con más casos",
     description="Retorna los contactos con más casos registrados"
 )
+@cached("analytics:casos-por-contacto", ttl=CACHE_CONFIG["ttl"]["analytics"], tags=["proyectos", "contactos"])
 async def get_casos_por_contacto(
     limit: int = Query(default=10, ge=1, le=50),
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Obtener top contactos con más casos"""
     try:
-        # Query principal
-        results = db.query(
-            Contacto.id_contacto,
-            Contacto.nombre,
-            Contacto.tipo,
-            func.count(Proyecto.id_proyecto).label('total_casos')
-        ).join(
-            Proyecto,
-            Proyecto.contacto_id_fk == Contacto.id_contacto
-        ).group_by(
-            Contacto.id_contacto,
-            Contacto.nombre,
-            Contacto.tipo
-        ).order_by(
-            func.count(Proyecto.id_proyecto).desc()
-        ).limit(limit).all()
-        
-        # Formatear datos y obtener desglose por estado
-        data = []
-        for contacto in results:
-            # Contar casos activos
-            casos_activos = db.query(
-                func.count(Proyecto.id_proyecto)
-            ).filter(
-                Proyecto.contacto_id_fk == contacto.id_contacto,
-                Proyecto.estado == 'activo'
-            ).scalar()
-            
-            # Contar casos finalizados
-            casos_finalizados = db.query(
-                func.count(Proyecto.id_proyecto)
-            ).filter(
-                Proyecto.contacto_id_fk == contacto.id_contacto,
-                Proyecto.estado == 'finalizado'
-            ).scalar()
-            
-            item = {
-                "contacto_id": contacto.id_contacto,
-                "contacto_nombre": contacto.nombre,
-                "contacto_tipo": contacto.tipo,
-                "total_casos": contacto.total_casos,
-                "casos_activos": casos_activos or 0,
-                "casos_finalizados": casos_finalizados or 0
-            }
-            data.append(item)
+        data = _top_contactos(db, limit)
         
         return {
             "success": True,
@@ -200,10 +201,11 @@ async def get_casos_por_contacto(
     "/casos-contacto/{contacto_id}",
     summary="Obtener estadísticas de un contacto específico"
 )
+@cached("analytics:casos-contacto", ttl=CACHE_CONFIG["ttl"]["analytics"], tags=["proyectos", "contactos"])
 async def get_casos_contacto_especifico(
     contacto_id: int,
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Obtener estadísticas de un contacto específico"""
     try:
@@ -219,26 +221,10 @@ async def get_casos_contacto_especifico(
             )
         
         # Contar casos por estado
-        casos_activos = db.query(
-            func.count(Proyecto.id_proyecto)
-        ).filter(
-            Proyecto.contacto_id_fk == contacto_id,
-            Proyecto.estado == 'activo'
-        ).scalar()
-        
-        casos_pausados = db.query(
-            func.count(Proyecto.id_proyecto)
-        ).filter(
-            Proyecto.contacto_id_fk == contacto_id,
-            Proyecto.estado == 'pausado'
-        ).scalar()
-        
-        casos_finalizados = db.query(
-            func.count(Proyecto.id_proyecto)
-        ).filter(
-            Proyecto.contacto_id_fk == contacto_id,
-            Proyecto.estado == 'finalizado'
-        ).scalar()
+        por_estado = _conteo_por_estado(db, Proyecto, Proyecto.contacto_id_fk == contacto_id)
+        casos_activos = por_estado.get('activo', 0)
+        casos_pausados = por_estado.get('pausado', 0)
+        casos_finalizados = por_estado.get('finalizado', 0)
         
         total_casos = (casos_activos or 0) + (casos_pausados or 0) + (casos_finalizados or 0)
         
@@ -268,26 +254,19 @@ async def get_casos_contacto_especifico(
     "/resumen-completo",
     summary="Obtener resumen completo de analytics"
 )
+@cached("analytics:resumen-completo", ttl=CACHE_CONFIG["ttl"]["analytics"], tags=["proyectos", "categorias_proyecto", "contactos", "tareas"])
 async def get_resumen_completo(
     current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Obtener resumen completo con todas las estadísticas"""
     try:
         # Estadísticas de proyectos
-        total_proyectos = db.query(func.count(Proyecto.id_proyecto)).scalar() or 0
-        
-        proyectos_activos = db.query(func.count(Proyecto.id_proyecto)).filter(
-            Proyecto.estado == 'activo'
-        ).scalar() or 0
-        
-        proyectos_pausados = db.query(func.count(Proyecto.id_proyecto)).filter(
-            Proyecto.estado == 'pausado'
-        ).scalar() or 0
-        
-        proyectos_finalizados = db.query(func.count(Proyecto.id_proyecto)).filter(
-            Proyecto.estado == 'finalizado'
-        ).scalar() or 0
+        proyectos_por_estado = await get_estado_rollup(db, "proyectos")
+        total_proyectos = sum(proyectos_por_estado.values())
+        proyectos_activos = proyectos_por_estado.get('activo', 0)
+        proyectos_pausados = proyectos_por_estado.get('pausado', 0)
+        proyectos_finalizados = proyectos_por_estado.get('finalizado', 0)
         
         # Casos por categoría
         results_categoria = db.query(
@@ -315,72 +294,24 @@ async def get_resumen_completo(
         ]
         
         # Casos por estado
-        results_estado = db.query(
-            Proyecto.estado,
-            func.count(Proyecto.id_proyecto).label('total_casos')
-        ).group_by(Proyecto.estado).all()
-        
-        casos_por_estado = []
-        for r in results_estado:
-            porcentaje = round((r.total_casos / total_proyectos * 100) if total_proyectos > 0 else 0, 2)
-            casos_por_estado.append({
-                "estado": r.estado,
-                "total_casos": r.total_casos,
-                "porcentaje": porcentaje
-            })
+        casos_por_estado = [
+            {
+                "estado": estado,
+                "total_casos": total_casos,
+                "porcentaje": round((total_casos / total_proyectos * 100) if total_proyectos > 0 else 0, 2)
+            }
+            for estado, total_casos in proyectos_por_estado.items()
+        ]
         
         # Top contactos
-        results_contactos = db.query(
-            Contacto.id_contacto,
-            Contacto.nombre,
-            Contacto.tipo,
-            func.count(Proyecto.id_proyecto).label('total_casos')
-        ).join(
-            Proyecto,
-            Proyecto.contacto_id_fk == Contacto.id_contacto
-        ).group_by(
-            Contacto.id_contacto,
-            Contacto.nombre,
-            Contacto.tipo
-        ).order_by(
-            func.count(Proyecto.id_proyecto).desc()
-        ).limit(10).all()
-        
-        top_contactos = []
-        for c in results_contactos:
-            activos = db.query(func.count(Proyecto.id_proyecto)).filter(
-                Proyecto.contacto_id_fk == c.id_contacto,
-                Proyecto.estado == 'activo'
-            ).scalar() or 0
-            
-            finalizados = db.query(func.count(Proyecto.id_proyecto)).filter(
-                Proyecto.contacto_id_fk == c.id_contacto,
-                Proyecto.estado == 'finalizado'
-            ).scalar() or 0
-            
-            top_contactos.append({
-                "contacto_id": c.id_contacto,
-                "contacto_nombre": c.nombre,
-                "contacto_tipo": c.tipo,
-                "total_casos": c.total_casos,
-                "casos_activos": activos,
-                "casos_finalizados": finalizados
-            })
+        top_contactos = _top_contactos(db, 10)
         
         # Estadísticas de tareas
-        total_tareas = db.query(func.count(Tarea.id_tarea)).scalar() or 0
-        
-        tareas_nuevas = db.query(func.count(Tarea.id_tarea)).filter(
-            Tarea.estado == 'nuevo'
-        ).scalar() or 0
-        
-        tareas_en_progreso = db.query(func.count(Tarea.id_tarea)).filter(
-            Tarea.estado == 'en_progreso'
-        ).scalar() or 0
-        
-        tareas_finalizadas = db.query(func.count(Tarea.id_tarea)).filter(
-            Tarea.estado == 'finalizado'
-        ).scalar() or 0
+        tareas_por_estado = await get_estado_rollup(db, "tareas")
+        total_tareas = sum(tareas_por_estado.values())
+        tareas_nuevas = tareas_por_estado.get('nuevo', 0)
+        tareas_en_progreso = tareas_por_estado.get('en_progreso', 0)
+        tareas_finalizadas = tareas_por_estado.get('finalizado', 0)
         
         return {
             "success": True,
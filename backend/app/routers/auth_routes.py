@@ -3,18 +3,22 @@
 # Funcionalidad: Login, registro y validación de usuarios
 # ✅ IMPLEMENTADO: Endpoint /me incluye rol, idioma y tema desde configuraciones
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Header
 from sqlalchemy.orm import Session
 from typing import Optional
-from jose import JWTError, jwt
 
 from app.database import get_db
 from app.factory import RepositoryFactory
 from app.controllers.auth_controller import AuthController
+from app.models.configuracion import Configuracion
+from app.observability import run_in_threadpool_timed
 from app.schemas.user_schema import UserCreate, UserLogin, TokenResponse, UserResponse
 from app.services.utility_service import UtilityService
-from app.config import JWT_CONFIG
+from app.utils.security import decode_access_token, is_admin_token, parse_access_token, token_from_header
 
+
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -48,7 +52,8 @@ async def register_user(
         HTTPException 500: Si ocurre un error interno del servidor
     """
     try:
-        user = auth_controller.register_user(user_data.model_dump())
+        # bcrypt (cientos de ms de CPU) en el threadpool: no bloquea el event loop
+        user = await run_in_threadpool_timed("bcrypt", auth_controller.register_user, user_data.model_dump())
         return UtilityService.success_response(
             data={
                 "id_usuario": user.id_usuario,
@@ -64,7 +69,7 @@ async def register_user(
             detail=str(e)
         )
     except Exception as e:
-        print(f"❌ Error en register_user endpoint: {e}")
+        logger.error("Error en register_user endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error interno del servidor al registrar usuario"
@@ -90,7 +95,7 @@ async def login_user(
         HTTPException 500: Si ocurre un error interno del servidor
     """
     try:
-        result = auth_controller.login(login_data.email, login_data.password)
+        result = await run_in_threadpool_timed("bcrypt", auth_controller.login, login_data.email, login_data.password)
         return UtilityService.success_response(
             data=result,
             message="Login exitoso"
@@ -102,7 +107,7 @@ async def login_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     except Exception as e:
-        print(f"❌ Error en login endpoint: {e}")
+        logger.error("Error en login endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error interno del servidor al procesar login"
@@ -161,18 +166,14 @@ async def get_current_user(
         
         # Decodificar el token JWT
         try:
-            payload = jwt.decode(
-                token,
-                JWT_CONFIG["secret_key"],
-                algorithms=[JWT_CONFIG["algorithm"]]
-            )
+            payload = parse_access_token(token)
             user_id = payload.get("sub")
             if not user_id:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Token inválido: sin identificador de usuario"
                 )
-        except JWTError as e:
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Token inválido o expirado: {str(e)}",
@@ -195,7 +196,6 @@ async def get_current_user(
             )
         
         # Obtener configuración del usuario (rol, idioma, tema)
-        from app.models.configuracion import Configuracion
         configuracion = db.query(Configuracion).filter(
             Configuracion.usuario_id_fk == user.id_usuario
         ).first()
@@ -225,7 +225,7 @@ async def get_current_user(
         # Re-lanzar excepciones HTTP sin modificar
         raise
     except Exception as e:
-        print(f"❌ Error en get_current_user endpoint: {e}")
+        logger.error("Error en get_current_user endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error interno del servidor al obtener usuario actual"
@@ -265,8 +265,28 @@ async def verify_token(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error en verify_token endpoint: {e}")
+        logger.error("Error en verify_token endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error interno del servidor al verificar token"
-        )
\ No newline at end of file
+        )
+
+
+async def require_admin(authorization: Optional[str] = Header(None)) -> str:
+    """
+    Dependencia de rutas administrativas: token válido con rol admin
+    (claim del JWT, sin consultar la base). Retorna el token.
+    """
+    token = token_from_header(authorization)
+    if not decode_access_token(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token ausente, inválido o expirado",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    if not is_admin_token(token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Se requiere rol admin"
+        )
+    return token
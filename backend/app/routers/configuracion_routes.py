@@ -9,6 +9,8 @@ from app.factory import RepositoryFactory
 from app.controllers.configuracion_controller import ConfiguracionController
 from app.schemas.configuracion_schema import ConfiguracionCreate, ConfiguracionUpdate, ConfiguracionResponse
 from app.services.utility_service import UtilityService
+from app.cache import cached
+from app.config import CACHE_CONFIG
 
 router = APIRouter()
 
@@ -20,6 +22,7 @@ def get_config_controller(db: Session = Depends(get_db)) -> ConfiguracionControl
 
 
 @router.get("/", response_model=dict)
+@cached("configuraciones:listado", ttl=CACHE_CONFIG["ttl"]["configuraciones"], tags=["configuraciones"])
 async def get_all_configs(
     config_controller: ConfiguracionController = Depends(get_config_controller)
 ):
@@ -58,6 +61,7 @@ async def get_config(
 
 
 @router.get("/usuario/{usuario_id}", response_model=dict)
+@cached("configuraciones:usuario", ttl=CACHE_CONFIG["ttl"]["configuraciones"], tags=["configuraciones"])
 async def get_config_by_usuario(
     usuario_id: int,
     config_controller: ConfiguracionController = Depends(get_config_controller)
@@ -2,7 +2,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.contact_controller import ContactController
 from app.schemas.contact_schema import ContactCreate, ContactUpdate, ContactResponse
@@ -17,16 +17,28 @@ def get_contact_controller(db: Session = Depends(get_db)) -> ContactController:
     return ContactController(contact_repo)
 
 
+def get_contact_read_controller(db: Session = Depends(get_read_db)) -> ContactController:
+    """Dependency para controlador de contactos en rutas de solo lectura (réplica)"""
+    contact_repo = RepositoryFactory.create_contact_repository(db)
+    return ContactController(contact_repo)
+
+
 @router.get("/", response_model=dict)
 async def get_contacts(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, le=100),
     tipo: Optional[str] = Query(None, regex="^(persona|empresa)$"),
-    contact_controller: ContactController = Depends(get_contact_controller)
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (activa modo lite)"),
+    lite: bool = Query(False, description="Devolver solo las columnas de la grilla"),
+    contact_controller: ContactController = Depends(get_contact_read_controller)
 ):
     """Obtener lista de contactos con filtros opcionales"""
     try:
-        if tipo:
+        if lite or fields:
+            # Modo lite: proyección de columnas sin hidratar objetos ORM
+            field_names = contact_controller.resolve_fields(fields)
+            contacts = contact_controller.get_all_contacts_lite(field_names, skip=skip, limit=limit, tipo=tipo)
+        elif tipo:
             contacts = contact_controller.get_by_type(tipo)
         else:
             contacts = contact_controller.get_all_contacts(skip=skip, limit=limit)
@@ -35,6 +47,8 @@ async def get_contacts(
             data=contacts,
             message=f"Se encontraron {len(contacts)} contactos"
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error al obtener contactos")
 
@@ -2,13 +2,14 @@
 # Descripción: Rutas API para gestión de documentos
 # Endpoints: Upload, List, Download, Update, Delete, Search
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
 import os
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.document_controller import DocumentController
 from app.schemas.document_schema import (
@@ -22,13 +23,20 @@ from app.services.utility_service import UtilityService
 from app.services.file_service import FileService
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 def get_document_controller(db: Session = Depends(get_db)) -> DocumentController:
     """Dependency para obtener controlador de documentos"""
-    from app.models.documento import Documento
-    document_repo = RepositoryFactory.create_repository(Documento, db)
+    document_repo = RepositoryFactory.create_document_repository(db)
+    file_service = FileService()
+    return DocumentController(document_repo, file_service)
+
+
+def get_document_read_controller(db: Session = Depends(get_read_db)) -> DocumentController:
+    """Dependency para controlador de documentos en rutas de solo lectura (réplica)"""
+    document_repo = RepositoryFactory.create_document_repository(db)
     file_service = FileService()
     return DocumentController(document_repo, file_service)
 
@@ -79,7 +87,7 @@ async def upload_document(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error en upload_document: {e}")
+        logger.error("Error en upload_document: %s", e)
         raise HTTPException(status_code=500, detail="Error al subir documento")
 
 
@@ -90,7 +98,9 @@ async def get_documents(
     proyecto_id: Optional[int] = Query(None, description="Filtrar por proyecto"),
     tipo_archivo: Optional[str] = Query(None, description="Filtrar por tipo (.pdf, .docx, etc.)"),
     usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
-    document_controller: DocumentController = Depends(get_document_controller)
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (activa modo lite)"),
+    lite: bool = Query(False, description="Devolver solo las columnas de la grilla"),
+    document_controller: DocumentController = Depends(get_document_read_controller)
 ):
     """
     📋 **Listar documentos**
@@ -100,15 +110,28 @@ async def get_documents(
     - tipo_archivo: Por extensión (.pdf, .docx, .jpg, etc.)
     - usuario_id: Documentos subidos por un usuario
     - Paginación: skip y limit
+    - fields / lite: Proyección de columnas (ej. fields=id_documento,nombre_archivo)
     """
     try:
-        documents = document_controller.get_all_documents(
-            skip=skip,
-            limit=limit,
-            proyecto_id=proyecto_id,
-            tipo_archivo=tipo_archivo,
-            usuario_id=usuario_id
-        )
+        if lite or fields:
+            # Modo lite: proyección de columnas sin hidratar objetos ORM
+            field_names = document_controller.resolve_fields(fields)
+            documents = document_controller.get_all_documents_lite(
+                field_names,
+                skip=skip,
+                limit=limit,
+                proyecto_id=proyecto_id,
+                tipo_archivo=tipo_archivo,
+                usuario_id=usuario_id
+            )
+        else:
+            documents = document_controller.get_all_documents(
+                skip=skip,
+                limit=limit,
+                proyecto_id=proyecto_id,
+                tipo_archivo=tipo_archivo,
+                usuario_id=usuario_id
+            )
         
         # Obtener estadísticas
         stats = document_controller.get_statistics()
@@ -122,15 +145,17 @@ async def get_documents(
             message=f"Se encontraron {len(documents)} documentos"
         )
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error en get_documents: {e}")
+        logger.error("Error en get_documents: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener documentos")
 
 
 @router.get("/search", response_model=dict)
 async def search_documents(
     q: str = Query(..., min_length=1, description="Término de búsqueda"),
-    document_controller: DocumentController = Depends(get_document_controller)
+    document_controller: DocumentController = Depends(get_document_read_controller)
 ):
     """
     🔍 **Buscar documentos por nombre**
@@ -150,14 +175,14 @@ async def search_documents(
         )
     
     except Exception as e:
-        print(f"Error en search_documents: {e}")
+        logger.error("Error en search_documents: %s", e)
         raise HTTPException(status_code=500, detail="Error al buscar documentos")
 
 
 @router.get("/proyecto/{proyecto_id}", response_model=dict)
 async def get_documents_by_project(
     proyecto_id: int,
-    document_controller: DocumentController = Depends(get_document_controller)
+    document_controller: DocumentController = Depends(get_document_read_controller)
 ):
     """
     📁 **Obtener documentos de un proyecto específico**
@@ -177,14 +202,14 @@ async def get_documents_by_project(
         )
     
     except Exception as e:
-        print(f"Error en get_documents_by_project: {e}")
+        logger.error("Error en get_documents_by_project: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener documentos del proyecto")
 
 
 @router.get("/tipo/{tipo_archivo}", response_model=dict)
 async def get_documents_by_type(
     tipo_archivo: str,
-    document_controller: DocumentController = Depends(get_document_controller)
+    document_controller: DocumentController = Depends(get_document_read_controller)
 ):
     """
     📑 **Obtener documentos por tipo de archivo**
@@ -204,7 +229,7 @@ async def get_documents_by_type(
         )
     
     except Exception as e:
-        print(f"Error en get_documents_by_type: {e}")
+        logger.error("Error en get_documents_by_type: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener documentos por tipo")
 
 
@@ -231,7 +256,7 @@ async def get_document(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en get_document: {e}")
+        logger.error("Error en get_document: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener documento")
 
 
@@ -292,7 +317,7 @@ async def download_document(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en download_document: {e}")
+        logger.error("Error en download_document: %s", e)
         raise HTTPException(status_code=500, detail="Error al descargar documento")
 
 
@@ -328,7 +353,7 @@ async def update_document(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en update_document: {e}")
+        logger.error("Error en update_document: %s", e)
         raise HTTPException(status_code=500, detail="Error al actualizar documento")
 
 
@@ -361,13 +386,13 @@ async def delete_document(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en delete_document: {e}")
+        logger.error("Error en delete_document: %s", e)
         raise HTTPException(status_code=500, detail="Error al eliminar documento")
 
 
 @router.get("/stats/summary", response_model=dict)
 async def get_statistics(
-    document_controller: DocumentController = Depends(get_document_controller)
+    document_controller: DocumentController = Depends(get_document_read_controller)
 ):
     """
     📊 **Obtener estadísticas de documentos**
@@ -386,5 +411,5 @@ async def get_statistics(
         )
     
     except Exception as e:
-        print(f"Error en get_statistics: {e}")
+        logger.error("Error en get_statistics: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener estadísticas")
\ No newline at end of file
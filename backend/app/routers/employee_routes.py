@@ -22,9 +22,7 @@ router = APIRouter()
 
 def get_empleado_controller(db: Session = Depends(get_db)) -> EmpleadoController:
     """Dependency para obtener controlador de empleados"""
-    from app.models.empleado import Empleado
-    from app.factory import BaseRepository
-    empleado_repo = BaseRepository(Empleado, db)
+    empleado_repo = RepositoryFactory.create_empleado_repository(db)
     return EmpleadoController(empleado_repo)
 
 
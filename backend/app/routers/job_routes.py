@@ -0,0 +1,70 @@
+# Archivo: app/routers/job_routes.py
+# Descripción: Rutas API de la cola de trabajos - /api/jobs/*
+# Funcionalidad: Estado de trabajos en segundo plano y reintento manual de fallidos
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_db
+from app.jobs import job_to_dict, retry
+from app.models.trabajo import Trabajo
+from app.services.utility_service import UtilityService
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/", response_model=dict)
+async def get_jobs(
+    estado: Optional[str] = Query(None, regex="^(pendiente|en_proceso|completado|fallido)$"),
+    tipo: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db)
+):
+    """Listar trabajos recientes (más nuevos primero)"""
+    try:
+        stmt = select(Trabajo).order_by(Trabajo.id_trabajo.desc()).limit(limit)
+        if estado:
+            stmt = stmt.where(Trabajo.estado == estado)
+        if tipo:
+            stmt = stmt.where(Trabajo.tipo == tipo)
+        jobs = [job_to_dict(job) for job in db.execute(stmt).scalars().all()]
+        return UtilityService.success_response(data=jobs, message=f"Se encontraron {len(jobs)} trabajos")
+    except Exception as e:
+        logger.error("Error en get_jobs: %s", e)
+        raise HTTPException(status_code=500, detail="Error al obtener trabajos")
+
+
+@router.get("/{job_id}", response_model=dict)
+async def get_job(job_id: int, db: Session = Depends(get_db)):
+    """Estado de un trabajo (el cliente consulta hasta completado / fallido)"""
+    try:
+        job = db.get(Trabajo, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+        return UtilityService.success_response(data=job_to_dict(job), message="Trabajo obtenido exitosamente")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error en get_job: %s", e)
+        raise HTTPException(status_code=500, detail="Error al obtener trabajo")
+
+
+@router.post("/{job_id}/reintentar", response_model=dict)
+async def retry_job(job_id: int, db: Session = Depends(get_db)):
+    """Reencolar un trabajo fallido"""
+    try:
+        job = retry(db, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Trabajo no encontrado")
+        return UtilityService.success_response(data=job_to_dict(job), message="Trabajo reencolado")
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Error en retry_job: %s", e)
+        raise HTTPException(status_code=500, detail="Error al reintentar trabajo")
@@ -5,11 +5,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional, List
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.pending_activity_controller import PendingActivityController
 from app.schemas.pending_activity_schema import PendingActivityCreate, PendingActivityUpdate, PendingActivityResponse
 from app.services.utility_service import UtilityService
+from app.scheduler.due_sets import get_due_set, filter_by_usuario
 
 router = APIRouter()
 
@@ -18,6 +19,11 @@ def get_pending_activity_controller(db: Session = Depends(get_db)) -> PendingAct
     pending_activity_repo = RepositoryFactory.create_pending_activity_repository(db)
     return PendingActivityController(pending_activity_repo)
 
+def get_pending_activity_read_controller(db: Session = Depends(get_read_db)) -> PendingActivityController:
+    """Dependency para controlador de actividades en rutas de solo lectura (réplica)"""
+    pending_activity_repo = RepositoryFactory.create_pending_activity_repository(db)
+    return PendingActivityController(pending_activity_repo)
+
 @router.get("/", response_model=dict)
 async def get_pending_activities(
     skip: int = Query(0, ge=0),
@@ -25,11 +31,20 @@ async def get_pending_activities(
     completada: Optional[bool] = Query(None, description="Filtrar por estado de completado"),
     usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
     prioridad: Optional[str] = Query(None, regex="^(baja|media|alta)$"),
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (activa modo lite)"),
+    lite: bool = Query(False, description="Devolver solo las columnas de la grilla"),
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener lista de actividades pendientes con filtros opcionales"""
     try:
-        if usuario_id and completada is not None:
+        if lite or fields:
+            # Modo lite: proyección de columnas, combina todos los filtros en una consulta
+            field_names = pending_activity_controller.resolve_fields(fields)
+            activities = pending_activity_controller.get_all_activities_lite(
+                field_names, skip=skip, limit=limit,
+                completada=completada, usuario_id=usuario_id, prioridad=prioridad
+            )
+        elif usuario_id and completada is not None:
             # Filtrar por usuario y estado
             if completada:
                 activities = pending_activity_controller.get_completadas(usuario_id=usuario_id)
@@ -48,13 +63,15 @@ async def get_pending_activities(
             data=activities,
             message=f"Se encontraron {len(activities)} actividades"
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error al obtener actividades pendientes")
 
 @router.get("/pendientes", response_model=dict)
 async def get_pendientes(
     usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener actividades pendientes (no completadas)"""
     try:
@@ -69,7 +86,7 @@ async def get_pendientes(
 @router.get("/completadas", response_model=dict)
 async def get_completadas(
     usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener actividades completadas"""
     try:
@@ -84,11 +101,14 @@ async def get_completadas(
 @router.get("/vencidas", response_model=dict)
 async def get_vencidas(
     usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener actividades vencidas (no completadas y con fecha pasada)"""
     try:
-        activities = pending_activity_controller.get_vencidas(usuario_id=usuario_id)
+        # Conjunto precalculado por el scheduler (ver app/scheduler/due_sets.py)
+        activities = filter_by_usuario(
+            await get_due_set(pending_activity_controller.repository.db, "actividades_vencidas"), usuario_id
+        )
         return UtilityService.success_response(
             data=activities,
             message=f"Se encontraron {len(activities)} actividades vencidas"
@@ -96,10 +116,27 @@ async def get_vencidas(
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error al obtener actividades vencidas")
 
+@router.get("/proximas", response_model=dict)
+async def get_proximas(
+    usuario_id: Optional[int] = Query(None, description="Filtrar por usuario"),
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
+):
+    """Obtener actividades no completadas que vencen en las próximas horas (SCHEDULER_CONFIG)"""
+    try:
+        activities = filter_by_usuario(
+            await get_due_set(pending_activity_controller.repository.db, "actividades_proximas"), usuario_id
+        )
+        return UtilityService.success_response(
+            data=activities,
+            message=f"Se encontraron {len(activities)} actividades próximas a vencer"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Error al obtener actividades próximas a vencer")
+
 @router.get("/usuario/{usuario_id}", response_model=dict)
 async def get_by_usuario(
     usuario_id: int,
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener actividades de un usuario específico"""
     try:
@@ -114,7 +151,7 @@ async def get_by_usuario(
 @router.get("/proyecto/{proyecto_id}", response_model=dict)
 async def get_by_proyecto(
     proyecto_id: int,
-    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_controller)
+    pending_activity_controller: PendingActivityController = Depends(get_pending_activity_read_controller)
 ):
     """Obtener actividades de un proyecto específico"""
     try:
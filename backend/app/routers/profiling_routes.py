@@ -0,0 +1,107 @@
+# Archivo: app/routers/profiling_routes.py
+# Descripción: Rutas API de profiling bajo demanda - /api/admin/profiling/* (solo admin)
+# Funcionalidad: Captura por muestreo del worker, descarga de perfiles .folded y volcado de tareas asyncio / hilos
+#
+# Cada request lo atiende un worker distinto: la captura y el volcado son
+# del worker que respondió (campo "pid"). Los perfiles se guardan en un
+# directorio compartido, así que se descargan desde cualquier worker.
+#
+#     curl -X POST -H "Authorization: Bearer $TOKEN" ".../api/admin/profiling/capture?seconds=10"
+#     curl -H "Authorization: Bearer $TOKEN" -o perfil.folded ".../api/admin/profiling/profiles/<name>"
+#     flamegraph.pl perfil.folded > perfil.svg      (o abrir el archivo en https://speedscope.app)
+
+import logging
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import PROFILING_CONFIG
+from app.observability.profiling import (
+    capture, dump_tasks, dump_threads, list_profiles, new_profile_name, profile_path, save_profile
+)
+from app.routers.auth_routes import require_admin
+from app.services.utility_service import UtilityService
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+def _ensure_enabled() -> None:
+    if not PROFILING_CONFIG["enabled"]:
+        raise HTTPException(status_code=404, detail="Profiling deshabilitado")
+
+
+@router.post("/capture", response_model=dict)
+async def capture_profile(
+    seconds: float = Query(10, gt=0, le=PROFILING_CONFIG["max_seconds"], description="Duración de la captura"),
+    interval_ms: Optional[float] = Query(None, ge=1, le=100, description="Milisegundos entre muestras")
+):
+    """
+    Muestrear todos los hilos de este worker durante `seconds` y guardar el
+    perfil. El event loop sigue atendiendo requests durante la captura.
+    """
+    _ensure_enabled()
+    try:
+        profiler = await capture(seconds, interval_ms / 1000 if interval_ms else None)
+        name = await run_in_threadpool(save_profile, profiler, new_profile_name("captura"))
+        return UtilityService.success_response(
+            data={
+                "name": name,
+                "pid": os.getpid(),
+                "download": f"/api/admin/profiling/profiles/{name}",
+                **profiler.summary()
+            },
+            message="Perfil capturado"
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        logger.error("Error en capture_profile: %s", e)
+        raise HTTPException(status_code=500, detail="Error al capturar perfil")
+
+
+@router.get("/profiles", response_model=dict)
+async def get_profiles():
+    """Perfiles guardados (capturas y requests con X-Profile), más recientes primero"""
+    _ensure_enabled()
+    try:
+        profiles = await run_in_threadpool(list_profiles)
+        return UtilityService.success_response(data=profiles, message=f"Se encontraron {len(profiles)} perfiles")
+    except Exception as e:
+        logger.error("Error en get_profiles: %s", e)
+        raise HTTPException(status_code=500, detail="Error al listar perfiles")
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str):
+    """Descargar un perfil en formato de pilas colapsadas (flamegraph.pl / speedscope / inferno)"""
+    _ensure_enabled()
+    path = await run_in_threadpool(profile_path, name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Perfil no encontrado")
+    return FileResponse(path, media_type="text/plain; charset=utf-8", filename=name)
+
+
+@router.get("/tasks", response_model=dict)
+async def get_task_dump(
+    limit: int = Query(20, ge=1, le=200, description="Frames máximos por tarea")
+):
+    """
+    Tareas asyncio de este worker con la cadena de awaits donde espera cada
+    una, y la pila de cada hilo (threadpool ocupado, scheduler). Si el event
+    loop está bloqueado esta ruta no responde: usar `kill -USR2 <pid>`, que
+    escribe las pilas de todos los hilos en stderr.
+    """
+    _ensure_enabled()
+    try:
+        return UtilityService.success_response(
+            data={"pid": os.getpid(), "tasks": dump_tasks(limit), "threads": dump_threads()},
+            message="Volcado de tareas obtenido"
+        )
+    except Exception as e:
+        logger.error("Error en get_task_dump: %s", e)
+        raise HTTPException(status_code=500, detail="Error al volcar tareas")
@@ -5,7 +5,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.project_controller import ProjectController
 from app.schemas.project_schema import ProjectCreate, ProjectUpdate, ProjectResponse
@@ -18,22 +18,25 @@ def get_project_controller(db: Session = Depends(get_db)) -> ProjectController:
     project_repo = RepositoryFactory.create_project_repository(db)
     return ProjectController(project_repo)
 
+def get_project_read_controller(db: Session = Depends(get_read_db)) -> ProjectController:
+    """Dependency para controlador de proyectos en rutas de solo lectura (réplica)"""
+    project_repo = RepositoryFactory.create_project_repository(db)
+    return ProjectController(project_repo)
+
 @router.get("/", response_model=dict)
 async def get_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, le=100),
     estado: Optional[str] = Query(None, regex="^(activo|pausado|finalizado)$"),
     categoria_id: Optional[int] = Query(None, ge=1),
-    project_controller: ProjectController = Depends(get_project_controller)
+    project_controller: ProjectController = Depends(get_project_read_controller)
 ):
     """Obtener lista de proyectos con filtros opcionales"""
     try:
-        if estado:
-            projects = project_controller.get_by_estado(estado)
-        elif categoria_id:
-            projects = project_controller.get_by_categoria(categoria_id)
-        else:
-            projects = project_controller.get_all_projects(skip=skip, limit=limit)  # ✅ CORREGIDO: Cambió de get_all() a get_all_projects()
+        # Los filtros respetan skip/limit: una sola consulta paginada
+        projects = project_controller.get_all_projects(
+            skip=skip, limit=limit, estado=estado, categoria_id=categoria_id
+        )
         
         return UtilityService.success_response(
             data=projects,
@@ -44,7 +47,7 @@ async def get_projects(
 
 @router.get("/dashboard/stats", response_model=dict)
 async def get_dashboard_stats(
-    project_controller: ProjectController = Depends(get_project_controller)
+    project_controller: ProjectController = Depends(get_project_read_controller)
 ):
     """Obtener estadísticas de proyectos para dashboard"""
     try:
@@ -58,7 +61,7 @@ async def get_dashboard_stats(
 
 @router.get("/activos", response_model=dict)
 async def get_active_projects(
-    project_controller: ProjectController = Depends(get_project_controller)
+    project_controller: ProjectController = Depends(get_project_read_controller)
 ):
     """Obtener proyectos activos"""
     try:
@@ -0,0 +1,152 @@
+# Archivo: app/routers/realtime_routes.py
+# Descripción: Rutas de push en tiempo real - /api/realtime/*
+# Funcionalidad: Server-Sent Events y WebSocket con cambios de tareas, proyectos, documentos y actividades
+
+import asyncio
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.config import REALTIME_CONFIG
+from app.realtime import Subscription, get_broker
+from app.realtime.broker import CLOSING, Message
+from app.utils.responses import json_dumps
+from app.utils.security import token_from_header, user_id_from_token
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _authenticate(token: Optional[str], authorization: Optional[str]) -> Optional[int]:
+    """
+    Mismo JWT que la API REST. EventSource y WebSocket del navegador no
+    permiten headers propios, por eso también se acepta ?token=
+    """
+    return user_id_from_token(token or token_from_header(authorization))
+
+
+def _encode(message: Message) -> str:
+    """Mismo JSON en SSE y WebSocket (y que las respuestas HTTP): fechas ISO 8601, Decimal como número"""
+    return json_dumps(message).decode("utf-8")
+
+
+def _sse_format(message: Message) -> str:
+    if message.get("tipo") == "ping":
+        return ": ping\n\n"  # comentario SSE: mantiene viva la conexión sin generar evento
+    return f"event: {message['tipo']}\ndata: {_encode(message)}\n\n"
+
+
+@router.get("/stream")
+async def stream_changes(
+    request: Request,
+    token: Optional[str] = Query(None, description="JWT (EventSource no envía headers)"),
+    proyecto_id: Optional[List[int]] = Query(None, description="Filtrar por proyectos"),
+    propios: bool = Query(False, description="Incluir los cambios del usuario autenticado"),
+    authorization: Optional[str] = Header(None)
+):
+    """
+    Stream Server-Sent Events con los cambios confirmados.
+
+    Eventos: tarea.estado, tarea.creado, proyecto.actualizado,
+    documento.creado, actividad.completada, ... y "resync" cuando el
+    cliente debe recargar porque se perdieron mensajes. "cierre" avisa que
+    el worker se apaga: el stream termina y el navegador reconecta.
+    """
+    if not REALTIME_CONFIG["enabled"]:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Tiempo real deshabilitado")
+
+    usuario_id = _authenticate(token, authorization)
+    if usuario_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token inválido o expirado",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    broker = get_broker()
+    subscription = broker.subscribe(Subscription(usuario_id, proyecto_id, propios))
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                message = await subscription.get(REALTIME_CONFIG["heartbeat"])
+                yield _sse_format(message)
+                if message is CLOSING:
+                    break  # EventSource reconecta solo (retry) contra otro worker
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def websocket_changes(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    proyecto_id: Optional[List[int]] = Query(None),
+    propios: bool = Query(False)
+):
+    """
+    WebSocket con los mismos mensajes que /stream (JSON). El cliente puede
+    cambiar sus filtros enviando:
+        {"accion": "suscribir", "proyectos": [1, 2], "propios": true}
+    """
+    usuario_id = _authenticate(token, websocket.headers.get("authorization"))
+    if usuario_id is None or not REALTIME_CONFIG["enabled"]:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    broker = get_broker()
+    subscription = broker.subscribe(Subscription(usuario_id, proyecto_id, propios))
+
+    async def sender():
+        while True:
+            message = await subscription.get(REALTIME_CONFIG["heartbeat"])
+            await websocket.send_text(_encode(message))
+            if message is CLOSING:
+                # 1012 Service Restart: el cliente debe reconectar
+                await websocket.close(code=1012)
+                return
+
+    async def receiver():
+        while True:
+            data = await websocket.receive_json()
+            if not isinstance(data, dict):
+                continue
+            if data.get("accion") == "suscribir":
+                subscription.update_filters(data.get("proyectos"), bool(data.get("propios", False)))
+                await websocket.send_text(_encode(
+                    {"tipo": "suscrito", "proyectos": sorted(subscription.proyectos), "propios": subscription.propios}
+                ))
+            elif data.get("accion") == "ping":
+                await websocket.send_text(_encode({"tipo": "pong"}))
+
+    tasks = [asyncio.create_task(sender()), asyncio.create_task(receiver())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                logger.error("Error en websocket de tiempo real: %s", error)
+                # Sin sender el cliente quedaría conectado sin recibir nada: 1011 y que reconecte
+                await _close_quietly(websocket, 1011)
+    finally:
+        for task in tasks:
+            task.cancel()
+        broker.unsubscribe(subscription)
+
+
+async def _close_quietly(websocket: WebSocket, code: int) -> None:
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        pass  # el cliente ya se fue o el close ya se envió
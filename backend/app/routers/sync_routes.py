@@ -0,0 +1,50 @@
+# Archivo: app/routers/sync_routes.py
+# Descripción: Rutas API de sincronización incremental - /api/sync
+# Funcionalidad: Cambios y eliminaciones desde un token para el store local del SPA
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.database import get_read_db
+from app.factory import RepositoryFactory
+from app.controllers.sync_controller import SyncController
+from app.models.sync import RegistroEliminado
+from app.services.utility_service import UtilityService
+from app.config import SYNC_CONFIG
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def get_sync_controller(db: Session = Depends(get_read_db)) -> SyncController:
+    """Dependency para controlador de sincronización (solo lectura)"""
+    return SyncController(RepositoryFactory.create_repository(RegistroEliminado, db))
+
+
+@router.get("", response_model=dict)
+async def get_changes(
+    since: Optional[str] = Query(None, description="Token devuelto por la sincronización anterior"),
+    limit: int = Query(SYNC_CONFIG["page_size"], ge=1, le=SYNC_CONFIG["max_page_size"]),
+    sync_controller: SyncController = Depends(get_sync_controller)
+):
+    """
+    Cambios de tareas, proyectos, actividades, contactos y documentos desde `since`.
+    
+    - Sin `since`: sincronización completa (reset=true).
+    - `has_more=true`: repetir con el token devuelto hasta que sea false.
+    - `reset=true`: el token era demasiado viejo; descartar el store local.
+    - Aplicar los cambios en el orden recibido (upsert / delete).
+    """
+    try:
+        result = sync_controller.get_changes(since=since, limit=limit)
+        return UtilityService.success_response(
+            data=result,
+            message=f"Se encontraron {len(result['cambios'])} cambios"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Error en get_changes: %s", e)
+        raise HTTPException(status_code=500, detail="Error al obtener cambios")
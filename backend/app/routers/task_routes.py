@@ -6,11 +6,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional, List
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.task_controller import TaskController
 from app.schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse
 from app.services.utility_service import UtilityService
+from app.scheduler.due_sets import get_due_set
 
 router = APIRouter()
 
@@ -19,30 +20,42 @@ def get_task_controller(db: Session = Depends(get_db)) -> TaskController:
     task_repo = RepositoryFactory.create_task_repository(db)
     return TaskController(task_repo)
 
+def get_task_read_controller(db: Session = Depends(get_read_db)) -> TaskController:
+    """Dependency para controlador de tareas en rutas de solo lectura (réplica)"""
+    task_repo = RepositoryFactory.create_task_repository(db)
+    return TaskController(task_repo)
+
 @router.get("/", response_model=dict)
 async def get_tasks(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, le=100),
     estado: Optional[str] = Query(None, regex="^(nuevo|en_progreso|finalizado)$"),  # ✅ ACTUALIZADO
-    task_controller: TaskController = Depends(get_task_controller)
+    fields: Optional[str] = Query(None, description="Campos a devolver separados por coma (activa modo lite)"),
+    lite: bool = Query(False, description="Devolver solo las columnas de la grilla"),
+    task_controller: TaskController = Depends(get_task_read_controller)
 ):
     """Obtener lista de tareas con filtros opcionales"""
     try:
-        if estado:
-            tasks = task_controller.get_by_estado(estado)
+        if lite or fields:
+            # Modo lite: proyección de columnas sin hidratar objetos ORM
+            field_names = task_controller.resolve_fields(fields)
+            tasks = task_controller.get_all_tasks_lite(field_names, skip=skip, limit=limit, estado=estado)
         else:
-            tasks = task_controller.get_all_tasks(skip=skip, limit=limit)
+            # El filtro de estado respeta skip/limit: una sola consulta paginada
+            tasks = task_controller.get_all_tasks(skip=skip, limit=limit, estado=estado)
         
         return UtilityService.success_response(
             data=tasks,
             message=f"Se encontraron {len(tasks)} tareas"
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error al obtener tareas")
 
 @router.get("/kanban", response_model=dict)
 async def get_kanban_board(
-    task_controller: TaskController = Depends(get_task_controller)
+    task_controller: TaskController = Depends(get_task_read_controller)
 ):
     """Obtener tablero Kanban completo con tareas agrupadas por estado"""
     try:
@@ -54,6 +67,34 @@ async def get_kanban_board(
     except Exception as e:
         raise HTTPException(status_code=500, detail="Error al obtener tablero Kanban")
 
+@router.get("/vencidas", response_model=dict)
+async def get_vencidas(
+    task_controller: TaskController = Depends(get_task_read_controller)
+):
+    """Obtener tareas no finalizadas con fecha de vencimiento pasada (conjunto precalculado)"""
+    try:
+        tasks = await get_due_set(task_controller.repository.db, "tareas_vencidas")
+        return UtilityService.success_response(
+            data=tasks,
+            message=f"Se encontraron {len(tasks)} tareas vencidas"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Error al obtener tareas vencidas")
+
+@router.get("/proximas", response_model=dict)
+async def get_proximas(
+    task_controller: TaskController = Depends(get_task_read_controller)
+):
+    """Obtener tareas no finalizadas que vencen en los próximos días (conjunto precalculado)"""
+    try:
+        tasks = await get_due_set(task_controller.repository.db, "tareas_proximas")
+        return UtilityService.success_response(
+            data=tasks,
+            message=f"Se encontraron {len(tasks)} tareas próximas a vencer"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail="Error al obtener tareas próximas a vencer")
+
 @router.get("/{task_id}", response_model=dict)
 async def get_task(
     task_id: int,
@@ -2,13 +2,14 @@
 # Descripción: Rutas API para gestión de plantillas de documentos
 # Endpoints: Upload, List, Download, Update, Delete
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
 import os
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.factory import RepositoryFactory
 from app.controllers.template_controller import TemplateController
 from app.schemas.template_schema import (
@@ -20,15 +21,24 @@ from app.schemas.template_schema import (
 )
 from app.services.utility_service import UtilityService
 from app.services.file_service import FileService
+from app.cache import cached
+from app.config import CACHE_CONFIG
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 def get_template_controller(db: Session = Depends(get_db)) -> TemplateController:
     """Dependency para obtener controlador de plantillas"""
-    from app.models.plantilla import Plantilla
-    template_repo = RepositoryFactory.create_repository(Plantilla, db)
+    template_repo = RepositoryFactory.create_template_repository(db)
+    file_service = FileService()
+    return TemplateController(template_repo, file_service)
+
+
+def get_template_read_controller(db: Session = Depends(get_read_db)) -> TemplateController:
+    """Dependency para controlador de plantillas en rutas de solo lectura (réplica)"""
+    template_repo = RepositoryFactory.create_template_repository(db)
     file_service = FileService()
     return TemplateController(template_repo, file_service)
 
@@ -75,17 +85,18 @@ async def upload_template(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        print(f"Error en upload_template: {e}")
+        logger.error("Error en upload_template: %s", e)
         raise HTTPException(status_code=500, detail="Error al subir plantilla")
 
 
 @router.get("/", response_model=dict)
+@cached("plantillas:listado", ttl=CACHE_CONFIG["ttl"]["plantillas"], tags=["plantillas"])
 async def get_templates(
     skip: int = Query(0, ge=0, description="Elementos a saltar"),
     limit: int = Query(100, le=100, description="Límite de resultados"),
     categoria: Optional[str] = Query(None, description="Filtrar por categoría"),
     solo_activas: bool = Query(True, description="Solo plantillas activas"),
-    template_controller: TemplateController = Depends(get_template_controller)
+    template_controller: TemplateController = Depends(get_template_read_controller)
 ):
     """
     📋 **Listar plantillas**
@@ -118,7 +129,7 @@ async def get_templates(
         )
     
     except Exception as e:
-        print(f"Error en get_templates: {e}")
+        logger.error("Error en get_templates: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener plantillas")
 
 
@@ -145,7 +156,7 @@ async def get_template(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en get_template: {e}")
+        logger.error("Error en get_template: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener plantilla")
 
 
@@ -186,7 +197,7 @@ async def download_template(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en download_template: {e}")
+        logger.error("Error en download_template: %s", e)
         raise HTTPException(status_code=500, detail="Error al descargar plantilla")
 
 
@@ -222,7 +233,7 @@ async def update_template(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en update_template: {e}")
+        logger.error("Error en update_template: %s", e)
         raise HTTPException(status_code=500, detail="Error al actualizar plantilla")
 
 
@@ -260,13 +271,14 @@ async def delete_template(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error en delete_template: {e}")
+        logger.error("Error en delete_template: %s", e)
         raise HTTPException(status_code=500, detail="Error al eliminar plantilla")
 
 
 @router.get("/stats/summary", response_model=dict)
+@cached("plantillas:estadisticas", ttl=CACHE_CONFIG["ttl"]["plantillas"], tags=["plantillas"])
 async def get_statistics(
-    template_controller: TemplateController = Depends(get_template_controller)
+    template_controller: TemplateController = Depends(get_template_read_controller)
 ):
     """
     📊 **Obtener estadísticas de plantillas**
@@ -285,5 +297,5 @@ async def get_statistics(
         )
     
     except Exception as e:
-        print(f"Error en get_statistics: {e}")
+        logger.error("Error en get_statistics: %s", e)
         raise HTTPException(status_code=500, detail="Error al obtener estadísticas")
\ No newline at end of file
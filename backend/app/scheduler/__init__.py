@@ -0,0 +1,22 @@
+# Archivo: app/scheduler/__init__.py
+# Descripción: Inicialización del módulo de tareas programadas
+# Funcionalidad: Scheduler asyncio con lock distribuido, reloj inyectable y conjuntos de vencimientos
+
+from .clock import Clock, FakeClock
+from .core import Job, Scheduler, get_scheduler, set_scheduler
+from .due_sets import compute_due_sets, get_due_set, refresh_due_sets, filter_by_usuario
+from .jobs import register_default_jobs
+
+__all__ = [
+    "Clock",
+    "FakeClock",
+    "Job",
+    "Scheduler",
+    "get_scheduler",
+    "set_scheduler",
+    "compute_due_sets",
+    "get_due_set",
+    "refresh_due_sets",
+    "filter_by_usuario",
+    "register_default_jobs"
+]
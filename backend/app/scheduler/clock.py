@@ -0,0 +1,55 @@
+# Archivo: app/scheduler/clock.py
+# Descripción: Reloj inyectable para el scheduler
+# Funcionalidad: Reloj del sistema y reloj falso controlable desde pruebas
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+
+class Clock:
+    """Reloj del sistema. now() es hora local (igual que datetime.now() en los controladores)"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class FakeClock(Clock):
+    """
+    Reloj manual para pruebas: el tiempo solo avanza con advance().
+    Las corrutinas dormidas en sleep() despiertan cuando el reloj pasa su hora.
+    """
+
+    def __init__(self, start: datetime):
+        self._now = start
+        self._sleepers: List[Tuple[float, asyncio.Future]] = []
+
+    def now(self) -> datetime:
+        return self._now
+
+    def time(self) -> float:
+        return self._now.timestamp()
+
+    async def sleep(self, seconds: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._sleepers.append((self.time() + seconds, future))
+        await future
+
+    async def advance(self, seconds: float) -> None:
+        """Avanzar el reloj y dejar correr a las tareas que despertaron"""
+        self._now += timedelta(seconds=seconds)
+        due = [(at, f) for at, f in self._sleepers if at <= self.time()]
+        self._sleepers = [(at, f) for at, f in self._sleepers if at > self.time()]
+        for _, future in due:
+            if not future.done():
+                future.set_result(None)
+        # Varias vueltas del loop: las tareas despiertas pueden encadenar awaits
+        for _ in range(10):
+            await asyncio.sleep(0)
@@ -0,0 +1,129 @@
+# Archivo: app/scheduler/core.py
+# Descripción: Scheduler asyncio de tareas periódicas en proceso
+# Funcionalidad: Intervalos alineados, lock distribuido por ejecución y reloj inyectable
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from app.cache import get_cache
+from app.cache.versions import multiple_workers
+from app.config import SCHEDULER_CONFIG
+from app.scheduler.clock import Clock
+
+
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    """Tarea periódica. func es una función async (o sync rápida) sin argumentos"""
+
+    def __init__(self, name: str, func: Callable[[], Any], interval: float, lock: bool = True):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.lock = lock
+        self.next_run = 0.0
+        self.runs = 0
+        self.last_error: Optional[str] = None
+
+
+class Scheduler:
+    """
+    Scheduler en el event loop de cada worker.
+
+    Las ejecuciones se alinean a múltiplos del intervalo (slot = t // intervalo)
+    y cada slot se reserva con un set-if-absent en el cache compartido: aunque
+    todos los workers corran el scheduler, solo uno ejecuta cada slot. Con el
+    cache en memoria el lock es por proceso (válido con un solo worker).
+    """
+
+    def __init__(self, clock: Optional[Clock] = None, tick: Optional[float] = None):
+        self.clock = clock or Clock()
+        self.tick = tick or SCHEDULER_CONFIG["tick"]
+        self.jobs: Dict[str, Job] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_job(self, name: str, func: Callable[[], Any], interval: float, lock: bool = True) -> Job:
+        """Registrar (o reemplazar) una tarea periódica"""
+        job = Job(name, func, interval, lock)
+        self.jobs[name] = job
+        return job
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run_pending(self) -> List[str]:
+        """Ejecutar las tareas vencidas. Retorna los nombres de las que corrieron en este worker"""
+        executed = []
+        now = self.clock.time()
+        for job in list(self.jobs.values()):
+            if job.next_run <= now and await self._run(job, now):
+                executed.append(job.name)
+        return executed
+
+    async def _run(self, job: Job, now: float) -> bool:
+        slot = int(now // job.interval)
+        job.next_run = (slot + 1) * job.interval
+        if job.lock:
+            acquired = await get_cache().add(f"scheduler:{job.name}:{slot}", 1, ttl=max(int(job.interval), 1))
+            if not acquired:
+                return False  # otro worker tomó este slot
+        try:
+            result = job.func()
+            if inspect.isawaitable(result):
+                await result
+            job.runs += 1
+            job.last_error = None
+        except Exception as e:
+            job.last_error = str(e)
+            logger.error("Error en tarea programada %s: %s", job.name, e)
+        return True
+
+    async def _loop(self) -> None:
+        while True:
+            await self.run_pending()
+            next_run = min((job.next_run for job in self.jobs.values()), default=self.clock.time() + self.tick)
+            await self.clock.sleep(max(0.0, min(self.tick, next_run - self.clock.time())))
+
+    def start(self) -> None:
+        """Arrancar el loop del scheduler en el event loop actual"""
+        if self.running:
+            return
+        if multiple_workers() and not get_cache().shared:
+            logger.warning("Scheduler sin cache compartido: cada worker ejecutará las tareas")
+        self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [
+            {"nombre": job.name, "intervalo": job.interval, "ejecuciones": job.runs,
+             "proxima": job.next_run, "ultimo_error": job.last_error}
+            for job in self.jobs.values()
+        ]
+
+
+_scheduler: Optional[Scheduler] = None
+
+
+def get_scheduler() -> Scheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = Scheduler()
+    return _scheduler
+
+
+def set_scheduler(scheduler: Optional[Scheduler]) -> None:
+    """Reemplazar el scheduler global (pruebas con FakeClock)"""
+    global _scheduler
+    _scheduler = scheduler
@@ -0,0 +1,127 @@
+# Archivo: app/scheduler/due_sets.py
+# Descripción: Conjuntos precalculados de vencidas / próximas a vencer
+# Funcionalidad: Snapshot en cache recalculado por el scheduler (lectura O(1)) y recordatorios push para los elementos nuevos
+
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy.orm import Session
+
+from app.cache import get_cache
+from app.config import SCHEDULER_CONFIG
+from app.controllers.pending_activity_controller import PendingActivityController
+from app.controllers.task_controller import TaskController
+from app.database import SessionLocal
+from app.factory import RepositoryFactory
+from app.realtime import get_broker
+
+
+DUE_SETS_KEY = "due_sets"
+NOTIFIED_KEY = "due_sets:notificados"
+# Cualquier escritura en estas tablas invalida el snapshot (suscriptor invalidate_cache):
+# hasta la próxima corrida del scheduler cada lectura hace la consulta de su conjunto
+DUE_SETS_TAGS = ("actividades_pendientes", "tareas", "proyectos", "usuarios")
+
+# conjunto -> (tabla, campo id, tipo de recordatorio)
+_REMINDERS = {
+    "actividades_vencidas": ("actividades_pendientes", "id_actividad_pendiente", "recordatorio.vencida"),
+    "actividades_proximas": ("actividades_pendientes", "id_actividad_pendiente", "recordatorio.proxima"),
+    "tareas_vencidas": ("tareas", "id_tarea", "recordatorio.vencida"),
+    "tareas_proximas": ("tareas", "id_tarea", "recordatorio.proxima")
+}
+
+
+def _compute(db: Session, now: datetime, conjuntos: Iterable[str]) -> Dict[str, Any]:
+    """Una consulta por conjunto pedido, respecto de `now`"""
+    activities = PendingActivityController(RepositoryFactory.create_pending_activity_repository(db))
+    tasks = TaskController(RepositoryFactory.create_task_repository(db))
+    hoy = now.date()
+    queries = {
+        "actividades_vencidas": lambda: activities.get_vencidas(now=now),
+        "actividades_proximas": lambda: activities.get_proximas(
+            now, now + timedelta(hours=SCHEDULER_CONFIG["activity_window_hours"])
+        ),
+        "tareas_vencidas": lambda: tasks.get_vencidas(hoy=hoy),
+        "tareas_proximas": lambda: tasks.get_proximas(hoy, hoy + timedelta(days=SCHEDULER_CONFIG["task_window_days"]))
+    }
+    return {conjunto: queries[conjunto]() for conjunto in conjuntos}
+
+
+def compute_due_sets(db: Session, now: datetime) -> Dict[str, Any]:
+    """Calcular los cuatro conjuntos respecto de `now`"""
+    return {"generado": now, **_compute(db, now, _REMINDERS)}
+
+
+async def get_due_set(db: Session, conjunto: str, now: datetime = None) -> List[Dict[str, Any]]:
+    """
+    Un conjunto desde el snapshot vigente. Solo el scheduler lo reconstruye
+    (fuera del loop): si una escritura lo invalidó, hasta la próxima corrida
+    se ejecuta la consulta de este conjunto, igual que sin snapshot.
+    """
+    snapshot = await get_cache().get(DUE_SETS_KEY)
+    if snapshot is not None:
+        return snapshot[conjunto]
+    return _compute(db, now or datetime.now(), [conjunto])[conjunto]
+
+
+def filter_by_usuario(items: List[Dict[str, Any]], usuario_id: int = None) -> List[Dict[str, Any]]:
+    if not usuario_id:
+        return items
+    return [item for item in items if item.get("usuario_id_fk") == usuario_id]
+
+
+def _compute_in_session(now: datetime) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return compute_due_sets(db, now)
+    finally:
+        db.close()
+
+
+def _isoformat(value: Any) -> Any:
+    # Los mensajes del broker viajan como JSON (send_json del WebSocket, Redis)
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def build_reminders(snapshot: Dict[str, Any], notified: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+    """Recordatorios para los elementos que entraron a un conjunto desde la última corrida"""
+    reminders = []
+    for conjunto, (tabla, id_field, tipo) in _REMINDERS.items():
+        already = set(notified.get(conjunto, []))
+        for item in snapshot[conjunto]:
+            if item[id_field] in already:
+                continue
+            reminders.append({
+                "tipo": tipo,
+                "tabla": tabla,
+                "id": item[id_field],
+                "proyecto_id": item.get("proyecto_id_fk"),
+                "usuario_id": item.get("usuario_id_fk"),
+                "fecha_vencimiento": _isoformat(item.get("fecha_vencimiento")),
+                "datos": {k: item[k] for k in ("titulo", "descripcion") if k in item}
+            })
+    return reminders
+
+
+async def refresh_due_sets(now: datetime) -> List[Dict[str, Any]]:
+    """
+    Tarea programada: recalcular el snapshot fuera del event loop, guardarlo
+    y publicar recordatorios solo para los elementos nuevos de cada conjunto.
+    """
+    snapshot = await asyncio.to_thread(_compute_in_session, now)
+    cache = get_cache()
+    await cache.set(DUE_SETS_KEY, snapshot, ttl=SCHEDULER_CONFIG["due_sets_interval"], tags=DUE_SETS_TAGS)
+
+    notified = await cache.get(NOTIFIED_KEY) or {}
+    reminders = build_reminders(snapshot, notified)
+    await cache.set(
+        NOTIFIED_KEY,
+        {conjunto: [item[id_field] for item in snapshot[conjunto]] for conjunto, (_, id_field, _) in _REMINDERS.items()},
+        ttl=SCHEDULER_CONFIG["notified_ttl"]
+    )
+
+    broker = get_broker()
+    for reminder in reminders:
+        await broker.publish(reminder)
+    return reminders
@@ -0,0 +1,47 @@
+# Archivo: app/scheduler/jobs.py
+# Descripción: Tareas programadas de la aplicación
+# Funcionalidad: Conjuntos de vencimientos, purga de lápidas y worker de cola embebido (opcional)
+
+import asyncio
+
+from app.config import JOBS_CONFIG, SCHEDULER_CONFIG, SYNC_CONFIG
+from app.controllers.sync_controller import SyncController
+from app.database import SessionLocal
+from app.factory import RepositoryFactory
+from app.jobs.worker import Worker
+from app.models.sync import RegistroEliminado
+from app.scheduler.core import Scheduler
+from app.scheduler.due_sets import refresh_due_sets
+
+
+def _purge_tombstones() -> int:
+    db = SessionLocal()
+    try:
+        controller = SyncController(RepositoryFactory.create_repository(RegistroEliminado, db))
+        return controller.purge_tombstones(SYNC_CONFIG["tombstone_retention_days"])
+    finally:
+        db.close()
+
+
+def register_default_jobs(scheduler: Scheduler) -> Scheduler:
+    """Registrar las tareas periódicas de JustTime"""
+    scheduler.add_job(
+        "due_sets",
+        lambda: refresh_due_sets(scheduler.clock.now()),
+        interval=SCHEDULER_CONFIG["due_sets_interval"]
+    )
+    scheduler.add_job(
+        "sync_purge",
+        lambda: asyncio.to_thread(_purge_tombstones),
+        interval=SCHEDULER_CONFIG["tombstone_purge_interval"]
+    )
+    if JOBS_CONFIG["embedded_worker"]:
+        # Sin lock: cada worker web procesa la cola (claim ya evita duplicados)
+        worker = Worker()
+        scheduler.add_job(
+            "jobs_embedded",
+            lambda: asyncio.to_thread(worker.run_batch, JOBS_CONFIG["embedded_batch"]),
+            interval=JOBS_CONFIG["poll_interval"],
+            lock=False
+        )
+    return scheduler
@@ -0,0 +1,162 @@
+# Archivo: app/server.py
+# Descripción: Perfil de servidor de producción (gunicorn + workers uvicorn)
+# Funcionalidad: Cantidad de workers según CPUs, implementaciones uvloop/httptools y estado de drenado
+#
+# Uso (desde backend/):
+#     gunicorn app.main:app -c gunicorn_conf.py     (producción, ver Procfile)
+#     python -m app.server                          (sin gunicorn: supervisor de uvicorn)
+
+import importlib.util
+import logging
+import os
+import shutil
+from typing import Optional
+
+from app.config import SERVER_CONFIG
+
+
+logger = logging.getLogger(__name__)
+
+
+_draining = False
+
+
+def cpu_count() -> int:
+    """CPUs utilizables por el proceso (respeta el affinity del contenedor)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
+def worker_count(cpus: Optional[int] = None) -> int:
+    """
+    WEB_CONCURRENCY explícito, o CPUs x workers_per_cpu acotado por max_workers.
+    Cada worker tiene su propio pool de base de datos: más workers que
+    núcleos solo multiplica conexiones.
+    """
+    if SERVER_CONFIG["workers"] > 0:
+        return SERVER_CONFIG["workers"]
+    cpus = cpus or cpu_count()
+    return max(1, min(cpus * SERVER_CONFIG["workers_per_cpu"], SERVER_CONFIG["max_workers"]))
+
+
+def _implementation(preferred: str, module: str) -> str:
+    # uvloop / httptools no existen en Windows: caer a la implementación por defecto
+    return preferred if importlib.util.find_spec(module) is not None else "auto"
+
+
+def loop_implementation() -> str:
+    return _implementation(SERVER_CONFIG["loop"], "uvloop")
+
+
+def http_implementation() -> str:
+    return _implementation(SERVER_CONFIG["http"], "httptools")
+
+
+def is_draining() -> bool:
+    """True desde que el worker empezó a apagarse"""
+    return _draining
+
+
+def begin_drain() -> None:
+    """
+    Inicio del apagado del worker (SIGTERM o reciclado por max_requests).
+    Los requests normales terminan solos; los streams de tiempo real se
+    cierran explícitamente para que el drenado no espere graceful_timeout.
+    """
+    global _draining
+    if _draining:
+        return
+    _draining = True
+    try:
+        from app.realtime import get_broker
+        get_broker().close_connections()
+    except Exception as e:
+        logger.error("Error cerrando conexiones de tiempo real: %s", e)
+
+
+def configure_metrics_dir() -> None:
+    """
+    Directorio de métricas compartido por los workers (PROMETHEUS_MULTIPROC_DIR).
+    Se vacía en cada arranque del master: archivos de un despliegue anterior
+    sumarían contadores de procesos que ya no existen. Debe llamarse antes de
+    que cualquier proceso importe prometheus_client.
+    """
+    from app.config import METRICS_CONFIG
+
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or METRICS_CONFIG["multiproc_dir"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Quitar los gauges en vivo (requests en curso) de un worker terminado (hook child_exit)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(pid)
+
+
+def reset_after_fork() -> None:
+    """
+    Estado por proceso que no debe heredarse del master de gunicorn
+    (hook post_fork): pools de base de datos y clientes Redis se crean de
+    nuevo en el worker, dentro de su propio event loop.
+    """
+    global _draining
+    from app.cache import set_cache, set_version_store
+    from app.database import dispose_engines
+    from app.realtime import set_broker
+    from app.scheduler import set_scheduler
+
+    _draining = False
+    dispose_engines()
+    set_cache(None)
+    set_version_store(None)
+    set_broker(None)
+    set_scheduler(None)
+
+
+def migrate_on_start() -> None:
+    """
+    Esquema: una sola vez por despliegue, en el proceso supervisor y antes
+    de crear workers (ningún worker ejecuta DDL ni compite por migrar).
+    Los engines se descartan después: cada worker abre los suyos.
+    """
+    if not SERVER_CONFIG["migrate_on_start"]:
+        return
+    from app.database import dispose_engines
+    from app.migrate import upgrade_database
+
+    upgrade_database()
+    dispose_engines()
+
+
+def main() -> None:
+    """Lanzador sin gunicorn: supervisor multiproceso de uvicorn (sin reciclado con jitter)"""
+    import uvicorn
+    from app.observability.logs import configure_logging
+
+    configure_logging()
+    migrate_on_start()
+    workers = worker_count()
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    configure_metrics_dir()
+    uvicorn.run(
+        "app.main:app",
+        host=SERVER_CONFIG["host"],
+        port=SERVER_CONFIG["port"],
+        workers=workers,
+        loop=loop_implementation(),
+        http=http_implementation(),
+        timeout_keep_alive=SERVER_CONFIG["keepalive"],
+        timeout_graceful_shutdown=SERVER_CONFIG["graceful_timeout"],
+        backlog=SERVER_CONFIG["backlog"],
+        proxy_headers=True,
+        forwarded_allow_ips=SERVER_CONFIG["forwarded_allow_ips"]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,16 @@
 # Funcionalidad: Subida, validación y gestión de documentos
 
 import os
+import shutil
+import time
 import uuid
 from pathlib import Path
 from typing import Optional
 from fastapi import UploadFile, HTTPException
+from starlette.concurrency import run_in_threadpool
 from app.config import FILE_CONFIG
+from app.observability.metrics import UPLOAD_BYTES, UPLOAD_LATENCY
+from app.observability.tracing import start_span
 
 
 class FileService:
@@ -62,24 +67,37 @@ class FileService:
         unique_filename = self.generate_unique_filename(file.filename)
         file_path = Path(self.upload_dir) / unique_filename
         
-        # Guardar archivo
-        contents = await file.read()
-        with open(file_path, 'wb') as f:
-            f.write(contents)
+        # Guardar archivo por bloques en un hilo: no carga el archivo
+        # completo en memoria ni bloquea el event loop con la escritura
+        started = time.perf_counter()
+        with start_span("file.write", {"file.name": unique_filename}) as span:
+            size = await run_in_threadpool(self._copy_to_disk, file, file_path)
+            if span is not None:
+                span.set_attribute("file.size", size)
+        UPLOAD_LATENCY.observe(time.perf_counter() - started)
+        UPLOAD_BYTES.inc(size)
         
         return {
             "nombre_archivo": file.filename,
             "ruta_archivo": str(file_path),
             "tipo_archivo": file.content_type,
-            "tamaño": len(contents)
+            "tamaño": size
         }
     
+    @staticmethod
+    def _copy_to_disk(file: UploadFile, file_path: Path) -> int:
+        file.file.seek(0)
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(file.file, f, 1024 * 1024)
+            return f.tell()
+    
     def delete_file(self, file_path: str) -> bool:
         """Eliminar archivo del sistema"""
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                return True
-        except Exception:
-            pass
-        return False
\ No newline at end of file
+        with start_span("file.delete", {"file.name": Path(file_path).name}):
+            try:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                    return True
+            except Exception:
+                pass
+            return False
\ No newline at end of file
@@ -15,12 +15,16 @@ class UtilityService:
     
     @staticmethod
     def format_response(success: bool, data: Any = None, message: str = "") -> Dict[str, Any]:
-        """Formatear respuesta estándar de la API"""
+        """
+        Formatear respuesta estándar de la API.
+        El timestamp se deja como datetime: lo serializa a ISO 8601 la
+        respuesta JSON (orjson), sin formatear strings en Python por request.
+        """
         return {
             "success": success,
             "data": data,
             "message": message,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
     
     @staticmethod
@@ -4,11 +4,29 @@
 
 from .exceptions import JustTimeException, ValidationError, AuthenticationError
 from .constants import *
+from .responses import FastJSONResponse
+from .security import (
+    create_access_token,
+    decode_access_token,
+    hash_password,
+    parse_access_token,
+    token_from_header,
+    user_id_from_token,
+    verify_password
+)
 
 __all__ = [
     "JustTimeException",
     "ValidationError", 
     "AuthenticationError",
+    "FastJSONResponse",
+    "create_access_token",
+    "decode_access_token",
+    "hash_password",
+    "parse_access_token",
+    "token_from_header",
+    "user_id_from_token",
+    "verify_password",
     "HTTP_STATUS",
     "TASK_STATES",
     "PROJECT_STATES", 
@@ -0,0 +1,57 @@
+# Archivo: app/utils/responses.py
+# Descripción: Clase de respuesta JSON rápida para toda la API
+# Funcionalidad: Serialización con orjson (fallback a json estándar) con soporte de fechas y Decimal
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Tipos que el serializador no conoce de forma nativa"""
+    if isinstance(obj, Decimal):
+        # Igual que jsonable_encoder: entero si no tiene decimales
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Tipo no serializable a JSON: {type(obj).__name__}")
+
+
+def json_dumps(content: Any) -> bytes:
+    """
+    Serializador JSON de la aplicación: orjson si está instalado, si no
+    json estándar con las mismas reglas de tipos. Lo usan las respuestas
+    HTTP y los mensajes de tiempo real (SSE, WebSocket, Redis).
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    Respuesta JSON por defecto de la aplicación.
+    Con orjson las fechas se serializan en C (ISO 8601) y el cuerpo se
+    genera directamente como bytes; sin orjson se usa json estándar.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
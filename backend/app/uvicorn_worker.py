@@ -0,0 +1,46 @@
+# Archivo: app/uvicorn_worker.py
+# Descripción: Worker de gunicorn para la aplicación ASGI (worker_class en gunicorn_conf.py)
+# Funcionalidad: uvloop + httptools, keep-alive / max_requests de gunicorn y drenado ordenado al apagar
+#
+# Módulo aparte de app/server.py: la aplicación consulta el estado de drenado
+# sin importar gunicorn ni uvicorn.
+
+import sys
+
+from gunicorn.arbiter import Arbiter
+from uvicorn.server import Server
+from uvicorn.workers import UvicornWorker
+
+from app.config import SERVER_CONFIG
+from app.server import begin_drain, http_implementation, loop_implementation
+
+
+class GracefulServer(Server):
+    """Server de uvicorn que avisa a la aplicación antes de drenar conexiones"""
+
+    async def shutdown(self, sockets=None) -> None:
+        begin_drain()
+        await super().shutdown(sockets=sockets)
+
+
+class JustTimeUvicornWorker(UvicornWorker):
+    """
+    Worker de gunicorn con uvloop + httptools. keep-alive y max_requests
+    (con jitter) los toma uvicorn de la configuración de gunicorn; el
+    drenado de requests en curso se limita a graceful_timeout.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": loop_implementation(),
+        "http": http_implementation(),
+        "timeout_graceful_shutdown": SERVER_CONFIG["graceful_timeout"],
+        "proxy_headers": True
+    }
+
+    async def _serve(self) -> None:
+        self.config.app = self.wsgi
+        server = GracefulServer(config=self.config)
+        self._install_sigquit_handler()
+        await server.serve(sockets=self.sockets)
+        if not server.started:
+            sys.exit(Arbiter.WORKER_BOOT_ERROR)
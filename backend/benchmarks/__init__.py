@@ -0,0 +1,3 @@
+# Archivo: benchmarks/__init__.py
+# Descripción: Paquete de benchmarks de rendimiento del backend JustTime
+# Funcionalidad: Scripts ejecutables con `python -m benchmarks.<nombre>` desde backend/
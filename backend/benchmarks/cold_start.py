@@ -0,0 +1,128 @@
+# Archivo: benchmarks/cold_start.py
+# Descripción: Benchmark de arranque en frío de un worker
+# Funcionalidad: Mide segundos desde el spawn hasta /health (escuchando) y /ready (listo para tráfico)
+#
+# Uso (desde backend/):
+#     python -m benchmarks.cold_start --runs 5
+#     python -m benchmarks.cold_start --runs 5 --budget 4 --json cold_start.json   (CI)
+#
+# Cada corrida lanza un proceso uvicorn nuevo (un worker, sin migrar al
+# iniciar) contra una base SQLite ya migrada, así se mide lo que paga cada
+# worker de gunicorn al nacer o reciclarse.
+
+import argparse
+import json
+import os
+import platform
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _poll(url: str, deadline: float) -> Optional[float]:
+    """Primer instante (perf_counter) en que la URL responde 200"""
+    while time.perf_counter() < deadline:
+        try:
+            if httpx.get(url, timeout=0.5).status_code == 200:
+                return time.perf_counter()
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.01)
+    return None
+
+
+def measure_once(database_url: str, timeout: float) -> Dict[str, float]:
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "SCHEDULER_ENABLED": "false",
+        "DB_MIGRATE_ON_START": "false",
+    }
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = started + timeout
+        listening = _poll(f"http://127.0.0.1:{port}/health", deadline)
+        ready = _poll(f"http://127.0.0.1:{port}/ready", deadline) if listening else None
+    finally:
+        stop_started = time.perf_counter()
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+        stopped = time.perf_counter()
+
+    if listening is None or ready is None:
+        raise RuntimeError(f"El worker no quedó listo en {timeout}s")
+    return {
+        "health_s": listening - started,
+        "ready_s": ready - started,
+        "shutdown_s": stopped - stop_started
+    }
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    return {
+        key: {
+            "median": statistics.median(r[key] for r in runs),
+            "min": min(r[key] for r in runs),
+            "max": max(r[key] for r in runs)
+        }
+        for key in runs[0]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tiempo de arranque en frío de un worker uvicorn")
+    parser.add_argument("--runs", type=int, default=5, help="Arranques a medir")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Segundos máximos por arranque")
+    parser.add_argument("--budget", type=float, default=None, help="Falla (código 1) si la mediana de /ready lo supera")
+    parser.add_argument("--json", dest="json_path", default=None, help="Guardar resultados (artefacto de CI)")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'cold_start.db')}"
+        subprocess.run(
+            [sys.executable, "-m", "app.migrate"],
+            env={**os.environ, "DATABASE_URL": database_url}, check=True, stdout=subprocess.DEVNULL
+        )
+        # Primera corrida descartada: compila bytecode y calienta la cache de disco
+        measure_once(database_url, options.timeout)
+        runs = [measure_once(database_url, options.timeout) for _ in range(options.runs)]
+
+    summary = summarize(runs)
+    print(f"{'métrica':<12} {'mediana s':>10} {'mín s':>8} {'máx s':>8}")
+    for key, stats in summary.items():
+        print(f"{key:<12} {stats['median']:>10.3f} {stats['min']:>8.3f} {stats['max']:>8.3f}")
+
+    if options.json_path:
+        with open(options.json_path, "w") as handle:
+            json.dump({
+                "python": platform.python_version(),
+                "runs": runs,
+                "summary": summary,
+                "budget_s": options.budget
+            }, handle, indent=2)
+
+    if options.budget is not None and summary["ready_s"]["median"] > options.budget:
+        print(f"❌ Arranque en frío {summary['ready_s']['median']:.3f}s supera el presupuesto de {options.budget}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Archivo: benchmarks/compression_tradeoff.py
+# Descripción: Benchmark CPU vs bytes de los encodings de compresión de respuestas
+# Funcionalidad: Mide ms de compresión, ratio y tiempo total estimado en un enlace lento
+#
+# Uso (desde backend/):
+#     python -m benchmarks.compression_tradeoff --rows 500 --link-kbps 2000
+
+import argparse
+import time
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+from app.config import COMPRESSION_CONFIG
+from app.middleware.compression import _GzipCompressor, _BrotliCompressor, _ZstdCompressor, brotli, zstandard
+from app.services.utility_service import UtilityService
+from app.utils.responses import FastJSONResponse
+
+
+ESTADOS = ["nuevo", "en_progreso", "finalizado"]
+
+# Niveles a comparar por encoding (el configurado se marca con *)
+LEVELS = {
+    "gzip": [1, 6, 9],
+    "br": [1, 4, 6, 11],
+    "zstd": [1, 3, 10, 19]
+}
+
+
+def kanban_payload(rows: int) -> bytes:
+    """Cuerpo JSON equivalente a GET /api/tasks/kanban con `rows` tareas"""
+    board = {estado: [] for estado in ESTADOS}
+    for i in range(rows):
+        board[ESTADOS[i % 3]].append({
+            "id_tarea": i,
+            "titulo": f"Revisar expediente {i}",
+            "descripcion": "Preparar documentación y coordinar con el cliente. " * 3,
+            "estado": ESTADOS[i % 3],
+            "prioridad": ["baja", "media", "alta"][i % 3],
+            "proyecto_id_fk": i % 40,
+            "fecha_vencimiento": date(2025, 1 + i % 12, 1 + i % 28),
+            "proyecto_nombre": f"Caso {i % 40}"
+        })
+    return FastJSONResponse(UtilityService.success_response(data=board)).body
+
+
+def documents_payload(rows: int) -> bytes:
+    """Cuerpo JSON equivalente a GET /api/documentos/ con estadísticas"""
+    documentos = [
+        {
+            "id_documento": i,
+            "nombre_archivo": f"contrato_{i}.pdf",
+            "ruta_archivo": f"uploads/proyectos/{i % 40}/20250101_{i:06d}_contrato_{i}.pdf",
+            "tipo_archivo": ".pdf",
+            "proyecto_id_fk": i % 40,
+            "subido_por_fk": 1,
+            "fecha_subida": datetime(2025, 1, 1, 9, i % 60)
+        }
+        for i in range(rows)
+    ]
+    data = {
+        "documentos": documentos,
+        "total": rows,
+        "estadisticas": {"total": rows, "con_proyecto": rows, "sin_proyecto": 0, "por_tipo": {".pdf": rows}}
+    }
+    return FastJSONResponse(UtilityService.success_response(data=data)).body
+
+
+def compressor_factory(encoding: str, level: int):
+    if encoding == "gzip":
+        return _GzipCompressor(level)
+    if encoding == "br":
+        return _BrotliCompressor(level)
+    return _ZstdCompressor(level)
+
+
+def measure(encoding: str, level: int, body: bytes, repeat: int) -> Tuple[float, int]:
+    """(ms de CPU por compresión, bytes comprimidos)"""
+    size = 0
+    start = time.process_time()
+    for _ in range(repeat):
+        compressor = compressor_factory(encoding, level)
+        size = len(compressor.compress(body) + compressor.flush())
+    return (time.process_time() - start) / repeat * 1000, size
+
+
+def run(rows: int, repeat: int) -> Dict[str, List[Tuple[str, int, float, int]]]:
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+
+    payloads = {"kanban": kanban_payload(rows), "documentos": documents_payload(rows)}
+    results: Dict[str, List[Tuple[str, int, float, int]]] = {}
+    for name, body in payloads.items():
+        results[name] = [("identity", 0, 0.0, len(body))]
+        for encoding in encodings:
+            for level in LEVELS[encoding]:
+                cpu_ms, size = measure(encoding, level, body, repeat)
+                results[name].append((encoding, level, cpu_ms, size))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CPU vs bytes de gzip/brotli/zstd sobre respuestas JSON")
+    parser.add_argument("--rows", type=int, default=500, help="Filas por respuesta")
+    parser.add_argument("--repeat", type=int, default=20, help="Iteraciones por medición")
+    parser.add_argument("--link-kbps", type=int, default=2000, help="Ancho de banda del enlace para estimar transferencia")
+    args = parser.parse_args()
+
+    configured = {
+        "gzip": COMPRESSION_CONFIG["gzip_level"],
+        "br": COMPRESSION_CONFIG["brotli_quality"],
+        "zstd": COMPRESSION_CONFIG["zstd_level"]
+    }
+    bytes_per_ms = args.link_kbps * 1000 / 8 / 1000
+
+    for name, rows in run(args.rows, args.repeat).items():
+        original = rows[0][3]
+        print(f"\n{name}: {original} bytes sin comprimir | enlace {args.link_kbps} kbps")
+        print(f"{'encoding':<10}{'nivel':>7}{'ms CPU':>10}{'bytes':>10}{'ratio':>8}{'ms total':>10}")
+        for encoding, level, cpu_ms, size in rows:
+            mark = "*" if configured.get(encoding) == level else " "
+            total = cpu_ms + size / bytes_per_ms
+            print(f"{encoding:<10}{level:>6}{mark}{cpu_ms:>10.2f}{size:>10}{original / size:>8.1f}{total:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+# Archivo: benchmarks/datagen.py
+# Descripción: Generador de datos sintéticos realistas para benchmarks y pruebas de carga
+# Funcionalidad: Usuarios, contactos, proyectos, tareas, documentos y actividades con distribuciones de un despacho
+#
+# Uso (desde backend/):
+#     python -m benchmarks.datagen --database-url sqlite:///bench.db --proyectos 5000
+#     DATABASE_URL=postgresql://... python -m benchmarks.datagen --proyectos 20000 --seed 7
+#
+# Con --proyectos 5000 genera ~3.000 contactos, ~40.000 tareas, ~15.000
+# documentos y ~20.000 actividades. La misma semilla produce exactamente los
+# mismos datos: los resultados de benchmarks/load.py son comparables entre
+# commits. Las filas se insertan con INSERT de Core por lotes (sin ORM ni
+# eventos de sesión) y con ids explícitos, sobre una base migrada y vacía.
+#
+# Todos los usuarios comparten la contraseña DEFAULT_PASSWORD; el primero
+# (usuario0@bench.justtime) es admin.
+
+import argparse
+import bisect
+import os
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import func, insert, select, text, update
+
+
+DEFAULT_PASSWORD = "bench1234"
+BATCH_SIZE = 5000
+
+# Materias del despacho y su peso relativo (pocas concentran la mayoría de los casos)
+CATEGORIAS = [
+    ("Civil", "#4f46e5", 30), ("Laboral", "#0ea5e9", 20), ("Familia", "#ec4899", 15),
+    ("Mercantil", "#f59e0b", 10), ("Penal", "#ef4444", 10), ("Administrativo", "#10b981", 7),
+    ("Fiscal", "#8b5cf6", 5), ("Migratorio", "#64748b", 3)
+]
+NOMBRES = ["Ana", "Luis", "María", "José", "Carmen", "Jorge", "Lucía", "Pedro", "Sofía", "Miguel",
+           "Elena", "Carlos", "Rosa", "Andrés", "Isabel", "Fernando", "Laura", "Ricardo", "Paula", "Diego"]
+APELLIDOS = ["García", "Martínez", "López", "Hernández", "González", "Pérez", "Rodríguez", "Sánchez",
+             "Ramírez", "Cruz", "Flores", "Gómez", "Morales", "Vázquez", "Reyes", "Jiménez", "Torres", "Ruiz"]
+EMPRESAS = ["Constructora", "Inmobiliaria", "Transportes", "Comercializadora", "Servicios", "Grupo", "Agrícola"]
+PUESTOS = ["Abogado", "Abogado asociado", "Pasante", "Asistente legal", "Socio"]
+DOCUMENTOS = ["contrato", "demanda", "poder notarial", "acta constitutiva", "sentencia", "recibo",
+              "identificación", "escritura", "convenio", "notificación", "peritaje", "amparo"]
+TAREAS = ["Revisar expediente", "Preparar escrito", "Audiencia", "Llamar al cliente", "Presentar pruebas",
+          "Solicitar copias", "Reunión con contraparte", "Redactar contrato", "Dar seguimiento", "Notificar"]
+ACTIVIDADES = ["Confirmar cita", "Enviar presupuesto", "Revisar correo del juzgado", "Cobrar honorarios",
+               "Actualizar expediente", "Archivar documentos", "Agendar audiencia", "Recoger firma"]
+EXTENSIONES = [(".pdf", "application/pdf", 60), (".docx", "application/vnd.openxmlformats-officedocument."
+               "wordprocessingml.document", 25), (".jpg", "image/jpeg", 10), (".xlsx", "application/vnd."
+               "openxmlformats-officedocument.spreadsheetml.sheet", 5)]
+
+
+class WeightedPicker:
+    """Muestreo ponderado O(log n) reutilizable (random.choices recalcula los acumulados)"""
+
+    def __init__(self, rng: random.Random, population: Sequence[Any], weights: Sequence[float]):
+        self.rng = rng
+        self.population = population
+        self.cumulative = list(accumulate(weights))
+
+    def __call__(self) -> Any:
+        point = self.rng.random() * self.cumulative[-1]
+        return self.population[bisect.bisect_right(self.cumulative, point)]
+
+
+def _zipf(rng: random.Random, population: Sequence[Any], exponent: float = 0.9) -> WeightedPicker:
+    """Pocos elementos concentran la mayoría (clientes frecuentes, usuarios muy activos)"""
+    return WeightedPicker(rng, population, [1 / (rank ** exponent) for rank in range(1, len(population) + 1)])
+
+
+def _weighted(rng: random.Random, weights: Dict[Any, float]) -> WeightedPicker:
+    return WeightedPicker(rng, list(weights), list(weights.values()))
+
+
+def _insert(connection, model, rows: List[Dict[str, Any]]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(insert(model.__table__), rows[start:start + BATCH_SIZE])
+
+
+def _reset_sequences(connection, tables: Dict[str, str]) -> None:
+    """Ids explícitos: en PostgreSQL las secuencias deben continuar después del máximo"""
+    if connection.dialect.name != "postgresql":
+        return
+    for table, column in tables.items():
+        connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+            f"COALESCE((SELECT MAX({column}) FROM {table}), 1))"
+        ))
+
+
+def generate(connection, proyectos: int = 5000, usuarios: int = 50, seed: int = 42,
+             password: str = DEFAULT_PASSWORD) -> Dict[str, int]:
+    """
+    Poblar una base migrada y vacía. Devuelve la cantidad de filas por tabla.
+    El llamador confirma la transacción.
+    """
+    from app.models import (
+        ActividadPendiente, CategoriaProyecto, Configuracion, Contacto, Documento,
+        Empleado, EmpleadoProyecto, EmpleadoTarea, Proyecto, Tarea, Usuario
+    )
+    from app.models.sync import SyncContador
+    from app.utils.security import hash_password
+
+    if connection.execute(select(func.count()).select_from(Proyecto.__table__)).scalar():
+        raise ValueError("La base ya tiene proyectos: el generador requiere una base vacía")
+
+    rng = random.Random(seed)
+    today = date.today()
+    now = datetime.now().replace(microsecond=0)
+    counts: Dict[str, int] = {}
+
+    # Usuarios, empleados y configuraciones (1:1:1). Un solo hash bcrypt para todos
+    password_hash = hash_password(password)
+    empleados = [{
+        "id_empleado": i + 1,
+        "nombre": f"{rng.choice(NOMBRES)} {rng.choice(APELLIDOS)}",
+        "telefono": f"55{rng.randrange(10**8):08d}",
+        "puesto": rng.choice(PUESTOS),
+        "activo": rng.random() > 0.05,
+        "fecha_ingreso": today - timedelta(days=rng.randrange(30, 3650))
+    } for i in range(usuarios)]
+    _insert(connection, Empleado, empleados)
+    _insert(connection, Usuario, [{
+        "id_usuario": i + 1,
+        "nombre": empleado["nombre"],
+        "email": f"usuario{i}@bench.justtime",
+        "password": password_hash,
+        "activo": True,
+        "empleado_id_fk": i + 1
+    } for i, empleado in enumerate(empleados)])
+    _insert(connection, Configuracion, [{
+        "id_configuracion": i + 1,
+        "usuario_id_fk": i + 1,
+        "idioma": "es" if rng.random() < 0.9 else "en",
+        "rol": "admin" if i == 0 else "usuario",
+        "tema": "claro" if rng.random() < 0.7 else "oscuro"
+    } for i in range(usuarios)])
+    counts["usuarios"] = usuarios
+
+    _insert(connection, CategoriaProyecto, [
+        {"id_categoria_proyecto": i + 1, "nombre": nombre, "color": color, "descripcion": f"Casos en materia {nombre.lower()}"}
+        for i, (nombre, color, _) in enumerate(CATEGORIAS)
+    ])
+    counts["categorias"] = len(CATEGORIAS)
+
+    # Contactos: 80% personas, 20% empresas
+    total_contactos = max(1, int(proyectos * 0.6))
+    contactos = []
+    for i in range(total_contactos):
+        persona = rng.random() < 0.8
+        apellido = rng.choice(APELLIDOS)
+        nombre = f"{rng.choice(NOMBRES)} {apellido} {rng.choice(APELLIDOS)}" if persona \
+            else f"{rng.choice(EMPRESAS)} {apellido} S.A. de C.V."
+        contactos.append({
+            "id_contacto": i + 1,
+            "nombre": nombre,
+            "telefono": f"55{rng.randrange(10**8):08d}" if rng.random() < 0.9 else None,
+            "email": f"contacto{i}@cliente.mx" if rng.random() < 0.75 else None,
+            "tipo": "persona" if persona else "empresa",
+            "direccion": f"Calle {rng.randrange(1, 300)} #{rng.randrange(1, 999)}" if rng.random() < 0.5 else None,
+            "activo": rng.random() > 0.1,
+            "version": 1
+        })
+    _insert(connection, Contacto, contactos)
+    counts["contactos"] = total_contactos
+
+    # Proyectos (casos). Clientes frecuentes concentran casos; 10% sin contacto, 15% sin categoría
+    contacto_de = _zipf(rng, [c["id_contacto"] for c in contactos])
+    categoria_de = WeightedPicker(rng, list(range(1, len(CATEGORIAS) + 1)), [w for _, _, w in CATEGORIAS])
+    estado_proyecto = _weighted(rng, {"activo": 55, "pausado": 15, "finalizado": 30})
+    prioridad = _weighted(rng, {"baja": 25, "media": 50, "alta": 25})
+    filas_proyectos = []
+    for i in range(proyectos):
+        estado = estado_proyecto()
+        inicio = today - timedelta(days=rng.randrange(0, 3 * 365))
+        categoria = categoria_de() if rng.random() > 0.15 else None
+        materia = CATEGORIAS[categoria - 1][0] if categoria else "General"
+        filas_proyectos.append({
+            "id_proyecto": i + 1,
+            "nombre": f"Caso {i + 1:05d} {materia} {rng.choice(APELLIDOS)}",
+            "descripcion": " ".join(rng.choices(DOCUMENTOS + TAREAS, k=rng.randrange(5, 40))),
+            "fecha_inicio": inicio,
+            "fecha_fin": inicio + timedelta(days=rng.randrange(30, 400)) if estado == "finalizado" else None,
+            "estado": estado,
+            "contacto_id_fk": contacto_de() if rng.random() > 0.1 else None,
+            "categoria_id_fk": categoria,
+            "prioridad": prioridad(),
+            "version": 1
+        })
+    _insert(connection, Proyecto, filas_proyectos)
+    counts["proyectos"] = proyectos
+
+    # Tareas: cantidad y estado según el estado del caso
+    estado_tarea = {
+        "activo": _weighted(rng, {"nuevo": 35, "en_progreso": 30, "finalizado": 35}),
+        "pausado": _weighted(rng, {"nuevo": 50, "en_progreso": 30, "finalizado": 20}),
+        "finalizado": _weighted(rng, {"nuevo": 2, "en_progreso": 3, "finalizado": 95})
+    }
+    tareas_por_caso = {"activo": (2, 16), "pausado": (2, 8), "finalizado": (3, 12)}
+    prioridad_tarea = _weighted(rng, {"baja": 20, "media": 55, "alta": 25})
+    tareas = []
+    for proyecto in filas_proyectos:
+        low, high = tareas_por_caso[proyecto["estado"]]
+        for _ in range(rng.randint(low, high)):
+            tareas.append({
+                "id_tarea": len(tareas) + 1,
+                "titulo": f"{rng.choice(TAREAS)} ({proyecto['nombre']})",
+                "descripcion": " ".join(rng.choices(DOCUMENTOS, k=rng.randrange(0, 25))) or None,
+                "estado": estado_tarea[proyecto["estado"]](),
+                "fecha_vencimiento": today + timedelta(days=rng.randint(-60, 120)) if rng.random() > 0.15 else None,
+                "proyecto_id_fk": proyecto["id_proyecto"],
+                "prioridad": prioridad_tarea(),
+                "version": 1
+            })
+    _insert(connection, Tarea, tareas)
+    counts["tareas"] = len(tareas)
+
+    # Asignaciones: 1-3 empleados por caso, la mitad de las tareas con responsable
+    empleado_ids = [e["id_empleado"] for e in empleados]
+    asignaciones_proyecto = []
+    for proyecto in filas_proyectos:
+        for empleado_id in rng.sample(empleado_ids, min(len(empleado_ids), rng.randint(1, 3))):
+            asignaciones_proyecto.append({
+                "empleado_id_fk": empleado_id,
+                "proyecto_id_fk": proyecto["id_proyecto"],
+                "fecha_asignacion": proyecto["fecha_inicio"]
+            })
+    _insert(connection, EmpleadoProyecto, asignaciones_proyecto)
+    asignaciones_tarea = [{
+        "empleado_id_fk": rng.choice(empleado_ids),
+        "tarea_id_fk": tarea["id_tarea"],
+        "rol_en_tarea": "asignado",
+        "estado_personal": "completado" if tarea["estado"] == "finalizado" else "pendiente",
+        "fecha_asignacion": now - timedelta(days=rng.randrange(0, 365))
+    } for tarea in tareas if rng.random() < 0.5]
+    _insert(connection, EmpleadoTarea, asignaciones_tarea)
+    counts["asignaciones"] = len(asignaciones_proyecto) + len(asignaciones_tarea)
+
+    # Documentos: ~3 por caso con cola larga; metadatos sin archivo físico
+    documentos_por_caso = _weighted(rng, {0: 15, 1: 20, 2: 20, 3: 15, 4: 12, 6: 10, 10: 6, 20: 2})
+    extension = WeightedPicker(rng, EXTENSIONES, [w for _, _, w in EXTENSIONES])
+    autor = _zipf(rng, [u + 1 for u in range(usuarios)])
+    documentos = []
+    for proyecto in filas_proyectos:
+        for _ in range(documentos_por_caso()):
+            ext, mime, _ = extension()
+            documentos.append({
+                "id_documento": len(documentos) + 1,
+                "nombre_archivo": f"{rng.choice(DOCUMENTOS)} {proyecto['id_proyecto']}-{len(documentos)}{ext}",
+                "ruta_archivo": f"uploads/bench/{uuid.UUID(int=rng.getrandbits(128))}{ext}",
+                "tipo_archivo": mime,
+                "proyecto_id_fk": proyecto["id_proyecto"],
+                "subido_por_fk": autor(),
+                "fecha_subida": datetime.combine(proyecto["fecha_inicio"], datetime.min.time())
+                + timedelta(minutes=rng.randrange(0, 60 * 24 * 365)),
+                "version": 1
+            })
+    _insert(connection, Documento, documentos)
+    counts["documentos"] = len(documentos)
+
+    # Actividades pendientes: usuarios muy activos concentran la mayoría; 40% completadas
+    responsable = _zipf(rng, [u + 1 for u in range(usuarios)], exponent=0.7)
+    actividades = [{
+        "id_actividad_pendiente": i + 1,
+        "descripcion": rng.choice(ACTIVIDADES),
+        "fecha_vencimiento": now + timedelta(hours=rng.randint(-24 * 30, 24 * 60)) if rng.random() > 0.1 else None,
+        "completada": rng.random() < 0.4,
+        "usuario_id_fk": responsable(),
+        "proyecto_id_fk": rng.randrange(1, proyectos + 1) if rng.random() < 0.5 else None,
+        "prioridad": prioridad(),
+        "version": 1
+    } for i in range(proyectos * 4)]
+    _insert(connection, ActividadPendiente, actividades)
+    counts["actividades"] = len(actividades)
+
+    # Todas las filas quedan en la versión 1 del contador de sincronización
+    if not connection.execute(update(SyncContador).where(SyncContador.id == 1).values(version=1)).rowcount:
+        connection.execute(insert(SyncContador).values(id=1, version=1, purgado_hasta=0))
+
+    _reset_sequences(connection, {
+        "empleados": "id_empleado", "usuarios": "id_usuario", "configuraciones": "id_configuracion",
+        "categorias_proyecto": "id_categoria_proyecto", "contactos": "id_contacto",
+        "proyectos": "id_proyecto", "tareas": "id_tarea", "documentos": "id_documento",
+        "actividades_pendientes": "id_actividad_pendiente"
+    })
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Poblar una base con datos sintéticos de JustTime")
+    parser.add_argument("--database-url", default=None, help="Base a poblar (por defecto DATABASE_URL)")
+    parser.add_argument("--proyectos", type=int, default=5000, help="Casos a generar; el resto escala con ellos")
+    parser.add_argument("--usuarios", type=int, default=50, help="Usuarios / empleados")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla (misma semilla = mismos datos)")
+    parser.add_argument("--no-migrate", action="store_true", help="No aplicar migraciones antes de poblar")
+    options = parser.parse_args()
+
+    if options.database_url:
+        # Antes de importar app: la configuración lee DATABASE_URL al cargarse
+        os.environ["DATABASE_URL"] = options.database_url
+
+    from app.database import get_engine
+    from app.migrate import upgrade_database
+
+    if not options.no_migrate and not upgrade_database():
+        raise SystemExit("No se pudo migrar la base")
+
+    started = time.perf_counter()
+    with get_engine().begin() as connection:
+        counts = generate(connection, options.proyectos, options.usuarios, options.seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"Datos generados en {elapsed:.1f}s (semilla {options.seed}, contraseña '{DEFAULT_PASSWORD}'):")
+    for table, count in counts.items():
+        print(f"  {table:<14} {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
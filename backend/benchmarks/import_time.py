@@ -0,0 +1,119 @@
+# Archivo: benchmarks/import_time.py
+# Descripción: Perfil de tiempo de importación de la aplicación (python -X importtime)
+# Funcionalidad: Mediana de `import app.main`, módulos y paquetes más costosos y dependencias diferidas
+#
+# Uso (desde backend/):
+#     python -m benchmarks.import_time --runs 5 --top 25
+#     python -m benchmarks.import_time --runs 5 --budget-ms 2500 --json import_time.json   (CI)
+#
+# Cada corrida es un intérprete nuevo, así se mide lo que paga cada worker
+# al arrancar. --check falla si alguna dependencia diferida (DEFERRED) se
+# vuelve a importar al cargar la aplicación.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+# Dependencias que la aplicación importa en el primer uso, no al arrancar
+DEFERRED = ("jose", "passlib", "uvicorn", "gunicorn", "alembic", "redis", "httpx")
+
+_PROBE = "import app.main, sys, json; print(json.dumps(sorted(sys.modules)))"
+
+
+def profile_once(target: str) -> Tuple[List[Tuple[str, int, int, int]], List[str]]:
+    """
+    Importar `target` en un intérprete nuevo.
+    Devuelve filas (módulo, self µs, acumulado µs, profundidad) y los módulos cargados.
+    """
+    probe = _PROBE.replace("app.main", target)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, env={**os.environ, "PYTHONWARNINGS": "ignore"}, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # encabezado
+        # El nombre lleva un espacio más dos por nivel de anidamiento
+        depth = (len(fields[2]) - len(fields[2].lstrip()) - 1) // 2
+        rows.append((fields[2].strip(), int(fields[0]), int(fields[1]), depth))
+    return rows, json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def total_ms(rows: List[Tuple[str, int, int, int]], target: str) -> float:
+    for name, _, cumulative, _ in rows:
+        if name == target:
+            return cumulative / 1000
+    return sum(r[1] for r in rows) / 1000
+
+
+def by_package(rows: List[Tuple[str, int, int, int]]) -> Dict[str, float]:
+    """Tiempo propio agrupado por paquete de primer nivel (fastapi, sqlalchemy, app, ...)"""
+    totals: Dict[str, float] = defaultdict(float)
+    for name, self_us, _, _ in rows:
+        totals[name.split(".")[0]] += self_us / 1000
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tiempo de importación de la aplicación")
+    parser.add_argument("--target", default="app.main", help="Módulo a importar")
+    parser.add_argument("--runs", type=int, default=5, help="Intérpretes nuevos a medir")
+    parser.add_argument("--top", type=int, default=20, help="Módulos a listar")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Falla (código 1) si la mediana lo supera")
+    parser.add_argument("--check", action="store_true", help="Falla si se cargó alguna dependencia diferida")
+    parser.add_argument("--json", dest="json_path", default=None, help="Guardar resultados (artefacto de CI)")
+    options = parser.parse_args()
+
+    profile_once(options.target)  # calentar bytecode y cache de disco
+    runs = [profile_once(options.target) for _ in range(options.runs)]
+    totals = [total_ms(rows, options.target) for rows, _ in runs]
+    median = statistics.median(totals)
+    # Perfil representativo: la corrida más cercana a la mediana
+    rows, loaded = min(runs, key=lambda run: abs(total_ms(run[0], options.target) - median))
+
+    print(f"import {options.target}: mediana {median:.0f} ms (mín {min(totals):.0f}, máx {max(totals):.0f}, {len(totals)} corridas)\n")
+
+    print(f"{'acumulado ms':>12} {'propio ms':>10}  módulo")
+    for name, self_us, cumulative, depth in sorted(rows, key=lambda r: r[2], reverse=True)[:options.top]:
+        print(f"{cumulative / 1000:>12.1f} {self_us / 1000:>10.1f}  {'  ' * depth}{name}")
+
+    packages = by_package(rows)
+    print(f"\n{'propio ms':>10}  paquete")
+    for package, ms in list(packages.items())[:options.top]:
+        print(f"{ms:>10.1f}  {package}")
+
+    eager = [dep for dep in DEFERRED if dep in loaded]
+    print(f"\nDependencias diferidas cargadas al importar: {', '.join(eager) if eager else 'ninguna'}")
+
+    if options.json_path:
+        with open(options.json_path, "w") as handle:
+            json.dump({
+                "target": options.target,
+                "median_ms": median,
+                "runs_ms": totals,
+                "packages_ms": packages,
+                "eager_deferred": eager,
+                "budget_ms": options.budget_ms
+            }, handle, indent=2)
+
+    failed = False
+    if options.check and eager:
+        print(f"❌ Se importan al arrancar: {', '.join(eager)}")
+        failed = True
+    if options.budget_ms is not None and median > options.budget_ms:
+        print(f"❌ Importación {median:.0f} ms supera el presupuesto de {options.budget_ms:.0f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+# Archivo: benchmarks/load.py
+# Descripción: Generador de carga async con escenarios realistas de JustTime
+# Funcionalidad: Usuarios virtuales concurrentes, latencias p50/p95/p99 y throughput comparables entre commits
+#
+# Uso (desde backend/):
+#     python -m benchmarks.load --users 50 --duration 30                      (mezcla por defecto)
+#     python -m benchmarks.load --scenario login_storm --users 100 --duration 10
+#     python -m benchmarks.load --scenario dashboard:3 --scenario kanban_polling:1 --workers 4
+#     python -m benchmarks.load --json after.json --compare before.json --max-regression 15
+#     python -m benchmarks.load --base-url http://staging:8000 --proyectos 5000   (servidor ya poblado)
+#
+# Sin --base-url levanta un servidor local (uvicorn, o gunicorn con
+# --workers > 1) sobre una base SQLite temporal poblada con
+# benchmarks/datagen.py; con la misma semilla y escala los datos son
+# idénticos y los reportes de distintos commits se pueden comparar.
+# --compare marca los requests cuyo p95 empeoró más de --max-regression %
+# y termina con código 1 (útil en CI).
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from benchmarks.datagen import WeightedPicker
+from benchmarks.scenarios import DEFAULT_MIX, SCENARIOS, Recorder, VirtualUser
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Percentil por rango más cercano sobre valores ya ordenados"""
+    if not sorted_values:
+        return 0.0
+    index = math.ceil(p / 100 * len(sorted_values)) - 1
+    return sorted_values[min(len(sorted_values) - 1, max(0, index))]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+        return revision.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _wait_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/ready", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("El servidor no quedó listo a tiempo")
+
+
+@contextmanager
+def local_server(options) -> Iterator[str]:
+    """Base temporal poblada + servidor local; se apaga con SIGTERM al salir"""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{os.path.join(tmp, 'load.db')}",
+            "UPLOAD_DIRECTORY": os.path.join(tmp, "uploads"),
+            "SCHEDULER_ENABLED": "false",
+            "DB_MIGRATE_ON_START": "false",
+            "DEBUG": "false",
+            "RATE_LIMIT_ENABLED": "false",  # todos los usuarios virtuales salen de la misma IP
+        }
+        print(f"Generando datos ({options.proyectos} proyectos, semilla {options.seed})...")
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.datagen", "--proyectos", str(options.proyectos),
+             "--usuarios", str(options.usuarios), "--seed", str(options.seed)],
+            env=env, check=True, stdout=subprocess.DEVNULL
+        )
+
+        port = _free_port()
+        if options.workers > 1:
+            command = [sys.executable, "-m", "gunicorn", "app.main:app", "-c", "gunicorn_conf.py",
+                       "--access-logfile", "/dev/null", "--log-level", "warning"]
+            env.update({"WEB_CONCURRENCY": str(options.workers), "PORT": str(port), "SERVER_MAX_REQUESTS": "0"})
+        else:
+            command = [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                       "--log-level", "warning", "--no-access-log"]
+        server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_ready(base_url)
+            yield base_url
+        finally:
+            server.terminate()
+            server.wait(timeout=60)
+
+
+async def run_load(base_url: str, options) -> Dict[str, Any]:
+    recorder = Recorder()
+    dataset = {"usuarios": options.usuarios, "proyectos": options.proyectos}
+    limits = httpx.Limits(max_connections=options.users, max_keepalive_connections=options.users)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=options.timeout) as client:
+        users = [VirtualUser(i, client, recorder, dataset, options.seed) for i in range(options.users)]
+        # Sesiones iniciales fuera de la medición (login_storm mide las suyas)
+        for start in range(0, len(users), 20):
+            await asyncio.gather(*(user.login() for user in users[start:start + 20]))
+
+        names = list(options.mix)
+        deadline = time.monotonic() + options.warmup + options.duration
+
+        async def virtual_user(user: VirtualUser) -> None:
+            pick = WeightedPicker(user.rng, names, [options.mix[name] for name in names])
+            while time.monotonic() < deadline:
+                name = pick()
+                await SCENARIOS[name](user)
+                if recorder.recording:
+                    recorder.iterations[name] += 1
+                if options.think > 0:
+                    await asyncio.sleep(user.rng.expovariate(1 / options.think))
+
+        async def measurement_window() -> float:
+            await asyncio.sleep(options.warmup)
+            recorder.recording = True
+            started = time.monotonic()
+            await asyncio.sleep(options.duration)
+            recorder.recording = False
+            return time.monotonic() - started
+
+        results = await asyncio.gather(measurement_window(), *(virtual_user(user) for user in users))
+        window = results[0]
+
+    requests: Dict[str, Dict[str, Any]] = {}
+    for name in sorted(recorder.latencies):
+        values = sorted(recorder.latencies[name])
+        requests[name] = {
+            "count": len(values),
+            "errors": recorder.errors[name],
+            "rps": len(values) / window,
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+            "max_ms": values[-1] * 1000,
+            "status": {str(code): count for code, count in sorted(recorder.statuses[name].items())}
+        }
+    all_values = sorted(v for values in recorder.latencies.values() for v in values)
+    return {
+        "requests": requests,
+        "scenarios": {name: {"iterations": count, "per_s": count / window} for name, count in recorder.iterations.items()},
+        "total": {
+            "count": len(all_values),
+            "errors": sum(recorder.errors.values()),
+            "rps": len(all_values) / window,
+            "p50_ms": percentile(all_values, 50) * 1000,
+            "p95_ms": percentile(all_values, 95) * 1000,
+            "p99_ms": percentile(all_values, 99) * 1000,
+            "max_ms": all_values[-1] * 1000 if all_values else 0.0
+        },
+        "window_s": window
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'request':<24} {'n':>7} {'err':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'máx ms':>8}")
+    rows = list(report["requests"].items()) + [("TOTAL", report["total"])]
+    for name, stats in rows:
+        print(
+            f"{name:<24} {stats['count']:>7} {stats['errors']:>5} {stats['rps']:>8.1f} {stats['p50_ms']:>8.1f} "
+            f"{stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} {stats['max_ms']:>8.1f}"
+        )
+    print(f"\n{'escenario':<24} {'iteraciones':>12} {'por s':>8}")
+    for name, stats in sorted(report["scenarios"].items()):
+        print(f"{name:<24} {stats['iterations']:>12} {stats['per_s']:>8.2f}")
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], max_regression: float, min_samples: int = 30) -> bool:
+    """Imprimir diferencias contra un reporte anterior. True si ningún p95 empeoró más del umbral"""
+    print(f"\nComparación con {baseline.get('meta', {}).get('revision') or 'reporte anterior'}:")
+    print(f"{'request':<24} {'p95 antes':>10} {'p95 ahora':>10} {'Δ%':>7} {'req/s Δ%':>9}")
+    ok = True
+    for name, stats in report["requests"].items():
+        before = baseline.get("requests", {}).get(name)
+        if not before or not before["p95_ms"] or not before["rps"]:
+            continue
+        delta = (stats["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        rps_delta = (stats["rps"] - before["rps"]) / before["rps"] * 100
+        regression = delta > max_regression and stats["count"] >= min_samples and before["count"] >= min_samples
+        ok = ok and not regression
+        print(f"{name:<24} {before['p95_ms']:>10.1f} {stats['p95_ms']:>10.1f} {delta:>+7.1f} {rps_delta:>+9.1f}"
+              f"{'  ❌' if regression else ''}")
+    return ok
+
+
+def _parse_mix(values: Optional[List[str]]) -> Dict[str, float]:
+    if not values:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for value in values:
+        name, _, weight = value.partition(":")
+        if name not in SCENARIOS:
+            raise SystemExit(f"Escenario desconocido: {name}. Disponibles: {', '.join(SCENARIOS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prueba de carga con escenarios de JustTime")
+    parser.add_argument("--scenario", action="append", help="nombre[:peso] (repetible); por defecto la mezcla diaria")
+    parser.add_argument("--users", type=int, default=50, help="Usuarios virtuales concurrentes")
+    parser.add_argument("--duration", type=float, default=30.0, help="Segundos de medición")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Segundos de carga previos sin medir")
+    parser.add_argument("--think", type=float, default=0.0, help="Pausa media entre acciones por usuario (s)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Timeout por request (s)")
+    parser.add_argument("--base-url", default=None, help="Servidor ya poblado con datagen (sin él se levanta uno local)")
+    parser.add_argument("--workers", type=int, default=1, help="Workers del servidor local (>1 usa gunicorn)")
+    parser.add_argument("--proyectos", type=int, default=5000, help="Escala de datos (debe coincidir con la base)")
+    parser.add_argument("--usuarios", type=int, default=50, help="Usuarios sembrados")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de datos y usuarios virtuales")
+    parser.add_argument("--json", dest="json_path", default=None, help="Guardar el reporte")
+    parser.add_argument("--compare", default=None, help="Reporte JSON anterior para comparar")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="Δ%% de p95 tolerado con --compare")
+    options = parser.parse_args()
+    options.mix = _parse_mix(options.scenario)
+
+    if options.base_url:
+        report = asyncio.run(run_load(options.base_url, options))
+    else:
+        with local_server(options) as base_url:
+            report = asyncio.run(run_load(base_url, options))
+
+    report["meta"] = {
+        "revision": _git_revision(),
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "mix": options.mix,
+        "users": options.users,
+        "duration_s": options.duration,
+        "workers": options.workers,
+        "proyectos": options.proyectos,
+        "seed": options.seed
+    }
+    print(f"Revisión {report['meta']['revision']} | {options.users} usuarios | {options.duration:.0f}s | "
+          f"mezcla {', '.join(f'{k}:{v:g}' for k, v in options.mix.items())}")
+    print_report(report)
+
+    if options.json_path:
+        with open(options.json_path, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    if options.compare:
+        with open(options.compare) as handle:
+            baseline = json.load(handle)
+        if not compare(report, baseline, options.max_regression):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
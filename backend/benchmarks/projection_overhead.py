@@ -0,0 +1,146 @@
+# Archivo: benchmarks/projection_overhead.py
+# Descripción: Benchmark de memoria y CPU del modo lite (proyección de columnas)
+# Funcionalidad: Compara listados vía entidades ORM + _to_dict vs tuplas Row por cada 1.000 filas
+#
+# Uso (desde backend/):
+#     python -m benchmarks.projection_overhead --rows 5000 --repeat 5
+
+import argparse
+import time
+import tracemalloc
+from typing import Callable, Dict, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.factory import BaseRepository
+from app.models import Proyecto, Tarea, ActividadPendiente, Usuario, Contacto, Documento
+from app.controllers.task_controller import TaskController
+from app.controllers.contact_controller import ContactController
+from app.controllers.document_controller import DocumentController
+from app.controllers.pending_activity_controller import PendingActivityController
+
+
+ESTADOS = ["nuevo", "en_progreso", "finalizado"]
+
+
+def seed(session: Session, rows: int) -> None:
+    """Poblar base en memoria con filas de todos los listados"""
+    usuario = Usuario(nombre="bench", email="bench@justtime.local", password="x")
+    session.add(usuario)
+    session.flush()
+
+    contactos = [
+        Contacto(nombre=f"Contacto {i}", tipo="persona", email=f"c{i}@justtime.local", direccion="d" * 200)
+        for i in range(rows)
+    ]
+    session.add_all(contactos)
+    session.flush()
+
+    proyectos = [
+        Proyecto(nombre=f"Caso {i}", estado="activo", contacto_id_fk=contactos[i].id_contacto)
+        for i in range(max(rows // 20, 1))
+    ]
+    session.add_all(proyectos)
+    session.flush()
+
+    session.add_all([
+        Tarea(
+            titulo=f"Tarea {i}",
+            descripcion="x" * 200,
+            estado=ESTADOS[i % 3],
+            proyecto_id_fk=proyectos[i % len(proyectos)].id_proyecto
+        )
+        for i in range(rows)
+    ])
+    session.add_all([
+        ActividadPendiente(
+            descripcion=f"Actividad {i}",
+            usuario_id_fk=usuario.id_usuario,
+            proyecto_id_fk=proyectos[i % len(proyectos)].id_proyecto
+        )
+        for i in range(rows)
+    ])
+    session.add_all([
+        Documento(
+            nombre_archivo=f"doc_{i}.pdf",
+            ruta_archivo=f"uploads/proyectos/{i}/doc_{i}.pdf",
+            tipo_archivo=".pdf",
+            proyecto_id_fk=proyectos[i % len(proyectos)].id_proyecto,
+            subido_por_fk=usuario.id_usuario
+        )
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def measure(session: Session, fn: Callable[[], list], repeat: int) -> Tuple[float, float, int]:
+    """
+    Devuelve (ms de CPU, KiB de pico de memoria, filas) por llamada.
+    Cada llamada arranca con la sesión vacía, como un request nuevo.
+    """
+    session.expunge_all()
+    fn()  # warm-up: compilación y cache de sentencias
+
+    cpu = 0.0
+    peak = 0
+    count = 0
+    for _ in range(repeat):
+        session.expunge_all()
+        tracemalloc.start()
+        start = time.process_time()
+        result = fn()
+        cpu += time.process_time() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        count = len(result)
+
+    return cpu / repeat * 1000, peak / 1024, count
+
+
+def run(rows: int, repeat: int) -> Dict[str, Tuple[float, float, int]]:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    seed(session, rows)
+
+    tasks = TaskController(BaseRepository(Tarea, session))
+    contacts = ContactController(BaseRepository(Contacto, session))
+    documents = DocumentController(BaseRepository(Documento, session))
+    activities = PendingActivityController(BaseRepository(ActividadPendiente, session))
+
+    scenarios = {
+        "tareas_orm": lambda: tasks.get_all_tasks(limit=rows),
+        "tareas_lite": lambda: tasks.get_all_tasks_lite(tasks.resolve_fields(), limit=rows),
+        "contactos_orm": lambda: contacts.get_all_contacts(limit=rows),
+        "contactos_lite": lambda: contacts.get_all_contacts_lite(contacts.resolve_fields(), limit=rows),
+        "documentos_orm": lambda: documents.get_all_documents(limit=rows),
+        "documentos_lite": lambda: documents.get_all_documents_lite(documents.resolve_fields(), limit=rows),
+        "actividades_orm": lambda: activities.get_all_activities(limit=rows),
+        "actividades_lite": lambda: activities.get_all_activities_lite(activities.resolve_fields(), limit=rows),
+    }
+
+    results = {name: measure(session, fn, repeat) for name, fn in scenarios.items()}
+    session.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memoria y CPU de listados ORM vs proyección de columnas")
+    parser.add_argument("--rows", type=int, default=5000, help="Filas a generar por tabla")
+    parser.add_argument("--repeat", type=int, default=5, help="Iteraciones por medición")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat)
+
+    print(f"Filas: {args.rows} | Iteraciones: {args.repeat}")
+    print(f"{'medición':<20}{'filas':>8}{'ms CPU/1k':>14}{'KiB pico/1k':>14}")
+    for name, (cpu_ms, peak_kib, count) in results.items():
+        per_k = 1000 / max(count, 1)
+        print(f"{name:<20}{count:>8}{cpu_ms * per_k:>14.2f}{peak_kib * per_k:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
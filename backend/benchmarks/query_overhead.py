@@ -0,0 +1,128 @@
+# Archivo: benchmarks/query_overhead.py
+# Descripción: Micro-benchmark del overhead Python por request en consultas ORM
+# Funcionalidad: Compara Query legacy vs select()/lambda_stmt e hidratación ORM
+#
+# Uso (desde backend/):
+#     python -m benchmarks.query_overhead --rows 2000 --repeat 300
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from sqlalchemy import create_engine, select, lambda_stmt
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.factory import BaseRepository
+from app.models import Proyecto, Tarea, ActividadPendiente, Usuario
+from app.controllers.task_controller import TaskController
+
+
+ESTADOS = ["nuevo", "en_progreso", "finalizado"]
+
+
+def seed(session: Session, rows: int) -> None:
+    """Poblar base en memoria con proyectos, tareas y actividades"""
+    usuario = Usuario(nombre="bench", email="bench@justtime.local", password="x")
+    session.add(usuario)
+    session.flush()
+    
+    proyectos = [Proyecto(nombre=f"Caso {i}", estado="activo") for i in range(max(rows // 20, 1))]
+    session.add_all(proyectos)
+    session.flush()
+    
+    session.add_all([
+        Tarea(
+            titulo=f"Tarea {i}",
+            descripcion="x" * 200,
+            estado=ESTADOS[i % 3],
+            proyecto_id_fk=proyectos[i % len(proyectos)].id_proyecto
+        )
+        for i in range(rows)
+    ])
+    session.add_all([
+        ActividadPendiente(descripcion=f"Actividad {i}", usuario_id_fk=usuario.id_usuario, completada=bool(i % 2))
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """Microsegundos promedio por llamada (tras un warm-up que llena las caches)"""
+    for _ in range(5):
+        fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def run(rows: int, repeat: int) -> Dict[str, float]:
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    seed(session, rows)
+    
+    estado = "nuevo"
+    results: Dict[str, float] = {}
+    
+    # 1. Solo construcción + cache key (sin ejecutar): overhead puro de Python
+    results["construccion_query_legacy"] = measure(
+        lambda: session.query(Tarea).filter(Tarea.estado == estado).limit(50).statement._generate_cache_key(),
+        repeat
+    )
+    results["construccion_lambda_stmt"] = measure(
+        lambda: lambda_stmt(lambda: select(Tarea).where(Tarea.estado == estado).limit(50))._generate_cache_key(),
+        repeat
+    )
+    
+    # 2. Ejecución con pocas filas: domina el overhead por request
+    results["ejecucion_query_legacy_50"] = measure(
+        lambda: session.query(Tarea).filter(Tarea.estado == estado).limit(50).all(),
+        repeat
+    )
+    results["ejecucion_lambda_stmt_50"] = measure(
+        lambda: session.execute(
+            lambda_stmt(lambda: select(Tarea).where(Tarea.estado == estado).limit(50))
+        ).scalars().all(),
+        repeat
+    )
+    
+    # 3. Hidratación: entidades ORM vs tuplas Row de las mismas columnas
+    results["hidratacion_orm_todas"] = measure(
+        lambda: session.execute(select(Tarea)).scalars().all(),
+        max(repeat // 10, 1)
+    )
+    results["hidratacion_rows_todas"] = measure(
+        lambda: session.execute(select(*Tarea.__table__.columns)).all(),
+        max(repeat // 10, 1)
+    )
+    
+    # 4. Ruta completa del controlador (consulta + _task_to_dict)
+    controller = TaskController(BaseRepository(Tarea, session))
+    results["controlador_get_by_estado"] = measure(
+        lambda: (controller.get_by_estado(estado), session.expunge_all()),
+        max(repeat // 10, 1)
+    )
+    
+    session.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Overhead de construcción de consultas e hidratación ORM")
+    parser.add_argument("--rows", type=int, default=2000, help="Tareas y actividades a generar")
+    parser.add_argument("--repeat", type=int, default=300, help="Iteraciones por medición")
+    args = parser.parse_args()
+    
+    results = run(args.rows, args.repeat)
+    
+    print(f"Filas: {args.rows} | Iteraciones: {args.repeat}")
+    print(f"{'medición':<32}{'µs/llamada':>14}")
+    for name, value in results.items():
+        print(f"{name:<32}{value:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
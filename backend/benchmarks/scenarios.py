@@ -0,0 +1,142 @@
+# Archivo: benchmarks/scenarios.py
+# Descripción: Escenarios de uso para la prueba de carga (benchmarks/load.py)
+# Funcionalidad: Usuario virtual con cliente HTTP propio y acciones típicas del frontend
+#
+# Cada escenario es una iteración de un usuario (una acción en la interfaz)
+# y puede hacer varios requests; cada request se registra con su propio
+# nombre ("dashboard.stats", "search.documentos", ...). Los datos que usan
+# (usuarios, ids, vocabulario de búsqueda) son los de benchmarks/datagen.py.
+
+import asyncio
+import random
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.datagen import APELLIDOS, DEFAULT_PASSWORD, DOCUMENTOS
+
+
+class Recorder:
+    """Latencias y errores por nombre de request (solo durante la ventana de medición)"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.iterations: Dict[str, int] = defaultdict(int)
+        self.recording = False
+
+    def add(self, name: str, elapsed: float, status: Optional[int]) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(elapsed)
+        self.statuses[name][status or 0] += 1
+        if status is None or status >= 400:
+            self.errors[name] += 1
+
+
+class VirtualUser:
+    """Un usuario del frontend: token propio, ETags recordados y generador aleatorio propio"""
+
+    def __init__(self, index: int, client: httpx.AsyncClient, recorder: Recorder, dataset: Dict[str, int], seed: int):
+        self.index = index
+        self.client = client
+        self.recorder = recorder
+        self.dataset = dataset
+        self.rng = random.Random(seed * 1000 + index)
+        self.email = f"usuario{index % dataset['usuarios']}@bench.justtime"
+        self.token: Optional[str] = None
+        self.etags: Dict[str, str] = {}
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.add(name, time.perf_counter() - started, None)
+            return None
+        self.recorder.add(name, time.perf_counter() - started, response.status_code)
+        return response
+
+    async def login(self, name: str = "auth.login") -> None:
+        response = await self.request(
+            name, "POST", "/api/auth/login", json={"email": self.email, "password": DEFAULT_PASSWORD}
+        )
+        if response is not None and response.status_code == 200:
+            self.token = response.json()["data"]["access_token"]
+
+    def proyecto_id(self) -> int:
+        return self.rng.randint(1, self.dataset["proyectos"])
+
+
+async def login_storm(user: VirtualUser) -> None:
+    """Inicio de jornada: todos los usuarios inician sesión a la vez (bcrypt en el threadpool)"""
+    await user.login()
+
+
+async def dashboard(user: VirtualUser) -> None:
+    """Carga del dashboard: el frontend pide sus paneles en paralelo"""
+    await asyncio.gather(
+        user.request("dashboard.stats", "GET", "/api/projects/dashboard/stats"),
+        user.request("dashboard.resumen", "GET", "/api/analytics/resumen-completo"),
+        user.request("dashboard.pendientes", "GET", "/api/pending-activities/pendientes"),
+        user.request("dashboard.proyectos", "GET", "/api/projects/", params={"estado": "activo", "limit": 20}),
+    )
+
+
+async def kanban_polling(user: VirtualUser) -> None:
+    """Tablero abierto: refresco periódico con If-None-Match (304 si nada cambió)"""
+    headers = {"If-None-Match": user.etags["kanban"]} if "kanban" in user.etags else {}
+    response = await user.request("kanban.poll", "GET", "/api/tasks/kanban", headers=headers)
+    if response is not None and response.headers.get("etag"):
+        user.etags["kanban"] = response.headers["etag"]
+
+
+async def bulk_upload(user: VirtualUser) -> None:
+    """Digitalización de un expediente: varios archivos seguidos al mismo caso"""
+    proyecto_id = user.proyecto_id()
+    for _ in range(user.rng.randint(3, 8)):
+        # Escaneos: mayoría de unos cientos de KB, algunos de varios MB
+        size = min(int(user.rng.lognormvariate(12.2, 0.8)), 8 * 1024 * 1024)
+        content = b"%PDF-1.4\n" + user.rng.randbytes(size)
+        nombre = f"{user.rng.choice(DOCUMENTOS)} escaneo {proyecto_id}.pdf"
+        await user.request(
+            "upload.documento", "POST", "/api/documentos/upload",
+            files={"file": (nombre, content, "application/pdf")},
+            data={"proyecto_id": str(proyecto_id)}
+        )
+
+
+async def search_as_you_type(user: VirtualUser, typing_delay: float = 0.08) -> None:
+    """Búsqueda de documentos mientras se escribe: un request por tecla"""
+    term = user.rng.choice(DOCUMENTOS + [apellido.lower() for apellido in APELLIDOS])
+    for end in range(1, len(term) + 1):
+        await user.request("search.documentos", "GET", "/api/documentos/search", params={"q": term[:end]})
+        await asyncio.sleep(typing_delay)
+
+
+Scenario = Callable[[VirtualUser], Awaitable[None]]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login_storm": login_storm,
+    "dashboard": dashboard,
+    "kanban_polling": kanban_polling,
+    "bulk_upload": bulk_upload,
+    "search_as_you_type": search_as_you_type,
+}
+
+# Mezcla por defecto: proporción aproximada de acciones en un día normal
+DEFAULT_MIX: Dict[str, float] = {
+    "dashboard": 4,
+    "kanban_polling": 4,
+    "search_as_you_type": 2,
+    "bulk_upload": 1,
+    "login_storm": 1,
+}
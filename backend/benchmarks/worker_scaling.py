@@ -0,0 +1,178 @@
+# Archivo: benchmarks/worker_scaling.py
+# Descripción: Benchmark de throughput del servidor de producción según cantidad de workers
+# Funcionalidad: Levanta gunicorn (gunicorn_conf.py) con 1..N workers y mide requests/s y latencias
+#
+# Uso (desde backend/):
+#     python -m benchmarks.worker_scaling --max-workers 4 --duration 10 --concurrency 64
+#
+# Usa una base SQLite temporal con proyectos sembrados. La carga se genera
+# en procesos aparte (--load-procs) para que el cliente no sea el cuello
+# de botella; en una máquina con pocos núcleos cliente y servidor compiten
+# por la misma CPU y la escala observada es menor a la real.
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+
+def seed_database(url: str, proyectos: int) -> None:
+    """Crear el esquema y sembrar proyectos en un proceso aparte (mismo código que el servidor)"""
+    code = (
+        "from app.database import SessionLocal\n"
+        "from app.migrate import upgrade_database\n"
+        "from app.models import Proyecto\n"
+        "assert upgrade_database()\n"
+        "db = SessionLocal()\n"
+        f"db.add_all([Proyecto(nombre=f'Caso {{i}}', estado='activo') for i in range({proyectos})])\n"
+        "db.commit()\n"
+        "db.close()\n"
+    )
+    subprocess.run([sys.executable, "-c", code], env={**os.environ, "DATABASE_URL": url}, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("El servidor no respondió a tiempo")
+
+
+async def _load(base_url: str, paths: List[str], concurrency: int, duration: float) -> Tuple[int, int, List[float]]:
+    """Clientes concurrentes con keep-alive durante `duration` segundos"""
+    ok = errors = 0
+    latencies: List[float] = []
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=10.0) as client:
+        async def user(index: int) -> None:
+            nonlocal ok, errors
+            i = index
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(paths[i % len(paths)])
+                    if response.status_code < 400:
+                        ok += 1
+                    else:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+                i += 1
+
+        await asyncio.gather(*(user(i) for i in range(concurrency)))
+    return ok, errors, latencies
+
+
+def _load_process(args) -> Tuple[int, int, List[float]]:
+    return asyncio.run(_load(*args))
+
+
+def run_level(workers: int, options, database_url: str) -> Dict[str, float]:
+    """Levantar gunicorn con `workers` procesos, cargarlo y apagarlo con SIGTERM"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "WEB_CONCURRENCY": str(workers),
+        "PORT": str(options.port),
+        "SCHEDULER_ENABLED": "false",
+        "CACHE_BACKEND": "none",
+        "SERVER_MAX_REQUESTS": "0",
+        "DB_MIGRATE_ON_START": "false",
+        "RATE_LIMIT_ENABLED": "false",  # se mide el servidor, no el límite de tasa
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "app.main:app", "-c", "gunicorn_conf.py",
+         "--access-logfile", "/dev/null", "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base_url = f"http://127.0.0.1:{options.port}"
+    try:
+        wait_until_ready(base_url)
+        # Calentar todos los workers (imports perezosos, pools, cache de SQL compilado)
+        asyncio.run(_load(base_url, options.path, options.concurrency, 1.0))
+
+        per_proc = max(1, options.concurrency // options.load_procs)
+        jobs = [(base_url, options.path, per_proc, options.duration)] * options.load_procs
+        with multiprocessing.Pool(options.load_procs) as pool:
+            results = pool.map(_load_process, jobs)
+    finally:
+        started = time.monotonic()
+        server.terminate()  # SIGTERM: drenado ordenado
+        server.wait(timeout=60)
+        drain = time.monotonic() - started
+
+    ok = sum(r[0] for r in results)
+    errors = sum(r[1] for r in results)
+    latencies = sorted(lat for r in results for lat in r[2])
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "workers": workers,
+        "rps": ok / options.duration,
+        "errors": errors,
+        "p50": pct(0.50),
+        "p99": pct(0.99),
+        "drain": drain
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main() -> None:
+    from app.server import cpu_count
+
+    parser = argparse.ArgumentParser(description="Throughput de gunicorn + uvicorn con 1..N workers")
+    parser.add_argument("--max-workers", type=int, default=cpu_count(), help="Mayor cantidad de workers a medir")
+    parser.add_argument("--duration", type=float, default=10.0, help="Segundos de carga por nivel")
+    parser.add_argument("--concurrency", type=int, default=64, help="Clientes concurrentes en total")
+    parser.add_argument("--load-procs", type=int, default=max(1, cpu_count() // 2), help="Procesos generadores de carga")
+    parser.add_argument("--path", action="append", help="Ruta a consultar (repetible); por defecto /health y /api/projects/")
+    parser.add_argument("--proyectos", type=int, default=100, help="Proyectos sembrados en la base temporal")
+    parser.add_argument("--port", type=int, default=0, help="Puerto del servidor (0 = libre)")
+    options = parser.parse_args()
+    options.path = options.path or ["/health", "/api/projects/"]
+    options.port = options.port or _free_port()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        seed_database(database_url, options.proyectos)
+
+        levels = sorted({1, *[w for w in (2, 4, 8, 16, 32) if w < options.max_workers], options.max_workers})
+        print(f"Rutas: {', '.join(options.path)} | concurrencia {options.concurrency} | {options.duration:.0f}s por nivel")
+        print(f"{'workers':>8} {'req/s':>10} {'escala':>8} {'p50 ms':>8} {'p99 ms':>8} {'errores':>8} {'drenado s':>10}")
+
+        baseline = None
+        for workers in levels:
+            result = run_level(workers, options, database_url)
+            baseline = baseline or result["rps"] or 1.0
+            print(
+                f"{result['workers']:>8} {result['rps']:>10.0f} {result['rps'] / baseline:>7.2f}x "
+                f"{result['p50']:>8.1f} {result['p99']:>8.1f} {result['errors']:>8} {result['drain']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
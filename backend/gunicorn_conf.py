@@ -0,0 +1,58 @@
+# Archivo: gunicorn_conf.py
+# Descripción: Configuración de gunicorn para producción
+# Funcionalidad: Workers uvicorn según CPUs, keep-alive, reciclado con jitter y drenado en SIGTERM
+#
+# Uso (desde backend/):
+#     gunicorn app.main:app -c gunicorn_conf.py
+# Variables: PORT, WEB_CONCURRENCY (o SERVER_MAX_WORKERS), SERVER_KEEPALIVE,
+# SERVER_MAX_REQUESTS, SERVER_MAX_REQUESTS_JITTER, SERVER_GRACEFUL_TIMEOUT, DB_MIGRATE_ON_START,
+# FORWARDED_ALLOW_IPS, METRICS_MULTIPROC_DIR, LOG_LEVEL, LOG_FORMAT
+
+import os
+
+from app.config import SERVER_CONFIG
+from app.server import configure_metrics_dir, mark_worker_dead, migrate_on_start, reset_after_fork, worker_count
+
+
+bind = f"{SERVER_CONFIG['host']}:{SERVER_CONFIG['port']}"
+workers = worker_count()
+worker_class = "app.uvicorn_worker.JustTimeUvicornWorker"
+backlog = SERVER_CONFIG["backlog"]
+
+keepalive = SERVER_CONFIG["keepalive"]
+max_requests = SERVER_CONFIG["max_requests"]
+max_requests_jitter = SERVER_CONFIG["max_requests_jitter"]
+graceful_timeout = SERVER_CONFIG["graceful_timeout"]
+timeout = SERVER_CONFIG["timeout"]
+
+# La app NO se importa en el master: cada worker crea engines, cache y
+# broker después del fork
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
+# Solo el proxy puede fijar la IP del cliente (X-Forwarded-For): de ella dependen los límites por IP
+forwarded_allow_ips = SERVER_CONFIG["forwarded_allow_ips"]
+
+# ETags, scheduler y cache en memoria consultan WEB_CONCURRENCY para saber
+# si hay más de un proceso
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# /metrics agrega los archivos de todos los workers (prometheus_client multiproceso)
+configure_metrics_dir()
+
+
+def on_starting(server):
+    # Logs JSON también en el master; cada worker relanza el hilo de la cola tras el fork
+    from app.observability.logs import configure_logging
+    configure_logging()
+    migrate_on_start()
+
+
+def child_exit(server, worker):
+    mark_worker_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # Con preload_app=True el master pudo abrir conexiones: no compartirlas
+    reset_after_fork()
@@ -0,0 +1,53 @@
+# Archivo: migrations/env.py
+# Descripción: Entorno de ejecución de Alembic
+# Funcionalidad: Usa el engine de la aplicación y los metadatos de los modelos ORM
+
+from alembic import context
+
+from app.database import Base, get_engine
+import app.models  # noqa: F401 - registra todos los modelos en Base.metadata
+
+
+config = context.config
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Generar el SQL sin conectarse (alembic upgrade --sql)"""
+    context.configure(
+        url=str(get_engine().url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    # app.migrate pasa su conexión para que la migración y la adopción de
+    # bases antiguas ocurran en la misma transacción
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+    with get_engine().connect() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite no soporta ALTER completos: las migraciones usan batch
+        render_as_batch=connection.dialect.name == "sqlite",
+        compare_type=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,241 @@
+"""esquema inicial
+
+Esquema equivalente al que generaba Base.metadata.create_all al iniciar la
+aplicación. Las bases creadas así se adoptan con app.migrate (stamp).
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 16:39:46.385951
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('categorias_proyecto',
+    sa.Column('id_categoria_proyecto', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('color', sa.String(length=7), nullable=True),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id_categoria_proyecto', name=op.f('pk_categorias_proyecto')),
+    sa.UniqueConstraint('nombre', name=op.f('uq_categorias_proyecto_nombre'))
+    )
+    op.create_table('contactos',
+    sa.Column('id_contacto', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=200), nullable=False),
+    sa.Column('telefono', sa.String(length=20), nullable=True),
+    sa.Column('email', sa.String(length=100), nullable=True),
+    sa.Column('tipo', sa.String(length=20), nullable=True),
+    sa.Column('direccion', sa.Text(), nullable=True),
+    sa.Column('activo', sa.Boolean(), nullable=True),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.CheckConstraint("tipo IN ('persona', 'empresa')", name=op.f('ck_contactos_ck_contactos_tipo')),
+    sa.PrimaryKeyConstraint('id_contacto', name=op.f('pk_contactos'))
+    )
+    op.create_index(op.f('ix_contactos_version'), 'contactos', ['version'], unique=False)
+    op.create_table('empleados',
+    sa.Column('id_empleado', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=150), nullable=False),
+    sa.Column('telefono', sa.String(length=20), nullable=True),
+    sa.Column('puesto', sa.String(length=100), nullable=True),
+    sa.Column('activo', sa.Boolean(), nullable=True),
+    sa.Column('fecha_ingreso', sa.Date(), nullable=True),
+    sa.PrimaryKeyConstraint('id_empleado', name=op.f('pk_empleados'))
+    )
+    op.create_table('jobs',
+    sa.Column('id_trabajo', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tipo', sa.String(length=100), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('estado', sa.String(length=20), nullable=False),
+    sa.Column('intentos', sa.Integer(), nullable=False),
+    sa.Column('max_intentos', sa.Integer(), nullable=False),
+    sa.Column('ejecutar_despues', sa.DateTime(), nullable=False),
+    sa.Column('clave_idempotencia', sa.String(length=200), nullable=True),
+    sa.Column('resultado', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('bloqueado_por', sa.String(length=100), nullable=True),
+    sa.Column('bloqueado_hasta', sa.DateTime(), nullable=True),
+    sa.Column('fecha_creacion', sa.DateTime(), nullable=False),
+    sa.Column('fecha_actualizacion', sa.DateTime(), nullable=False),
+    sa.CheckConstraint("estado IN ('pendiente', 'en_proceso', 'completado', 'fallido')", name=op.f('ck_jobs_ck_jobs_estado')),
+    sa.PrimaryKeyConstraint('id_trabajo', name=op.f('pk_jobs')),
+    sa.UniqueConstraint('clave_idempotencia', name=op.f('uq_jobs_clave_idempotencia'))
+    )
+    op.create_index('ix_jobs_estado_ejecutar_despues', 'jobs', ['estado', 'ejecutar_despues'], unique=False)
+    op.create_table('plantillas',
+    sa.Column('id_plantilla', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=200), nullable=False, comment='Nombre descriptivo de la plantilla'),
+    sa.Column('nombre_archivo', sa.String(length=255), nullable=False, comment='Nombre original del archivo .docx'),
+    sa.Column('ruta_archivo', sa.Text(), nullable=False, comment='Ruta en sistema de archivos'),
+    sa.Column('categoria', sa.String(length=50), nullable=True, comment='Categoría: contrato, demanda, escritura, etc.'),
+    sa.Column('descripcion', sa.Text(), nullable=True, comment='Descripción opcional de la plantilla'),
+    sa.Column('fecha_subida', sa.DateTime(), nullable=True, comment='Fecha de subida'),
+    sa.Column('activo', sa.Integer(), nullable=True, comment='1=activo, 0=eliminado (soft delete)'),
+    sa.PrimaryKeyConstraint('id_plantilla', name=op.f('pk_plantillas'))
+    )
+    op.create_table('sync_contador',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('purgado_hasta', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_sync_contador'))
+    )
+    # Contador global de versiones (delta sync): una sola fila
+    op.bulk_insert(
+        sa.table('sync_contador', sa.column('id'), sa.column('version'), sa.column('purgado_hasta')),
+        [{'id': 1, 'version': 0, 'purgado_hasta': 0}]
+    )
+    op.create_table('sync_eliminados',
+    sa.Column('id_registro_eliminado', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('tabla', sa.String(length=50), nullable=False),
+    sa.Column('registro_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('fecha_eliminacion', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id_registro_eliminado', name=op.f('pk_sync_eliminados'))
+    )
+    op.create_index(op.f('ix_sync_eliminados_fecha_eliminacion'), 'sync_eliminados', ['fecha_eliminacion'], unique=False)
+    op.create_index(op.f('ix_sync_eliminados_version'), 'sync_eliminados', ['version'], unique=False)
+    op.create_table('proyectos',
+    sa.Column('id_proyecto', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=200), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('fecha_inicio', sa.Date(), nullable=True),
+    sa.Column('fecha_fin', sa.Date(), nullable=True),
+    sa.Column('estado', sa.String(length=20), nullable=True),
+    sa.Column('contacto_id_fk', sa.Integer(), nullable=True),
+    sa.Column('categoria_id_fk', sa.Integer(), nullable=True),
+    sa.Column('prioridad', sa.String(length=10), nullable=True),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.CheckConstraint("estado IN ('activo', 'pausado', 'finalizado')", name=op.f('ck_proyectos_ck_proyectos_estado')),
+    sa.CheckConstraint("prioridad IN ('baja', 'media', 'alta')", name=op.f('ck_proyectos_ck_proyectos_prioridad')),
+    sa.ForeignKeyConstraint(['categoria_id_fk'], ['categorias_proyecto.id_categoria_proyecto'], name=op.f('fk_proyectos_categoria_id_fk_categorias_proyecto')),
+    sa.ForeignKeyConstraint(['contacto_id_fk'], ['contactos.id_contacto'], name=op.f('fk_proyectos_contacto_id_fk_contactos')),
+    sa.PrimaryKeyConstraint('id_proyecto', name=op.f('pk_proyectos'))
+    )
+    op.create_index(op.f('ix_proyectos_version'), 'proyectos', ['version'], unique=False)
+    op.create_table('usuarios',
+    sa.Column('id_usuario', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre', sa.String(length=100), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('password', sa.String(length=255), nullable=False),
+    sa.Column('activo', sa.Boolean(), nullable=True),
+    sa.Column('empleado_id_fk', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['empleado_id_fk'], ['empleados.id_empleado'], name=op.f('fk_usuarios_empleado_id_fk_empleados')),
+    sa.PrimaryKeyConstraint('id_usuario', name=op.f('pk_usuarios')),
+    sa.UniqueConstraint('email', name=op.f('uq_usuarios_email')),
+    sa.UniqueConstraint('empleado_id_fk', name=op.f('uq_usuarios_empleado_id_fk'))
+    )
+    op.create_table('actividades_pendientes',
+    sa.Column('id_actividad_pendiente', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=False),
+    sa.Column('fecha_vencimiento', sa.DateTime(), nullable=True),
+    sa.Column('completada', sa.Boolean(), nullable=True),
+    sa.Column('usuario_id_fk', sa.Integer(), nullable=False),
+    sa.Column('proyecto_id_fk', sa.Integer(), nullable=True),
+    sa.Column('prioridad', sa.String(length=10), nullable=True),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.CheckConstraint("prioridad IN ('baja', 'media', 'alta')", name=op.f('ck_actividades_pendientes_ck_actividades_prioridad')),
+    sa.ForeignKeyConstraint(['proyecto_id_fk'], ['proyectos.id_proyecto'], name=op.f('fk_actividades_pendientes_proyecto_id_fk_proyectos')),
+    sa.ForeignKeyConstraint(['usuario_id_fk'], ['usuarios.id_usuario'], name=op.f('fk_actividades_pendientes_usuario_id_fk_usuarios')),
+    sa.PrimaryKeyConstraint('id_actividad_pendiente', name=op.f('pk_actividades_pendientes'))
+    )
+    op.create_index(op.f('ix_actividades_pendientes_version'), 'actividades_pendientes', ['version'], unique=False)
+    op.create_table('configuraciones',
+    sa.Column('id_configuracion', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('usuario_id_fk', sa.Integer(), nullable=False),
+    sa.Column('idioma', sa.String(length=10), nullable=True),
+    sa.Column('rol', sa.String(length=20), nullable=True),
+    sa.Column('tema', sa.String(length=10), nullable=True),
+    sa.CheckConstraint("idioma IN ('es', 'en')", name=op.f('ck_configuraciones_ck_configuraciones_idioma')),
+    sa.CheckConstraint("rol IN ('admin', 'usuario')", name=op.f('ck_configuraciones_ck_configuraciones_rol')),
+    sa.CheckConstraint("tema IN ('claro', 'oscuro')", name=op.f('ck_configuraciones_ck_configuraciones_tema')),
+    sa.ForeignKeyConstraint(['usuario_id_fk'], ['usuarios.id_usuario'], name=op.f('fk_configuraciones_usuario_id_fk_usuarios')),
+    sa.PrimaryKeyConstraint('id_configuracion', name=op.f('pk_configuraciones')),
+    sa.UniqueConstraint('usuario_id_fk', name=op.f('uq_configuraciones_usuario_id_fk'))
+    )
+    op.create_table('documentos',
+    sa.Column('id_documento', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('nombre_archivo', sa.String(length=255), nullable=False),
+    sa.Column('ruta_archivo', sa.Text(), nullable=False),
+    sa.Column('tipo_archivo', sa.String(length=50), nullable=True),
+    sa.Column('proyecto_id_fk', sa.Integer(), nullable=True),
+    sa.Column('subido_por_fk', sa.Integer(), nullable=True),
+    sa.Column('fecha_subida', sa.DateTime(), nullable=True),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['proyecto_id_fk'], ['proyectos.id_proyecto'], name=op.f('fk_documentos_proyecto_id_fk_proyectos')),
+    sa.ForeignKeyConstraint(['subido_por_fk'], ['usuarios.id_usuario'], name=op.f('fk_documentos_subido_por_fk_usuarios')),
+    sa.PrimaryKeyConstraint('id_documento', name=op.f('pk_documentos'))
+    )
+    op.create_index(op.f('ix_documentos_version'), 'documentos', ['version'], unique=False)
+    op.create_table('empleado_proyecto',
+    sa.Column('id_empleado_proyecto', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('empleado_id_fk', sa.Integer(), nullable=False),
+    sa.Column('proyecto_id_fk', sa.Integer(), nullable=False),
+    sa.Column('fecha_asignacion', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['empleado_id_fk'], ['empleados.id_empleado'], name=op.f('fk_empleado_proyecto_empleado_id_fk_empleados')),
+    sa.ForeignKeyConstraint(['proyecto_id_fk'], ['proyectos.id_proyecto'], name=op.f('fk_empleado_proyecto_proyecto_id_fk_proyectos')),
+    sa.PrimaryKeyConstraint('id_empleado_proyecto', name=op.f('pk_empleado_proyecto')),
+    sa.UniqueConstraint('empleado_id_fk', 'proyecto_id_fk', name='uq_empleado_proyecto')
+    )
+    op.create_table('tareas',
+    sa.Column('id_tarea', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('titulo', sa.String(length=200), nullable=False),
+    sa.Column('descripcion', sa.Text(), nullable=True),
+    sa.Column('estado', sa.String(length=20), nullable=True),
+    sa.Column('fecha_vencimiento', sa.Date(), nullable=True),
+    sa.Column('proyecto_id_fk', sa.Integer(), nullable=True),
+    sa.Column('prioridad', sa.String(length=10), nullable=True),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.CheckConstraint("estado IN ('nuevo', 'en_progreso', 'finalizado')", name=op.f('ck_tareas_ck_tareas_estado')),
+    sa.CheckConstraint("prioridad IN ('baja', 'media', 'alta')", name=op.f('ck_tareas_ck_tareas_prioridad')),
+    sa.ForeignKeyConstraint(['proyecto_id_fk'], ['proyectos.id_proyecto'], name=op.f('fk_tareas_proyecto_id_fk_proyectos')),
+    sa.PrimaryKeyConstraint('id_tarea', name=op.f('pk_tareas'))
+    )
+    op.create_index(op.f('ix_tareas_version'), 'tareas', ['version'], unique=False)
+    op.create_table('empleado_tarea',
+    sa.Column('id_empleado_tarea', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('empleado_id_fk', sa.Integer(), nullable=False),
+    sa.Column('tarea_id_fk', sa.Integer(), nullable=False),
+    sa.Column('rol_en_tarea', sa.String(length=50), nullable=True),
+    sa.Column('fecha_asignacion', sa.DateTime(), nullable=True),
+    sa.Column('estado_personal', sa.String(length=20), nullable=True),
+    sa.ForeignKeyConstraint(['empleado_id_fk'], ['empleados.id_empleado'], name=op.f('fk_empleado_tarea_empleado_id_fk_empleados')),
+    sa.ForeignKeyConstraint(['tarea_id_fk'], ['tareas.id_tarea'], name=op.f('fk_empleado_tarea_tarea_id_fk_tareas')),
+    sa.PrimaryKeyConstraint('id_empleado_tarea', name=op.f('pk_empleado_tarea')),
+    sa.UniqueConstraint('empleado_id_fk', 'tarea_id_fk', name='uq_empleado_tarea')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('empleado_tarea')
+    op.drop_index(op.f('ix_tareas_version'), table_name='tareas')
+    op.drop_table('tareas')
+    op.drop_table('empleado_proyecto')
+    op.drop_index(op.f('ix_documentos_version'), table_name='documentos')
+    op.drop_table('documentos')
+    op.drop_table('configuraciones')
+    op.drop_index(op.f('ix_actividades_pendientes_version'), table_name='actividades_pendientes')
+    op.drop_table('actividades_pendientes')
+    op.drop_table('usuarios')
+    op.drop_index(op.f('ix_proyectos_version'), table_name='proyectos')
+    op.drop_table('proyectos')
+    op.drop_index(op.f('ix_sync_eliminados_version'), table_name='sync_eliminados')
+    op.drop_index(op.f('ix_sync_eliminados_fecha_eliminacion'), table_name='sync_eliminados')
+    op.drop_table('sync_eliminados')
+    op.drop_table('sync_contador')
+    op.drop_table('plantillas')
+    op.drop_index('ix_jobs_estado_ejecutar_despues', table_name='jobs')
+    op.drop_table('jobs')
+    op.drop_table('empleados')
+    op.drop_index(op.f('ix_contactos_version'), table_name='contactos')
+    op.drop_table('contactos')
+    op.drop_table('categorias_proyecto')
@@ -0,0 +1,106 @@
+# Archivo: tests/conftest.py
+# Descripción: Fixtures compartidos de la suite de pytest
+# Funcionalidad: Base temporal migrada y poblada con benchmarks/datagen.py, cliente HTTP y conteo de sentencias SQL
+#
+# Uso (desde backend/):
+#     python -m pytest                                   (SQLite temporal)
+#     TEST_DATABASE_URL=postgresql://.../justtime_test python -m pytest
+#
+# La base de PostgreSQL debe existir y estar vacía: se migra y se puebla
+# al iniciar la sesión.
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+import pytest
+
+# Antes de importar app: la configuración se lee al cargarse el módulo
+_TMP = tempfile.TemporaryDirectory(prefix="justtime-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{_TMP.name}/test.db"
+os.environ["UPLOAD_DIRECTORY"] = os.path.join(_TMP.name, "uploads")
+os.environ["PROFILING_DIR"] = os.path.join(_TMP.name, "profiles")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["CACHE_BACKEND"] = "none"     # medir siempre el camino sin cache
+os.environ["METRICS_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"  # tests/test_rate_limit.py lo habilita con buckets propios
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.database import get_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.migrate import upgrade_database  # noqa: E402
+from benchmarks.datagen import DEFAULT_PASSWORD, generate  # noqa: E402
+
+
+# Escala de datos: suficiente para que un N+1 supere cualquier presupuesto
+SEED_PROYECTOS = 60
+SEED_USUARIOS = 5
+
+
+class QueryCounter:
+    """Sentencias ejecutadas dentro de un bloque `with counter:` (de cualquier hilo)"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self._active = False
+
+    def _listener(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._active:
+            self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def __enter__(self) -> "QueryCounter":
+        self.statements = []
+        self._active = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._active = False
+
+    def report(self) -> str:
+        return "\n".join(f"  {i + 1:>3}. {' '.join(s.split())[:200]}" for i, s in enumerate(self.statements))
+
+
+@pytest.fixture(scope="session")
+def seeded_database() -> Dict[str, int]:
+    assert upgrade_database(), "No se pudo migrar la base de pruebas"
+    with get_engine().begin() as connection:
+        return generate(connection, proyectos=SEED_PROYECTOS, usuarios=SEED_USUARIOS, seed=7)
+
+
+@pytest.fixture(scope="session")
+def client(seeded_database) -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client) -> Dict[str, str]:
+    response = client.post("/api/auth/login", json={"email": "usuario0@bench.justtime", "password": DEFAULT_PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+@pytest.fixture(scope="session")
+def query_counter(seeded_database) -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", counter._listener)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter._listener)
+
+
+@pytest.fixture
+def count_queries(query_counter):
+    """`with count_queries() as counter:` cuenta las sentencias de los requests del bloque"""
+    @contextmanager
+    def _count() -> Iterator[QueryCounter]:
+        with query_counter:
+            yield query_counter
+    return _count
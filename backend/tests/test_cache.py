@@ -0,0 +1,246 @@
+# Archivo: tests/test_cache.py
+# Descripción: Pruebas del cache de aplicación
+# Funcionalidad: Backends memoria y Redis con los mismos tipos, TTL, tags, single-flight y lock distribuido
+
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app.cache import Cache, MemoryBackend, NullBackend, RedisBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _redis_backend():
+    fakeredis = pytest.importorskip("fakeredis")
+    return RedisBackend(client=fakeredis.aioredis.FakeRedis())
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_backend(request):
+    if request.param == "memory":
+        return MemoryBackend
+    pytest.importorskip("fakeredis")
+    return _redis_backend
+
+
+VALUE = {
+    "fecha": date(2024, 5, 1),
+    "creado": datetime(2024, 5, 1, 9, 30),
+    "monto": Decimal("12.50"),
+    "total": Decimal("3"),
+    "ids": (1, 2),
+    "anidado": [{"ok": True, "nada": None}],
+}
+
+EXPECTED = {
+    "fecha": "2024-05-01",
+    "creado": "2024-05-01T09:30:00",
+    "monto": 12.5,
+    "total": 3,
+    "ids": [1, 2],
+    "anidado": [{"ok": True, "nada": None}],
+}
+
+
+def test_backends_return_the_same_json_types(make_backend):
+    async def scenario():
+        cache = Cache(make_backend(), namespace="t")
+        await cache.set("k", VALUE, ttl=60)
+        first = await cache.get("k")
+        first["anidado"].append("mutado")
+        return first, await cache.get("k")
+
+    first, second = asyncio.run(scenario())
+    assert second == EXPECTED
+    # Lo que devuelve get() es una copia: modificarla no altera la entrada
+    assert first is not second and "mutado" not in second["anidado"]
+
+
+def test_get_or_set_returns_the_same_on_miss_and_hit(make_backend):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return VALUE
+
+    async def scenario():
+        cache = Cache(make_backend(), namespace="t")
+        return await cache.get_or_set("k", loader, ttl=60), await cache.get_or_set("k", loader, ttl=60)
+
+    miss, hit = asyncio.run(scenario())
+    assert miss == hit == EXPECTED
+    assert len(calls) == 1
+
+
+def test_invalidate_tags_removes_only_tagged_keys(make_backend):
+    async def scenario():
+        cache = Cache(make_backend(), namespace="t")
+        await cache.set("proyectos", 1, ttl=60, tags=["proyectos"])
+        await cache.set("resumen", 2, ttl=60, tags=["proyectos", "tareas"])
+        await cache.set("plantillas", 3, ttl=60, tags=["plantillas"])
+        removed = await cache.invalidate_tags("proyectos")
+        return removed, [await cache.get(key) for key in ("proyectos", "resumen", "plantillas")]
+
+    removed, values = asyncio.run(scenario())
+    assert removed == 2
+    assert values == [None, None, 3]
+
+
+def test_add_only_sets_missing_keys(make_backend):
+    async def scenario():
+        cache = Cache(make_backend(), namespace="t")
+        return await cache.add("k", "a", ttl=60), await cache.add("k", "b", ttl=60), await cache.get("k")
+
+    assert asyncio.run(scenario()) == (True, False, "a")
+
+
+def test_memory_entries_expire_and_evict_lru():
+    clock = FakeClock()
+    backend = MemoryBackend(max_entries=2, clock=clock)
+
+    async def scenario():
+        cache = Cache(backend, namespace="t")
+        await cache.set("a", 1, ttl=10)
+        clock.now += 11
+        expired = await cache.get("a")
+
+        await cache.set("a", 1, ttl=60)
+        await cache.set("b", 2, ttl=60)
+        await cache.get("a")  # "b" queda como la menos usada
+        await cache.set("c", 3, ttl=60)
+        return expired, [await cache.get(key) for key in ("a", "b", "c")]
+
+    expired, values = asyncio.run(scenario())
+    assert expired is None
+    assert values == [1, None, 3]
+
+
+def test_concurrent_get_or_set_runs_the_loader_once():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"valor": 42}
+
+    async def scenario():
+        cache = Cache(MemoryBackend(), namespace="t")
+        return await asyncio.gather(*(cache.get_or_set("k", loader, ttl=60) for _ in range(10)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert results == [{"valor": 42}] * 10
+
+
+def test_loader_error_reaches_every_waiter_and_is_not_cached():
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("falló la consulta")
+
+    async def scenario():
+        cache = Cache(MemoryBackend(), namespace="t")
+        results = await asyncio.gather(*(cache.get_or_set("k", failing) for _ in range(3)), return_exceptions=True)
+        return results, await cache.get("k")
+
+    results, cached = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cached is None
+
+
+def test_waiters_take_over_the_load_when_the_owner_is_cancelled():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"valor": len(calls)}
+
+    async def scenario():
+        cache = Cache(MemoryBackend(), namespace="t")
+        owner = asyncio.create_task(cache.get_or_set("k", loader, ttl=60))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(cache.get_or_set("k", loader, ttl=60)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        owner.cancel()  # el cliente del primer request se desconectó
+        results = await asyncio.gather(*waiters)
+        return owner.cancelled(), results
+
+    owner_cancelled, results = asyncio.run(scenario())
+    assert owner_cancelled
+    # Un solo waiter retomó la carga; los demás esperaron su resultado
+    assert results == [{"valor": 2}] * 3
+    assert len(calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_load():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"valor": 42}
+
+    async def scenario():
+        cache = Cache(MemoryBackend(), namespace="t")
+        owner = asyncio.create_task(cache.get_or_set("k", loader, ttl=60))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.get_or_set("k", loader, ttl=60))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        return waiter.cancelled(), await owner
+
+    assert asyncio.run(scenario()) == (True, {"valor": 42})
+    assert len(calls) == 1
+
+
+def test_shared_backend_lock_runs_the_loader_once_across_workers():
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"valor": 42}
+
+    async def scenario():
+        # Dos workers: instancias de Cache distintas sobre el mismo Redis
+        workers = [
+            Cache(RedisBackend(client=fakeredis.aioredis.FakeRedis(server=server)), namespace="t", poll_interval=0.01)
+            for _ in range(2)
+        ]
+        results = await asyncio.gather(*(worker.get_or_set("k", loader, ttl=60) for worker in workers))
+        lock_left = await workers[0].get("lock:k")
+        return results, lock_left
+
+    results, lock_left = asyncio.run(scenario())
+    assert results == [{"valor": 42}, {"valor": 42}]
+    assert len(calls) == 1
+    assert lock_left is None
+
+
+def test_disabled_cache_always_calls_the_loader():
+    calls = []
+
+    async def scenario():
+        cache = Cache(NullBackend(), namespace="t")
+        for _ in range(2):
+            await cache.get_or_set("k", lambda: calls.append(1) or "v")
+        return cache.enabled
+
+    assert asyncio.run(scenario()) is False
+    assert len(calls) == 2
@@ -0,0 +1,102 @@
+# Archivo: tests/test_compression.py
+# Descripción: Pruebas de la compresión de respuestas
+# Funcionalidad: Negociación por Accept-Encoding, umbral mínimo, tipos excluidos y streaming con gzip / brotli / zstd
+
+import asyncio
+import gzip
+from typing import Dict, List
+
+import pytest
+
+from app.config import COMPRESSION_CONFIG
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+
+BODY = b'{"data": [' + b", ".join(b'{"id": %d, "nombre": "Proyecto de prueba"}' % i for i in range(200)) + b"]}"
+
+
+def _config(**overrides) -> Dict:
+    return {**COMPRESSION_CONFIG, "enabled": True, "minimum_size": 500, **overrides}
+
+
+def _app(body: bytes, content_type: bytes = b"application/json", chunks: int = 1):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type)]
+        if chunks == 1:
+            headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        size = len(body) // chunks + 1
+        for start in range(0, len(body), size):
+            more_body = start + size < len(body)
+            await send({"type": "http.response.body", "body": body[start:start + size], "more_body": more_body})
+    return app
+
+
+def _call(app, accept_encoding: str, config: Dict = None):
+    """Request GET contra CompressionMiddleware(app); devuelve (headers, cuerpo, mensajes de cuerpo)"""
+    async def main():
+        sent: List = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/api/projects", "query_string": b"",
+                 "headers": [(b"accept-encoding", accept_encoding.encode())]}
+        await CompressionMiddleware(app, config or _config())(scope, receive, send)
+        return sent
+
+    sent = asyncio.run(main())
+    headers = {k.decode().lower(): v.decode() for k, v in sent[0]["headers"]}
+    bodies = [m for m in sent if m["type"] == "http.response.body"]
+    return headers, b"".join(m["body"] for m in bodies), bodies
+
+
+def test_negotiation_uses_weights_then_server_preference():
+    preference = ["br", "zstd", "gzip"]
+    assert negotiate_encoding("gzip, deflate, br, zstd", preference) == "br"
+    assert negotiate_encoding("br;q=0.5, gzip", preference) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", preference) is None
+    assert negotiate_encoding("*", preference) == "br"
+    assert negotiate_encoding("*, br;q=0", preference) == "zstd"
+    assert negotiate_encoding("", preference) is None
+
+
+def test_gzip_response_is_compressed_and_decodes_to_the_original():
+    headers, body, _ = _call(_app(BODY), "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert headers["content-length"] == str(len(body))
+    assert "Accept-Encoding" in headers["vary"]
+    assert gzip.decompress(body) == BODY
+
+
+@pytest.mark.parametrize("encoding, module", [("br", "brotli"), ("zstd", "zstandard")])
+def test_optional_encodings_are_preferred_when_installed(encoding, module):
+    library = pytest.importorskip(module)
+    headers, body, _ = _call(_app(BODY), "gzip, br, zstd" if encoding == "br" else "gzip, zstd")
+    assert headers["content-encoding"] == encoding
+    if encoding == "br":
+        assert library.decompress(body) == BODY
+    else:
+        assert library.ZstdDecompressor().decompressobj().decompress(body) == BODY
+
+
+def test_small_and_excluded_responses_are_sent_as_is():
+    headers, body, _ = _call(_app(b'{"ok": true}'), "gzip")
+    assert "content-encoding" not in headers and body == b'{"ok": true}'
+
+    headers, body, _ = _call(_app(BODY, b"application/pdf"), "gzip")
+    assert "content-encoding" not in headers and body == BODY
+
+    headers, body, _ = _call(_app(BODY), "gzip", _config(enabled=False))
+    assert "content-encoding" not in headers and body == BODY
+
+
+def test_streaming_response_is_compressed_by_chunks():
+    headers, body, messages = _call(_app(BODY, chunks=4), "gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert len(messages) > 1 and messages[-1]["more_body"] is False
+    assert gzip.decompress(body) == BODY
@@ -0,0 +1,99 @@
+# Archivo: tests/test_etag.py
+# Descripción: Pruebas de los GET condicionales
+# Funcionalidad: ETag por versiones de tablas, 304 con If-None-Match solo con token válido y rutas que dependen de la hora
+
+import asyncio
+from datetime import datetime, timedelta
+
+from jose import jwt
+
+from app.cache.versions import get_version_store
+from app.config import JWT_CONFIG
+from benchmarks.datagen import DEFAULT_PASSWORD
+
+
+def test_time_dependent_routes_have_no_etag(client, auth_headers):
+    for path in ("/api/tasks/vencidas", "/api/tasks/proximas",
+                 "/api/pending-activities/vencidas", "/api/pending-activities/proximas"):
+        response = client.get(path, headers=auth_headers)
+        assert response.status_code == 200, path
+        assert "etag" not in response.headers, path
+
+    assert "etag" in client.get("/api/tasks/", headers=auth_headers).headers
+
+
+def test_matching_if_none_match_returns_304_without_touching_the_database(client, auth_headers, count_queries):
+    first = client.get("/api/contactos/", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"') and first.headers["cache-control"] == "private, no-cache"
+
+    with count_queries() as counter:
+        response = client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag and response.content == b""
+    assert counter.count == 0, counter.report()
+
+    # Comparación débil y listas de ETags
+    strong = etag[2:]
+    assert client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": f'"otro", {strong}'}).status_code == 304
+
+
+def test_commit_to_a_dependency_table_changes_the_etag(client, auth_headers):
+    etag = client.get("/api/contactos/", headers=auth_headers).headers["etag"]
+    contacto = client.get("/api/contactos/", headers=auth_headers).json()["data"][0]
+
+    updated = client.put(
+        f"/api/contactos/{contacto['id_contacto']}", json={"direccion": "Av. Siempre Viva 742"}, headers=auth_headers
+    )
+    assert updated.status_code == 200, updated.text
+
+    response = client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+    # Una tabla de la que la ruta no depende no invalida su ETag
+    etag = response.headers["etag"]
+    project = client.put("/api/projects/1", json={"descripcion": "Actualizado por test_etag"}, headers=auth_headers)
+    assert project.status_code == 200, project.text
+    assert client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+
+def test_etag_depends_on_the_authorization_header(client, auth_headers):
+    login = client.post("/api/auth/login", json={"email": "usuario1@bench.justtime", "password": DEFAULT_PASSWORD})
+    other_headers = {"Authorization": f"Bearer {login.json()['data']['access_token']}"}
+
+    mine = client.get("/api/contactos/", headers=auth_headers)
+    theirs = client.get("/api/contactos/", headers=other_headers)
+    assert mine.headers["etag"] != theirs.headers["etag"]
+    assert "Authorization" in mine.headers["vary"]
+
+    response = client.get("/api/contactos/", headers={**other_headers, "If-None-Match": mine.headers["etag"]})
+    assert response.status_code == 200
+
+
+def _token(exp: datetime, secret: str = JWT_CONFIG["secret_key"]) -> str:
+    return jwt.encode({"sub": "1", "exp": exp}, secret, algorithm=JWT_CONFIG["algorithm"])
+
+
+def test_invalid_or_expired_token_gets_401_instead_of_304(client, auth_headers):
+    path = "/api/analytics/casos-por-estado"  # requiere get_current_user
+    # If-None-Match: * coincide con cualquier ETag: solo el token decide
+    assert client.get(path, headers={**auth_headers, "If-None-Match": "*"}).status_code == 304
+
+    for token in (
+        _token(datetime.utcnow() - timedelta(minutes=1)),
+        _token(datetime.utcnow() + timedelta(minutes=5), secret="otra-clave"),
+        "no-es-un-jwt"
+    ):
+        response = client.get(path, headers={"Authorization": f"Bearer {token}", "If-None-Match": "*"})
+        assert response.status_code == 401, token
+
+
+def test_user_changes_invalidate_authenticated_etags(client, auth_headers):
+    etag = client.get("/api/contactos/", headers=auth_headers).headers["etag"]
+    assert client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+    # Commit en usuarios (por ejemplo, un usuario desactivado): se vuelve a autenticar
+    asyncio.run(get_version_store().bump(["usuarios"]))
+    assert client.get("/api/contactos/", headers={**auth_headers, "If-None-Match": etag}).status_code == 200
@@ -0,0 +1,253 @@
+# Archivo: tests/test_events.py
+# Descripción: Pruebas del bus de eventos de cambio
+# Funcionalidad: Eventos publicados solo al confirmar, combinación por fila, UPDATE masivo, filtros, suscriptores async y rollups
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, update
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from app.cache import Cache, MemoryBackend, set_cache
+from app.database import SessionLocal
+from app.events import (
+    DELETE, INSERT, UPDATE, ChangeEvent, EventBus, bus, get_estado_rollup,
+    register_default_subscribers, register_session_events
+)
+from app.events.bus import begin_request_scope, drain_request_scope, end_request_scope
+from app.events.rollups import count_by_estado
+from app.models.proyecto import Proyecto
+from app.models.tarea import Tarea
+
+
+Base = declarative_base()
+
+
+class Item(Base):
+    __tablename__ = "items_eventos"
+
+    id = Column(Integer, primary_key=True)
+    titulo = Column(String(100))
+    estado = Column(String(20))
+    proyecto_id_fk = Column(Integer)
+
+
+@pytest.fixture
+def session():
+    register_session_events()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def published():
+    """Lotes publicados en el bus global, uno por transacción confirmada"""
+    batches = []
+
+    def recorder(events):
+        batches.append(events)
+
+    bus.subscribe(recorder, tables=[Item.__tablename__])
+    yield batches
+    bus.unsubscribe(recorder)
+
+
+def test_commit_publishes_one_batch_with_routing_data(session, published):
+    session.add(Item(id=1, titulo="Contestar demanda", estado="pendiente", proyecto_id_fk=7))
+    session.flush()
+    session.get(Item, 1).estado = "en_curso"  # INSERT + UPDATE en la misma transacción: sigue siendo INSERT
+    assert published == []  # nada antes del commit
+    session.commit()
+
+    [[event]] = published
+    assert (event.pk, event.op, event.data["proyecto_id_fk"], event.data["estado"]) == (1, INSERT, 7, "en_curso")
+
+    item = session.get(Item, 1)
+    item.estado = "cerrado"
+    session.commit()
+    [event] = published[1]
+    assert (event.pk, event.op, event.data["campos"], event.data["estado"]) == (1, UPDATE, ["estado"], "cerrado")
+
+    session.delete(session.get(Item, 1))
+    session.commit()
+    assert published[2] == [ChangeEvent("items_eventos", 1, DELETE, {"proyecto_id_fk": 7, "estado": "cerrado"})]
+
+
+def test_update_carries_the_value_from_before_the_transaction(session, published):
+    session.add(Item(id=1, estado="pendiente", proyecto_id_fk=7))
+    session.commit()
+
+    item = session.get(Item, 1)
+    item.estado = "en_curso"
+    session.flush()
+    item.estado = "cerrado"
+    item.titulo = "Renombrado"
+    session.commit()
+
+    [event] = published[1]
+    assert event.data["anterior"] == {"estado": "pendiente"}
+    assert (event.data["estado"], event.data["campos"]) == ("cerrado", ["estado", "titulo"])
+
+
+def test_rollback_publishes_nothing(session, published):
+    session.add(Item(id=1, titulo="Borrador"))
+    session.flush()
+    session.rollback()
+
+    session.add(Item(id=2, titulo="Confirmado"))
+    session.commit()
+    assert [[event.pk for event in batch] for batch in published] == [[2]]
+
+
+def test_row_inserted_and_deleted_in_the_same_transaction_is_not_published(session, published):
+    session.add(Item(id=1, titulo="Temporal"))
+    session.flush()
+    session.delete(session.get(Item, 1))
+    session.commit()
+    assert published == []
+
+
+def test_bulk_update_is_published_at_table_level(session, published):
+    session.add_all([Item(id=1, estado="pendiente"), Item(id=2, estado="pendiente")])
+    session.commit()
+
+    session.execute(update(Item).values(estado="vencida"))
+    session.commit()
+    assert published[1] == [ChangeEvent("items_eventos", None, UPDATE)]
+
+
+def test_subscribers_are_filtered_by_table_and_isolated_from_failures():
+    local = EventBus()
+    received = []
+
+    def failing(events):
+        raise RuntimeError("suscriptor roto")
+
+    local.subscribe(failing)
+    local.subscribe(lambda events: received.append([e.table for e in events]), tables=["tareas"])
+    local.publish([ChangeEvent("proyectos", 1, UPDATE), ChangeEvent("tareas", 3, INSERT)])
+    local.publish([ChangeEvent("proyectos", 2, UPDATE)])
+
+    assert received == [["tareas"]]
+
+
+def test_async_subscribers_are_awaited_by_the_request_scope():
+    local = EventBus()
+    done = []
+
+    async def slow(events):
+        await asyncio.sleep(0.02)
+        done.append(len(events))
+
+    local.subscribe(slow)
+
+    async def request():
+        token = begin_request_scope()
+        try:
+            local.publish([ChangeEvent("tareas", 1, INSERT)])
+            assert done == []  # programado en el loop, no ejecutado en el acto
+            await drain_request_scope()
+            return list(done)
+        finally:
+            end_request_scope(token)
+
+    assert asyncio.run(request()) == [1]
+
+
+def test_commit_from_another_thread_runs_async_subscribers_on_the_bound_loop():
+    local = EventBus()
+    loops = []
+
+    async def record(events):
+        loops.append(asyncio.get_running_loop())
+
+    local.subscribe(record)
+
+    async def main():
+        local.bind_loop(asyncio.get_running_loop())
+        # Commit en un hilo del worker de jobs
+        worker = threading.Thread(target=local.publish, args=([ChangeEvent("tareas", 1, INSERT)],))
+        worker.start()
+        await asyncio.to_thread(worker.join)
+        await asyncio.sleep(0.01)
+        return asyncio.get_running_loop()
+
+    loop = asyncio.run(main())
+    assert loops == [loop]
+
+
+@pytest.fixture
+def rollup_env(seeded_database):
+    register_session_events()
+    register_default_subscribers()
+    set_cache(Cache(MemoryBackend()))
+    db = SessionLocal()
+    yield db
+    db.close()
+    set_cache(None)
+
+
+def test_rollups_follow_committed_changes_without_querying(rollup_env, count_queries):
+    db = rollup_env
+
+    async def commit(change, *loaded):
+        # Como en los repositorios: la fila se lee antes de modificarla
+        for obj in loaded:
+            db.refresh(obj)
+        change()
+        db.commit()
+        await bus.drain()
+
+    async def rollups():
+        return {table: await get_estado_rollup(db, table) for table in ("tareas", "proyectos")}
+
+    async def scenario():
+        await rollups()  # el primer uso hace el GROUP BY
+        tarea = Tarea(titulo="Rollup", estado="en_progreso")
+        proyecto = db.query(Proyecto).filter(Proyecto.estado == "activo").first()
+        await commit(lambda: db.add(tarea))
+        await commit(lambda: setattr(proyecto, "estado", "pausado"), proyecto)
+        await commit(lambda: setattr(tarea, "estado", "finalizado"), tarea)
+
+        with count_queries() as counter:
+            maintained = await rollups()
+        assert counter.count == 0, counter.report()
+        expected = {table: count_by_estado(db, table) for table in maintained}
+
+        # Dejar la base como estaba para las demás pruebas
+        await commit(lambda: db.delete(tarea), tarea)
+        await commit(lambda: setattr(proyecto, "estado", "activo"), proyecto)
+        restored = await rollups()
+        return maintained, expected, restored
+
+    maintained, expected, restored = asyncio.run(scenario())
+    assert maintained == expected
+    assert restored == {table: count_by_estado(db, table) for table in restored}
+
+
+def test_bulk_update_discards_the_rollup(rollup_env):
+    db = rollup_env
+    tarea_id, estado = db.query(Tarea.id_tarea, Tarea.estado).filter(Tarea.estado == "nuevo").first()
+
+    async def bulk(nuevo_estado):
+        db.execute(update(Tarea).where(Tarea.id_tarea == tarea_id).values(estado=nuevo_estado))
+        db.commit()
+        await bus.drain()
+        return await get_estado_rollup(db, "tareas"), count_by_estado(db, "tareas")
+
+    async def scenario():
+        await get_estado_rollup(db, "tareas")
+        # UPDATE masivo: no hay filas en el evento, el rollup se recalcula
+        after = await bulk("finalizado")
+        restored = await bulk(estado)
+        return after, restored
+
+    (after, expected_after), (restored, expected_restored) = asyncio.run(scenario())
+    assert after == expected_after and restored == expected_restored
+    assert after != restored
@@ -0,0 +1,84 @@
+# Archivo: tests/test_jobs.py
+# Descripción: Pruebas de la cola de trabajos
+# Funcionalidad: Lease renovado por heartbeat y complete / fail solo con el lease vigente
+
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config import JOBS_CONFIG
+from app.database import SessionLocal
+from app.jobs import COMPLETADO, EN_PROCESO, FALLIDO, claim, complete, enqueue, fail, heartbeat, job_handler
+from app.jobs.worker import Worker
+from app.models.trabajo import Trabajo
+
+
+@pytest.fixture
+def db(seeded_database):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+def _tipo() -> str:
+    # Un tipo por prueba: claim no toma trabajos de otras pruebas
+    return f"test.{uuid.uuid4().hex[:8]}"
+
+
+def _expire_lease(db, job_id: int) -> None:
+    db.get(Trabajo, job_id).bloqueado_hasta = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+
+def test_worker_that_lost_its_lease_cannot_complete_or_fail(db):
+    tipo = _tipo()
+    job = enqueue(db, tipo, max_intentos=1)
+    stale = claim(db, "worker-a", [tipo])
+    _expire_lease(db, job.id_trabajo)
+    current = claim(db, "worker-b", [tipo])
+    assert current.id_trabajo == job.id_trabajo
+
+    assert not heartbeat(db, job.id_trabajo, "worker-a")
+    assert not complete(db, stale, "worker-a", {"ok": "a"})
+    assert not fail(db, stale, "worker-a", "tarde")
+    job = db.get(Trabajo, job.id_trabajo, populate_existing=True)
+    assert job.estado == EN_PROCESO and job.bloqueado_por == "worker-b" and job.resultado is None
+
+    assert complete(db, current, "worker-b", {"ok": "b"})
+    job = db.get(Trabajo, job.id_trabajo, populate_existing=True)
+    assert job.estado == COMPLETADO and job.resultado == {"ok": "b"} and job.bloqueado_por is None
+
+
+def test_fail_with_current_lease_marks_failed_after_last_attempt(db):
+    tipo = _tipo()
+    enqueue(db, tipo, max_intentos=1)
+    job = claim(db, "worker-a", [tipo])
+    assert fail(db, job, "worker-a", "boom")
+    assert db.get(Trabajo, job.id_trabajo, populate_existing=True).estado == FALLIDO
+
+
+def test_heartbeat_keeps_a_long_handler_from_being_reclaimed(db, monkeypatch):
+    monkeypatch.setitem(JOBS_CONFIG, "lease_seconds", 0.4)
+    monkeypatch.setitem(JOBS_CONFIG, "heartbeat_interval", 0.1)
+    tipo = _tipo()
+    started = threading.Event()
+
+    @job_handler(tipo)
+    def slow(payload, session):
+        started.set()
+        time.sleep(1.0)  # más del doble del lease
+        return {"ok": True}
+
+    job = enqueue(db, tipo)
+    worker = threading.Thread(target=Worker("worker-lento", [tipo]).run_once)
+    worker.start()
+    assert started.wait(5)
+    time.sleep(0.6)
+    assert claim(db, "worker-intruso", [tipo]) is None
+    worker.join()
+
+    job = db.get(Trabajo, job.id_trabajo, populate_existing=True)
+    assert job.estado == COMPLETADO and job.intentos == 1
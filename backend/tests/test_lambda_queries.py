@@ -0,0 +1,196 @@
+# Archivo: tests/test_lambda_queries.py
+# Descripción: Pruebas de las consultas cacheadas con lambda_stmt
+# Funcionalidad: Cada método llamado dos veces con argumentos distintos devuelve las filas de SUS argumentos
+#
+# lambda_stmt cachea la sentencia por el código de la lambda y toma los
+# valores de las variables capturadas como parámetros. Una variable mal
+# capturada (un valor resuelto al construir la cache key, un closure que
+# no se rastrea) haría que la segunda llamada repita los filtros de la
+# primera. Cada caso compara contra la misma consulta escrita sin lambdas.
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.controllers.pending_activity_controller import PendingActivityController
+from app.controllers.project_controller import ProjectController
+from app.controllers.task_controller import TaskController
+from app.database import SessionLocal
+from app.factory import RepositoryFactory
+from app.models.actividad_pendiente import ActividadPendiente
+from app.models.proyecto import Proyecto
+from app.models.tarea import Tarea
+
+
+@pytest.fixture
+def db(seeded_database):
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def tasks(db):
+    return TaskController(RepositoryFactory.create_task_repository(db))
+
+
+@pytest.fixture
+def activities(db):
+    return PendingActivityController(RepositoryFactory.create_pending_activity_repository(db))
+
+
+@pytest.fixture
+def projects(db):
+    return ProjectController(RepositoryFactory.create_project_repository(db))
+
+
+def _ids(rows, pk):
+    return sorted(row[pk] for row in rows)
+
+
+def _expected(query, column):
+    return sorted(value for (value,) in query.with_entities(column))
+
+
+def _assert_differs_as_expected(results, expected):
+    first, second = results
+    assert first == expected[0] and second == expected[1]
+    assert first != second, "los casos de prueba deben devolver filas distintas"
+
+
+def test_task_filters(db, tasks):
+    ids = lambda query: _expected(query, Tarea.id_tarea)
+    base = db.query(Tarea)
+
+    _assert_differs_as_expected(
+        [_ids(tasks.get_by_estado(estado), "id_tarea") for estado in ("nuevo", "finalizado")],
+        [ids(base.filter(Tarea.estado == estado)) for estado in ("nuevo", "finalizado")]
+    )
+    _assert_differs_as_expected(
+        [_ids(tasks.get_by_prioridad(prioridad), "id_tarea") for prioridad in ("alta", "baja")],
+        [ids(base.filter(Tarea.prioridad == prioridad)) for prioridad in ("alta", "baja")]
+    )
+    proyectos = [1, 2]
+    _assert_differs_as_expected(
+        [_ids(tasks.get_by_proyecto(proyecto), "id_tarea") for proyecto in proyectos],
+        [ids(base.filter(Tarea.proyecto_id_fk == proyecto)) for proyecto in proyectos]
+    )
+    task_ids = ids(base)[:2]
+    assert [tasks.get_by_id(i)["id_tarea"] for i in task_ids] == task_ids
+
+
+def test_task_due_dates(db, tasks):
+    ids = lambda query: _expected(query, Tarea.id_tarea)
+    abiertas = db.query(Tarea).filter(Tarea.estado != "finalizado")
+    hoy = date.today()
+
+    dias = [hoy - timedelta(days=20), hoy + timedelta(days=20)]
+    _assert_differs_as_expected(
+        [_ids(tasks.get_vencidas(hoy=dia), "id_tarea") for dia in dias],
+        [ids(abiertas.filter(Tarea.fecha_vencimiento < dia)) for dia in dias]
+    )
+    ventanas = [(hoy, hoy + timedelta(days=7)), (hoy - timedelta(days=30), hoy)]
+    _assert_differs_as_expected(
+        [_ids(tasks.get_proximas(desde, hasta), "id_tarea") for desde, hasta in ventanas],
+        [ids(abiertas.filter(Tarea.fecha_vencimiento >= desde, Tarea.fecha_vencimiento <= hasta))
+         for desde, hasta in ventanas]
+    )
+
+
+def test_task_listing_pages_and_state(db, tasks):
+    ordered = [value for (value,) in db.query(Tarea.id_tarea).order_by(Tarea.id_tarea)]
+    pages = [tasks.get_all_tasks(skip=0, limit=10), tasks.get_all_tasks(skip=10, limit=5)]
+    assert [[task["id_tarea"] for task in page] for page in pages] == [ordered[:10], ordered[10:15]]
+
+    by_state = [tasks.get_all_tasks(estado=estado) for estado in ("en_progreso", "nuevo")]
+    assert [{task["estado"] for task in page} for page in by_state] == [{"en_progreso"}, {"nuevo"}]
+    # Sin filtro después de una llamada filtrada: no queda el WHERE de la anterior
+    assert len({task["estado"] for task in tasks.get_all_tasks()}) > 1
+
+
+def test_activity_filters(db, activities):
+    ids = lambda query: _expected(query, ActividadPendiente.id_actividad_pendiente)
+    pk = "id_actividad_pendiente"
+    base = db.query(ActividadPendiente)
+    usuarios = [value for (value,) in db.query(ActividadPendiente.usuario_id_fk).distinct().order_by(
+        ActividadPendiente.usuario_id_fk
+    )][:2]
+
+    _assert_differs_as_expected(
+        [_ids(activities.get_by_usuario(usuario), pk) for usuario in usuarios],
+        [ids(base.filter(ActividadPendiente.usuario_id_fk == usuario)) for usuario in usuarios]
+    )
+    # Con y sin el filtro agregado con += sobre la misma sentencia base
+    pendientes = base.filter(ActividadPendiente.completada == False)  # noqa: E712
+    _assert_differs_as_expected(
+        [_ids(activities.get_pendientes(usuario_id=usuario), pk) for usuario in (usuarios[0], None)],
+        [ids(pendientes.filter(ActividadPendiente.usuario_id_fk == usuarios[0])), ids(pendientes)]
+    )
+    completadas = base.filter(ActividadPendiente.completada == True)  # noqa: E712
+    _assert_differs_as_expected(
+        [_ids(activities.get_completadas(usuario_id=usuario), pk) for usuario in usuarios],
+        [ids(completadas.filter(ActividadPendiente.usuario_id_fk == usuario)) for usuario in usuarios]
+    )
+    _assert_differs_as_expected(
+        [_ids(activities.get_by_prioridad(prioridad), pk) for prioridad in ("alta", "baja")],
+        [ids(base.filter(ActividadPendiente.prioridad == prioridad)) for prioridad in ("alta", "baja")]
+    )
+    _assert_differs_as_expected(
+        [_ids(activities.get_all_activities(completada=completada), pk) for completada in (True, False)],
+        [ids(base.filter(ActividadPendiente.completada == completada).order_by(
+            ActividadPendiente.id_actividad_pendiente
+        ).limit(100)) for completada in (True, False)]
+    )
+
+
+def test_activity_due_dates(db, activities):
+    ids = lambda query: _expected(query, ActividadPendiente.id_actividad_pendiente)
+    pk = "id_actividad_pendiente"
+    abiertas = db.query(ActividadPendiente).filter(ActividadPendiente.completada == False)  # noqa: E712
+    now = datetime.now()
+
+    momentos = [now - timedelta(days=20), now + timedelta(days=20)]
+    _assert_differs_as_expected(
+        [_ids(activities.get_vencidas(now=momento), pk) for momento in momentos],
+        [ids(abiertas.filter(ActividadPendiente.fecha_vencimiento < momento)) for momento in momentos]
+    )
+    ventanas = [(now, now + timedelta(days=7)), (now - timedelta(days=30), now)]
+    _assert_differs_as_expected(
+        [_ids(activities.get_proximas(desde, hasta), pk) for desde, hasta in ventanas],
+        [ids(abiertas.filter(ActividadPendiente.fecha_vencimiento >= desde, ActividadPendiente.fecha_vencimiento < hasta))
+         for desde, hasta in ventanas]
+    )
+
+
+def test_project_filters(db, projects):
+    ids = lambda query: _expected(query, Proyecto.id_proyecto)
+    pk = "id_proyecto"
+    base = db.query(Proyecto)
+
+    _assert_differs_as_expected(
+        [_ids(projects.get_by_estado(estado), pk) for estado in ("activo", "finalizado")],
+        [ids(base.filter(Proyecto.estado == estado)) for estado in ("activo", "finalizado")]
+    )
+    categorias = [value for (value,) in db.query(Proyecto.categoria_id_fk).filter(
+        Proyecto.categoria_id_fk.isnot(None)
+    ).distinct().order_by(Proyecto.categoria_id_fk)][:2]
+    _assert_differs_as_expected(
+        [_ids(projects.get_by_categoria(categoria), pk) for categoria in categorias],
+        [ids(base.filter(Proyecto.categoria_id_fk == categoria)) for categoria in categorias]
+    )
+    contactos = [value for (value,) in db.query(Proyecto.contacto_id_fk).filter(
+        Proyecto.contacto_id_fk.isnot(None)
+    ).distinct().order_by(Proyecto.contacto_id_fk)][:2]
+    _assert_differs_as_expected(
+        [_ids(projects.get_by_contacto(contacto), pk) for contacto in contactos],
+        [ids(base.filter(Proyecto.contacto_id_fk == contacto)) for contacto in contactos]
+    )
+
+    ordered = [value for (value,) in db.query(Proyecto.id_proyecto).order_by(Proyecto.id_proyecto)]
+    pages = [projects.get_all_projects(skip=0, limit=10), projects.get_all_projects(skip=20, limit=5)]
+    assert [[project[pk] for project in page] for page in pages] == [ordered[:10], ordered[20:25]]
+    filtered = [projects.get_all_projects(estado="activo", categoria_id=categoria) for categoria in categorias]
+    assert [_ids(page, pk) for page in filtered] == [
+        ids(base.filter(Proyecto.estado == "activo", Proyecto.categoria_id_fk == categoria)) for categoria in categorias
+    ]
+    assert [projects.get_project_by_id(i)[pk] for i in ordered[:2]] == ordered[:2]
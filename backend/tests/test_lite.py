@@ -0,0 +1,54 @@
+# Archivo: tests/test_lite.py
+# Descripción: Pruebas del modo lite (?lite / ?fields=) de los listados
+# Funcionalidad: Campos inválidos, columnas de tablas unidas, una sola sentencia y la misma página que el listado completo
+
+import pytest
+
+
+LISTINGS = [
+    ("/api/tasks/", "id_tarea"),
+    ("/api/contactos/", "id_contacto"),
+    ("/api/pending-activities/", "id_actividad_pendiente"),
+]
+
+
+@pytest.mark.parametrize("path, pk", LISTINGS)
+def test_unknown_field_returns_400(client, auth_headers, path, pk):
+    response = client.get(path, params={"fields": f"{pk},no_existe"}, headers=auth_headers)
+    assert response.status_code == 400
+    assert "no_existe" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("path, pk", LISTINGS)
+def test_lite_page_matches_the_full_listing(client, auth_headers, count_queries, path, pk):
+    page = {"skip": 5, "limit": 10}
+    full = client.get(path, params=page, headers=auth_headers).json()["data"]
+
+    with count_queries() as counter:
+        response = client.get(path, params={**page, "fields": pk}, headers=auth_headers)
+    assert response.status_code == 200
+    assert counter.count == 1, counter.report()
+
+    lite = response.json()["data"]
+    assert lite and all(list(row) == [pk] for row in lite)
+    assert [row[pk] for row in lite] == [row[pk] for row in full]
+
+
+def test_lite_tasks_carry_the_joined_project_name(client, auth_headers, count_queries):
+    full = {task["id_tarea"]: task for task in client.get("/api/tasks/", headers=auth_headers).json()["data"]}
+
+    with count_queries() as counter:
+        lite = client.get("/api/tasks/", params={"lite": "true"}, headers=auth_headers).json()["data"]
+    assert counter.count == 1, counter.report()
+
+    assert lite and all("proyecto_nombre" in task for task in lite)
+    assert any(task["proyecto_nombre"] for task in lite)
+    for task in lite:
+        assert task["proyecto_nombre"] == full[task["id_tarea"]]["proyecto_nombre"]
+
+
+def test_lite_activities_join_user_and_project(client, auth_headers):
+    fields = "id_actividad_pendiente,usuario_nombre,proyecto_nombre"
+    lite = client.get("/api/pending-activities/", params={"fields": fields}, headers=auth_headers).json()["data"]
+    assert lite and all(list(row) == fields.split(",") for row in lite)
+    assert any(row["usuario_nombre"] for row in lite)
@@ -0,0 +1,83 @@
+# Archivo: tests/test_logging.py
+# Descripción: Pruebas del logging estructurado
+# Funcionalidad: Formato JSON, request id, muestreo y header X-Request-ID
+
+import json
+import logging
+import queue
+import sys
+
+from app.observability.logs import (
+    JsonFormatter, LogQueueHandler, RequestIdFilter, SamplingFilter, reset_request_id, set_request_id
+)
+
+
+def _record(name="app.controllers.task_controller", level=logging.INFO, msg="Tarea %s", args=(7,), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_line_carries_request_id_and_extra_fields():
+    token = set_request_id("req-123")
+    try:
+        record = _record(tarea_id=7)
+        RequestIdFilter().filter(record)
+    finally:
+        reset_request_id(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["msg"] == "Tarea 7"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.controllers.task_controller"
+    assert entry["request_id"] == "req-123"
+    assert entry["tarea_id"] == 7
+
+
+def test_queued_record_keeps_exception_as_text():
+    handler = LogQueueHandler(queue.Queue())
+    try:
+        raise ValueError("fallo")
+    except ValueError:
+        record = _record(level=logging.ERROR, msg="Error en get_by_id: %s", args=("fallo",))
+        record.exc_info = sys.exc_info()
+
+    handler.handle(record)
+    queued = handler.queue.get_nowait()
+    entry = json.loads(JsonFormatter().format(queued))
+
+    assert queued.exc_info is None and queued.args is None
+    assert entry["msg"] == "Error en get_by_id: fallo"
+    assert "ValueError: fallo" in entry["exc"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = LogQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record())
+    handler.handle(_record())
+    assert handler.dropped == 1
+
+
+def test_sampling_keeps_warnings_and_unlisted_loggers():
+    sampling = SamplingFilter({"app.cache": 0.0})
+
+    assert not sampling.filter(_record(name="app.cache.core"))
+    assert sampling.filter(_record(name="app.cache.core", level=logging.WARNING))
+    assert sampling.filter(_record(name="app.cachex"))
+    assert sampling.filter(_record(name="app.controllers.task_controller"))
+
+
+def test_sampling_rate_per_call():
+    sampling = SamplingFilter({})
+
+    assert not sampling.filter(_record(sample_rate=0.0))
+    assert sampling.filter(_record(sample_rate=1.0))
+
+
+def test_request_id_header(client):
+    response = client.get("/health", headers={"X-Request-ID": "proxy-abc.1"})
+    assert response.headers["x-request-id"] == "proxy-abc.1"
+
+    generated = client.get("/health", headers={"X-Request-ID": "id con espacios"}).headers["x-request-id"]
+    assert len(generated) == 32 and generated != "id con espacios"
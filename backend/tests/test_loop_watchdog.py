@@ -0,0 +1,60 @@
+# Archivo: tests/test_loop_watchdog.py
+# Descripción: Pruebas del watchdog del event loop
+# Funcionalidad: Un callback bloqueante se detecta con su ruta y su pila; las esperas async no
+
+import asyncio
+import logging
+import time
+
+from app.observability.loop_watchdog import LoopWatchdog, register_request_task, unregister_request_task
+
+
+def _bloquear_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def _request(scope, work):
+    task = register_request_task(scope)
+    try:
+        await work()
+    finally:
+        unregister_request_task(task)
+
+
+def _run(work, scope=None):
+    async def main():
+        watchdog = LoopWatchdog(interval=0.02, threshold=0.1).start()
+        try:
+            await _request(scope or {"type": "http", "method": "GET", "path": "/api/lento"}, work)
+            await asyncio.sleep(0.05)
+        finally:
+            watchdog.stop()
+        return watchdog
+
+    return asyncio.run(main())
+
+
+def test_blocking_callback_is_reported_with_route_and_stack(caplog):
+    async def work():
+        _bloquear_loop(0.4)
+
+    with caplog.at_level(logging.WARNING, logger="justtime.loop"):
+        watchdog = _run(work)
+
+    assert watchdog.blocks == 1
+    report = caplog.records[-1]
+    assert report.event == "event_loop_blocked"
+    assert report.route == "GET /api/lento"
+    assert report.blocked_ms >= 100
+    assert "_bloquear_loop" in report.stack[-1]
+
+
+def test_async_waits_are_not_reported(caplog):
+    async def work():
+        await asyncio.sleep(0.3)
+
+    with caplog.at_level(logging.WARNING, logger="justtime.loop"):
+        watchdog = _run(work)
+
+    assert watchdog.blocks == 0
+    assert not caplog.records
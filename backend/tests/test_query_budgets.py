@@ -0,0 +1,331 @@
+# Archivo: tests/test_query_budgets.py
+# Descripción: Presupuesto de sentencias SQL por ruta de app/routers
+# Funcionalidad: Cada endpoint tiene un máximo de queries por request, verificado contra la base poblada
+#
+# Un N+1 (un _to_dict que toca una relación lazy por fila) hace crecer las
+# sentencias con la cantidad de filas; con la base de conftest.py ningún
+# N+1 cabe en estos presupuestos. Las rutas paginadas además deben ejecutar
+# las mismas sentencias con limit=5 que con limit=50.
+#
+# Toda ruta nueva necesita su entrada en BUDGETS (test_every_route_has_budget
+# falla si falta). Subir un presupuesto va en el mismo commit que el cambio
+# que lo necesita, con la razón en el mensaje.
+
+import io
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Tuple, Union
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.database import SessionLocal
+from app.jobs.queue import FALLIDO, enqueue
+from app.main import app
+
+
+# Rutas sin presupuesto: (método, plantilla) -> razón
+EXCLUDED = {
+    ("GET", "/api/realtime/stream"): "SSE: la respuesta no termina",
+}
+
+
+class Factory:
+    """Crea (fuera del conteo) las entidades que consumen las rutas de escritura"""
+
+    _sequence = itertools.count(1)
+
+    def __init__(self, client, headers: Dict[str, str]):
+        self.client = client
+        self.headers = headers
+
+    def _created(self, url: str, **kwargs) -> Dict[str, Any]:
+        response = self.client.post(url, headers=self.headers, **kwargs)
+        assert response.status_code == 201, response.text
+        return response.json()["data"]
+
+    def email(self, prefix: str) -> str:
+        return f"{prefix}{next(self._sequence)}@prueba.justtime"
+
+    def project(self) -> int:
+        return self._created("/api/projects/", json=PROJECT)["id_proyecto"]
+
+    def task(self) -> int:
+        return self._created("/api/tasks/", json=TASK)["id_tarea"]
+
+    def contact(self) -> int:
+        return self._created("/api/contactos/", json=CONTACT)["id_contacto"]
+
+    def activity(self) -> int:
+        return self._created("/api/pending-activities/", json=ACTIVITY)["id_actividad_pendiente"]
+
+    def employee(self) -> int:
+        return self._created("/api/empleados/", json=EMPLOYEE)["id_empleado"]
+
+    def employee_with_user(self) -> Dict[str, Any]:
+        return self._created("/api/empleados/con-usuario", json=employee_with_user(self))
+
+    def document(self) -> int:
+        return self._created("/api/documentos/upload", **document_upload(self))["id_documento"]
+
+    def template(self) -> int:
+        return self._created("/api/plantillas/upload", **template_upload(self))["id_plantilla"]
+
+    def config(self) -> Dict[str, Any]:
+        usuario_id = self.employee_with_user()["usuario_id"]
+        response = self.client.get(f"/api/configuraciones/usuario/{usuario_id}", headers=self.headers)
+        assert response.status_code == 200, response.text
+        return response.json()["data"]
+
+    def user_without_config(self) -> int:
+        usuario_id = self.config()["usuario_id_fk"]
+        response = self.client.delete(f"/api/configuraciones/usuario/{usuario_id}", headers=self.headers)
+        assert response.status_code == 200, response.text
+        return usuario_id
+
+    def profile(self) -> str:
+        response = self.client.post("/api/admin/profiling/capture", headers=self.headers, params={"seconds": 0.05})
+        assert response.status_code == 200, response.text
+        return response.json()["data"]["name"]
+
+    def failed_job(self) -> int:
+        db = SessionLocal()
+        try:
+            job = enqueue(db, "prueba")
+            job.estado = FALLIDO
+            db.commit()
+            return job.id_trabajo
+        finally:
+            db.close()
+
+
+PROJECT = {"nombre": "Caso de prueba", "contacto_id_fk": 1, "categoria_id_fk": 1}
+TASK = {"titulo": "Tarea de prueba", "proyecto_id_fk": 1}
+CONTACT = {"nombre": "Contacto de prueba", "tipo": "persona"}
+ACTIVITY = {"descripcion": "Actividad de prueba", "usuario_id_fk": 1, "proyecto_id_fk": 1}
+EMPLOYEE = {"nombre": "Empleado de prueba", "puesto": "Procurador"}
+
+
+def employee_with_user(make: Factory) -> Dict[str, Any]:
+    return {"nombre": "Empleado con usuario", "email": make.email("empleado"), "password": "prueba123"}
+
+
+def document_upload(make: Factory) -> Dict[str, Any]:
+    return {
+        "files": {"file": ("escrito.pdf", io.BytesIO(b"%PDF-1.4\nprueba"), "application/pdf")},
+        "data": {"proyecto_id": "1"},
+    }
+
+
+def template_upload(make: Factory) -> Dict[str, Any]:
+    return {
+        "files": {"file": ("modelo.docx", io.BytesIO(b"PK\x03\x04prueba"), "application/octet-stream")},
+        "data": {"nombre": "Modelo de prueba", "categoria": "contrato"},
+    }
+
+
+Url = Union[str, Callable[[Factory], str]]
+Body = Callable[[Factory], Dict[str, Any]]
+
+
+@dataclass
+class RouteBudget:
+    method: str
+    path: str
+    budget: int
+    # URL fija, o función que prepara lo necesario (sin contar) y retorna la URL
+    url: Url
+    # kwargs de client.request; función cuando cada request necesita datos nuevos
+    body: Union[Dict[str, Any], Body] = field(default_factory=dict)
+    # Acepta limit: el conteo no puede depender del tamaño de página
+    paged: bool = False
+
+    @property
+    def id(self) -> str:
+        return f"{self.method} {self.path}"
+
+    def prepare(self, make: Factory) -> Tuple[str, Dict[str, Any]]:
+        url = self.url(make) if callable(self.url) else self.url
+        body = self.body(make) if callable(self.body) else dict(self.body)
+        return url, body
+
+
+BUDGETS = [
+    # Autenticación (register: empleado, usuario y configuración en una transacción)
+    RouteBudget("POST", "/api/auth/register", 6, "/api/auth/register",
+                lambda make: {"json": {"nombre": "Registro", "email": make.email("registro"), "password": "prueba123"}}),
+    RouteBudget("POST", "/api/auth/login", 2, "/api/auth/login",
+                {"json": {"email": "usuario1@bench.justtime", "password": "bench1234"}}),
+    RouteBudget("GET", "/api/auth/me", 2, "/api/auth/me"),
+    RouteBudget("POST", "/api/auth/verify-token", 0, "/api/auth/verify-token",
+                lambda make: {"params": {"token": make.headers["Authorization"].split()[1]}}),
+
+    # Tareas
+    RouteBudget("GET", "/api/tasks/", 1, "/api/tasks/", paged=True),
+    RouteBudget("GET", "/api/tasks/kanban", 1, "/api/tasks/kanban"),
+    RouteBudget("GET", "/api/tasks/vencidas", 4, "/api/tasks/vencidas"),
+    RouteBudget("GET", "/api/tasks/proximas", 4, "/api/tasks/proximas"),
+    RouteBudget("GET", "/api/tasks/{task_id}", 1, "/api/tasks/1"),
+    RouteBudget("POST", "/api/tasks/", 4, "/api/tasks/", {"json": TASK}),
+    RouteBudget("PUT", "/api/tasks/{task_id}", 5, lambda make: f"/api/tasks/{make.task()}",
+                {"json": {"titulo": "Tarea editada"}}),
+    RouteBudget("PATCH", "/api/tasks/{task_id}/estado", 5, lambda make: f"/api/tasks/{make.task()}/estado",
+                {"params": {"nuevo_estado": "en_progreso"}}),
+    RouteBudget("DELETE", "/api/tasks/{task_id}", 5, lambda make: f"/api/tasks/{make.task()}"),
+
+    # Proyectos
+    RouteBudget("GET", "/api/projects/", 1, "/api/projects/", paged=True),
+    RouteBudget("GET", "/api/projects/dashboard/stats", 1, "/api/projects/dashboard/stats"),
+    RouteBudget("GET", "/api/projects/activos", 1, "/api/projects/activos"),
+    RouteBudget("GET", "/api/projects/{project_id}", 1, "/api/projects/1"),
+    RouteBudget("POST", "/api/projects/", 6, "/api/projects/", {"json": PROJECT}),
+    RouteBudget("PUT", "/api/projects/{project_id}", 7, lambda make: f"/api/projects/{make.project()}",
+                {"json": {"nombre": "Caso editado"}}),
+    RouteBudget("PATCH", "/api/projects/{project_id}/finalizar", 7,
+                lambda make: f"/api/projects/{make.project()}/finalizar"),
+    RouteBudget("DELETE", "/api/projects/{project_id}", 8, lambda make: f"/api/projects/{make.project()}"),
+
+    # Contactos
+    RouteBudget("GET", "/api/contactos/", 1, "/api/contactos/", paged=True),
+    RouteBudget("GET", "/api/contactos/{id_contacto}", 1, "/api/contactos/1"),
+    RouteBudget("POST", "/api/contactos/", 3, "/api/contactos/", {"json": CONTACT}),
+    RouteBudget("PUT", "/api/contactos/{id_contacto}", 4, lambda make: f"/api/contactos/{make.contact()}",
+                {"json": {"nombre": "Contacto editado"}}),
+    RouteBudget("DELETE", "/api/contactos/{id_contacto}", 5, lambda make: f"/api/contactos/{make.contact()}"),
+
+    # Analytics
+    RouteBudget("GET", "/api/analytics/casos-por-categoria", 3, "/api/analytics/casos-por-categoria"),
+    RouteBudget("GET", "/api/analytics/casos-por-estado", 4, "/api/analytics/casos-por-estado"),
+    RouteBudget("GET", "/api/analytics/casos-por-contacto", 3, "/api/analytics/casos-por-contacto"),
+    RouteBudget("GET", "/api/analytics/casos-contacto/{contacto_id}", 4, "/api/analytics/casos-contacto/1"),
+    RouteBudget("GET", "/api/analytics/resumen-completo", 6, "/api/analytics/resumen-completo"),
+
+    # Plantillas
+    RouteBudget("POST", "/api/plantillas/upload", 2, "/api/plantillas/upload", template_upload),
+    RouteBudget("GET", "/api/plantillas/", 4, "/api/plantillas/", paged=True),
+    RouteBudget("GET", "/api/plantillas/{id_plantilla}", 1, lambda make: f"/api/plantillas/{make.template()}"),
+    RouteBudget("GET", "/api/plantillas/{id_plantilla}/download", 1,
+                lambda make: f"/api/plantillas/{make.template()}/download"),
+    RouteBudget("PUT", "/api/plantillas/{id_plantilla}", 3, lambda make: f"/api/plantillas/{make.template()}",
+                {"json": {"descripcion": "Editada"}}),
+    RouteBudget("DELETE", "/api/plantillas/{id_plantilla}", 2, lambda make: f"/api/plantillas/{make.template()}",
+                {"params": {"hard_delete": True}}),
+    RouteBudget("GET", "/api/plantillas/stats/summary", 3, "/api/plantillas/stats/summary"),
+
+    # Documentos (upload: registro + trabajo de miniatura)
+    RouteBudget("POST", "/api/documentos/upload", 6, "/api/documentos/upload", document_upload),
+    RouteBudget("GET", "/api/documentos/", 4, "/api/documentos/", paged=True),
+    RouteBudget("GET", "/api/documentos/search", 1, "/api/documentos/search", {"params": {"q": "escrito"}}),
+    RouteBudget("GET", "/api/documentos/proyecto/{proyecto_id}", 1, "/api/documentos/proyecto/1"),
+    RouteBudget("GET", "/api/documentos/tipo/{tipo_archivo}", 1, "/api/documentos/tipo/pdf"),
+    RouteBudget("GET", "/api/documentos/{id_documento}", 1, "/api/documentos/1"),
+    RouteBudget("GET", "/api/documentos/{id_documento}/download", 1,
+                lambda make: f"/api/documentos/{make.document()}/download"),
+    RouteBudget("PUT", "/api/documentos/{id_documento}", 4, lambda make: f"/api/documentos/{make.document()}",
+                {"json": {"nombre_archivo": "escrito editado.pdf"}}),
+    RouteBudget("DELETE", "/api/documentos/{id_documento}", 4, lambda make: f"/api/documentos/{make.document()}",
+                {"params": {"delete_file": True}}),
+    RouteBudget("GET", "/api/documentos/stats/summary", 3, "/api/documentos/stats/summary"),
+
+    # Actividades pendientes
+    RouteBudget("GET", "/api/pending-activities/", 1, "/api/pending-activities/", paged=True),
+    RouteBudget("GET", "/api/pending-activities/pendientes", 1, "/api/pending-activities/pendientes"),
+    RouteBudget("GET", "/api/pending-activities/completadas", 1, "/api/pending-activities/completadas"),
+    RouteBudget("GET", "/api/pending-activities/vencidas", 4, "/api/pending-activities/vencidas"),
+    RouteBudget("GET", "/api/pending-activities/proximas", 4, "/api/pending-activities/proximas"),
+    RouteBudget("GET", "/api/pending-activities/usuario/{usuario_id}", 1, "/api/pending-activities/usuario/1"),
+    RouteBudget("GET", "/api/pending-activities/proyecto/{proyecto_id}", 1, "/api/pending-activities/proyecto/1"),
+    RouteBudget("GET", "/api/pending-activities/{activity_id}", 1, "/api/pending-activities/1"),
+    RouteBudget("POST", "/api/pending-activities/", 5, "/api/pending-activities/", {"json": ACTIVITY}),
+    RouteBudget("PUT", "/api/pending-activities/{activity_id}", 6,
+                lambda make: f"/api/pending-activities/{make.activity()}", {"json": {"descripcion": "Actividad editada"}}),
+    RouteBudget("PATCH", "/api/pending-activities/{activity_id}/completar", 6,
+                lambda make: f"/api/pending-activities/{make.activity()}/completar"),
+    RouteBudget("DELETE", "/api/pending-activities/{activity_id}", 4,
+                lambda make: f"/api/pending-activities/{make.activity()}"),
+
+    # Configuraciones
+    RouteBudget("GET", "/api/configuraciones/", 1, "/api/configuraciones/", paged=True),
+    RouteBudget("GET", "/api/configuraciones/{config_id}", 1, "/api/configuraciones/1"),
+    RouteBudget("GET", "/api/configuraciones/usuario/{usuario_id}", 1, "/api/configuraciones/usuario/1"),
+    RouteBudget("POST", "/api/configuraciones/", 3, "/api/configuraciones/",
+                lambda make: {"json": {"usuario_id_fk": make.user_without_config(), "idioma": "es", "rol": "usuario", "tema": "claro"}}),
+    RouteBudget("PUT", "/api/configuraciones/{config_id}", 3,
+                lambda make: f"/api/configuraciones/{make.config()['id_configuracion']}", {"json": {"tema": "oscuro"}}),
+    RouteBudget("PUT", "/api/configuraciones/usuario/{usuario_id}", 3,
+                lambda make: f"/api/configuraciones/usuario/{make.config()['usuario_id_fk']}", {"json": {"idioma": "en"}}),
+    RouteBudget("DELETE", "/api/configuraciones/{config_id}", 2,
+                lambda make: f"/api/configuraciones/{make.config()['id_configuracion']}"),
+    RouteBudget("DELETE", "/api/configuraciones/usuario/{usuario_id}", 2,
+                lambda make: f"/api/configuraciones/usuario/{make.config()['usuario_id_fk']}"),
+
+    # Empleados
+    RouteBudget("GET", "/api/empleados/", 1, "/api/empleados/", paged=True),
+    RouteBudget("GET", "/api/empleados/{empleado_id}", 3, "/api/empleados/1"),
+    RouteBudget("POST", "/api/empleados/", 3, "/api/empleados/", {"json": EMPLOYEE}),
+    RouteBudget("POST", "/api/empleados/con-usuario", 7, "/api/empleados/con-usuario",
+                lambda make: {"json": employee_with_user(make)}),
+    RouteBudget("PUT", "/api/empleados/{empleado_id}", 4, lambda make: f"/api/empleados/{make.employee()}",
+                {"json": {"puesto": "Asociado"}}),
+    RouteBudget("DELETE", "/api/empleados/{empleado_id}", 3, lambda make: f"/api/empleados/{make.employee()}"),
+    RouteBudget("POST", "/api/empleados/{empleado_id}/vincular-usuario", 5, "/api/empleados/2/vincular-usuario",
+                {"json": {"usuario_id": 2}}),
+
+    # Sincronización y trabajos
+    RouteBudget("GET", "/api/sync", 6, "/api/sync", paged=True),
+    RouteBudget("GET", "/api/jobs/", 1, "/api/jobs/", paged=True),
+    RouteBudget("GET", "/api/jobs/{job_id}", 1, lambda make: f"/api/jobs/{make.failed_job()}"),
+    RouteBudget("POST", "/api/jobs/{job_id}/reintentar", 3, lambda make: f"/api/jobs/{make.failed_job()}/reintentar"),
+
+    # Profiling (solo admin; el rol sale del token, sin consultas)
+    RouteBudget("POST", "/api/admin/profiling/capture", 0, "/api/admin/profiling/capture", {"params": {"seconds": 0.05}}),
+    RouteBudget("GET", "/api/admin/profiling/profiles", 0, "/api/admin/profiling/profiles"),
+    RouteBudget("GET", "/api/admin/profiling/profiles/{name}", 0,
+                lambda make: f"/api/admin/profiling/profiles/{make.profile()}"),
+    RouteBudget("GET", "/api/admin/profiling/tasks", 0, "/api/admin/profiling/tasks"),
+]
+
+
+def _api_routes():
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path.startswith("/api/"):
+            for method in route.methods:
+                yield method, route.path
+
+
+def test_every_route_has_budget():
+    budgeted = {(entry.method, entry.path) for entry in BUDGETS}
+    missing = sorted(set(_api_routes()) - budgeted - set(EXCLUDED))
+    assert not missing, f"Rutas sin presupuesto de queries en tests/test_query_budgets.py: {missing}"
+    stale = sorted(budgeted - set(_api_routes()))
+    assert not stale, f"Presupuestos de rutas que ya no existen: {stale}"
+
+
+def _call(client, headers, make: Factory, entry: RouteBudget, count_queries, **params):
+    url, body = entry.prepare(make)
+    if params:
+        body["params"] = {**body.get("params", {}), **params}
+    with count_queries() as counter:
+        response = client.request(entry.method, url, headers=headers, **body)
+    assert response.status_code < 400, f"{entry.id} -> {response.status_code}: {response.text[:500]}"
+    return counter.count, counter.report()
+
+
+@pytest.mark.parametrize("entry", BUDGETS, ids=lambda entry: entry.id)
+def test_route_query_budget(client, auth_headers, count_queries, entry: RouteBudget):
+    make = Factory(client, auth_headers)
+    params = {"limit": 50} if entry.paged else {}
+    count, report = _call(client, auth_headers, make, entry, count_queries, **params)
+    assert count <= entry.budget, (
+        f"{entry.id} ejecutó {count} sentencias (presupuesto {entry.budget}):\n{report}"
+    )
+
+
+@pytest.mark.parametrize("entry", [entry for entry in BUDGETS if entry.paged], ids=lambda entry: entry.id)
+def test_paged_route_does_not_scale_with_page_size(client, auth_headers, count_queries, entry: RouteBudget):
+    make = Factory(client, auth_headers)
+    small, _ = _call(client, auth_headers, make, entry, count_queries, limit=5)
+    large, report = _call(client, auth_headers, make, entry, count_queries, limit=50)
+    assert small == large, (
+        f"{entry.id}: {small} sentencias con limit=5 y {large} con limit=50 (N+1 por fila):\n{report}"
+    )
@@ -0,0 +1,130 @@
+# Archivo: tests/test_rate_limit.py
+# Descripción: Pruebas del control de admisión
+# Funcionalidad: Token buckets (memoria y Redis), grupos de rutas, 429 con Retry-After y cupos de requests simultáneos
+
+import asyncio
+import copy
+
+import pytest
+
+from app.config import RATE_LIMIT_CONFIG
+from app.ratelimit import (
+    Bucket, ConcurrencyLimiter, MemoryBucketStore, RateLimiter, RedisBucketStore, route_group, set_rate_limiter
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _take(store, *buckets):
+    return asyncio.run(store.take(buckets))
+
+
+def test_bucket_allows_burst_then_refills_at_rate():
+    clock = FakeClock()
+    store = MemoryBucketStore(clock=clock)
+    bucket = Bucket("user:1", rate=1.0, capacity=3, name="user")
+
+    assert [_take(store, bucket) for _ in range(3)] == [(0.0, None)] * 3
+    wait, limiting = _take(store, bucket)
+    assert limiting == 0 and wait == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert _take(store, bucket) == (0.0, None)
+    assert _take(store, bucket)[1] == 0
+
+
+def test_rejected_request_does_not_spend_other_buckets():
+    store = MemoryBucketStore(clock=FakeClock())
+    user = Bucket("user:1", rate=1.0, capacity=2, name="user")
+    analytics = Bucket("analytics:user:1", rate=1.0, capacity=1, name="analytics")
+
+    assert _take(store, user, analytics) == (0.0, None)
+    assert _take(store, user, analytics)[1] == 1
+    # El rechazo por analytics no consumió el token restante del usuario
+    assert _take(store, user) == (0.0, None)
+
+
+def test_redis_store_shares_the_same_semantics():
+    pytest.importorskip("lupa")  # fakeredis ejecuta scripts Lua con lupa
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scenario():
+        store = RedisBucketStore(client=fakeredis.aioredis.FakeRedis())
+        user = Bucket("rl:user:1", rate=0.5, capacity=2, name="user")
+        analytics = Bucket("rl:analytics:user:1", rate=0.5, capacity=1, name="analytics")
+        results = [await store.take([user, analytics]) for _ in range(2)]
+        results.append(await store.take([user]))
+        return results
+
+    first, second, third = asyncio.run(scenario())
+    assert first == (0.0, None)
+    assert second[1] == 1 and 0 < second[0] <= 2.0
+    assert third == (0.0, None)
+
+
+def test_route_groups():
+    assert route_group("GET", "/api/analytics/resumen-completo") == "analytics"
+    assert route_group("GET", "/api/documentos/search") == "search"
+    assert route_group("POST", "/api/documentos/upload") == "uploads"
+    assert route_group("GET", "/api/documentos/upload") is None
+    assert route_group("GET", "/api/analyticsx") is None
+
+
+def test_user_and_ip_buckets(auth_headers):
+    limiter = RateLimiter(MemoryBucketStore())
+    scope = {"type": "http", "method": "GET", "path": "/api/analytics/casos-por-estado", "client": ("10.0.0.7", 5000)}
+
+    anonymous = limiter.buckets_for({**scope, "headers": []})
+    assert [b.name for b in anonymous] == ["ip", "analytics"]
+    assert anonymous[1].key.endswith("analytics:ip:10.0.0.7")
+
+    token = auth_headers["Authorization"].encode("latin-1")
+    authenticated = limiter.buckets_for({**scope, "headers": [(b"authorization", token)]})
+    assert [b.name for b in authenticated] == ["ip", "user", "analytics"]
+    assert authenticated[2].key.split(":")[-2] == "user"
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    """Límite activo con un presupuesto de analytics de 2 requests y reposición lenta"""
+    config = copy.deepcopy(RATE_LIMIT_CONFIG)
+    config["groups"]["analytics"].update(per_minute=1, burst=2)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, "enabled", True)
+    set_rate_limiter(RateLimiter(MemoryBucketStore(), config))
+    yield
+    set_rate_limiter(None)
+
+
+def test_exhausted_group_returns_429_with_retry_after(client, auth_headers, rate_limited):
+    path = "/api/analytics/casos-por-estado"
+    assert [client.get(path, headers=auth_headers).status_code for _ in range(2)] == [200, 200]
+
+    response = client.get(path, headers=auth_headers)
+    assert response.status_code == 429
+    assert response.json()["error_type"] == "rate_limited"
+    assert 1 <= int(response.headers["retry-after"]) <= 60
+
+    # El resto de la API y las probes siguen disponibles para el mismo usuario
+    assert client.get("/api/projects/1", headers=auth_headers).status_code == 200
+    assert client.get("/health").status_code == 200
+
+
+def test_concurrency_limiter_sheds_after_queue_timeout():
+    async def scenario():
+        limiter = ConcurrencyLimiter(limit=1, queue_timeout=0.05)
+        assert await limiter.acquire()
+        shed = not await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        limiter.release()
+        return shed, await waiter, limiter.in_flight
+
+    shed, admitted, in_flight = asyncio.run(scenario())
+    assert shed and admitted and in_flight == 1
@@ -0,0 +1,79 @@
+# Archivo: tests/test_read_replica.py
+# Descripción: Pruebas de la réplica de lectura con stickiness read-your-writes
+# Funcionalidad: Primario y réplica separados; quien escribe lee del primario, en este worker o en otro (cache compartido)
+
+import sqlite3
+import uuid
+
+import pytest
+
+from app import database
+from app.cache import Cache, RedisBackend, set_cache
+from app.config import DATABASE_CONFIG
+from benchmarks.datagen import DEFAULT_PASSWORD
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch, seeded_database):
+    """Réplica = copia del primario tomada ahora: no ve lo que se escriba después"""
+    primary_url = DATABASE_CONFIG["url"]
+    if not primary_url.startswith("sqlite:///"):
+        pytest.skip("La réplica de prueba es una copia del archivo SQLite")
+    path = tmp_path / "replica.db"
+    source, target = sqlite3.connect(primary_url[len("sqlite:///"):]), sqlite3.connect(path)
+    source.backup(target)
+    source.close()
+    target.close()
+
+    monkeypatch.setitem(DATABASE_CONFIG, "replica_url", f"sqlite:///{path}")
+    monkeypatch.setattr(database, "_read_engine", None)
+    monkeypatch.setattr(database, "_recent_writers", type(database._recent_writers)())
+    yield
+    if database._read_engine is not None:
+        database._read_engine.dispose()
+
+
+@pytest.fixture
+def other_user_headers(client):
+    response = client.post("/api/auth/login", json={"email": "usuario1@bench.justtime", "password": DEFAULT_PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+def _create_contact(client, headers) -> str:
+    nombre = f"Contacto {uuid.uuid4().hex[:8]}"
+    response = client.post("/api/contactos/", json={"nombre": nombre, "tipo": "empresa"}, headers=headers)
+    assert response.status_code == 201, response.text
+    return nombre
+
+
+def _sees(client, headers, nombre) -> bool:
+    response = client.get("/api/contactos/", params={"tipo": "empresa"}, headers=headers)
+    assert response.status_code == 200
+    return any(contact["nombre"] == nombre for contact in response.json()["data"])
+
+
+def test_writer_reads_from_primary_and_others_from_replica(client, auth_headers, other_user_headers, replica):
+    nombre = _create_contact(client, auth_headers)
+
+    assert _sees(client, auth_headers, nombre)
+    assert not _sees(client, other_user_headers, nombre)
+    # La marca es el usuario, nunca el token
+    assert list(database._recent_writers) and all(key.startswith("user:") for key in database._recent_writers)
+
+
+def test_marker_in_shared_cache_reaches_other_workers(client, auth_headers, replica):
+    fakeredis = pytest.importorskip("fakeredis")
+    set_cache(Cache(RedisBackend(client=fakeredis.aioredis.FakeRedis())))
+    try:
+        nombre = _create_contact(client, auth_headers)
+        database._recent_writers.clear()  # la lectura llega a un worker que no vio la escritura
+        assert _sees(client, auth_headers, nombre)
+    finally:
+        set_cache(None)
+
+
+def test_writer_markers_are_bounded(monkeypatch, replica):
+    monkeypatch.setattr(database, "_MAX_TRACKED_WRITERS", 3)
+    for user_id in range(5):
+        database.mark_write(f"user:{user_id}")
+    assert list(database._recent_writers) == ["user:2", "user:3", "user:4"]
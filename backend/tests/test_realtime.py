@@ -0,0 +1,96 @@
+# Archivo: tests/test_realtime.py
+# Descripción: Pruebas del push en tiempo real
+# Funcionalidad: Mismo JSON en WebSocket y SSE, cierre del WebSocket cuando falla el envío y reconexión del listener Redis
+
+import asyncio
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.config import REALTIME_CONFIG
+from app.realtime import RedisBroker, Subscription, get_broker
+from app.routers.realtime_routes import _sse_format
+
+
+MESSAGE = {
+    "tipo": "recordatorio.vencida",
+    "fecha_vencimiento": date(2026, 3, 1),
+    "generado": datetime(2026, 3, 1, 8, 30),
+    "horas": Decimal("1.5")
+}
+EXPECTED = {"tipo": "recordatorio.vencida", "fecha_vencimiento": "2026-03-01", "generado": "2026-03-01T08:30:00", "horas": 1.5}
+
+
+def _publish(message):
+    # Desde otro loop: el broker encola en el loop de la conexión (call_soon_threadsafe)
+    asyncio.run(get_broker().publish(message))
+
+
+@pytest.fixture
+def websocket(client, auth_headers):
+    token = auth_headers["Authorization"].split(" ", 1)[1]
+    with client.websocket_connect(f"/api/realtime/ws?token={token}") as ws:
+        ws.send_json({"accion": "suscribir", "proyectos": []})
+        assert ws.receive_json()["tipo"] == "suscrito"  # la suscripción ya está registrada
+        yield ws
+
+
+def test_websocket_and_sse_share_the_encoder(websocket):
+    _publish(MESSAGE)
+    assert websocket.receive_json() == EXPECTED
+
+    event, data = _sse_format(MESSAGE).strip().split("\n")
+    assert event == "event: recordatorio.vencida"
+    assert json.loads(data[len("data: "):]) == EXPECTED
+
+
+def test_websocket_is_closed_when_sender_fails(websocket):
+    _publish({"tipo": "roto", "valor": object()})  # no serializable: el sender falla
+    with pytest.raises(WebSocketDisconnect) as closed:
+        websocket.receive_json()
+    assert closed.value.code == 1011
+
+
+class DroppingClient:
+    """Cliente Redis cuya primera suscripción se corta (reinicio de Redis, failover)"""
+
+    def __init__(self, client):
+        self.client = client
+        self.subscriptions = 0
+
+    def pubsub(self):
+        self.subscriptions += 1
+        pubsub = self.client.pubsub()
+        if self.subscriptions == 1:
+            async def dropped(**kwargs):
+                raise ConnectionError("Connection closed by server.")
+            pubsub.get_message = dropped
+        return pubsub
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def test_redis_listener_reconnects_and_sends_resync(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setitem(REALTIME_CONFIG, "reconnect_min", 0.01)
+
+    async def scenario():
+        client = DroppingClient(fakeredis.aioredis.FakeRedis())
+        broker = RedisBroker(client=client)
+        subscription = broker.subscribe(Subscription(usuario_id=1))
+        try:
+            resync = await asyncio.wait_for(subscription.queue.get(), 1)
+            await broker.publish({"tipo": "tarea.actualizada", "id": 7})
+            message = await asyncio.wait_for(subscription.queue.get(), 1)
+        finally:
+            await broker.close()
+        return client.subscriptions, resync, message
+
+    subscriptions, resync, message = asyncio.run(scenario())
+    assert subscriptions == 2
+    assert resync["tipo"] == "resync"
+    assert message == {"tipo": "tarea.actualizada", "id": 7}
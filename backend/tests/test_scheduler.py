@@ -0,0 +1,104 @@
+# Archivo: tests/test_scheduler.py
+# Descripción: Pruebas del scheduler de vencimientos
+# Funcionalidad: Ejecución por slot con reloj falso, recordatorios serializables, solo para elementos nuevos y lecturas del snapshot
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from app.cache import Cache, MemoryBackend, get_cache, set_cache
+from app.config import SCHEDULER_CONFIG
+from app.realtime import LocalBroker, set_broker
+from app.database import SessionLocal
+from app.scheduler import FakeClock, Scheduler, get_due_set, refresh_due_sets, register_default_jobs
+from app.scheduler.due_sets import DUE_SETS_KEY, DUE_SETS_TAGS
+
+
+class RecordingBroker(LocalBroker):
+    def __init__(self):
+        super().__init__()
+        self.published = []
+
+    async def publish(self, message):
+        self.published.append(message)
+        await super().publish(message)
+
+
+@pytest.fixture
+def scheduler_env(seeded_database):
+    broker = RecordingBroker()
+    set_cache(Cache(MemoryBackend()))
+    set_broker(broker)
+    yield broker
+    set_cache(None)
+    set_broker(None)
+
+
+def _keys(reminders):
+    return {(reminder["tipo"], reminder["tabla"], reminder["id"]) for reminder in reminders}
+
+
+def test_due_sets_job_runs_once_per_slot_and_reminds_only_new_items(scheduler_env):
+    broker = scheduler_env
+    clock = FakeClock(datetime.now())
+    scheduler = register_default_jobs(Scheduler(clock=clock))
+    interval = SCHEDULER_CONFIG["due_sets_interval"]
+
+    async def scenario():
+        first = await scheduler.run_pending()
+        notified = list(broker.published)
+        # Mismo slot: el lock del cache impide una segunda ejecución
+        scheduler.jobs["due_sets"].next_run = 0
+        repeated = await scheduler.run_pending()
+
+        await clock.advance(interval)
+        await scheduler.run_pending()
+        next_slot = broker.published[len(notified):]
+
+        await clock.advance(3 * 86400)
+        await scheduler.run_pending()
+        later = broker.published[len(notified) + len(next_slot):]
+        return first, repeated, notified, next_slot, later
+
+    first, repeated, notified, next_slot, later = asyncio.run(scenario())
+
+    assert "due_sets" in first and "due_sets" not in repeated
+    assert notified and {reminder["tipo"] for reminder in notified} == {"recordatorio.vencida", "recordatorio.proxima"}
+    # Los mensajes salen tal cual por send_json del WebSocket y por Redis
+    assert json.loads(json.dumps(notified)) == notified
+    assert all(isinstance(reminder["fecha_vencimiento"], str) for reminder in notified)
+
+    assert not _keys(next_slot) & _keys(notified)
+    # Tres días después hay vencidas nuevas, y ninguna repetida
+    assert any(reminder["tipo"] == "recordatorio.vencida" for reminder in later)
+    assert not _keys(later) & _keys(notified + next_slot)
+
+
+def test_reads_use_the_snapshot_and_never_rebuild_it(scheduler_env, count_queries):
+    now = datetime.now()
+    db = SessionLocal()
+
+    async def scenario():
+        cache = get_cache()
+        await refresh_due_sets(now)
+        with count_queries() as counter:
+            from_snapshot = await get_due_set(db, "tareas_vencidas", now)
+        snapshot_queries = counter.count
+
+        # Una escritura invalidó el snapshot: solo la consulta del conjunto pedido
+        await cache.invalidate_tags(*DUE_SETS_TAGS)
+        with count_queries() as counter:
+            queried = await get_due_set(db, "tareas_vencidas", now)
+        return from_snapshot, snapshot_queries, queried, counter.count, await cache.get(DUE_SETS_KEY)
+
+    try:
+        from_snapshot, snapshot_queries, queried, miss_queries, rebuilt = asyncio.run(scenario())
+    finally:
+        db.close()
+
+    assert from_snapshot and snapshot_queries == 0
+    assert miss_queries == 1
+    assert [task["id_tarea"] for task in queried] == [task["id_tarea"] for task in from_snapshot]
+    assert rebuilt is None  # solo el scheduler vuelve a armar el snapshot
@@ -0,0 +1,34 @@
+# Archivo: tests/test_server.py
+# Descripción: Pruebas del perfil de servidor
+# Funcionalidad: El lanzador sin gunicorn migra el esquema antes de arrancar uvicorn, según migrate_on_start
+
+import pytest
+import uvicorn
+
+import app.migrate
+from app import server
+from app.config import SERVER_CONFIG
+
+
+@pytest.fixture
+def launcher(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path / "metrics"))
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    monkeypatch.setattr(app.migrate, "upgrade_database", lambda: calls.append("migrate") or True)
+    monkeypatch.setattr(uvicorn, "run", lambda target, **options: calls.append(("run", options)))
+    return calls
+
+
+def test_main_migrates_before_starting_workers(launcher, monkeypatch):
+    monkeypatch.setitem(SERVER_CONFIG, "migrate_on_start", True)
+    server.main()
+    assert launcher[0] == "migrate"
+    assert launcher[1][0] == "run"
+    assert launcher[1][1]["forwarded_allow_ips"] == SERVER_CONFIG["forwarded_allow_ips"]
+
+
+def test_main_skips_migrations_when_disabled(launcher, monkeypatch):
+    monkeypatch.setitem(SERVER_CONFIG, "migrate_on_start", False)
+    server.main()
+    assert [call[0] for call in launcher] == ["run"]
@@ -0,0 +1,92 @@
+# Archivo: tests/test_sync.py
+# Descripción: Pruebas de la sincronización incremental
+# Funcionalidad: Deltas por token, lápidas de eliminados, purga con reset y versión tomada al confirmar
+
+from sqlalchemy import select
+
+from app.controllers.sync_controller import SyncController
+from app.database import SessionLocal
+from app.events import current_version
+from app.factory import RepositoryFactory
+from app.models.contacto import Contacto
+from app.models.sync import RegistroEliminado
+
+
+def _sync(client, headers, token=None):
+    response = client.get("/api/sync", params={"since": token} if token else {}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _drain(client, headers, token):
+    """Todas las páginas desde token: (cambios, token final)"""
+    cambios = []
+    while True:
+        page = _sync(client, headers, token)
+        cambios += page["cambios"]
+        token = page["token"]
+        if not page["has_more"]:
+            return cambios, token
+
+
+def test_delta_sync_returns_writes_and_tombstones_once(client, auth_headers):
+    _, token = _drain(client, auth_headers, _sync(client, auth_headers)["token"])
+
+    contacto = client.post("/api/contactos/", json={"nombre": "Contacto delta", "tipo": "persona"}, headers=auth_headers)
+    contacto_id = contacto.json()["data"]["id_contacto"]
+    cambios, token = _drain(client, auth_headers, token)
+    assert [(c["tabla"], c["operacion"], c["id"]) for c in cambios] == [("contactos", "upsert", contacto_id)]
+    assert cambios[0]["datos"]["nombre"] == "Contacto delta"
+
+    assert client.delete(f"/api/contactos/{contacto_id}", headers=auth_headers).status_code == 200
+    cambios, token = _drain(client, auth_headers, token)
+    assert [(c["tabla"], c["operacion"], c["id"]) for c in cambios] == [("contactos", "delete", contacto_id)]
+
+    assert _sync(client, auth_headers, token)["cambios"] == []
+
+
+def test_purged_tombstones_force_reset_for_older_tokens(client, auth_headers):
+    _, old_token = _drain(client, auth_headers, _sync(client, auth_headers)["token"])
+    contacto_id = client.post(
+        "/api/contactos/", json={"nombre": "Contacto purgado", "tipo": "persona"}, headers=auth_headers
+    ).json()["data"]["id_contacto"]
+    client.delete(f"/api/contactos/{contacto_id}", headers=auth_headers)
+    _, new_token = _drain(client, auth_headers, old_token)
+
+    db = SessionLocal()
+    try:
+        assert SyncController(RepositoryFactory.create_repository(RegistroEliminado, db)).purge_tombstones(-1) >= 1
+    finally:
+        db.close()
+
+    assert _sync(client, auth_headers, old_token)["reset"] is True
+    assert _sync(client, auth_headers, new_token)["reset"] is False
+
+
+def test_version_is_taken_at_commit_not_at_first_flush(seeded_database):
+    db = SessionLocal()
+    try:
+        before = current_version(db)
+        early = Contacto(nombre="Flush temprano", tipo="persona")
+        doomed = Contacto(nombre="Eliminado tras flush", tipo="persona")
+        db.add_all([early, doomed])
+        db.flush()
+        # Con filas escritas el contador sigue sin tocar: ningún lock hasta el commit
+        assert current_version(db) == before
+
+        db.delete(doomed)
+        db.flush()
+        late = Contacto(nombre="Flush del commit", tipo="persona")
+        db.add(late)
+        db.commit()
+
+        version = current_version(db)
+        assert version == before + 1
+        assert early.version == late.version == version
+        tombstone = db.execute(
+            select(RegistroEliminado).where(RegistroEliminado.tabla == "contactos",
+                                            RegistroEliminado.registro_id == doomed.id_contacto)
+        ).scalar_one()
+        assert tombstone.version == version
+    finally:
+        db.close()
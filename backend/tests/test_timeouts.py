@@ -0,0 +1,175 @@
+# Archivo: tests/test_timeouts.py
+# Descripción: Pruebas de los deadlines por request
+# Funcionalidad: 504 al vencer el deadline, 503 con el pool agotado, cancelación por desconexión y statement_timeout
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.config import TIMEOUT_CONFIG
+from app.database import InstrumentedQueuePool
+from app.deadlines import TIMEOUT, Deadline, apply_statement_timeout, current_deadline, reset_deadline, set_deadline
+from app.middleware.timeout import TimeoutMiddleware
+
+
+@pytest.fixture(autouse=True)
+def short_deadline(monkeypatch):
+    monkeypatch.setitem(TIMEOUT_CONFIG, "enabled", True)
+    monkeypatch.setitem(TIMEOUT_CONFIG, "default", 0.2)
+
+
+async def _respond(send, status: int, body: bytes = b"{}") -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _call(app, disconnect_after: float = None):
+    """Request GET /api/lento contra TimeoutMiddleware(app); devuelve los mensajes enviados al cliente"""
+    async def main():
+        incoming: asyncio.Queue = asyncio.Queue()
+        incoming.put_nowait({"type": "http.request", "body": b"", "more_body": False})
+        if disconnect_after is not None:
+            asyncio.get_running_loop().call_later(disconnect_after, incoming.put_nowait, {"type": "http.disconnect"})
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/api/lento", "headers": [], "query_string": b""}
+        await TimeoutMiddleware(app)(scope, incoming.get, send)
+        return sent
+
+    return asyncio.run(main())
+
+
+def _status_and_body(sent):
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    body = b"".join(message.get("body", b"") for message in sent if message["type"] == "http.response.body")
+    return start["status"], body
+
+
+def test_expired_deadline_returns_504_and_cancels_the_route():
+    cancelled = []
+
+    async def app(scope, receive, send):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    status, body = _status_and_body(_call(app))
+    assert status == 504
+    assert json.loads(body)["error_type"] == "timeout"
+    assert cancelled
+
+
+def test_error_of_a_cancelled_request_is_replaced_whatever_its_status():
+    async def app(scope, receive, send):
+        # Router que devuelve 400 con str(e) de la sentencia cancelada
+        current_deadline().cancel(TIMEOUT)
+        await _respond(send, 400, b'{"detail": "canceling statement due to user request"}')
+
+    status, body = _status_and_body(_call(app))
+    assert status == 504
+    assert b"canceling" not in body
+
+
+def test_pool_timeout_returns_503_with_retry_after():
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01)
+    held = engine.connect()
+
+    async def app(scope, receive, send):
+        try:
+            engine.connect()
+        except Exception:
+            await _respond(send, 500)  # los routers devuelven 500 ante cualquier excepción
+
+    try:
+        sent = _call(app)
+    finally:
+        held.close()
+        engine.dispose()
+    status, body = _status_and_body(sent)
+    assert status == 503
+    assert json.loads(body)["error_type"] == "overloaded"
+    assert (b"retry-after", b"1") in next(m for m in sent if m["type"] == "http.response.start")["headers"]
+
+
+def test_client_disconnect_cancels_the_route_without_response(monkeypatch):
+    monkeypatch.setitem(TIMEOUT_CONFIG, "default", 5.0)
+    cancelled = []
+
+    async def app(scope, receive, send):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    assert _call(app, disconnect_after=0.05) == []
+    assert cancelled
+
+
+def test_started_response_is_not_cut_by_the_deadline():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        for _ in range(4):
+            await asyncio.sleep(0.1)  # el cuerpo completo tarda el doble del deadline
+            await send({"type": "http.response.body", "body": b"x", "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    status, body = _status_and_body(_call(app))
+    assert status == 200 and body == b"xxxx"
+
+
+class FakeCursor:
+    def __init__(self, statements):
+        self.statements = statements
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self.statements)
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeRecord:
+    def __init__(self):
+        self.info = {}
+
+
+def test_statement_timeout_is_set_from_remaining_deadline_on_every_checkout(monkeypatch):
+    monkeypatch.setitem(TIMEOUT_CONFIG, "statement_timeout", True)
+    connection, record = FakeConnection(), FakeRecord()
+
+    token = set_deadline(Deadline(5.0))
+    try:
+        apply_statement_timeout(connection, record, None)
+        apply_statement_timeout(connection, record, None)
+    finally:
+        reset_deadline(token)
+    assert len(connection.statements) == 2
+    for statement in connection.statements:
+        milliseconds = int(statement.rsplit("=", 1)[1])
+        assert 4000 < milliseconds <= 5000
+
+    # Sin deadline: vuelve a 0 una sola vez
+    apply_statement_timeout(connection, record, None)
+    apply_statement_timeout(connection, record, None)
+    assert connection.statements[2:] == ["SET statement_timeout = 0"]
+    assert connection.commits == 3
@@ -0,0 +1,97 @@
+# Archivo: tests/test_tracing.py
+# Descripción: Pruebas de las trazas OpenTelemetry
+# Funcionalidad: Jerarquía request -> controlador -> SQL, traceparent entrante y spans de archivos
+
+import asyncio
+import io
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from fastapi import UploadFile  # noqa: E402
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+from app.config import TRACING_CONFIG  # noqa: E402
+from app.controllers.base_controller import BaseController  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.factory import RepositoryFactory  # noqa: E402
+from app.observability.tracing import configure_tracing, shutdown_tracing, start_span  # noqa: E402
+from app.services.file_service import FileService  # noqa: E402
+
+
+TRACE_ID = "4bf92f3577b34da6a3ce929b0e0e4736"
+
+
+@pytest.fixture
+def spans(monkeypatch):
+    """Tracing con muestreo total hacia un exporter en memoria; spans() los vacía al exportador"""
+    monkeypatch.setitem(TRACING_CONFIG, "enabled", True)
+    monkeypatch.setitem(TRACING_CONFIG, "sample_ratio", 1.0)
+    exporter = InMemorySpanExporter()
+    shutdown_tracing()  # con TRACING_ENABLED=true la app ya configuró el exporter OTLP
+    assert configure_tracing(exporter=exporter)
+
+    def finished():
+        shutdown_tracing()
+        return {span.name: span for span in exporter.get_finished_spans()}
+
+    yield finished
+    shutdown_tracing()
+
+
+def _parent_id(span):
+    return span.parent.span_id if span.parent is not None else None
+
+
+def test_controller_span_sits_between_request_and_sql(seeded_database, spans):
+    # Los métodos se envuelven al definir la clase: aquí ya con tracing activo
+    class DemoController(BaseController):
+        def validate_data(self, data):
+            return data
+
+        def contar(self):
+            return self.repository.db.query(self.repository.model).limit(5).count()
+
+    db = SessionLocal()
+    try:
+        with start_span("request"):
+            assert DemoController(RepositoryFactory.create_project_repository(db)).contar() == 5
+    finally:
+        db.close()
+
+    finished = spans()
+    request, contar = finished["request"], finished["DemoController.contar"]
+    select = finished["SELECT"]
+
+    assert _parent_id(contar) == request.context.span_id
+    assert _parent_id(select) == contar.context.span_id
+    assert select.kind == trace.SpanKind.CLIENT
+    assert select.attributes["db.statement"].startswith("SELECT")
+
+
+def test_request_span_continues_incoming_trace(client, auth_headers, spans):
+    headers = {**auth_headers, "traceparent": f"00-{TRACE_ID}-00f067aa0ba902b7-01"}
+    assert client.get("/api/projects/1", headers=headers).status_code == 200
+
+    finished = spans()
+    server = finished["GET /api/projects/{project_id}"]
+    select = finished["SELECT"]
+
+    assert format(server.context.trace_id, "032x") == TRACE_ID
+    assert server.kind == trace.SpanKind.SERVER
+    assert server.attributes["http.route"] == "/api/projects/{project_id}"
+    assert server.attributes["http.response.status_code"] == 200
+    assert select.context.trace_id == server.context.trace_id
+
+
+def test_file_write_and_delete_spans(spans):
+    service = FileService()
+    upload = UploadFile(file=io.BytesIO(b"contenido"), filename="escrito.pdf")
+    saved = asyncio.run(service.save_file(upload))
+    assert service.delete_file(saved["ruta_archivo"])
+
+    finished = spans()
+    assert finished["file.write"].attributes["file.size"] == len(b"contenido")
+    assert finished["file.delete"].attributes["file.name"] == finished["file.write"].attributes["file.name"]